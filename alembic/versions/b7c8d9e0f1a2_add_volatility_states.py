@@ -0,0 +1,47 @@
+"""Add volatility_states table
+
+Revision ID: b7c8d9e0f1a2
+Revises: a1b2c3d4e5f6
+Create Date: 2026-03-02 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c8d9e0f1a2'
+down_revision: Union[str, Sequence[str], None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create volatility_states table."""
+    op.create_table(
+        'volatility_states',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('symbol', sa.String(), nullable=False),
+        sa.Column('short_window', sa.Integer(), nullable=False),
+        sa.Column('long_window', sa.Integer(), nullable=False),
+        sa.Column('ewma_lambda', sa.Float(), nullable=False),
+        sa.Column('last_date', sa.String(), nullable=True),
+        sa.Column('last_close', sa.Float(), nullable=True),
+        sa.Column('bars', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('short_sum', sa.Float(), nullable=False, server_default='0.0'),
+        sa.Column('short_sum_sq', sa.Float(), nullable=False, server_default='0.0'),
+        sa.Column('long_sum', sa.Float(), nullable=False, server_default='0.0'),
+        sa.Column('long_sum_sq', sa.Float(), nullable=False, server_default='0.0'),
+        sa.Column('ewma_variance', sa.Float(), nullable=True),
+        sa.Column('returns', sa.Text(), nullable=False, server_default='[]'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_volatility_states_symbol', 'volatility_states', ['symbol'], unique=True)
+
+
+def downgrade() -> None:
+    """Remove volatility_states table."""
+    op.drop_table('volatility_states')
@@ -0,0 +1,30 @@
+"""Add scan fingerprint columns to watchlist
+
+Revision ID: c3d4e5f6a7b8
+Revises: b7c8d9e0f1a2
+Create Date: 2026-03-09 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6a7b8'
+down_revision: Union[str, Sequence[str], None] = 'b7c8d9e0f1a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add scan_fingerprint and scanned_at to watchlist."""
+    op.add_column('watchlist', sa.Column('scan_fingerprint', sa.String(), nullable=True))
+    op.add_column('watchlist', sa.Column('scanned_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove scan_fingerprint and scanned_at from watchlist."""
+    op.drop_column('watchlist', 'scanned_at')
+    op.drop_column('watchlist', 'scan_fingerprint')
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Options Chain Representation Benchmark
+
+Builds a synthetic SPY-sized chain and compares the list-of-contracts
+lookups that the scan used to repeat (a linear scan per type, profile and
+expiration) with the columnar, indexed ColumnarChain. Reports the time per
+lookup pattern and the memory held by the contract objects versus the
+column arrays.
+
+Usage:
+    python scripts/benchmark_chain.py
+
+    # 40 expirations x 600 strikes, 50 repetitions
+    python scripts/benchmark_chain.py --expirations 40 --strikes 600 --repeat 50
+"""
+
+import argparse
+import random
+import sys
+import timeit
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models import ColumnarChain, OptionContract, OptionsChain
+
+PROFILES = 4
+
+
+def make_contracts(expirations: int, strikes: int, seed: int = 42) -> list[OptionContract]:
+    """
+    Generate a chain with a call and a put per (expiration, strike).
+
+    Args:
+        expirations: Number of expirations
+        strikes: Strikes per expiration
+        seed: Random seed
+
+    Returns:
+        List of OptionContract in provider order
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    contracts = []
+    for e in range(expirations):
+        expiration = (today + timedelta(days=1 + 3 * e)).isoformat()
+        for option_type in ("Call", "Put"):
+            for k in range(strikes):
+                bid = rng.choice([0.0, rng.uniform(0.01, 20.0)])
+                contracts.append(
+                    OptionContract(
+                        symbol="SPY",
+                        strike=300.0 + k * 0.5,
+                        expiration_date=expiration,
+                        option_type=option_type,
+                        bid=bid,
+                        ask=bid + 0.05,
+                        last=bid,
+                        volume=rng.randint(0, 5000),
+                        open_interest=rng.randint(0, 50000),
+                        delta=rng.uniform(-1, 1),
+                        gamma=rng.uniform(0, 0.1),
+                        theta=rng.uniform(-1, 0),
+                        vega=rng.uniform(0, 1),
+                        implied_volatility=rng.uniform(0.1, 0.6),
+                    )
+                )
+    return contracts
+
+
+def list_scan(chain: OptionsChain, price: float, expirations: list[str]) -> int:
+    """The former candidate search: list filters per type, profile and expiration."""
+    found = 0
+    for option_type in ("call", "put"):
+        for _ in range(PROFILES):
+            typed = [c for c in chain.contracts if c.option_type.lower() == option_type]
+            for exp in expirations:
+                for c in typed:
+                    if c.expiration_date != exp or c.bid is None or c.bid <= 0:
+                        continue
+                    if (c.strike > price) if option_type == "call" else (c.strike < price):
+                        found += 1
+    return found
+
+
+def column_scan(columns: ColumnarChain, price: float, expirations: list[str]) -> int:
+    """The same search over strike-sorted column slices."""
+    found = 0
+    for option_type in ("call", "put"):
+        for _ in range(PROFILES):
+            for exp in expirations:
+                group = columns.slice(option_type, exp)
+                if option_type == "call":
+                    otm = group.strike_range(low=np.nextafter(price, np.inf))
+                else:
+                    otm = group.strike_range(high=np.nextafter(price, -np.inf))
+                found += int((otm.bid > 0).sum())
+    return found
+
+
+def main() -> int:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark options chain representations")
+    parser.add_argument("--expirations", type=int, default=30, help="Expirations (default: 30)")
+    parser.add_argument("--strikes", type=int, default=400, help="Strikes per expiration")
+    parser.add_argument("--repeat", type=int, default=20, help="Repetitions per lookup")
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    contracts = make_contracts(args.expirations, args.strikes)
+    contracts_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    chain = OptionsChain(symbol="SPY", contracts=contracts, retrieved_at="benchmark")
+    build_ms = timeit.timeit(lambda: ColumnarChain.from_contracts("SPY", contracts), number=3) / 3
+    columns = chain.columns
+    price = 300.0 + args.strikes * 0.25
+    expirations = columns.expirations[:5]
+
+    assert list_scan(chain, price, expirations) == column_scan(columns, price, expirations)
+
+    print(f"Chain: {len(contracts)} contracts, {args.expirations} expirations, repeat: {args.repeat}")
+    print(f"{'lookup':<24}{'list (ms)':>12}{'columns (ms)':>14}{'speedup':>10}")
+
+    first_exp = expirations[0]
+    cases = [
+        (
+            "calls",
+            lambda: [c for c in contracts if c.is_call],
+            lambda: columns.type_slice("call"),
+        ),
+        (
+            "by expiration",
+            lambda: [c for c in contracts if c.expiration_date == first_exp],
+            lambda: (columns.slice("call", first_exp), columns.slice("put", first_exp)),
+        ),
+        (
+            "strikes",
+            lambda: sorted({c.strike for c in contracts if c.expiration_date == first_exp}),
+            lambda: np.unique(columns.slice("call", first_exp).strike),
+        ),
+        (
+            "candidate search",
+            lambda: list_scan(chain, price, expirations),
+            lambda: column_scan(columns, price, expirations),
+        ),
+    ]
+    for name, list_fn, column_fn in cases:
+        # Warm up so one-time import costs are not timed
+        list_fn()
+        column_fn()
+        list_ms = timeit.timeit(list_fn, number=args.repeat) / args.repeat * 1000
+        column_ms = timeit.timeit(column_fn, number=args.repeat) / args.repeat * 1000
+        print(f"{name:<24}{list_ms:>12.3f}{column_ms:>14.3f}{list_ms / column_ms:>9.0f}x")
+
+    print()
+    print(f"Column build: {build_ms * 1000:.1f} ms (once per chain)")
+    print(f"Memory: contracts {contracts_bytes / 1e6:.1f} MB, columns {columns.nbytes / 1e6:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Schwab Option Chain Parser Benchmark
+
+Builds a synthetic SPY-sized Schwab chain response and compares the
+dict-based parse (json.loads + parse_schwab_option_chain, then columns
+built from the contracts) with parse_option_chain_payload() for every
+registered decoder. Reports wall time and peak traced memory per parse.
+
+Usage:
+    python scripts/benchmark_chain_parser.py
+
+    # 40 expirations x 300 strikes, 5 repetitions
+    python scripts/benchmark_chain_parser.py --expirations 40 --strikes 300 --repeat 5
+"""
+
+import argparse
+import json
+import random
+import sys
+import timeit
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.schwab.chain_parser import available_decoders, parse_option_chain_payload
+from src.schwab.parsers import parse_schwab_option_chain
+
+
+def make_payload(expirations: int, strikes: int, seed: int = 42) -> bytes:
+    """
+    Generate a Schwab option chain response body.
+
+    Args:
+        expirations: Number of expirations
+        strikes: Strikes per expiration
+        seed: Random seed
+
+    Returns:
+        JSON-encoded response body
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    payload = {"symbol": "SPY", "underlyingPrice": 500.0, "callExpDateMap": {}, "putExpDateMap": {}}
+    for map_key, put_call in (("callExpDateMap", "CALL"), ("putExpDateMap", "PUT")):
+        for e in range(expirations):
+            days = 1 + 3 * e
+            expiration = (today + timedelta(days=days)).isoformat()
+            strike_map = {}
+            for k in range(strikes):
+                strike = 400.0 + k * 0.5
+                bid = round(rng.uniform(0, 20), 2)
+                strike_map[f"{strike:.1f}"] = [
+                    {
+                        "putCall": put_call,
+                        "symbol": f"SPY   {expiration}{put_call[0]}{strike:08.1f}",
+                        "description": f"SPY {expiration} {strike} {put_call}",
+                        "exchangeName": "OPR",
+                        "bid": bid,
+                        "ask": round(bid + 0.05, 2),
+                        "last": bid,
+                        "mark": round(bid + 0.02, 2),
+                        "bidSize": rng.randint(1, 500),
+                        "askSize": rng.randint(1, 500),
+                        "highPrice": bid,
+                        "lowPrice": bid,
+                        "openPrice": 0.0,
+                        "closePrice": bid,
+                        "totalVolume": rng.randint(0, 5000),
+                        "openInterest": rng.randint(0, 50000),
+                        "volatility": rng.choice([-999.0, rng.uniform(5, 60)]),
+                        "delta": rng.uniform(-1, 1),
+                        "gamma": rng.uniform(0, 0.1),
+                        "theta": rng.uniform(-1, 0),
+                        "vega": rng.uniform(0, 1),
+                        "rho": rng.uniform(-0.1, 0.1),
+                        "timeValue": bid,
+                        "theoreticalOptionValue": bid,
+                        "strikePrice": strike,
+                        "expirationDate": f"{expiration}T20:00:00.000+00:00",
+                        "daysToExpiration": days,
+                        "multiplier": 100.0,
+                        "inTheMoney": False,
+                        "optionDeliverablesList": [
+                            {"symbol": "SPY", "assetType": "STOCK", "deliverableUnits": 100.0}
+                        ],
+                    }
+                ]
+            payload[map_key][f"{expiration}:{days}"] = strike_map
+    return json.dumps(payload).encode()
+
+
+def dict_parse(body: bytes):
+    """The former path: full dict tree, contracts, then columns from the contracts."""
+    chain = parse_schwab_option_chain("SPY", json.loads(body))
+    assert len(chain.columns) == len(chain.contracts)
+    return chain
+
+
+def measure(fn, repeat: int) -> tuple[float, float]:
+    """Mean milliseconds per call and peak traced megabytes for one call."""
+    fn()
+    ms = timeit.timeit(fn, number=repeat) / repeat * 1000
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return ms, peak / 1e6
+
+
+def main() -> int:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark Schwab option chain parsing")
+    parser.add_argument("--expirations", type=int, default=30, help="Expirations (default: 30)")
+    parser.add_argument("--strikes", type=int, default=200, help="Strikes per expiration")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per parser")
+    args = parser.parse_args()
+
+    body = make_payload(args.expirations, args.strikes)
+    reference = dict_parse(body)
+    print(f"Payload: {len(body) / 1e6:.1f} MB, {len(reference.contracts)} contracts")
+    print(f"{'parser':<24}{'time (ms)':>12}{'peak (MB)':>12}")
+
+    cases = [("json.loads + parser", lambda: dict_parse(body))]
+    for name in available_decoders():
+        cases.append((f"payload [{name}]", lambda name=name: parse_option_chain_payload("SPY", body, decoder=name)))
+
+    for name, fn in cases:
+        assert fn().contracts == reference.contracts
+        ms, peak = measure(fn, args.repeat)
+        print(f"{name:<24}{ms:>12.1f}{peak:>12.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
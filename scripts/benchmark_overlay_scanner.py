@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Overlay Scanner Filter Benchmark
+
+Scans a synthetic portfolio with OverlayScanner and compares the former
+per-candidate filter pass (apply_tradability_filters, apply_delta_band_filter
+and populate_near_miss_details on every OTM call, building RejectionDetail
+objects for all of them) with the array pipeline scan_holding now runs
+(compile_filters, near-miss scores from the masks, details for the top
+near-misses only). Checks that both reject the same strikes for the same
+reasons with the same near-miss scores, then reports the filter time and
+the time of a whole scan_portfolio call.
+
+Usage:
+    python scripts/benchmark_overlay_scanner.py
+
+    # 50 holdings, 6 weekly expirations of 300 strikes, 10 repetitions
+    python scripts/benchmark_overlay_scanner.py --holdings 50 --weeks 6 --strikes 300 --repeat 10
+"""
+
+import argparse
+import logging
+import random
+import sys
+import timeit
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models import (
+    CandidateStrike,
+    OptionContract,
+    OptionsChain,
+    PortfolioHolding,
+    RejectionDetail,
+    RejectionReason,
+    ScannerConfig,
+    ScanResult,
+)
+from src.scanning import OverlayScanner
+from src.scanning.filters import (
+    apply_delta_band_filter,
+    apply_tradability_filters,
+    compile_filters,
+    populate_near_miss_details,
+)
+from src.strategies.strike_optimizer import StrikeOptimizer
+
+
+class NoEarnings:
+    """Earnings calendar stand-in: no earnings, no API calls."""
+
+    def get_earnings_dates(self, symbol: str) -> list[str]:
+        return []
+
+    def expiration_spans_earnings(self, symbol: str, expiration: str) -> tuple[bool, Optional[str]]:
+        return False, None
+
+
+def make_chain(symbol: str, price: float, weeks: int, strikes: int, seed: int) -> OptionsChain:
+    """
+    Generate weekly calls and puts around a price with mixed liquidity.
+
+    Args:
+        symbol: Underlying symbol
+        price: Underlying price
+        weeks: Weekly expirations
+        strikes: Strikes per expiration
+        seed: Random seed
+
+    Returns:
+        OptionsChain in provider order
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    step = price * 0.005
+    contracts = []
+    for week in range(weeks):
+        expiration = (today + timedelta(days=3 + 7 * week)).isoformat()
+        for option_type in ("Call", "Put"):
+            for k in range(strikes):
+                strike = round(price * 0.75 + k * step, 2)
+                otm = max(0.0, strike - price if option_type == "Call" else price - strike)
+                bid = round(max(0.0, price * 0.02 * (week + 1) ** 0.5 - otm * 0.3), 2)
+                contracts.append(
+                    OptionContract(
+                        symbol=symbol,
+                        strike=strike,
+                        expiration_date=expiration,
+                        option_type=option_type,
+                        bid=bid,
+                        ask=round(bid + rng.choice([0.01, 0.05, 0.10, 0.25]), 2),
+                        volume=rng.choice([0, 5, 50, 500]),
+                        open_interest=rng.choice([0, 50, 500, 5000]),
+                    )
+                )
+    return OptionsChain(symbol=symbol, contracts=contracts, retrieved_at="benchmark")
+
+
+def candidates(result: ScanResult) -> list[CandidateStrike]:
+    """Every candidate of a scan, recommended or not."""
+    return result.recommended_strikes + result.rejected_strikes
+
+
+def rejection_details(
+    scanner: OverlayScanner, candidate: CandidateStrike, current_price: float
+) -> list[RejectionDetail]:
+    """Detail objects of every check a candidate fails."""
+    _, details = apply_tradability_filters(candidate, scanner.config, current_price)
+    delta_detail = apply_delta_band_filter(candidate, scanner.config)
+    if delta_detail:
+        details.append(delta_detail)
+    return details
+
+
+def deferred_details(
+    scanner: OverlayScanner, candidate: CandidateStrike, result: ScanResult
+) -> tuple[list[RejectionDetail], Optional[RejectionDetail]]:
+    """Details and binding constraint of a near-miss."""
+    details = rejection_details(scanner, candidate, result.current_price)
+    return details, min(details, key=lambda d: d.margin)
+
+
+def per_candidate_filters(
+    scanner: OverlayScanner, result: ScanResult
+) -> tuple[list[list[RejectionReason]], list[float]]:
+    """The former filter pass: detail objects for every candidate."""
+    reasons = []
+    rejected = []
+    for candidate in candidates(result):
+        details = rejection_details(scanner, candidate, result.current_price)
+        reasons.append([d.reason for d in details])
+        if details:
+            candidate.rejection_details = details
+            rejected.append(candidate)
+    max_net_credit = max((c.total_net_credit for c in rejected), default=100.0) or 100.0
+    for candidate in rejected:
+        populate_near_miss_details(candidate, max_net_credit)
+    # Near-miss selection, as the former scan did it
+    sorted(rejected, key=lambda c: c.near_miss_score, reverse=True)[:5]
+    return reasons, [c.near_miss_score for c in rejected]
+
+
+def compiled_filters(
+    scanner: OverlayScanner, result: ScanResult
+) -> tuple[list[list[RejectionReason]], list[float]]:
+    """The array pipeline: masks for every candidate, details for the top five."""
+    found = candidates(result)
+    bids = np.array([c.bid for c in found], dtype=np.float64)
+    asks = np.array([c.ask for c in found], dtype=np.float64)
+    masks = compile_filters(
+        scanner.config,
+        bid=bids,
+        ask=asks,
+        open_interest=np.array([c.open_interest for c in found], dtype=np.float64),
+        volume=np.array([c.volume for c in found], dtype=np.float64),
+        delta=np.array([c.delta for c in found], dtype=np.float64),
+        costs=scanner.calculate_execution_costs(bids, asks, result.contracts_available),
+        spans_earnings=np.zeros(len(found), dtype=bool),
+        current_price=result.current_price,
+    )
+    rows = np.flatnonzero(masks.rejected).tolist()
+    rejected = [found[i] for i in rows]
+    max_net_credit = max((c.total_net_credit for c in rejected), default=100.0) or 100.0
+    net_credit = np.array([c.total_net_credit for c in found], dtype=np.float64)
+    scores = masks.near_miss_scores(net_credit, max_net_credit)[rows].tolist()
+    for candidate, score in zip(rejected, scores):
+        candidate.near_miss_score = score
+    for candidate in sorted(rejected, key=lambda c: c.near_miss_score, reverse=True)[:5]:
+        candidate.rejection_details, candidate.binding_constraint = deferred_details(
+            scanner, candidate, result
+        )
+    return [masks.reasons(i) for i in range(len(found))], scores
+
+
+def main() -> int:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark the overlay scanner filters")
+    parser.add_argument("--holdings", type=int, default=25, help="Holdings (default: 25)")
+    parser.add_argument("--weeks", type=int, default=4, help="Weekly expirations (default: 4)")
+    parser.add_argument("--strikes", type=int, default=200, help="Strikes per expiration")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement")
+    args = parser.parse_args()
+
+    # scan_holding logs a line per holding; keep the table readable
+    logging.disable(logging.INFO)
+
+    rng = random.Random(7)
+    holdings, prices, chains, volatilities = [], {}, {}, {}
+    for n in range(args.holdings):
+        symbol = f"SYM{n:03d}"
+        holdings.append(PortfolioHolding(symbol=symbol, shares=rng.choice([100, 500, 2000])))
+        prices[symbol] = round(rng.uniform(20, 500), 2)
+        chains[symbol] = make_chain(symbol, prices[symbol], args.weeks, args.strikes, seed=n)
+        volatilities[symbol] = rng.uniform(0.15, 0.6)
+
+    scanner = OverlayScanner(
+        finnhub_client=None,
+        strike_optimizer=StrikeOptimizer(),
+        config=ScannerConfig(weeks_to_scan=args.weeks),
+    )
+    scanner.earnings_calendar = NoEarnings()
+
+    results = scanner.scan_portfolio(holdings, prices, chains, volatilities)
+    for result in results.values():
+        assert compiled_filters(scanner, result) == per_candidate_filters(scanner, result)
+    total = sum(len(candidates(r)) for r in results.values())
+
+    def run_former() -> None:
+        for result in results.values():
+            per_candidate_filters(scanner, result)
+
+    def run_compiled() -> None:
+        for result in results.values():
+            compiled_filters(scanner, result)
+
+    # Warm up so only the filter work is timed
+    run_former()
+    former_ms = timeit.timeit(run_former, number=args.repeat) / args.repeat * 1000
+    compiled_ms = timeit.timeit(run_compiled, number=args.repeat) / args.repeat * 1000
+    scan_ms = (
+        timeit.timeit(
+            lambda: scanner.scan_portfolio(holdings, prices, chains, volatilities),
+            number=args.repeat,
+        )
+        / args.repeat
+        * 1000
+    )
+
+    print(
+        f"Portfolio: {args.holdings} holdings, {total} OTM calls scanned, repeat: {args.repeat}"
+    )
+    print(f"{'filters':<24}{'per-candidate (ms)':>20}{'arrays (ms)':>14}{'speedup':>10}")
+    speedup = former_ms / compiled_ms
+    print(f"{'all holdings':<24}{former_ms:>20.2f}{compiled_ms:>14.2f}{speedup:>9.1f}x")
+    print()
+    print(f"scan_portfolio: {scan_ms:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Provider Registry Latency Benchmark
+
+Compares request latency of the server's two client setups against a local
+stand-in for the Schwab quotes endpoint:
+
+- per request: every request builds its own PositionMonitorService, so a new
+  SchwabClient (OAuth token load, HTTP session, empty caches)
+- registry: every request builds PositionMonitorService(providers=registry)
+  over one ProviderRegistry, so the session and caches outlive the request
+
+The registry is measured twice: with warm caches, as requests inside the
+quote TTL see it, and with force_refresh so every request still goes over
+the wire and only connection and token reuse remain.
+
+The local server adds --latency-ms per response; TLS setup against the real
+API is not simulated, so the per-request numbers are a lower bound.
+
+Usage:
+    python scripts/benchmark_provider_registry.py
+
+    # 200 requests for 25 symbols with 20 ms simulated latency
+    python scripts/benchmark_provider_registry.py --requests 200 --symbols 25 --latency-ms 20
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.oauth.config import SchwabOAuthConfig
+from src.oauth.coordinator import OAuthCoordinator
+from src.oauth.token_storage import TokenData, TokenStorage
+from src.schwab.client import SchwabClient
+from src.server.services.position_service import PositionMonitorService
+from src.server.services.provider_registry import ProviderRegistry
+
+
+def make_handler(latency_seconds: float) -> type:
+    """Build a quotes endpoint handler that waits latency_seconds per response."""
+
+    class QuotesHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, as the real API
+        disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+        def do_GET(self):
+            symbols = parse_qs(urlparse(self.path).query).get("symbols", [""])[0]
+            body = json.dumps(
+                {
+                    symbol: {
+                        "symbol": symbol,
+                        "quoteType": "NBBO",
+                        "realtime": True,
+                        "quote": {"lastPrice": 100.0, "closePrice": 99.5, "bidPrice": 99.9},
+                    }
+                    for symbol in symbols.split(",")
+                    if symbol
+                }
+            ).encode()
+            time.sleep(latency_seconds)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return QuotesHandler
+
+
+def make_oauth_config(token_dir: Path) -> SchwabOAuthConfig:
+    """OAuth config whose token file holds a valid (fake) token."""
+    config = SchwabOAuthConfig(
+        client_id="benchmark",
+        client_secret="benchmark",
+        token_file=str(token_dir / "tokens.json"),
+    )
+    TokenStorage(config.token_file).save(
+        TokenData(
+            access_token="benchmark_token",
+            refresh_token="benchmark_refresh",
+            token_type="Bearer",
+            expires_in=1800,
+            scope="api",
+            issued_at=datetime.now(timezone.utc).isoformat(),
+        )
+    )
+    return config
+
+
+def measure(request, count: int) -> list[float]:
+    """Milliseconds per call of request(), after one warm-up call."""
+    request()
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        request()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> int:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark shared vs per-request clients")
+    parser.add_argument("--requests", type=int, default=100, help="Requests per setup")
+    parser.add_argument("--symbols", type=int, default=10, help="Symbols per request")
+    parser.add_argument(
+        "--latency-ms", type=float, default=10.0, help="Simulated response latency"
+    )
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.latency_ms / 1000))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    SchwabClient.BASE_URL = f"http://127.0.0.1:{server.server_port}"
+    symbols = [f"SYM{i}" for i in range(args.symbols)]
+
+    with tempfile.TemporaryDirectory() as token_dir:
+        config = make_oauth_config(Path(token_dir))
+
+        def new_client() -> SchwabClient:
+            return SchwabClient(oauth_coordinator=OAuthCoordinator(config))
+
+        def per_request():
+            client = new_client()
+            try:
+                PositionMonitorService(None, schwab_client=client).monitor.prefetch_quotes(
+                    symbols
+                )
+            finally:
+                client.close()
+
+        registry = ProviderRegistry(schwab_client=new_client())
+
+        def shared(force_refresh: bool):
+            service = PositionMonitorService(None, providers=registry)
+            service.monitor.prefetch_quotes(symbols, force_refresh=force_refresh)
+
+        cases = [
+            ("per request", per_request),
+            ("registry, force_refresh", lambda: shared(True)),
+            ("registry, warm caches", lambda: shared(False)),
+        ]
+
+        print(
+            f"{args.requests} requests x {args.symbols} symbols, "
+            f"{args.latency_ms:.0f} ms simulated latency"
+        )
+        print(f"{'setup':<26}{'mean (ms)':>12}{'p50 (ms)':>12}{'p95 (ms)':>12}")
+        for name, request in cases:
+            timings = sorted(measure(request, args.requests))
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            print(
+                f"{name:<26}{statistics.mean(timings):>12.2f}"
+                f"{statistics.median(timings):>12.2f}{p95:>12.2f}"
+            )
+        registry.close()
+
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
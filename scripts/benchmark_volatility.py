@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Volatility Estimator Benchmark
+
+Compares the list-based VolatilityCalculator with the NumPy-backed
+VectorizedVolatilityCalculator on a synthetic multi-year OHLC history and
+checks that both produce the same volatility. The "table" row compares one
+call per (method, window) against a single calculate_multi_window pass, and
+the "panel" row compares a per-symbol loop over a whole watchlist against a
+single PanelVolatilityCalculator call.
+
+Usage:
+    python scripts/benchmark_volatility.py
+
+    # 3 years of history, 500 repetitions per estimator
+    python scripts/benchmark_volatility.py --days 756 --repeat 500
+"""
+
+import argparse
+import math
+import random
+import sys
+import timeit
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analysis.volatility import VolatilityCalculator
+from src.analysis.volatility_models import PriceData
+from src.analysis.volatility_panel import PanelVolatilityCalculator, VolatilityPanel
+from src.analysis.volatility_vectorized import PriceArrays, VectorizedVolatilityCalculator
+
+METHODS = ["close_to_close", "parkinson", "garman_klass", "yang_zhang"]
+
+
+def make_price_data(days: int, seed: int = 42) -> PriceData:
+    """
+    Generate a random-walk OHLC series.
+
+    Args:
+        days: Number of daily bars
+        seed: Random seed
+
+    Returns:
+        PriceData with OHLC fields populated
+    """
+    rng = random.Random(seed)
+    opens, highs, lows, closes = [], [], [], []
+    prev_close = 100.0
+    for _ in range(days):
+        o = prev_close * math.exp(rng.gauss(0, 0.005))
+        c = o * math.exp(rng.gauss(0, 0.015))
+        highs.append(max(o, c) * math.exp(abs(rng.gauss(0, 0.006))))
+        lows.append(min(o, c) * math.exp(-abs(rng.gauss(0, 0.006))))
+        opens.append(o)
+        closes.append(c)
+        prev_close = c
+    dates = [f"day-{i:05d}" for i in range(days)]
+    return PriceData(dates=dates, opens=opens, highs=highs, lows=lows, closes=closes)
+
+
+def main() -> int:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark volatility estimators")
+    parser.add_argument("--days", type=int, default=756, help="Bars of history (default: 756)")
+    parser.add_argument("--repeat", type=int, default=200, help="Calls per estimator")
+    parser.add_argument("--symbols", type=int, default=400, help="Symbols in the panel run")
+    args = parser.parse_args()
+
+    price_data = make_price_data(args.days)
+    arrays = PriceArrays.from_price_data(price_data)
+    reference = VolatilityCalculator()
+    vectorized = VectorizedVolatilityCalculator()
+
+    print(f"History: {args.days} bars, window: full history, repeat: {args.repeat}")
+    print(f"{'method':<16}{'list (ms)':>12}{'numpy (ms)':>12}{'speedup':>10}{'abs diff':>12}")
+
+    for method in METHODS + ["blended"]:
+        if method == "blended":
+            run_ref = lambda: reference.calculate_blended(price_data, 0.30)  # noqa: E731
+            run_vec = lambda: vectorized.calculate_blended(arrays, 0.30)  # noqa: E731
+        else:
+            run_ref = lambda m=method: reference.calculate_from_price_data(  # noqa: E731
+                price_data, method=m, window=args.days
+            )
+            run_vec = lambda m=method: vectorized.calculate_from_price_data(  # noqa: E731
+                arrays, method=m, window=args.days
+            )
+
+        diff = abs(run_ref().volatility - run_vec().volatility)
+        ref_ms = timeit.timeit(run_ref, number=args.repeat) / args.repeat * 1000
+        vec_ms = timeit.timeit(run_vec, number=args.repeat) / args.repeat * 1000
+        print(f"{method:<16}{ref_ms:>12.4f}{vec_ms:>12.4f}{ref_ms / vec_ms:>9.1f}x{diff:>12.2e}")
+
+    # All estimators over several windows: one call per cell vs one prefix-sum pass
+    windows = [20, 60, 252]
+
+    def run_cells() -> dict:
+        return {
+            (m, w): reference.calculate_from_price_data(price_data, method=m, window=w).volatility
+            for m in METHODS
+            for w in windows
+        }
+
+    def run_table() -> dict:
+        return vectorized.calculate_multi_window(arrays, windows=windows).to_dict()
+
+    cells, table = run_cells(), run_table()
+    diff = max(abs(cells[key] - table[key]) for key in cells)
+    ref_ms = timeit.timeit(run_cells, number=args.repeat) / args.repeat * 1000
+    vec_ms = timeit.timeit(run_table, number=args.repeat) / args.repeat * 1000
+    label = f"table {len(METHODS)}x{len(windows)}"
+    print(f"{label:<16}{ref_ms:>12.4f}{vec_ms:>12.4f}{ref_ms / vec_ms:>9.1f}x{diff:>12.2e}")
+
+    # Whole watchlist: per-symbol loop vs one panel call (60-bar history per symbol)
+    universe = {f"SYM{i:04d}": make_price_data(60, seed=i) for i in range(args.symbols)}
+    panel = VolatilityPanel.from_price_data(universe)
+    panel_calculator = PanelVolatilityCalculator()
+
+    def run_loop() -> dict:
+        return {
+            symbol: {m: reference.calculate_from_price_data(data, method=m).volatility for m in METHODS}
+            for symbol, data in universe.items()
+        }
+
+    def run_panel() -> dict:
+        return panel_calculator.calculate(panel).volatilities
+
+    loop, batch = run_loop(), run_panel()
+    diff = max(
+        abs(loop[symbol][m] - batch[m][row])
+        for row, symbol in enumerate(panel.symbols)
+        for m in METHODS
+    )
+    repeat = max(1, args.repeat // 20)
+    ref_ms = timeit.timeit(run_loop, number=repeat) / repeat * 1000
+    vec_ms = timeit.timeit(run_panel, number=repeat) / repeat * 1000
+    label = f"panel {args.symbols}"
+    print(f"{label:<16}{ref_ms:>12.4f}{vec_ms:>12.4f}{ref_ms / vec_ms:>9.1f}x{diff:>12.2e}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
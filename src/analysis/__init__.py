@@ -6,6 +6,9 @@ This package contains modules for analyzing market data:
 - volatility: Volatility calculation (realized, implied, blended)
 - volatility_models: Volatility data models and structures
 - volatility_integration: Integration helpers for volatility with options chains
+- volatility_vectorized: NumPy-backed volatility estimators
+- volatility_panel: Cross-sectional volatility for batches of symbols
+- volatility_state: Incremental per-symbol volatility state
 
 All classes and functions are re-exported at the package level for convenience.
 """
@@ -30,6 +33,23 @@ from src.analysis.volatility import (
 # Import from volatility_models
 from src.analysis.volatility_models import PriceData, VolatilityResult
 
+# Import from volatility_vectorized
+from src.analysis.volatility_vectorized import (
+    PriceArrays,
+    VectorizedVolatilityCalculator,
+    VolatilityTable,
+)
+
+# Import from volatility_panel
+from src.analysis.volatility_panel import (
+    PanelVolatilityCalculator,
+    PanelVolatilityResult,
+    VolatilityPanel,
+)
+
+# Import from volatility_state
+from src.analysis.volatility_state import VolatilityState
+
 # Import from volatility_integration
 from src.analysis.volatility_integration import (
     calculate_iv_term_structure,
@@ -54,6 +74,16 @@ __all__ = [
     # volatility_models
     "PriceData",
     "VolatilityResult",
+    # volatility_vectorized
+    "PriceArrays",
+    "VectorizedVolatilityCalculator",
+    "VolatilityTable",
+    # volatility_panel
+    "PanelVolatilityCalculator",
+    "PanelVolatilityResult",
+    "VolatilityPanel",
+    # volatility_state
+    "VolatilityState",
     # volatility_integration
     "calculate_iv_term_structure",
     "calculate_volatility_with_iv",
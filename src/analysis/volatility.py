@@ -15,10 +15,13 @@ Mathematical References:
 import logging
 import math
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from .volatility_models import PriceData, VolatilityResult
 
+if TYPE_CHECKING:
+    from .volatility_state import VolatilityState
+
 logger = logging.getLogger(__name__)
 
 
@@ -577,3 +580,71 @@ class VolatilityCalculator:
                 f"Unknown method: {method}. "
                 f"Choose from: close_to_close, parkinson, garman_klass, yang_zhang"
             )
+
+    def calculate_from_state(
+        self,
+        state: "VolatilityState",
+        method: str = "close_to_close",
+        window: Optional[int] = None,
+        annualize: bool = True,
+    ) -> VolatilityResult:
+        """
+        Calculate volatility from an incremental VolatilityState.
+
+        Answers in O(1) from the state's running sums instead of the full
+        price history. Close-to-close results match calculate_close_to_close
+        over the same bars; "ewma" returns the exponentially weighted
+        volatility.
+
+        Args:
+            state: Incremental volatility state
+            method: close_to_close or ewma
+            window: Close-to-close window, the state's short or long window
+                (None = use config short window)
+            annualize: Whether to annualize the result
+
+        Returns:
+            VolatilityResult (start_date is "unknown"; the state keeps no history)
+
+        Raises:
+            ValueError: If the state has too little data or the window is not tracked
+        """
+        method = method.lower()
+        scale = math.sqrt(self.config.annualization_factor) if annualize else 1.0
+        end_date = state.last_date or "unknown"
+
+        if method == "close_to_close":
+            window = window or self.config.short_window
+            variance, points = state.window_variance(window)
+            if points < self.config.min_data_points:
+                raise ValueError(
+                    f"Insufficient data: need at least {self.config.min_data_points} points, "
+                    f"got {points}"
+                )
+            return VolatilityResult(
+                volatility=math.sqrt(variance) * scale,
+                method="close_to_close",
+                window=window,
+                data_points=points,
+                start_date="unknown",
+                end_date=end_date,
+                annualized=annualize,
+                metadata={"returns_count": points - 1, "efficiency_ratio": 1.0, "source": "state"},
+            )
+
+        elif method == "ewma":
+            if state.ewma_variance is None:
+                raise ValueError("Insufficient data: EWMA needs at least 2 points")
+            return VolatilityResult(
+                volatility=math.sqrt(state.ewma_variance) * scale,
+                method="ewma",
+                window=state.bars,
+                data_points=state.bars,
+                start_date="unknown",
+                end_date=end_date,
+                annualized=annualize,
+                metadata={"lambda": state.ewma_lambda, "source": "state"},
+            )
+
+        else:
+            raise ValueError(f"Unknown method: {method}. Choose from: close_to_close, ewma")
@@ -0,0 +1,318 @@
+"""
+Cross-sectional volatility for many symbols at once.
+
+A VolatilityPanel holds aligned OHLC data for a batch of symbols as 2-D
+arrays (symbols x days). Missing bars, whether holidays for one listing or
+days before an IPO, are stored as NaN and masked out. PanelVolatilityCalculator
+evaluates close-to-close, Parkinson, Garman-Klass, Yang-Zhang and blended
+volatility for every symbol in one vectorized call.
+
+Each symbol's result matches what VolatilityCalculator returns for that
+symbol's own bars. Before windowing, every row's valid bars are packed to
+the right edge, so a missing day shortens the history rather than creating
+a return across the gap.
+
+Example:
+    from src.analysis.volatility_panel import PanelVolatilityCalculator, VolatilityPanel
+
+    panel = VolatilityPanel.from_price_data({"AAPL": aapl_data, "MSFT": msft_data})
+    result = PanelVolatilityCalculator().calculate(panel)
+    print(result.get("AAPL", "yang_zhang"))
+"""
+
+import logging
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import numpy as np
+
+from .volatility import BlendWeights, VolatilityConfig
+from .volatility_models import PriceData
+
+logger = logging.getLogger(__name__)
+
+_LN2 = math.log(2)
+
+
+@dataclass
+class VolatilityPanel:
+    """
+    Aligned price history for a batch of symbols.
+
+    Attributes:
+        symbols: Symbol for each row
+        dates: Date for each column (ISO format, oldest to newest)
+        closes: Closing prices, shape (symbols, days); NaN marks a missing bar
+        opens: Opening prices, same shape (optional)
+        highs: High prices, same shape (optional)
+        lows: Low prices, same shape (optional)
+    """
+
+    symbols: list[str]
+    dates: list[str]
+    closes: np.ndarray
+    opens: Optional[np.ndarray] = None
+    highs: Optional[np.ndarray] = None
+    lows: Optional[np.ndarray] = None
+
+    def __post_init__(self) -> None:
+        """Validate panel shapes."""
+        shape = (len(self.symbols), len(self.dates))
+        for name in ("closes", "opens", "highs", "lows"):
+            values = getattr(self, name)
+            if values is not None and values.shape != shape:
+                raise ValueError(f"{name} must have shape {shape}, got {values.shape}")
+
+    @classmethod
+    def from_price_data(cls, price_data: Mapping[str, PriceData]) -> "VolatilityPanel":
+        """
+        Align per-symbol PriceData on the union of their dates.
+
+        Symbols without OHLC data get NaN rows in the OHLC arrays, so only
+        close-to-close and blended volatility are produced for them.
+
+        Args:
+            price_data: Mapping of symbol to its price history
+
+        Returns:
+            VolatilityPanel with one row per symbol
+        """
+        symbols = list(price_data)
+        dates = sorted({d for data in price_data.values() for d in data.dates})
+        column = {d: i for i, d in enumerate(dates)}
+        shape = (len(symbols), len(dates))
+
+        has_ohlc = any(
+            data.opens and data.highs and data.lows for data in price_data.values()
+        )
+        closes = np.full(shape, np.nan)
+        opens = np.full(shape, np.nan) if has_ohlc else None
+        highs = np.full(shape, np.nan) if has_ohlc else None
+        lows = np.full(shape, np.nan) if has_ohlc else None
+
+        for row, data in enumerate(price_data.values()):
+            cols = [column[d] for d in data.dates]
+            closes[row, cols] = data.closes
+            if has_ohlc and data.opens and data.highs and data.lows:
+                opens[row, cols] = data.opens
+                highs[row, cols] = data.highs
+                lows[row, cols] = data.lows
+
+        return cls(
+            symbols=symbols, dates=dates, closes=closes, opens=opens, highs=highs, lows=lows
+        )
+
+    @property
+    def has_ohlc(self) -> bool:
+        """Whether OHLC arrays are present."""
+        return self.opens is not None and self.highs is not None and self.lows is not None
+
+
+@dataclass
+class PanelVolatilityResult:
+    """
+    Volatility for every symbol in a panel.
+
+    Attributes:
+        symbols: Symbol for each entry
+        window: Lookback window used for the single-window estimators
+        volatilities: Method name -> array of volatility per symbol (NaN if unavailable)
+        data_points: Close bars used per symbol in the window
+        annualized: Whether values are annualized
+    """
+
+    symbols: list[str]
+    window: int
+    volatilities: dict[str, np.ndarray]
+    data_points: np.ndarray
+    annualized: bool
+
+    def get(self, symbol: str, method: str = "blended") -> Optional[float]:
+        """
+        Look up one symbol's volatility.
+
+        Args:
+            symbol: Stock ticker symbol
+            method: Estimator name
+
+        Returns:
+            Volatility as decimal, or None if unavailable
+        """
+        if symbol not in self.symbols or method not in self.volatilities:
+            return None
+        value = self.volatilities[method][self.symbols.index(symbol)]
+        return None if np.isnan(value) else float(value)
+
+    def to_dict(self, method: str = "blended") -> dict[str, float]:
+        """Convert one method's results to {symbol: volatility}, skipping unavailable entries."""
+        values = self.volatilities[method]
+        return {
+            symbol: float(value)
+            for symbol, value in zip(self.symbols, values)
+            if not np.isnan(value)
+        }
+
+
+def _right_align(
+    valid: np.ndarray, window: int, *arrays: np.ndarray
+) -> tuple[np.ndarray, list[np.ndarray]]:
+    """
+    Pack each row's valid bars against the right edge and keep the last window.
+
+    Returns the number of valid bars per row in the window and the aligned
+    arrays, with NaN wherever a row has fewer valid bars than the window.
+    """
+    window = min(window, valid.shape[1])
+    # A stable sort puts invalid bars first and keeps valid bars in date order
+    order = np.argsort(valid, axis=1, kind="stable")[:, valid.shape[1] - window :]
+    counts = np.minimum(valid.sum(axis=1), window)
+    in_window = np.arange(window) >= (window - counts)[:, None]
+    aligned = [
+        np.where(in_window, np.take_along_axis(values, order, axis=1), np.nan)
+        for values in arrays
+    ]
+    return counts, aligned
+
+
+class PanelVolatilityCalculator:
+    """
+    Vectorized volatility estimators over a VolatilityPanel.
+
+    Uses the same formulas, windows and minimum data requirements as
+    VolatilityCalculator; symbols with too little history get NaN.
+    """
+
+    def __init__(self, config: Optional[VolatilityConfig] = None):
+        """
+        Initialize panel calculator.
+
+        Args:
+            config: Optional configuration. Uses defaults if not provided.
+        """
+        self.config = config or VolatilityConfig()
+
+    def _close_to_close(self, panel: VolatilityPanel, window: int) -> tuple[np.ndarray, np.ndarray]:
+        """Close-to-close variance per symbol and the close bars used."""
+        counts, (c,) = _right_align(~np.isnan(panel.closes), window, panel.closes)
+        returns = np.log(c[:, 1:] / c[:, :-1])
+        m = counts - 1
+        mean = np.nansum(returns, axis=1) / m
+        deviations = returns - mean[:, None]
+        variance = np.nansum(deviations * deviations, axis=1) / (m - 1)
+        return variance, counts
+
+    def _annualized(self, variance: np.ndarray, counts: np.ndarray, annualize: bool) -> np.ndarray:
+        """Convert variance to volatility, masking rows below the minimum data points."""
+        scale = math.sqrt(self.config.annualization_factor) if annualize else 1.0
+        valid = counts >= max(self.config.min_data_points, 3)
+        return np.where(valid, np.sqrt(variance) * scale, np.nan)
+
+    def calculate(
+        self,
+        panel: VolatilityPanel,
+        window: Optional[int] = None,
+        implied_volatility: Optional[Union[Sequence[float], Mapping[str, float]]] = None,
+        weights: Optional[BlendWeights] = None,
+        annualize: bool = True,
+    ) -> PanelVolatilityResult:
+        """
+        Calculate every estimator for every symbol in the panel.
+
+        The blended estimate combines short- and long-window close-to-close
+        volatility with implied volatility. Symbols without an implied
+        volatility get a realized-only blend with the realized weights
+        renormalized.
+
+        Args:
+            panel: Aligned price history
+            window: Lookback window for the single-window estimators
+                (default: config short window)
+            implied_volatility: Optional per-symbol IV, as a sequence aligned
+                with panel.symbols or a {symbol: iv} mapping
+            weights: Optional blend weights (uses defaults if None)
+            annualize: Whether to annualize the results
+
+        Returns:
+            PanelVolatilityResult with one array per method
+        """
+        window = window or self.config.short_window
+        weights = weights or BlendWeights()
+        volatilities: dict[str, np.ndarray] = {}
+
+        if isinstance(implied_volatility, Mapping):
+            iv = np.array(
+                [implied_volatility.get(s, np.nan) for s in panel.symbols], dtype=np.float64
+            )
+        elif implied_volatility is not None:
+            iv = np.asarray(implied_volatility, dtype=np.float64)
+        else:
+            iv = np.full(len(panel.symbols), np.nan)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance, counts = self._close_to_close(panel, window)
+            volatilities["close_to_close"] = self._annualized(variance, counts, annualize)
+
+            if panel.has_ohlc:
+                valid = ~(
+                    np.isnan(panel.opens)
+                    | np.isnan(panel.highs)
+                    | np.isnan(panel.lows)
+                    | np.isnan(panel.closes)
+                )
+                ohlc_counts, (o, h, lo, c) = _right_align(
+                    valid, window, panel.opens, panel.highs, panel.lows, panel.closes
+                )
+                p = ohlc_counts.astype(np.float64)
+
+                log_hl = np.log(h / lo)
+                log_co = np.log(c / o)
+                hl_sq = np.nansum(log_hl * log_hl, axis=1)
+                co_sq = np.nansum(log_co * log_co, axis=1)
+
+                volatilities["parkinson"] = self._annualized(
+                    hl_sq / (4 * p * _LN2), ohlc_counts, annualize
+                )
+                volatilities["garman_klass"] = self._annualized(
+                    (0.5 * hl_sq - (2 * _LN2 - 1) * co_sq) / p, ohlc_counts, annualize
+                )
+
+                overnight = np.log(o[:, 1:] / c[:, :-1])
+                overnight_dev = overnight - (np.nansum(overnight, axis=1) / (p - 1))[:, None]
+                oc_dev = log_co - (np.nansum(log_co, axis=1) / p)[:, None]
+                rs = np.log(h / o) * np.log(h / c) + np.log(lo / o) * np.log(lo / c)
+
+                sigma_o_sq = np.nansum(overnight_dev * overnight_dev, axis=1) / (p - 1)
+                sigma_c_sq = np.nansum(oc_dev * oc_dev, axis=1) / p
+                sigma_rs_sq = np.nansum(rs, axis=1) / p
+                k = 0.34 / (1.34 + (p + 1) / (p - 1))
+                volatilities["yang_zhang"] = self._annualized(
+                    sigma_o_sq + k * sigma_c_sq + (1 - k) * sigma_rs_sq, ohlc_counts, annualize
+                )
+
+            if window == self.config.short_window and annualize:
+                rv_short = volatilities["close_to_close"]
+            else:
+                short_variance, short_counts = self._close_to_close(
+                    panel, self.config.short_window
+                )
+                rv_short = self._annualized(short_variance, short_counts, True)
+            long_variance, long_counts = self._close_to_close(panel, self.config.long_window)
+            rv_long = self._annualized(long_variance, long_counts, True)
+
+            # Realized-only blend where no IV is available
+            realized = weights.realized_short * rv_short + weights.realized_long * rv_long
+            volatilities["blended"] = np.where(
+                np.isnan(iv),
+                realized / (weights.realized_short + weights.realized_long),
+                realized + weights.implied * iv,
+            )
+
+        return PanelVolatilityResult(
+            symbols=list(panel.symbols),
+            window=window,
+            volatilities=volatilities,
+            data_points=counts,
+            annualized=annualize,
+        )
@@ -0,0 +1,249 @@
+"""
+Incremental volatility state.
+
+VolatilityState keeps the compact per-symbol state needed to answer
+close-to-close and EWMA volatility without revisiting the full price
+history: the last close, running sums of log returns over the short and
+long windows, and the EWMA variance. Each new daily bar updates the state
+in O(1), so a job that runs once per bar no longer pays for the whole
+lookback.
+
+The last (long_window - 1) returns are kept alongside the sums so the
+return that falls out of each window can be subtracted exactly. A full
+recompute from PriceData (VolatilityState.from_price_data) remains the
+reference used for validation.
+
+Example:
+    from src.analysis.volatility_state import VolatilityState
+
+    state = VolatilityState.from_price_data(price_data)
+    state.update("2026-03-02", 187.41)
+    result = VolatilityCalculator().calculate_from_state(state)
+"""
+
+import logging
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .volatility import VolatilityConfig
+from .volatility_models import PriceData
+
+logger = logging.getLogger(__name__)
+
+# RiskMetrics decay factor for daily returns
+DEFAULT_EWMA_LAMBDA = 0.94
+
+
+@dataclass
+class VolatilityState:
+    """
+    Running volatility state for one symbol.
+
+    Attributes:
+        short_window: Short close-to-close window in price points
+        long_window: Long close-to-close window in price points
+        ewma_lambda: EWMA decay factor (0 < lambda < 1)
+        last_date: Date of the last bar applied (ISO format)
+        last_close: Close of the last bar applied
+        bars: Total bars applied since the state was created
+        short_sum: Sum of log returns in the short window
+        short_sum_sq: Sum of squared log returns in the short window
+        long_sum: Sum of log returns in the long window
+        long_sum_sq: Sum of squared log returns in the long window
+        ewma_variance: EWMA of squared daily log returns (None until the first return)
+        returns: Most recent log returns, oldest first (at most long_window - 1)
+    """
+
+    short_window: int = 20
+    long_window: int = 60
+    ewma_lambda: float = DEFAULT_EWMA_LAMBDA
+    last_date: Optional[str] = None
+    last_close: Optional[float] = None
+    bars: int = 0
+    short_sum: float = 0.0
+    short_sum_sq: float = 0.0
+    long_sum: float = 0.0
+    long_sum_sq: float = 0.0
+    ewma_variance: Optional[float] = None
+    returns: deque = field(default_factory=deque)
+
+    def __post_init__(self) -> None:
+        """Validate windows and normalize the returns buffer."""
+        if self.short_window < 2:
+            raise ValueError("short_window must be at least 2")
+        if self.long_window < self.short_window:
+            raise ValueError("long_window must be >= short_window")
+        if not 0 < self.ewma_lambda < 1:
+            raise ValueError("ewma_lambda must be between 0 and 1")
+        self.returns = deque(self.returns, maxlen=self.long_window - 1)
+
+    @classmethod
+    def from_config(
+        cls, config: Optional[VolatilityConfig] = None, ewma_lambda: float = DEFAULT_EWMA_LAMBDA
+    ) -> "VolatilityState":
+        """Create an empty state using the windows of a VolatilityConfig."""
+        config = config or VolatilityConfig()
+        return cls(
+            short_window=config.short_window,
+            long_window=config.long_window,
+            ewma_lambda=ewma_lambda,
+        )
+
+    @classmethod
+    def from_price_data(
+        cls,
+        price_data: PriceData,
+        config: Optional[VolatilityConfig] = None,
+        ewma_lambda: float = DEFAULT_EWMA_LAMBDA,
+    ) -> "VolatilityState":
+        """
+        Build a state by replaying a full price history.
+
+        This is the full recompute: the result depends only on the price
+        history, so it can be compared against a state that was updated
+        incrementally over the same bars.
+
+        Args:
+            price_data: Historical price data (oldest to newest)
+            config: Optional configuration providing the windows
+            ewma_lambda: EWMA decay factor
+
+        Returns:
+            VolatilityState after the last bar of price_data
+        """
+        state = cls.from_config(config, ewma_lambda)
+        state.update_many(price_data.dates, price_data.closes)
+        return state
+
+    @property
+    def short_points(self) -> int:
+        """Price points currently covered by the short window."""
+        return min(self.bars, self.short_window)
+
+    @property
+    def long_points(self) -> int:
+        """Price points currently covered by the long window."""
+        return min(self.bars, self.long_window)
+
+    def update(self, date: str, close: float) -> bool:
+        """
+        Apply one new daily bar.
+
+        Bars dated on or before last_date are ignored, so re-running a job
+        on the same history leaves the state unchanged.
+
+        Args:
+            date: Bar date (ISO format)
+            close: Closing price
+
+        Returns:
+            True if the bar was applied, False if it was already seen
+
+        Raises:
+            ValueError: If close is not positive
+        """
+        if self.last_date is not None and date <= self.last_date:
+            return False
+        if close <= 0:
+            raise ValueError(f"Close must be positive, got {close}")
+
+        if self.last_close is not None:
+            r = math.log(close / self.last_close)
+            n = len(self.returns)
+
+            # Returns leaving each window before r is appended
+            if n >= self.short_window - 1:
+                dropped = self.returns[n - (self.short_window - 1)]
+                self.short_sum -= dropped
+                self.short_sum_sq -= dropped * dropped
+            if n >= self.long_window - 1:
+                dropped = self.returns[0]
+                self.long_sum -= dropped
+                self.long_sum_sq -= dropped * dropped
+
+            self.returns.append(r)
+            self.short_sum += r
+            self.short_sum_sq += r * r
+            self.long_sum += r
+            self.long_sum_sq += r * r
+
+            if self.ewma_variance is None:
+                self.ewma_variance = r * r
+            else:
+                self.ewma_variance = (
+                    self.ewma_lambda * self.ewma_variance + (1 - self.ewma_lambda) * r * r
+                )
+
+        self.last_date = date
+        self.last_close = close
+        self.bars += 1
+        return True
+
+    def update_many(self, dates: list[str], closes: list[float]) -> int:
+        """
+        Apply a sequence of bars, skipping any already seen.
+
+        Args:
+            dates: Bar dates (oldest to newest)
+            closes: Closing prices aligned with dates
+
+        Returns:
+            Number of bars applied
+        """
+        return sum(self.update(d, c) for d, c in zip(dates, closes))
+
+    def window_variance(self, window: int) -> tuple[float, int]:
+        """
+        Sample variance of daily log returns over a window.
+
+        Only the short and long windows are tracked.
+
+        Args:
+            window: short_window or long_window
+
+        Returns:
+            Tuple of (variance, price points used)
+
+        Raises:
+            ValueError: If window is not tracked or fewer than 3 points are available
+        """
+        if window == self.short_window:
+            total, total_sq, points = self.short_sum, self.short_sum_sq, self.short_points
+        elif window == self.long_window:
+            total, total_sq, points = self.long_sum, self.long_sum_sq, self.long_points
+        else:
+            raise ValueError(
+                f"Window {window} is not tracked; "
+                f"choose {self.short_window} or {self.long_window}"
+            )
+
+        n = points - 1
+        if n < 2:
+            raise ValueError(f"Insufficient data: need at least 3 points, got {points}")
+
+        # Running sums can drift slightly negative when the returns are all equal
+        return max((total_sq - total * total / n) / (n - 1), 0.0), points
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "short_window": self.short_window,
+            "long_window": self.long_window,
+            "ewma_lambda": self.ewma_lambda,
+            "last_date": self.last_date,
+            "last_close": self.last_close,
+            "bars": self.bars,
+            "short_sum": self.short_sum,
+            "short_sum_sq": self.short_sum_sq,
+            "long_sum": self.long_sum,
+            "long_sum_sq": self.long_sum_sq,
+            "ewma_variance": self.ewma_variance,
+            "returns": list(self.returns),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "VolatilityState":
+        """Restore a state produced by to_dict()."""
+        return cls(**data)
@@ -0,0 +1,716 @@
+"""
+Array-backed volatility estimators.
+
+This module provides a NumPy implementation of every estimator in
+VolatilityCalculator. Prices are converted once to contiguous float64
+arrays and each estimator is evaluated in a few vectorized passes instead
+of Python loops over lists.
+
+The results are the same VolatilityResult objects (identical method names,
+windows, dates and metadata keys) as the list implementation, so
+VectorizedVolatilityCalculator is a drop-in replacement anywhere a
+VolatilityCalculator is expected.
+
+Example:
+    from src.analysis.volatility_vectorized import VectorizedVolatilityCalculator
+
+    calculator = VectorizedVolatilityCalculator()
+    result = calculator.calculate_from_price_data(price_data, method="yang_zhang")
+"""
+
+import logging
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import numpy as np
+
+from .volatility import BlendWeights, VolatilityCalculator
+from .volatility_models import PriceData, VolatilityResult
+
+logger = logging.getLogger(__name__)
+
+# Anything that can be turned into a 1-D float64 array
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+_LN2 = math.log(2)
+
+
+def as_price_array(values: ArrayLike) -> np.ndarray:
+    """
+    Convert a price sequence into a contiguous float64 array.
+
+    Arrays that are already contiguous float64 are returned without copying.
+
+    Args:
+        values: Sequence of prices or NumPy array
+
+    Returns:
+        1-D contiguous float64 array
+    """
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+@dataclass
+class PriceArrays:
+    """
+    Contiguous float64 view of a PriceData object.
+
+    Converting PriceData once and reusing the arrays avoids paying the
+    list-to-array conversion for every estimator call.
+
+    Attributes:
+        dates: List of dates (ISO format strings)
+        closes: Closing prices
+        opens: Opening prices (optional)
+        highs: High prices (optional)
+        lows: Low prices (optional)
+    """
+
+    dates: list[str]
+    closes: np.ndarray
+    opens: Optional[np.ndarray] = None
+    highs: Optional[np.ndarray] = None
+    lows: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_price_data(cls, price_data: PriceData) -> "PriceArrays":
+        """
+        Build arrays from a PriceData container.
+
+        Args:
+            price_data: Price data with list-based fields
+
+        Returns:
+            PriceArrays with float64 arrays for each available series
+        """
+        return cls(
+            dates=price_data.dates,
+            closes=as_price_array(price_data.closes),
+            opens=as_price_array(price_data.opens) if price_data.opens else None,
+            highs=as_price_array(price_data.highs) if price_data.highs else None,
+            lows=as_price_array(price_data.lows) if price_data.lows else None,
+        )
+
+    def __len__(self) -> int:
+        """Number of bars."""
+        return len(self.closes)
+
+
+# ============================================================================
+# Multi-window Table
+# ============================================================================
+
+EFFICIENCY_RATIOS: dict[str, float] = {
+    "close_to_close": 1.0,
+    "parkinson": 5.2,
+    "garman_klass": 7.4,
+    "yang_zhang": 8.0,
+}
+
+
+@dataclass
+class VolatilityTable:
+    """
+    Volatility for several estimators and lookback windows.
+
+    Values are stored as a (methods x windows) array. Cells are NaN when a
+    window has fewer than the configured minimum data points or the estimator
+    is undefined for the data (e.g. a negative Garman-Klass variance).
+
+    Attributes:
+        methods: Estimator names, one per row
+        windows: Lookback windows in days, one per column
+        values: Volatility per (method, window)
+        data_points: Bars actually used per window
+        start_dates: First date used per window
+        end_date: Last date in the series
+        annualized: Whether values are annualized
+    """
+
+    methods: tuple[str, ...]
+    windows: tuple[int, ...]
+    values: np.ndarray
+    data_points: tuple[int, ...]
+    start_dates: tuple[str, ...]
+    end_date: str
+    annualized: bool
+
+    def get(self, method: str, window: int) -> Optional[float]:
+        """
+        Look up a single volatility.
+
+        Args:
+            method: Estimator name
+            window: Lookback window in days
+
+        Returns:
+            Volatility as decimal, or None if not computed or not available
+        """
+        if method not in self.methods or window not in self.windows:
+            return None
+        value = self.values[self.methods.index(method), self.windows.index(window)]
+        return None if np.isnan(value) else float(value)
+
+    def __getitem__(self, key: tuple[str, int]) -> float:
+        """Return the volatility for (method, window), raising KeyError if unavailable."""
+        value = self.get(*key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def to_dict(self) -> dict[tuple[str, int], float]:
+        """Convert to a {(method, window): volatility} mapping of available cells."""
+        return {
+            (method, window): float(self.values[i, j])
+            for i, method in enumerate(self.methods)
+            for j, window in enumerate(self.windows)
+            if not np.isnan(self.values[i, j])
+        }
+
+    def to_result(self, method: str, window: int) -> VolatilityResult:
+        """
+        Expand one cell into a VolatilityResult.
+
+        Args:
+            method: Estimator name
+            window: Lookback window in days
+
+        Returns:
+            VolatilityResult for the cell
+
+        Raises:
+            KeyError: If the cell is not available
+        """
+        volatility = self[method, window]
+        j = self.windows.index(window)
+        return VolatilityResult(
+            volatility=volatility,
+            method=method,
+            window=window,
+            data_points=self.data_points[j],
+            start_date=self.start_dates[j],
+            end_date=self.end_date,
+            annualized=self.annualized,
+            metadata={"efficiency_ratio": EFFICIENCY_RATIOS[method], "source": "multi_window"},
+        )
+
+
+def _tail_sums(values: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Sum the last k elements of values for every k in counts using one prefix sum."""
+    prefix = np.concatenate(([0.0], np.cumsum(values)))
+    return prefix[-1] - prefix[len(values) - counts]
+
+
+# ============================================================================
+# Vectorized Calculator
+# ============================================================================
+
+
+class VectorizedVolatilityCalculator(VolatilityCalculator):
+    """
+    NumPy implementation of VolatilityCalculator.
+
+    Accepts lists or arrays wherever the base class accepts lists and returns
+    VolatilityResult objects that match the list implementation to floating
+    point rounding. Validation errors carry the same messages.
+    """
+
+    def _window_slice(self, n: int, window: int) -> slice:
+        """Return the slice selecting the trailing window of an n-length series."""
+        return slice(n - window, n) if n > window else slice(0, n)
+
+    def _check_min_points(self, n_points: int, include_count: bool = False) -> None:
+        """Raise ValueError if the window has too few data points."""
+        if n_points < self.config.min_data_points:
+            message = f"Insufficient data: need at least {self.config.min_data_points} points"
+            if include_count:
+                message += f", got {n_points}"
+            raise ValueError(message)
+
+    def _annualize(self, volatility: float, annualize: bool) -> float:
+        """Apply the √252 scaling when requested."""
+        if annualize:
+            return volatility * math.sqrt(self.config.annualization_factor)
+        return volatility
+
+    def _close_to_close_result(
+        self,
+        log_returns: np.ndarray,
+        window: int,
+        annualize: bool,
+        dates: Optional[list[str]],
+    ) -> VolatilityResult:
+        """Build a close-to-close result from precomputed log returns."""
+        n_prices = len(log_returns) + 1
+        mean_return = float(log_returns.mean())
+        deviations = log_returns - mean_return
+        variance = float(np.dot(deviations, deviations)) / (len(log_returns) - 1)
+        volatility = self._annualize(math.sqrt(variance), annualize)
+
+        return VolatilityResult(
+            volatility=volatility,
+            method="close_to_close",
+            window=window,
+            data_points=n_prices,
+            start_date=dates[-n_prices] if dates else "unknown",
+            end_date=dates[-1] if dates else "unknown",
+            annualized=annualize,
+            metadata={
+                "returns_count": len(log_returns),
+                "mean_return": mean_return,
+                "efficiency_ratio": 1.0,
+            },
+        )
+
+    def calculate_close_to_close(
+        self,
+        prices: ArrayLike,
+        window: Optional[int] = None,
+        annualize: bool = True,
+        dates: Optional[list[str]] = None,
+    ) -> VolatilityResult:
+        """
+        Calculate close-to-close realized volatility from an array.
+
+        See VolatilityCalculator.calculate_close_to_close for the formula.
+        """
+        window = window or self.config.short_window
+        closes = as_price_array(prices)
+        closes = closes[self._window_slice(len(closes), window)]
+        self._check_min_points(len(closes), include_count=True)
+
+        log_returns = np.log(closes[1:] / closes[:-1])
+        return self._close_to_close_result(log_returns, window, annualize, dates)
+
+    def calculate_parkinson(
+        self,
+        highs: ArrayLike,
+        lows: ArrayLike,
+        window: Optional[int] = None,
+        annualize: bool = True,
+        dates: Optional[list[str]] = None,
+    ) -> VolatilityResult:
+        """
+        Calculate Parkinson (high-low) volatility from arrays.
+
+        See VolatilityCalculator.calculate_parkinson for the formula.
+        """
+        window = window or self.config.short_window
+        highs_arr, lows_arr = self._hl_window(highs, lows, window)
+
+        log_hl = np.log(highs_arr / lows_arr)
+        n = len(highs_arr)
+        variance = float(np.dot(log_hl, log_hl)) / (4 * n * _LN2)
+        volatility = self._annualize(math.sqrt(variance), annualize)
+
+        return VolatilityResult(
+            volatility=volatility,
+            method="parkinson",
+            window=window,
+            data_points=n,
+            start_date=dates[-n] if dates else "unknown",
+            end_date=dates[-1] if dates else "unknown",
+            annualized=annualize,
+            metadata={"efficiency_ratio": 5.2, "uses_intraday": True},
+        )
+
+    def _hl_window(
+        self, highs: ArrayLike, lows: ArrayLike, window: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Validate lengths and return the trailing high/low window as arrays."""
+        if len(highs) != len(lows):
+            raise ValueError("highs and lows must have same length")
+
+        window_slice = self._window_slice(len(highs), window)
+        h = as_price_array(highs)[window_slice]
+        lo = as_price_array(lows)[window_slice]
+        self._check_min_points(len(h))
+
+        # Report the first offending bar, in the same order the list version checks
+        invalid = (h < lo) | (lo <= 0)
+        if invalid.any():
+            i = int(np.argmax(invalid))
+            if h[i] < lo[i]:
+                raise ValueError(f"High ({h[i]}) < Low ({lo[i]})")
+            raise ValueError("Prices must be positive")
+
+        return h, lo
+
+    def _ohlc_window(
+        self,
+        opens: ArrayLike,
+        highs: ArrayLike,
+        lows: ArrayLike,
+        closes: ArrayLike,
+        window: int,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Validate lengths and return the trailing OHLC window as arrays."""
+        if not (len(opens) == len(highs) == len(lows) == len(closes)):
+            raise ValueError("All OHLC arrays must have same length")
+
+        window_slice = self._window_slice(len(closes), window)
+        o = as_price_array(opens)[window_slice]
+        h = as_price_array(highs)[window_slice]
+        lo = as_price_array(lows)[window_slice]
+        c = as_price_array(closes)[window_slice]
+        self._check_min_points(len(c))
+
+        # Report the first offending bar, in the same order the list version checks
+        non_positive = (o <= 0) | (h <= 0) | (lo <= 0) | (c <= 0)
+        invalid = non_positive | (h < lo)
+        if invalid.any():
+            i = int(np.argmax(invalid))
+            if non_positive[i]:
+                raise ValueError("All prices must be positive")
+            raise ValueError(f"High ({h[i]}) < Low ({lo[i]})")
+
+        return o, h, lo, c
+
+    def calculate_garman_klass(
+        self,
+        opens: ArrayLike,
+        highs: ArrayLike,
+        lows: ArrayLike,
+        closes: ArrayLike,
+        window: Optional[int] = None,
+        annualize: bool = True,
+        dates: Optional[list[str]] = None,
+    ) -> VolatilityResult:
+        """
+        Calculate Garman-Klass volatility from arrays.
+
+        See VolatilityCalculator.calculate_garman_klass for the formula.
+        """
+        window = window or self.config.short_window
+        o, h, lo, c = self._ohlc_window(opens, highs, lows, closes, window)
+
+        log_hl = np.log(h / lo)
+        log_co = np.log(c / o)
+        n_points = len(c)
+        sum_gk = 0.5 * float(np.dot(log_hl, log_hl)) - (2 * _LN2 - 1) * float(
+            np.dot(log_co, log_co)
+        )
+        variance = sum_gk / n_points
+        volatility = self._annualize(math.sqrt(variance), annualize)
+
+        return VolatilityResult(
+            volatility=volatility,
+            method="garman_klass",
+            window=window,
+            data_points=n_points,
+            start_date=dates[-n_points] if dates else "unknown",
+            end_date=dates[-1] if dates else "unknown",
+            annualized=annualize,
+            metadata={"efficiency_ratio": 7.4, "uses_ohlc": True},
+        )
+
+    def calculate_yang_zhang(
+        self,
+        opens: ArrayLike,
+        highs: ArrayLike,
+        lows: ArrayLike,
+        closes: ArrayLike,
+        window: Optional[int] = None,
+        annualize: bool = True,
+        dates: Optional[list[str]] = None,
+    ) -> VolatilityResult:
+        """
+        Calculate Yang-Zhang volatility from arrays.
+
+        See VolatilityCalculator.calculate_yang_zhang for the formula.
+        """
+        window = window or self.config.short_window
+        o, h, lo, c = self._ohlc_window(opens, highs, lows, closes, window)
+        n_points = len(c)
+
+        overnight_returns = np.log(o[1:] / c[:-1])
+        oc_returns = np.log(c / o)
+        log_ho = np.log(h / o)
+        log_lo = np.log(lo / o)
+        log_hc = np.log(h / c)
+        log_lc = np.log(lo / c)
+        rs_sum = float(np.dot(log_ho, log_hc) + np.dot(log_lo, log_lc))
+
+        overnight_dev = overnight_returns - overnight_returns.mean()
+        oc_dev = oc_returns - oc_returns.mean()
+
+        sigma_o_sq = float(np.dot(overnight_dev, overnight_dev)) / (n_points - 1)
+        sigma_c_sq = float(np.dot(oc_dev, oc_dev)) / n_points
+        sigma_rs_sq = rs_sum / n_points
+
+        k = 0.34 / (1.34 + (n_points + 1) / (n_points - 1))
+
+        variance = sigma_o_sq + k * sigma_c_sq + (1 - k) * sigma_rs_sq
+        volatility = self._annualize(math.sqrt(variance), annualize)
+
+        return VolatilityResult(
+            volatility=volatility,
+            method="yang_zhang",
+            window=window,
+            data_points=n_points,
+            start_date=dates[-n_points] if dates else "unknown",
+            end_date=dates[-1] if dates else "unknown",
+            annualized=annualize,
+            metadata={
+                "efficiency_ratio": 8.0,
+                "handles_gaps": True,
+                "overnight_variance": sigma_o_sq,
+                "oc_variance": sigma_c_sq,
+                "rs_variance": sigma_rs_sq,
+                "k_parameter": k,
+            },
+        )
+
+    def calculate_blended(
+        self,
+        price_data: Union[PriceData, PriceArrays],
+        implied_volatility: float,
+        weights: Optional[BlendWeights] = None,
+    ) -> VolatilityResult:
+        """
+        Calculate blended volatility estimate from arrays.
+
+        Log returns for the long window are computed once and the short
+        window reuses their tail. See VolatilityCalculator.calculate_blended.
+        """
+        weights = weights or BlendWeights()
+        closes = as_price_array(price_data.closes)
+        short_window = self.config.short_window
+        long_window = self.config.long_window
+
+        short_count = min(len(closes), short_window)
+        self._check_min_points(short_count, include_count=True)
+
+        # long_window >= short_window, so the short returns are a tail view of these
+        long_closes = closes[self._window_slice(len(closes), long_window)]
+        long_returns = np.log(long_closes[1:] / long_closes[:-1])
+        short_returns = long_returns[len(long_returns) - (short_count - 1) :]
+
+        rv_short = self._close_to_close_result(
+            short_returns, short_window, True, price_data.dates
+        )
+        rv_long = self._close_to_close_result(long_returns, long_window, True, price_data.dates)
+
+        blended_vol = (
+            weights.realized_short * rv_short.volatility
+            + weights.realized_long * rv_long.volatility
+            + weights.implied * implied_volatility
+        )
+
+        return VolatilityResult(
+            volatility=blended_vol,
+            method="blended",
+            window=long_window,
+            data_points=len(closes),
+            start_date=price_data.dates[0] if price_data.dates else "unknown",
+            end_date=price_data.dates[-1] if price_data.dates else "unknown",
+            annualized=True,
+            metadata={
+                "rv_short": rv_short.volatility,
+                "rv_long": rv_long.volatility,
+                "implied_vol": implied_volatility,
+                "weights": {
+                    "realized_short": weights.realized_short,
+                    "realized_long": weights.realized_long,
+                    "implied": weights.implied,
+                },
+                "components": {
+                    "rv_short_contribution": weights.realized_short * rv_short.volatility,
+                    "rv_long_contribution": weights.realized_long * rv_long.volatility,
+                    "implied_contribution": weights.implied * implied_volatility,
+                },
+            },
+        )
+
+    def calculate_from_price_data(
+        self,
+        price_data: Union[PriceData, PriceArrays],
+        method: str = "close_to_close",
+        window: Optional[int] = None,
+        annualize: bool = True,
+    ) -> VolatilityResult:
+        """
+        Calculate volatility from PriceData or PriceArrays using the given method.
+
+        PriceData is converted to arrays once before dispatching. See
+        VolatilityCalculator.calculate_from_price_data for the supported methods.
+        """
+        if isinstance(price_data, PriceData):
+            price_data = PriceArrays.from_price_data(price_data)
+        method = method.lower()
+        has_ohlc = (
+            price_data.opens is not None
+            and price_data.highs is not None
+            and price_data.lows is not None
+        )
+
+        if method == "close_to_close":
+            return self.calculate_close_to_close(
+                prices=price_data.closes, window=window, annualize=annualize, dates=price_data.dates
+            )
+
+        elif method == "parkinson":
+            if price_data.highs is None or price_data.lows is None:
+                raise ValueError("Parkinson method requires high and low prices")
+            return self.calculate_parkinson(
+                highs=price_data.highs,
+                lows=price_data.lows,
+                window=window,
+                annualize=annualize,
+                dates=price_data.dates,
+            )
+
+        elif method == "garman_klass":
+            if not has_ohlc:
+                raise ValueError("Garman-Klass method requires OHLC prices")
+            return self.calculate_garman_klass(
+                opens=price_data.opens,
+                highs=price_data.highs,
+                lows=price_data.lows,
+                closes=price_data.closes,
+                window=window,
+                annualize=annualize,
+                dates=price_data.dates,
+            )
+
+        elif method == "yang_zhang":
+            if not has_ohlc:
+                raise ValueError("Yang-Zhang method requires OHLC prices")
+            return self.calculate_yang_zhang(
+                opens=price_data.opens,
+                highs=price_data.highs,
+                lows=price_data.lows,
+                closes=price_data.closes,
+                window=window,
+                annualize=annualize,
+                dates=price_data.dates,
+            )
+
+        else:
+            raise ValueError(
+                f"Unknown method: {method}. "
+                f"Choose from: close_to_close, parkinson, garman_klass, yang_zhang"
+            )
+
+    def calculate_multi_window(
+        self,
+        price_data: Union[PriceData, PriceArrays],
+        windows: Optional[Sequence[int]] = None,
+        methods: Optional[Sequence[str]] = None,
+        annualize: bool = True,
+    ) -> VolatilityTable:
+        """
+        Calculate several estimators over several trailing windows in one pass.
+
+        Per-bar terms (log returns, squared ranges, Rogers-Satchell products)
+        are computed once over the longest window and every window is read
+        from prefix sums, so the cost is O(n + windows) instead of one full
+        computation per (method, window).
+
+        Args:
+            price_data: Price data container or its array view
+            windows: Lookback windows in days (default: config short and long window)
+            methods: Estimators to compute (default: all the data supports)
+            annualize: Whether to annualize the results
+
+        Returns:
+            VolatilityTable keyed by (method, window)
+
+        Raises:
+            ValueError: If a method is unknown or requires data not available
+        """
+        arrays = (
+            PriceArrays.from_price_data(price_data)
+            if isinstance(price_data, PriceData)
+            else price_data
+        )
+        config = self.config
+        has_hl = arrays.highs is not None and arrays.lows is not None
+        has_ohlc = has_hl and arrays.opens is not None
+
+        windows = tuple(windows or (config.short_window, config.long_window))
+        if methods is None:
+            methods = ["close_to_close"]
+            if has_hl:
+                methods.append("parkinson")
+            if has_ohlc:
+                methods.extend(["garman_klass", "yang_zhang"])
+        methods = tuple(m.lower() for m in methods)
+
+        for method in methods:
+            if method not in EFFICIENCY_RATIOS:
+                raise ValueError(
+                    f"Unknown method: {method}. "
+                    f"Choose from: close_to_close, parkinson, garman_klass, yang_zhang"
+                )
+            if method == "parkinson" and not has_hl:
+                raise ValueError("Parkinson method requires high and low prices")
+            if method in ("garman_klass", "yang_zhang") and not has_ohlc:
+                raise ValueError("Garman-Klass and Yang-Zhang methods require OHLC prices")
+
+        n = len(arrays)
+        points = np.minimum(np.asarray(windows, dtype=np.int64), n)
+        span = int(points.max()) if len(points) else 0
+        tail = slice(n - span, n)
+        # Variance estimators divide by (points - 1) or (points - 2); below 3 bars they are undefined
+        valid = points >= max(config.min_data_points, 3)
+        p = points.astype(np.float64)
+        values = np.full((len(methods), len(windows)), np.nan)
+        scale = math.sqrt(config.annualization_factor) if annualize else 1.0
+
+        dates = arrays.dates
+        table = VolatilityTable(
+            methods=methods,
+            windows=windows,
+            values=values,
+            data_points=tuple(int(k) for k in points),
+            start_dates=tuple(dates[-int(k)] if dates and k else "unknown" for k in points),
+            end_date=dates[-1] if dates else "unknown",
+            annualized=annualize,
+        )
+        if not valid.any():
+            return table
+
+        closes = arrays.closes[tail]
+        if has_ohlc and any(m in ("garman_klass", "yang_zhang") for m in methods):
+            o, h, lo, c = self._ohlc_window(
+                arrays.opens[tail], arrays.highs[tail], arrays.lows[tail], closes, span
+            )
+        elif has_hl and "parkinson" in methods:
+            h, lo = self._hl_window(arrays.highs[tail], arrays.lows[tail], span)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for i, method in enumerate(methods):
+                if method == "close_to_close":
+                    returns = np.log(closes[1:] / closes[:-1])
+                    m = p - 1
+                    s1 = _tail_sums(returns, points - 1)
+                    s2 = _tail_sums(returns * returns, points - 1)
+                    variance = (s2 - s1 * s1 / m) / (m - 1)
+                elif method == "parkinson":
+                    log_hl = np.log(h / lo)
+                    variance = _tail_sums(log_hl * log_hl, points) / (4 * p * _LN2)
+                elif method == "garman_klass":
+                    log_hl = np.log(h / lo)
+                    log_co = np.log(c / o)
+                    terms = 0.5 * log_hl * log_hl - (2 * _LN2 - 1) * log_co * log_co
+                    variance = _tail_sums(terms, points) / p
+                else:
+                    overnight = np.log(o[1:] / c[:-1])
+                    oc = np.log(c / o)
+                    rs = np.log(h / o) * np.log(h / c) + np.log(lo / o) * np.log(lo / c)
+                    on_s1 = _tail_sums(overnight, points - 1)
+                    on_s2 = _tail_sums(overnight * overnight, points - 1)
+                    oc_s1 = _tail_sums(oc, points)
+                    oc_s2 = _tail_sums(oc * oc, points)
+                    sigma_o_sq = (on_s2 - on_s1 * on_s1 / (p - 1)) / (p - 1)
+                    sigma_c_sq = (oc_s2 - oc_s1 * oc_s1 / p) / p
+                    sigma_rs_sq = _tail_sums(rs, points) / p
+                    k = 0.34 / (1.34 + (p + 1) / (p - 1))
+                    variance = sigma_o_sq + k * sigma_c_sq + (1 - k) * sigma_rs_sq
+
+                values[i] = np.where(valid, np.sqrt(variance) * scale, np.nan)
+
+        return table
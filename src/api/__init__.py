@@ -1,5 +1,56 @@
 """API client base classes and utilities."""
 
+from .async_base_client import AsyncBaseAPIClient
 from .base_client import BaseAPIClient
+from .cache import (
+    Cache,
+    CacheBackend,
+    CacheNamespace,
+    CacheStats,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    persistent_cache,
+)
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    CircuitState,
+    shared_circuit_breakers,
+)
+from .rate_limiter import (
+    BucketStore,
+    MemoryBucketStore,
+    RateLimit,
+    RateLimiter,
+    RateLimiterMetrics,
+    SQLiteBucketStore,
+    shared_rate_limiter,
+)
+from .single_flight import SingleFlight, SingleFlightStats
 
-__all__ = ["BaseAPIClient"]
+__all__ = [
+    "AsyncBaseAPIClient",
+    "BaseAPIClient",
+    "BucketStore",
+    "Cache",
+    "CacheBackend",
+    "CacheNamespace",
+    "CacheStats",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitOpenError",
+    "CircuitState",
+    "MemoryBucketStore",
+    "MemoryCacheBackend",
+    "RateLimit",
+    "RateLimiter",
+    "RateLimiterMetrics",
+    "SQLiteBucketStore",
+    "SQLiteCacheBackend",
+    "SingleFlight",
+    "SingleFlightStats",
+    "persistent_cache",
+    "shared_circuit_breakers",
+    "shared_rate_limiter",
+]
@@ -0,0 +1,285 @@
+"""
+Async base API client with bounded concurrency.
+
+This module is the asyncio counterpart of base_client. It provides:
+- A shared httpx.AsyncClient with connection pooling
+- A limit on requests in flight at once
+- Retry logic with jittered exponential backoff, as in BaseAPIClient
+- Optional per-host circuit breaking (see circuit_breaker)
+- Optional client-side rate limiting (see rate_limiter)
+- Error handling and logging
+
+Requests fan out concurrently up to the in-flight limit, so fetching N
+resources takes roughly N / max_concurrency round trips instead of N.
+
+An instance is bound to the event loop it is first used in; create one
+per asyncio.run() and close it with aclose() (or use ``async with``).
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from src.constants import RETRY_MAX_DELAY_SECONDS
+
+from .circuit_breaker import CircuitState, decorrelated_jitter
+
+if TYPE_CHECKING:
+    from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+    from .rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Default number of requests in flight per client
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class AsyncBaseAPIClient:
+    """
+    Base class for asyncio API clients.
+
+    Subclasses should:
+    - Set BASE_URL class attribute
+    - Implement authentication if needed
+    - Override _handle_error_response() for custom error handling
+    - Add domain-specific async methods
+
+    Example:
+        class MyAsyncClient(AsyncBaseAPIClient):
+            BASE_URL = "https://api.example.com"
+
+            async def get_data(self, resource_id: str) -> dict[str, Any]:
+                response = await self.get(f"/data/{resource_id}")
+                return response.json()
+    """
+
+    BASE_URL: str = ""  # Subclasses must override this
+    RATE_LIMIT_KEY: str = ""  # Provider key for rate limiter budgets
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        timeout: float = 30,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+        circuit_breakers: Optional["CircuitBreakerRegistry"] = None,
+    ):
+        """
+        Initialize async base API client.
+
+        Args:
+            max_retries: Maximum number of retry attempts for transient errors
+            retry_delay: Base delay in seconds between retries (exponential backoff)
+            timeout: Request timeout in seconds
+            max_concurrency: Maximum number of requests in flight at once
+            transport: Optional httpx transport (e.g. httpx.MockTransport in tests)
+            rate_limiter: Optional limiter consulted before every request
+            circuit_breakers: Optional per-host breakers consulted before
+                              every request
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter
+        self.circuit_breakers = circuit_breakers
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.session = httpx.AsyncClient(
+            headers={
+                "Accept": "application/json",
+                "User-Agent": f"{self.__class__.__name__}/1.0",
+            },
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_concurrency),
+            transport=transport,
+        )
+
+        logger.info(f"{self.__class__.__name__} initialized (max_concurrency={max_concurrency})")
+
+    def _get_full_url(self, endpoint: str) -> str:
+        """
+        Construct full API URL from endpoint path.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/resource/123")
+
+        Returns:
+            Full URL with base URL
+        """
+        if not self.BASE_URL:
+            raise ValueError(f"{self.__class__.__name__} must set BASE_URL class attribute")
+
+        if not endpoint.startswith("/"):
+            endpoint = f"/{endpoint}"
+
+        return f"{self.BASE_URL.rstrip('/')}{endpoint}"
+
+    async def _make_request_with_retry(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        json_data: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Make HTTP request with jittered exponential backoff retry logic.
+
+        Each attempt checks the host's circuit breaker, waits for the rate
+        limiter, then holds one in-flight slot; rate limit and backoff
+        waits do not hold a slot. The reservation itself runs in a worker
+        thread so a locked bucket store does not stall the event loop.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Full request URL
+            params: Query parameters
+            json_data: JSON request body
+            headers: Additional request headers
+
+        Returns:
+            HTTP response object
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open (before or
+                              between attempts)
+            httpx.HTTPError: If all retry attempts fail
+        """
+        logger.debug(f"{method} {url}")
+        if params:
+            logger.debug(f"  Params: {params}")
+
+        breaker = self._circuit_breaker(url)
+        retry_count = 0
+        delay = self.retry_delay
+        while True:
+            if breaker is not None:
+                breaker.before_request()
+            if self.rate_limiter is not None:
+                # reserve() may block on the SQLite bucket store's file lock
+                wait = await asyncio.to_thread(
+                    self.rate_limiter.reserve, self.RATE_LIMIT_KEY, urlparse(url).path
+                )
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            try:
+                async with self._semaphore:
+                    response = await self.session.request(
+                        method, url, params=params, json=json_data, headers=headers
+                    )
+            except httpx.TimeoutException:
+                if breaker is not None:
+                    breaker.record_failure()
+                if retry_count >= self.max_retries:
+                    logger.error(f"Request timeout after {self.max_retries} retries")
+                    raise
+                reason = "Request timeout"
+            except httpx.TransportError as e:
+                if breaker is not None:
+                    breaker.record_failure()
+                if retry_count >= self.max_retries:
+                    logger.error(f"Network error after {self.max_retries} retries: {e}")
+                    raise
+                reason = f"Network error: {e}"
+            else:
+                if response.status_code < 500:
+                    if breaker is not None:
+                        breaker.record_success()
+                    logger.debug(f"Response: {response.status_code}")
+                    return response
+                if breaker is not None:
+                    breaker.record_failure()
+                if retry_count >= self.max_retries:
+                    logger.error(
+                        f"Server error ({response.status_code}) after {self.max_retries} retries"
+                    )
+                    # Let subclass handle the error
+                    self._handle_error_response(response)
+                    return response
+                reason = f"Server error ({response.status_code})"
+
+            delay = self._calculate_backoff_delay(delay)
+            logger.warning(
+                f"{reason}. Retrying in {delay:.2f}s "
+                f"(attempt {retry_count + 1}/{self.max_retries})"
+            )
+            await asyncio.sleep(delay)
+            retry_count += 1
+
+    def _circuit_breaker(self, url: str) -> Optional["CircuitBreaker"]:
+        """Breaker guarding a URL's host, or None without circuit_breakers."""
+        if self.circuit_breakers is None:
+            return None
+        return self.circuit_breakers.get(urlparse(url).netloc)
+
+    def circuit_state(self) -> CircuitState:
+        """State of the circuit guarding BASE_URL's host (see BaseAPIClient)."""
+        breaker = self._circuit_breaker(self.BASE_URL)
+        return breaker.state if breaker is not None else CircuitState.CLOSED
+
+    def _calculate_backoff_delay(self, previous_delay: float) -> float:
+        """
+        Calculate the next retry delay with decorrelated jitter.
+
+        Args:
+            previous_delay: Previous retry delay (retry_delay before the first)
+
+        Returns:
+            Delay in seconds, between retry_delay and RETRY_MAX_DELAY_SECONDS
+        """
+        return decorrelated_jitter(
+            self.retry_delay, previous_delay, max(self.retry_delay, RETRY_MAX_DELAY_SECONDS)
+        )
+
+    def _handle_error_response(self, response: httpx.Response) -> None:
+        """
+        Handle error responses from API.
+
+        Args:
+            response: HTTP response with error status code
+
+        Raises:
+            httpx.HTTPStatusError: For unhandled errors
+        """
+        response.raise_for_status()
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Make GET request.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            headers: Additional request headers
+
+        Returns:
+            HTTP response object
+        """
+        url = self._get_full_url(endpoint)
+        return await self._make_request_with_retry("GET", url, params=params, headers=headers)
+
+    async def aclose(self) -> None:
+        """Close the HTTP session and cleanup resources."""
+        await self.session.aclose()
+        logger.info(f"{self.__class__.__name__} closed")
+
+    async def __aenter__(self) -> "AsyncBaseAPIClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - ensures cleanup."""
+        await self.aclose()
@@ -3,10 +3,12 @@ Base API client with common HTTP functionality.
 
 This module provides a base class for API clients with shared functionality:
 - HTTP session management with connection pooling
-- Retry logic with exponential backoff
+- Retry logic with jittered exponential backoff
+- Optional per-host circuit breaking (see circuit_breaker)
 - Error handling and logging
 - Request/response logging
 - Timeout handling
+- Optional client-side rate limiting (see rate_limiter)
 
 All API clients (Schwab, Finnhub, etc.) should inherit from this base class
 to avoid code duplication and ensure consistent behavior.
@@ -14,10 +16,19 @@ to avoid code duplication and ensure consistent behavior.
 
 import logging
 import time
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from urllib.parse import urlparse
 
 import requests
 
+from src.constants import RETRY_MAX_DELAY_SECONDS
+
+from .circuit_breaker import CircuitState, decorrelated_jitter
+
+if TYPE_CHECKING:
+    from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+    from .rate_limiter import RateLimiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,12 +38,14 @@ class BaseAPIClient:
 
     This class provides:
     - Session management with connection pooling
-    - Automatic retry with exponential backoff
+    - Automatic retry with jittered exponential backoff
+    - Optional per-host circuit breaking
     - Consistent error handling and logging
     - Request timeout handling
 
     Subclasses should:
     - Set BASE_URL class attribute
+    - Set RATE_LIMIT_KEY to the provider's rate limiter budget key
     - Implement authentication if needed
     - Override _handle_error_response() for custom error handling
     - Add domain-specific methods
@@ -47,12 +60,15 @@ class BaseAPIClient:
     """
 
     BASE_URL: str = ""  # Subclasses must override this
+    RATE_LIMIT_KEY: str = ""  # Provider key for rate limiter budgets
 
     def __init__(
         self,
         max_retries: int = 3,
         retry_delay: float = 1.0,
         timeout: int = 30,
+        rate_limiter: Optional["RateLimiter"] = None,
+        circuit_breakers: Optional["CircuitBreakerRegistry"] = None,
     ):
         """
         Initialize base API client.
@@ -61,10 +77,15 @@ class BaseAPIClient:
             max_retries: Maximum number of retry attempts for transient errors
             retry_delay: Base delay in seconds between retries (exponential backoff)
             timeout: Request timeout in seconds
+            rate_limiter: Optional limiter consulted before every request
+            circuit_breakers: Optional per-host breakers consulted before
+                              every request
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.circuit_breakers = circuit_breakers
         self.session = requests.Session()
 
         # Set default headers
@@ -102,15 +123,16 @@ class BaseAPIClient:
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-        retry_count: int = 0,
     ) -> requests.Response:
         """
-        Make HTTP request with exponential backoff retry logic.
+        Make HTTP request with jittered exponential backoff retry logic.
 
         This method handles:
+        - Refusing requests while the host's circuit is open
+        - Waiting for the rate limiter before each attempt
         - Network errors (timeout, connection errors)
         - Transient server errors (5xx)
-        - Automatic retry with exponential backoff
+        - Automatic retry with decorrelated jitter backoff
 
         Args:
             method: HTTP method (GET, POST, etc.)
@@ -118,12 +140,13 @@ class BaseAPIClient:
             params: Query parameters
             json_data: JSON request body
             headers: Additional request headers
-            retry_count: Current retry attempt (for internal use)
 
         Returns:
             HTTP response object
 
         Raises:
+            CircuitOpenError: If the host's circuit is open (before or
+                              between attempts)
             requests.exceptions.RequestException: If all retry attempts fail
         """
         # Merge additional headers with session headers
@@ -136,81 +159,97 @@ class BaseAPIClient:
         if params:
             logger.debug(f"  Params: {params}")
 
-        try:
-            # Make request
-            response = self.session.request(
-                method,
-                url,
-                headers=request_headers,
-                params=params,
-                json=json_data,
-                timeout=self.timeout,
-            )
-
-            # Handle server errors with retry
-            if response.status_code >= 500:
-                if retry_count < self.max_retries:
-                    delay = self._calculate_backoff_delay(retry_count)
-                    logger.warning(
-                        f"Server error ({response.status_code}). "
-                        f"Retrying in {delay}s (attempt {retry_count + 1}/{self.max_retries})"
-                    )
-                    time.sleep(delay)
-                    return self._make_request_with_retry(
-                        method, url, params, json_data, headers, retry_count + 1
-                    )
-                else:
+        breaker = self._circuit_breaker(url)
+        retry_count = 0
+        delay = self.retry_delay
+        while True:
+            # Fail fast once the upstream is down, retries included
+            if breaker is not None:
+                breaker.before_request()
+
+            # Wait for budget before every attempt, retries included
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(self.RATE_LIMIT_KEY, urlparse(url).path)
+
+            try:
+                response = self.session.request(
+                    method,
+                    url,
+                    headers=request_headers,
+                    params=params,
+                    json=json_data,
+                    timeout=self.timeout,
+                )
+            except requests.exceptions.Timeout:
+                if breaker is not None:
+                    breaker.record_failure()
+                if retry_count >= self.max_retries:
+                    logger.error(f"Request timeout after {self.max_retries} retries")
+                    raise
+                reason = "Request timeout"
+            except requests.exceptions.RequestException as e:
+                if breaker is not None:
+                    breaker.record_failure()
+                if retry_count >= self.max_retries:
+                    logger.error(f"Network error after {self.max_retries} retries: {e}")
+                    raise
+                reason = f"Network error: {e}"
+            else:
+                if response.status_code < 500:
+                    if breaker is not None:
+                        breaker.record_success()
+                    logger.debug(f"Response: {response.status_code}")
+                    return response
+                if breaker is not None:
+                    breaker.record_failure()
+                if retry_count >= self.max_retries:
                     logger.error(
                         f"Server error ({response.status_code}) after {self.max_retries} retries"
                     )
                     # Let subclass handle the error
                     self._handle_error_response(response)
+                    return response
+                reason = f"Server error ({response.status_code})"
 
-            # Log response
-            logger.debug(f"Response: {response.status_code}")
-            return response
+            delay = self._calculate_backoff_delay(delay)
+            logger.warning(
+                f"{reason}. Retrying in {delay:.2f}s "
+                f"(attempt {retry_count + 1}/{self.max_retries})"
+            )
+            time.sleep(delay)
+            retry_count += 1
 
-        except requests.exceptions.Timeout:
-            if retry_count < self.max_retries:
-                delay = self._calculate_backoff_delay(retry_count)
-                logger.warning(
-                    f"Request timeout. Retrying in {delay}s "
-                    f"(attempt {retry_count + 1}/{self.max_retries})"
-                )
-                time.sleep(delay)
-                return self._make_request_with_retry(
-                    method, url, params, json_data, headers, retry_count + 1
-                )
-            else:
-                logger.error(f"Request timeout after {self.max_retries} retries")
-                raise
-
-        except (requests.exceptions.ConnectionError, requests.exceptions.RequestException) as e:
-            if retry_count < self.max_retries:
-                delay = self._calculate_backoff_delay(retry_count)
-                logger.warning(
-                    f"Network error: {e}. Retrying in {delay}s "
-                    f"(attempt {retry_count + 1}/{self.max_retries})"
-                )
-                time.sleep(delay)
-                return self._make_request_with_retry(
-                    method, url, params, json_data, headers, retry_count + 1
-                )
-            else:
-                logger.error(f"Network error after {self.max_retries} retries: {e}")
-                raise
+    def _circuit_breaker(self, url: str) -> Optional["CircuitBreaker"]:
+        """Breaker guarding a URL's host, or None without circuit_breakers."""
+        if self.circuit_breakers is None:
+            return None
+        return self.circuit_breakers.get(urlparse(url).netloc)
 
-    def _calculate_backoff_delay(self, retry_count: int) -> float:
+    def circuit_state(self) -> CircuitState:
         """
-        Calculate exponential backoff delay.
+        State of the circuit guarding BASE_URL's host.
+
+        Lets callers skip work up front while the upstream is down.
+
+        Returns:
+            CircuitState (always CLOSED without circuit_breakers)
+        """
+        breaker = self._circuit_breaker(self.BASE_URL)
+        return breaker.state if breaker is not None else CircuitState.CLOSED
+
+    def _calculate_backoff_delay(self, previous_delay: float) -> float:
+        """
+        Calculate the next retry delay with decorrelated jitter.
 
         Args:
-            retry_count: Current retry attempt number (0-indexed)
+            previous_delay: Previous retry delay (retry_delay before the first)
 
         Returns:
-            Delay in seconds
+            Delay in seconds, between retry_delay and RETRY_MAX_DELAY_SECONDS
         """
-        return self.retry_delay * (2 ** retry_count)
+        return decorrelated_jitter(
+            self.retry_delay, previous_delay, max(self.retry_delay, RETRY_MAX_DELAY_SECONDS)
+        )
 
     def _handle_error_response(self, response: requests.Response) -> None:
         """
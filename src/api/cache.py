@@ -0,0 +1,610 @@
+"""
+Bounded response cache for API clients.
+
+API clients and the data layers above them cache responses (quotes,
+option chains, price history, earnings dates) to save API calls. A Cache
+bounds them all: entries carry a per-namespace TTL, the backend holds at
+most ``max_entries`` entries and evicts the least recently used ones when
+full. Expired entries are dropped when read and before any live entry is
+evicted. The entry limit bounds a count, not bytes, so namespaces holding
+large values (option chains) also take a limit of their own.
+
+Each consumer takes a CacheNamespace with its own TTL and counters:
+
+    cache = Cache(MemoryCacheBackend(max_entries=2048))
+    quotes = cache.namespace("schwab_quote", ttl_seconds=300)
+    chains = cache.namespace("schwab_chain", ttl_seconds=900, max_entries=32)
+    quotes.store("AAPL", quote)
+    quotes.lookup("AAPL")  # quote, or None once stale
+    cache.stats()          # hits/misses/evictions/expirations per namespace
+
+Entries live in a CacheBackend:
+- MemoryCacheBackend: in-process, shared by threads
+- SQLiteCacheBackend: a local SQLite file, so entries survive restarts and
+  are shared by processes on the host (values are pickled; only point it
+  at files this user owns)
+
+persistent_cache() opens the on-disk cache the CLI and server share when
+WHEEL_PERSISTENT_CACHE is set (or the CLI runs with --persistent-cache), so
+back-to-back CLI commands start warm.
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from src.constants import CACHE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+# Separator between namespace and key in backend keys
+_NAMESPACE_SEPARATOR = "\x1f"
+
+# Backend entry: (value, stored_at, expires_at)
+Entry = tuple[Any, float, float]
+
+# Environment variable enabling the persistent cache, and one overriding its file
+PERSISTENT_CACHE_ENV = "WHEEL_PERSISTENT_CACHE"
+CACHE_DB_ENV = "WHEEL_CACHE_DB"
+DEFAULT_CACHE_DB = "~/.wheel_strategy/cache.db"
+
+
+class CacheBackend:
+    """Storage for cache entries. Subclasses must be safe to share between threads."""
+
+    def get(self, key: str) -> Optional[Entry]:
+        """
+        Look up an entry and mark it most recently used.
+
+        Args:
+            key: Backend key
+
+        Returns:
+            Entry, or None if missing
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, entry: Entry, now: float) -> list[str]:
+        """
+        Store an entry, dropping expired entries and then the least
+        recently used ones while over capacity.
+
+        Args:
+            key: Backend key
+            entry: Entry to store
+            now: Current time, for dropping expired entries
+
+        Returns:
+            Keys evicted by the capacity limit
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> bool:
+        """Delete an entry; returns whether it existed."""
+        raise NotImplementedError
+
+    def keys(self, prefix: str = "") -> list[str]:
+        """Keys starting with prefix, least recently used first."""
+        raise NotImplementedError
+
+    def clear(self, prefix: str = "") -> int:
+        """Delete entries whose key starts with prefix; returns the number deleted."""
+        raise NotImplementedError
+
+    def purge_expired(self, now: float) -> list[str]:
+        """Delete expired entries; returns their keys."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU entry store."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        """
+        Initialize the store.
+
+        Args:
+            max_entries: Maximum number of entries held
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Entry] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Entry, now: float) -> list[str]:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) <= self.max_entries:
+                return []
+            # Expired entries go before live ones are evicted
+            self._purge_expired_locked(now)
+            evicted = []
+            while len(self._entries) > self.max_entries:
+                evicted.append(self._entries.popitem(last=False)[0])
+            return evicted
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def keys(self, prefix: str = "") -> list[str]:
+        with self._lock:
+            return [k for k in self._entries if k.startswith(prefix)]
+
+    def clear(self, prefix: str = "") -> int:
+        with self._lock:
+            if not prefix:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            doomed = [k for k in self._entries if k.startswith(prefix)]
+            for k in doomed:
+                del self._entries[k]
+            return len(doomed)
+
+    def purge_expired(self, now: float) -> list[str]:
+        with self._lock:
+            return self._purge_expired_locked(now)
+
+    def _purge_expired_locked(self, now: float) -> list[str]:
+        expired = [k for k, (_, _, expires_at) in self._entries.items() if expires_at <= now]
+        for k in expired:
+            del self._entries[k]
+        return expired
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    LRU entry store in a SQLite file, shared by processes on one host.
+
+    Values are pickled. The file is created on first use.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: int = CACHE_MAX_ENTRIES,
+        timeout: float = 30.0,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            path: SQLite file path (~ is expanded)
+            max_entries: Maximum number of entries held
+            timeout: Seconds to wait for the file lock
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.path = Path(os.path.expanduser(str(path)))
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, stored_at REAL NOT NULL, "
+                "expires_at REAL NOT NULL, accessed INTEGER NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _next_access(conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT COALESCE(MAX(accessed), 0) + 1 FROM entries").fetchone()[0]
+
+    def get(self, key: str) -> Optional[Entry]:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT value, stored_at, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE entries SET accessed = ? WHERE key = ?",
+                    (self._next_access(conn), key),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if row is None:
+            return None
+        try:
+            return pickle.loads(row[0]), row[1], row[2]
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cache entry {key!r}: {e}")
+            self.delete(key)
+            return None
+
+    def set(self, key: str, entry: Entry, now: float) -> list[str]:
+        value, stored_at, expires_at = entry
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (key, blob, stored_at, expires_at, self._next_access(conn)),
+            )
+            evicted: list[str] = []
+            count = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            if count > self.max_entries:
+                conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+                count = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            if count > self.max_entries:
+                evicted = [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT key FROM entries ORDER BY accessed LIMIT ?",
+                        (count - self.max_entries,),
+                    )
+                ]
+                conn.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k in evicted])
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return evicted
+
+    def delete(self, key: str) -> bool:
+        cursor = self._connection().execute("DELETE FROM entries WHERE key = ?", (key,))
+        return cursor.rowcount > 0
+
+    def keys(self, prefix: str = "") -> list[str]:
+        rows = self._connection().execute(
+            "SELECT key FROM entries WHERE substr(key, 1, ?) = ? ORDER BY accessed",
+            (len(prefix), prefix),
+        )
+        return [row[0] for row in rows]
+
+    def clear(self, prefix: str = "") -> int:
+        cursor = self._connection().execute(
+            "DELETE FROM entries WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+        )
+        return cursor.rowcount
+
+    def purge_expired(self, now: float) -> list[str]:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            expired = [
+                row[0]
+                for row in conn.execute("SELECT key FROM entries WHERE expires_at <= ?", (now,))
+            ]
+            conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return expired
+
+    def size_bytes(self) -> int:
+        """Size of the SQLite file in bytes (0 if not created yet)."""
+        return self.path.stat().st_size if self.path.exists() else 0
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters for one namespace, in this process.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that found nothing fresh
+        evictions: Entries dropped to stay under the entry limit
+        expirations: Entries dropped because their TTL passed
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class Cache:
+    """
+    Bounded cache shared by namespaces.
+
+    Attributes:
+        backend: Entry storage
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Entry storage (default: MemoryCacheBackend())
+            clock: Wall-clock time source
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self._clock = clock
+        self._stats_lock = threading.Lock()
+        self._stats: dict[str, CacheStats] = {}
+
+    def namespace(
+        self, name: str, ttl_seconds: float, max_entries: Optional[int] = None
+    ) -> "CacheNamespace":
+        """
+        Get a namespace of this cache.
+
+        Args:
+            name: Namespace name (e.g. "schwab_quote")
+            ttl_seconds: Lifetime of entries stored through it
+            max_entries: Most entries the namespace may hold; its least
+                recently used entries are evicted beyond that (default:
+                only the backend's limit applies)
+
+        Returns:
+            CacheNamespace
+        """
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        with self._stats_lock:
+            self._stats.setdefault(name, CacheStats())
+        return CacheNamespace(self, name, ttl_seconds, max_entries)
+
+    def now(self) -> float:
+        """Current time on the cache's clock."""
+        return self._clock()
+
+    def record(self, namespace: str, **counts: int) -> None:
+        """Add to a namespace's counters."""
+        with self._stats_lock:
+            stats = self._stats.setdefault(namespace, CacheStats())
+            for field, count in counts.items():
+                setattr(stats, field, getattr(stats, field) + count)
+
+    def record_dropped(self, keys: list[str], field: str) -> None:
+        """Attribute evicted or expired backend keys to their namespaces."""
+        for key in keys:
+            self.record(key.split(_NAMESPACE_SEPARATOR, 1)[0], **{field: 1})
+
+    def purge_expired(self) -> int:
+        """
+        Drop every expired entry.
+
+        Returns:
+            Number of entries dropped
+        """
+        expired = self.backend.purge_expired(self.now())
+        self.record_dropped(expired, "expirations")
+        return len(expired)
+
+    def clear(self, namespace: Optional[str] = None) -> int:
+        """
+        Drop every entry, or every entry of one namespace.
+
+        Args:
+            namespace: Namespace to clear (default: all)
+
+        Returns:
+            Number of entries dropped
+        """
+        prefix = "" if namespace is None else f"{namespace}{_NAMESPACE_SEPARATOR}"
+        return self.backend.clear(prefix)
+
+    def entry_counts(self) -> dict[str, int]:
+        """
+        Number of entries held per namespace, across processes sharing the backend.
+
+        Returns:
+            Entry count by namespace
+        """
+        counts: dict[str, int] = {}
+        for key in self.backend.keys(prefix=""):
+            name = key.split(_NAMESPACE_SEPARATOR, 1)[0]
+            counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """
+        Snapshot of this process's counters.
+
+        Returns:
+            Counters (see CacheStats) by namespace
+        """
+        with self._stats_lock:
+            return {name: asdict(stats) for name, stats in self._stats.items()}
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+
+class CacheNamespace(MutableMapping):
+    """
+    A Cache's entries for one kind of data, with their own TTL.
+
+    lookup() and store() are the TTL-aware interface. The mapping
+    interface exposes raw ``(value, stored_at)`` entries by key, fresh or
+    not, for inspection and seeding.
+    """
+
+    def __init__(
+        self, cache: Cache, name: str, ttl_seconds: float, max_entries: Optional[int] = None
+    ):
+        self.cache = cache
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._prefix = f"{name}{_NAMESPACE_SEPARATOR}"
+
+    def lookup(self, key: str, max_age_seconds: Optional[float] = None) -> Optional[Any]:
+        """
+        Get a fresh value.
+
+        Args:
+            key: Key within the namespace
+            max_age_seconds: Stricter age limit than the TTL for this lookup
+
+        Returns:
+            Cached value, or None if missing or stale
+        """
+        entry = self.lookup_entry(key, max_age_seconds)
+        return None if entry is None else entry[0]
+
+    def lookup_entry(
+        self, key: str, max_age_seconds: Optional[float] = None
+    ) -> Optional[tuple[Any, float]]:
+        """
+        Get a fresh value with the time it was stored, reading the backend once.
+
+        Args:
+            key: Key within the namespace
+            max_age_seconds: Stricter age limit than the TTL for this lookup
+
+        Returns:
+            Tuple of (value, stored_at), or None if missing or stale
+        """
+        backend_key = self._prefix + key
+        entry = self.cache.backend.get(backend_key)
+        if entry is None:
+            self.cache.record(self.name, misses=1)
+            return None
+        value, stored_at, expires_at = entry
+        now = self.cache.now()
+        if expires_at <= now:
+            self.cache.backend.delete(backend_key)
+            self.cache.record(self.name, misses=1, expirations=1)
+            return None
+        if max_age_seconds is not None and now - stored_at >= max_age_seconds:
+            self.cache.record(self.name, misses=1)
+            return None
+        self.cache.record(self.name, hits=1)
+        return value, stored_at
+
+    def keys_with_prefix(self, prefix: str) -> list[str]:
+        """
+        Keys within the namespace that start with prefix, fresh or not.
+
+        Args:
+            prefix: Start of the keys (e.g. "AAPL_")
+
+        Returns:
+            Keys, least recently used first
+        """
+        start = len(self._prefix)
+        return [k[start:] for k in self.cache.backend.keys(self._prefix + prefix)]
+
+    def store(self, key: str, value: Any, stored_at: Optional[float] = None) -> None:
+        """
+        Store a value for the namespace's TTL.
+
+        Args:
+            key: Key within the namespace
+            value: Value to cache
+            stored_at: When the value was fetched (default: now)
+        """
+        now = self.cache.now()
+        stored_at = now if stored_at is None else stored_at
+        evicted = self.cache.backend.set(
+            self._prefix + key, (value, stored_at, stored_at + self.ttl_seconds), now
+        )
+        if self.max_entries is not None:
+            # Least recently used first
+            keys = self.cache.backend.keys(self._prefix)
+            evicted.extend(
+                k for k in keys[: len(keys) - self.max_entries] if self.cache.backend.delete(k)
+            )
+        if evicted:
+            self.cache.record_dropped(evicted, "evictions")
+
+    def __getitem__(self, key: str) -> tuple[Any, float]:
+        entry = self.cache.backend.get(self._prefix + key)
+        if entry is None:
+            raise KeyError(key)
+        return entry[0], entry[1]
+
+    def __setitem__(self, key: str, entry: tuple[Any, float]) -> None:
+        value, stored_at = entry
+        self.store(key, value, stored_at)
+
+    def __delitem__(self, key: str) -> None:
+        if not self.cache.backend.delete(self._prefix + key):
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        prefix_length = len(self._prefix)
+        return iter([k[prefix_length:] for k in self.cache.backend.keys(self._prefix)])
+
+    def __len__(self) -> int:
+        return len(self.cache.backend.keys(self._prefix))
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.cache.backend.get(self._prefix + key) is not None
+
+    def clear(self) -> None:
+        """Drop every entry in the namespace."""
+        self.cache.backend.clear(self._prefix)
+
+    def stats(self) -> dict[str, int]:
+        """This namespace's counters (see CacheStats)."""
+        return self.cache.stats().get(self.name, asdict(CacheStats()))
+
+
+def persistent_cache_path() -> Path:
+    """
+    File of the persistent cache.
+
+    Returns:
+        DEFAULT_CACHE_DB, or the WHEEL_CACHE_DB environment variable if set
+    """
+    return Path(os.path.expanduser(os.environ.get(CACHE_DB_ENV) or DEFAULT_CACHE_DB))
+
+
+def persistent_cache(path: Optional[Union[str, Path]] = None) -> Cache:
+    """
+    Cache backed by the host-wide SQLite file.
+
+    CLI runs and the server share its entries, so a command run shortly
+    after another finds quotes, chains, price history and earnings dates
+    already cached. Entries keep the TTLs of the namespaces storing them.
+
+    Args:
+        path: SQLite file (default: persistent_cache_path())
+
+    Returns:
+        Cache over a SQLiteCacheBackend
+    """
+    return Cache(SQLiteCacheBackend(path or persistent_cache_path()))
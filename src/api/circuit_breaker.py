@@ -0,0 +1,259 @@
+"""
+Per-host circuit breakers for degraded upstreams.
+
+Retries absorb the odd 5xx, but during an outage every request walks the
+whole retry ladder, so a scan of hundreds of symbols hangs for minutes
+while hammering the API. A CircuitBreaker watches consecutive failures
+per host and, once the upstream is clearly down, fails requests at once:
+
+- closed: requests flow; failure_threshold consecutive failures open it
+- open: requests fail fast with CircuitOpenError for recovery_timeout
+- half-open: one probe request goes through; success closes the
+  circuit, failure opens it again
+
+Failures are timeouts, connection errors and 5xx responses; any other
+response counts as success. Clients take a CircuitBreakerRegistry, which
+keeps one breaker per host, the same way they take a rate limiter:
+
+    breakers = shared_circuit_breakers()
+    client = SchwabClient(rate_limiter=shared_rate_limiter(), circuit_breakers=breakers)
+    if client.circuit_state() is CircuitState.OPEN:
+        ...  # skip the scan rather than fail every symbol
+"""
+
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable
+from enum import Enum
+from typing import Optional
+
+import requests
+
+from src.constants import CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_RECOVERY_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """
+    Request refused because the host's circuit is open.
+
+    Subclasses requests' ConnectionError so sync callers already handling
+    request failures treat it as one; async clients catch it explicitly.
+
+    Attributes:
+        host: Host whose circuit is open
+        retry_after: Seconds until a probe request will be let through
+    """
+
+    def __init__(self, host: str, retry_after: float):
+        super().__init__(
+            f"Circuit open for {host}: upstream failing, retry in {retry_after:.0f}s"
+        )
+        self.host = host
+        self.retry_after = retry_after
+
+
+def decorrelated_jitter(
+    base: float, previous: float, cap: float, rng: Callable[[float, float], float] = random.uniform
+) -> float:
+    """
+    Next retry delay with decorrelated jitter.
+
+    Delays grow roughly threefold per attempt but are spread at random, so
+    clients that failed together do not retry in lockstep.
+
+    Args:
+        base: Smallest delay in seconds
+        previous: Previous delay in seconds (base for the first retry)
+        cap: Largest delay in seconds
+        rng: Uniform random number source (for tests)
+
+    Returns:
+        Delay in seconds, between base and cap
+    """
+    return min(cap, rng(base, max(base, previous * 3)))
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for one host. Thread-safe."""
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = CIRCUIT_BREAKER_RECOVERY_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            host: Host the breaker guards (for messages)
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before a probe
+            clock: Monotonic time source (for tests)
+        """
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be at least 1, got {failure_threshold}")
+
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit past its timeout reads half-open."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> CircuitState:
+        """state without taking the lock."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.recovery_timeout
+        ):
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a probe through (0 if not open)."""
+        with self._lock:
+            if self._state is not CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self.recovery_timeout - (self._clock() - self._opened_at))
+
+    def before_request(self) -> None:
+        """
+        Admit a request, or refuse it while the circuit is open.
+
+        In half-open state only one probe is admitted at a time; a probe
+        that never reports back is replaced after recovery_timeout.
+
+        Raises:
+            CircuitOpenError: If the request must not be sent
+        """
+        with self._lock:
+            state = self._current_state()
+            if state is CircuitState.CLOSED:
+                return
+            now = self._clock()
+            if state is CircuitState.HALF_OPEN and (
+                self._probe_started is None
+                or now - self._probe_started >= self.recovery_timeout
+            ):
+                self._state = CircuitState.HALF_OPEN
+                self._probe_started = now
+                logger.info(f"Circuit half-open for {self.host}, probing upstream")
+                return
+            if state is CircuitState.OPEN:
+                retry_after = self.recovery_timeout - (now - self._opened_at)
+            else:
+                retry_after = self.recovery_timeout - (now - self._probe_started)
+        raise CircuitOpenError(self.host, max(0.0, retry_after))
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            if self._state is not CircuitState.CLOSED:
+                logger.info(f"Circuit closed for {self.host}, upstream recovered")
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._probe_started = None
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._state is CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state is not CircuitState.OPEN:
+                    logger.warning(
+                        f"Circuit open for {self.host} after {self._failures} failures; "
+                        f"failing fast for {self.recovery_timeout:.0f}s"
+                    )
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+                self._probe_started = None
+
+
+class CircuitBreakerRegistry:
+    """One CircuitBreaker per host, created on first use. Thread-safe."""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = CIRCUIT_BREAKER_RECOVERY_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit
+            recovery_timeout: Seconds a circuit stays open before a probe
+            clock: Monotonic time source (for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, host: str) -> CircuitBreaker:
+        """
+        Breaker for a host.
+
+        Args:
+            host: Network location, e.g. "api.schwabapi.com"
+
+        Returns:
+            The host's CircuitBreaker
+        """
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    host, self.failure_threshold, self.recovery_timeout, self._clock
+                )
+                self._breakers[host] = breaker
+            return breaker
+
+    def states(self) -> dict[str, CircuitState]:
+        """Current state of every host's breaker."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.host: breaker.state for breaker in breakers}
+
+
+_shared_breakers: Optional[CircuitBreakerRegistry] = None
+_shared_lock = threading.Lock()
+
+
+def shared_circuit_breakers() -> CircuitBreakerRegistry:
+    """
+    Process-wide circuit breaker registry.
+
+    Returns:
+        The shared CircuitBreakerRegistry
+    """
+    global _shared_breakers
+    with _shared_lock:
+        if _shared_breakers is None:
+            _shared_breakers = CircuitBreakerRegistry()
+        return _shared_breakers
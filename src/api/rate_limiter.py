@@ -0,0 +1,330 @@
+"""
+Client-side token bucket rate limiting for API clients.
+
+API clients consult a RateLimiter before every request instead of finding
+out about the provider's quota from a 429. Budgets are token buckets keyed
+by provider ("schwab") and optionally by endpoint path
+("schwab:/marketdata/v1/chains"); a request draws one token from every
+bucket that applies to it and waits for the slowest.
+
+Bucket state lives in a BucketStore:
+- MemoryBucketStore: shared by the threads of one process
+- SQLiteBucketStore: a small SQLite file shared by every process on the
+  host (scheduler workers, API requests and CLI runs using the same
+  credentials)
+
+Example:
+    limiter = RateLimiter(
+        {"schwab": RateLimit(120, 60), "schwab:/marketdata/v1/chains": RateLimit(30, 60)},
+        store=SQLiteBucketStore("~/.wheel_strategy/rate_limits.db"),
+    )
+    client = SchwabClient(rate_limiter=limiter)
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from src.constants import (
+    RATE_LIMIT_FINNHUB_CALLS_PER_MINUTE,
+    RATE_LIMIT_SCHWAB_CALLS_PER_MINUTE,
+)
+
+logger = logging.getLogger(__name__)
+
+# Environment variable overriding the shared limiter's SQLite file
+RATE_LIMIT_DB_ENV = "WHEEL_RATE_LIMIT_DB"
+DEFAULT_RATE_LIMIT_DB = "~/.wheel_strategy/rate_limits.db"
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    A token bucket budget.
+
+    Attributes:
+        calls: Requests allowed per period
+        period_seconds: Period length in seconds
+        burst: Bucket capacity (default: calls)
+    """
+
+    calls: int
+    period_seconds: float = 60.0
+    burst: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.calls <= 0 or self.period_seconds <= 0:
+            raise ValueError("Rate limit calls and period must be positive")
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+        return self.calls / self.period_seconds
+
+    @property
+    def capacity(self) -> float:
+        """Maximum tokens held."""
+        return float(self.burst if self.burst is not None else self.calls)
+
+
+def _take(tokens: float, updated: float, limit: RateLimit, now: float) -> tuple[float, float]:
+    """
+    Refill a bucket and reserve one token.
+
+    The balance may go negative: the caller is then owed a wait of
+    ``-tokens / rate`` seconds, and later callers queue behind it.
+
+    Returns:
+        Tuple of (new token balance, seconds to wait)
+    """
+    tokens = min(limit.capacity, tokens + max(0.0, now - updated) * limit.rate) - 1.0
+    wait = -tokens / limit.rate if tokens < 0 else 0.0
+    return tokens, wait
+
+
+class BucketStore:
+    """Storage for token bucket state. Subclasses must be safe to share."""
+
+    def reserve(self, key: str, limit: RateLimit, now: float) -> float:
+        """
+        Reserve one token from a bucket.
+
+        Args:
+            key: Bucket key
+            limit: Bucket budget
+            now: Current wall-clock time (seconds since epoch)
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        raise NotImplementedError
+
+
+class MemoryBucketStore(BucketStore):
+    """In-process bucket state shared by threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def reserve(self, key: str, limit: RateLimit, now: float) -> float:
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (limit.capacity, now))
+            tokens, wait = _take(tokens, updated, limit, now)
+            self._buckets[key] = (tokens, now)
+            return wait
+
+
+class SQLiteBucketStore(BucketStore):
+    """
+    Bucket state in a SQLite file, shared by processes on one host.
+
+    Each reservation is one IMMEDIATE transaction, so concurrent
+    processes serialize on the file lock. The file is created on first use.
+    """
+
+    def __init__(self, path: Union[str, Path], timeout: float = 30.0):
+        """
+        Initialize the store.
+
+        Args:
+            path: SQLite file path (~ is expanded)
+            timeout: Seconds to wait for the file lock
+        """
+        self.path = Path(os.path.expanduser(str(path)))
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets "
+                "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            self._local.conn = conn
+        return conn
+
+    def reserve(self, key: str, limit: RateLimit, now: float) -> float:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated FROM buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated = row if row else (limit.capacity, now)
+            # Another process's clock may be slightly ahead
+            tokens, wait = _take(tokens, min(updated, now), limit, now)
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                (key, tokens, max(updated, now)),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return wait
+
+
+@dataclass
+class RateLimiterMetrics:
+    """
+    Throttling counters for one bucket, in this process.
+
+    Attributes:
+        requests: Requests that drew a token
+        throttled: Requests that had to wait
+        total_wait_seconds: Sum of waits
+        max_wait_seconds: Longest single wait
+    """
+
+    requests: int = 0
+    throttled: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def record(self, wait: float) -> None:
+        self.requests += 1
+        if wait > 0:
+            self.throttled += 1
+            self.total_wait_seconds += wait
+            self.max_wait_seconds = max(self.max_wait_seconds, wait)
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter with per-provider and per-endpoint budgets.
+
+    Attributes:
+        limits: Budgets keyed by "provider" or "provider:/endpoint/path";
+                endpoint budgets apply to paths starting with the key's path
+        store: Bucket state storage
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, RateLimit],
+        store: Optional[BucketStore] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            limits: Budgets by bucket key
+            store: Bucket state storage (default: in-process MemoryBucketStore)
+            clock: Wall-clock time source (must agree across processes)
+            sleep: Sleep function used by acquire()
+        """
+        self.limits = dict(limits)
+        self.store = store or MemoryBucketStore()
+        self._clock = clock
+        self._sleep = sleep
+        self._metrics_lock = threading.Lock()
+        self._metrics: dict[str, RateLimiterMetrics] = {}
+
+    def buckets_for(self, provider: str, endpoint: Optional[str] = None) -> list[str]:
+        """
+        Bucket keys that apply to a request.
+
+        Args:
+            provider: Provider key (e.g. "schwab")
+            endpoint: Request path (e.g. "/marketdata/v1/chains")
+
+        Returns:
+            Matching bucket keys, provider first
+        """
+        keys = [provider] if provider in self.limits else []
+        if endpoint:
+            prefix = f"{provider}:"
+            keys.extend(
+                key
+                for key in self.limits
+                if key.startswith(prefix) and endpoint.startswith(key[len(prefix):])
+            )
+        return keys
+
+    def reserve(self, provider: str, endpoint: Optional[str] = None) -> float:
+        """
+        Reserve a token in every applicable bucket without blocking.
+
+        Args:
+            provider: Provider key
+            endpoint: Request path
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        now = self._clock()
+        wait = 0.0
+        for key in self.buckets_for(provider, endpoint):
+            key_wait = self.store.reserve(key, self.limits[key], now)
+            with self._metrics_lock:
+                self._metrics.setdefault(key, RateLimiterMetrics()).record(key_wait)
+            wait = max(wait, key_wait)
+        return wait
+
+    def acquire(self, provider: str, endpoint: Optional[str] = None) -> float:
+        """
+        Block until a request may be sent.
+
+        Args:
+            provider: Provider key
+            endpoint: Request path
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(provider, endpoint)
+        if wait > 0:
+            logger.debug(f"Rate limit: waiting {wait:.2f}s for {provider} {endpoint or ''}")
+            self._sleep(wait)
+        return wait
+
+    def metrics(self) -> dict[str, dict[str, float]]:
+        """
+        Snapshot of this process's throttling counters.
+
+        Returns:
+            Counters (see RateLimiterMetrics) by bucket key
+        """
+        with self._metrics_lock:
+            return {key: asdict(m) for key, m in self._metrics.items()}
+
+
+def default_rate_limits() -> dict[str, RateLimit]:
+    """Default per-provider budgets."""
+    return {
+        "schwab": RateLimit(RATE_LIMIT_SCHWAB_CALLS_PER_MINUTE, 60),
+        "finnhub": RateLimit(RATE_LIMIT_FINNHUB_CALLS_PER_MINUTE, 60),
+    }
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def shared_rate_limiter() -> RateLimiter:
+    """
+    Process-wide rate limiter backed by the host-wide SQLite store.
+
+    The file is DEFAULT_RATE_LIMIT_DB unless the WHEEL_RATE_LIMIT_DB
+    environment variable points elsewhere.
+
+    Returns:
+        The shared RateLimiter
+    """
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            path = os.environ.get(RATE_LIMIT_DB_ENV) or DEFAULT_RATE_LIMIT_DB
+            _shared_limiter = RateLimiter(default_rate_limits(), SQLiteBucketStore(path))
+        return _shared_limiter
@@ -0,0 +1,177 @@
+"""
+Single-flight coalescing of identical in-flight API calls.
+
+When scheduled tasks and requests miss the cache for the same data at the
+same moment, each would issue its own request. A SingleFlight lets the
+first caller for a key perform the fetch while concurrent callers for the
+same key wait for it; everyone gets the same result or the same exception.
+
+Calls are concurrent.futures.Future objects, so threads and asyncio tasks
+can join each other's calls:
+
+    flight = SingleFlight()
+    quote = flight.do("schwab_quote", "AAPL", lambda: fetch_quote("AAPL"))
+    chain = await flight.do_async("schwab_chain", key, lambda: fetch_chain_async(...))
+    flight.stats()  # executed/coalesced counts per namespace
+
+Callers that fetch many keys in one request (quote batches) use begin()
+and finish() directly: they lead the keys nobody else is fetching and wait
+for the rest.
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from typing import Any, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """
+    Counters for one namespace, in this process.
+
+    Attributes:
+        executed: Calls that performed the fetch
+        coalesced: Calls that waited for another caller's fetch instead
+    """
+
+    executed: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight:
+    """Registry of in-flight calls, keyed by namespace and key. Thread-safe."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[tuple[str, str], Future] = {}
+        self._stats: dict[str, SingleFlightStats] = {}
+
+    def begin(self, namespace: str, key: str) -> tuple[Future, bool]:
+        """
+        Join the in-flight call for a key, or start one.
+
+        The leader must call finish() with the outcome, also on failure,
+        or the callers waiting on it never return.
+
+        Args:
+            namespace: Kind of call (e.g. "schwab_quote")
+            key: Key within the namespace
+
+        Returns:
+            (call, leader): leader is True if the caller must perform the fetch
+        """
+        with self._lock:
+            stats = self._stats.setdefault(namespace, SingleFlightStats())
+            call = self._calls.get((namespace, key))
+            if call is not None:
+                stats.coalesced += 1
+                return call, False
+            call = Future()
+            self._calls[(namespace, key)] = call
+            stats.executed += 1
+            return call, True
+
+    def finish(
+        self,
+        namespace: str,
+        key: str,
+        call: Future,
+        value: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Publish a led call's outcome to its waiters.
+
+        Args:
+            namespace: Namespace passed to begin()
+            key: Key passed to begin()
+            call: Call returned by begin()
+            value: Result, if the fetch succeeded
+            error: Exception raised by the fetch, if it failed
+        """
+        with self._lock:
+            if self._calls.get((namespace, key)) is call:
+                del self._calls[(namespace, key)]
+        if error is not None:
+            call.set_exception(error)
+        else:
+            call.set_result(value)
+
+    def do(self, namespace: str, key: str, fn: Callable[[], T]) -> T:
+        """
+        Call fn(), unless a call for the key is in flight; then wait for its outcome.
+
+        Args:
+            namespace: Kind of call (e.g. "schwab_chain")
+            key: Key within the namespace
+            fn: Performs the fetch
+
+        Returns:
+            fn()'s result, from this call or the one joined
+
+        Raises:
+            Whatever fn() raised, in this call or the one joined
+        """
+        call, leader = self.begin(namespace, key)
+        if not leader:
+            logger.debug(f"Joining in-flight {namespace} {key}")
+            return call.result()
+        try:
+            value = fn()
+        except BaseException as e:
+            self.finish(namespace, key, call, error=e)
+            raise
+        self.finish(namespace, key, call, value=value)
+        return value
+
+    async def do_async(self, namespace: str, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await fn(), unless a call for the key is in flight; then await its outcome.
+
+        Same contract as do(). The joined call may be led by a thread or by
+        a task on any event loop.
+        """
+        call, leader = self.begin(namespace, key)
+        if not leader:
+            logger.debug(f"Joining in-flight {namespace} {key}")
+            return await self.wait_async(call)
+        try:
+            value = await fn()
+        except BaseException as e:
+            self.finish(namespace, key, call, error=e)
+            raise
+        self.finish(namespace, key, call, value=value)
+        return value
+
+    @staticmethod
+    async def wait_async(call: Future) -> Any:
+        """
+        Await a call's outcome without blocking the event loop.
+
+        Cancelling the waiting task does not cancel the call, which other
+        callers may be waiting on too.
+        """
+        return await asyncio.shield(asyncio.wrap_future(call))
+
+    def in_flight(self) -> int:
+        """Number of calls currently in flight."""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """
+        Snapshot of this process's counters.
+
+        Returns:
+            Counters (see SingleFlightStats) by namespace
+        """
+        with self._lock:
+            return {name: asdict(stats) for name, stats in self._stats.items()}
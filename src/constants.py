@@ -11,6 +11,10 @@ CACHE_TTL_OPTIONS_CHAIN_SECONDS = 900  # 15 minutes for options chains
 CACHE_TTL_PRICE_HISTORY_SECONDS = 86400  # 24 hours for historical price data
 CACHE_TTL_POSITION_STATUS_SECONDS = 300  # 5 minutes for position status
 
+# Maximum entries held by a response cache before LRU eviction
+CACHE_MAX_ENTRIES = 2048
+CACHE_MAX_CHAIN_ENTRIES = 32  # Option chains are large; cap them separately
+
 # Default lookback periods (in days)
 DEFAULT_LOOKBACK_DAYS_SHORT = 30  # Short-term analysis (1 month)
 DEFAULT_LOOKBACK_DAYS_MEDIUM = 60  # Medium-term analysis (2 months)
@@ -41,6 +45,29 @@ CALENDAR_DAYS_PER_YEAR = 365
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY_SECONDS = 1.0
 DEFAULT_REQUEST_TIMEOUT_SECONDS = 30
+RETRY_MAX_DELAY_SECONDS = 10.0  # Cap on one jittered retry delay
+
+# Account sync
+ACCOUNT_SYNC_MAX_AGE_SECONDS = 3600  # Refetch unchanged accounts after 1 hour
+
+# Candidate ranking
+RECOMMENDATION_TOP_K = 5  # Candidates kept per (symbol, direction, profile)
+
+# Watchlist scans
+SCAN_FETCH_WORKERS = 8  # Threads fetching market data (paced by the rate limiter)
+SCAN_SCORE_WORKERS = 4  # Threads scoring fetched chains
+SCAN_SYMBOL_TIMEOUT_SECONDS = 120.0  # Give up on a symbol this long after its fetch starts
+SCAN_WRITE_BATCH_SIZE = 500  # Opportunities inserted per transaction
+SCAN_FINGERPRINT_PRICE_BUCKET_PCT = 0.5  # Price moves below this don't trigger a rescan
+SCAN_FINGERPRINT_VOL_BUCKET = 0.01  # Volatility moves below 1 point don't trigger a rescan
+
+# Circuit breakers (per host)
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5  # Consecutive failures that open the circuit
+CIRCUIT_BREAKER_RECOVERY_SECONDS = 30.0  # Fail fast this long before probing again
+
+# Client-side rate limits (requests per minute, per host)
+RATE_LIMIT_SCHWAB_CALLS_PER_MINUTE = 120  # Schwab market data quota
+RATE_LIMIT_FINNHUB_CALLS_PER_MINUTE = 60  # Finnhub free tier
 
 # Date ranges for options screening
 MIN_DAYS_TO_EXPIRY = 7  # Don't trade options with less than 1 week
@@ -69,3 +96,6 @@ STRIKE_INCREMENTS = {
     (200, 500): 2.50,  # $200-$500: $2.50 increments
     (500, float('inf')): 5.00,  # Above $500: $5.00 increments
 }
+
+# Narrowed option-chain requests: strikes requested beyond the sigma envelope
+CHAIN_FETCH_STRIKE_PADDING = 2
@@ -5,6 +5,8 @@ This package contains modules for fetching external market data:
 - price_fetcher: Historical price data with caching
 - earnings_calendar: Earnings event calendar data
 - finnhub_client: Finnhub API client (legacy)
+- async_finnhub_client: Asyncio Finnhub client with bounded concurrency
+- chain_store: On-disk option chain snapshots
 
 All classes and functions are re-exported at the package level for convenience.
 """
@@ -23,6 +25,12 @@ from src.market_data.earnings_calendar import EarningsCalendar, EarningsEvent
 # Import from finnhub_client
 from src.market_data.finnhub_client import FinnhubAPIError, FinnhubClient
 
+# Import from async_finnhub_client
+from src.market_data.async_finnhub_client import AsyncFinnhubClient
+
+# Import from chain_store
+from src.market_data.chain_store import ChainSnapshot, ChainSnapshotStore
+
 __all__ = [
     # price_fetcher
     "CacheEntry",
@@ -35,4 +43,9 @@ __all__ = [
     # finnhub_client
     "FinnhubAPIError",
     "FinnhubClient",
+    # async_finnhub_client
+    "AsyncFinnhubClient",
+    # chain_store
+    "ChainSnapshot",
+    "ChainSnapshotStore",
 ]
@@ -0,0 +1,167 @@
+"""
+Asyncio Finnhub API client with bounded concurrency.
+
+Async counterpart of FinnhubClient for fanning out option chain requests.
+It shares FinnhubClient's symbol validation, status mapping and candle
+parser; at most ``max_concurrency`` requests are in flight at once.
+
+    async with AsyncFinnhubClient(config, max_concurrency=4) as client:
+        chains = await client.gather_chains(["AAPL", "F"])
+
+Keep max_concurrency low on the free tier (60 calls/minute).
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import httpx
+
+from src.analysis.volatility import PriceData
+from src.api.async_base_client import DEFAULT_MAX_CONCURRENCY, AsyncBaseAPIClient
+from src.api.circuit_breaker import CircuitOpenError
+from src.config import FinnhubConfig
+from src.market_data.finnhub_client import (
+    FinnhubAPIError,
+    FinnhubClient,
+    parse_candle_response,
+    raise_for_finnhub_status,
+    validate_symbol,
+)
+
+if TYPE_CHECKING:
+    from src.api.circuit_breaker import CircuitBreakerRegistry
+    from src.api.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFinnhubClient(AsyncBaseAPIClient):
+    """Asyncio client for the Finnhub option chain and candle endpoints."""
+
+    BASE_URL = FinnhubClient.BASE_URL
+    RATE_LIMIT_KEY = FinnhubClient.RATE_LIMIT_KEY
+
+    def __init__(
+        self,
+        config: FinnhubConfig,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+        circuit_breakers: Optional["CircuitBreakerRegistry"] = None,
+    ):
+        """
+        Initialize client with configuration.
+
+        Args:
+            config: FinnhubConfig instance with API credentials and settings
+            max_concurrency: Maximum number of requests in flight at once
+            transport: Optional httpx transport (e.g. httpx.MockTransport in tests)
+            rate_limiter: Optional limiter consulted before every request
+            circuit_breakers: Optional per-host breakers consulted before
+                              every request
+        """
+        super().__init__(
+            max_retries=config.max_retries,
+            retry_delay=config.retry_delay,
+            timeout=config.timeout,
+            max_concurrency=max_concurrency,
+            transport=transport,
+            rate_limiter=rate_limiter,
+            circuit_breakers=circuit_breakers,
+        )
+        self.config = config
+
+        if getattr(config, "base_url", None):
+            self.BASE_URL = config.base_url
+
+    async def get_option_chain(self, symbol: str) -> dict[str, Any]:
+        """
+        Retrieve options chain for a given symbol.
+
+        Args:
+            symbol: Stock ticker symbol (e.g., "F", "AAPL")
+
+        Returns:
+            API response as dictionary
+
+        Raises:
+            FinnhubAPIError: If API request fails
+            ValueError: If symbol is invalid
+        """
+        symbol = validate_symbol(symbol)
+        params = {"symbol": symbol, "token": self.config.api_key}
+
+        logger.info(f"Fetching options chain for {symbol}")
+
+        try:
+            response = await self.get("/stock/option-chain", params=params)
+            raise_for_finnhub_status(response.status_code)
+            response.raise_for_status()
+            return response.json()
+        except (httpx.HTTPError, CircuitOpenError) as e:
+            raise FinnhubAPIError(f"API request failed: {str(e)}") from e
+        except ValueError as e:
+            raise FinnhubAPIError(f"Invalid JSON response from API: {str(e)}") from e
+
+    async def gather_chains(
+        self, symbols: list[str]
+    ) -> dict[str, Union[dict[str, Any], Exception]]:
+        """
+        Fetch option chains for many symbols concurrently.
+
+        Args:
+            symbols: Stock ticker symbols (duplicates are ignored)
+
+        Returns:
+            Dict of symbol to API response, or the exception raised for it
+        """
+        unique = list(dict.fromkeys(symbols))
+        results = await asyncio.gather(
+            *(self.get_option_chain(symbol) for symbol in unique), return_exceptions=True
+        )
+        chains: dict[str, Union[dict[str, Any], Exception]] = {}
+        for symbol, result in zip(unique, results):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            chains[symbol] = result
+        return chains
+
+    async def get_candle_data(
+        self, symbol: str, lookback_days: int = 60, resolution: str = "D"
+    ) -> PriceData:
+        """
+        Fetch historical OHLC candle data for a symbol.
+
+        Same contract as FinnhubClient.get_candle_data() (premium endpoint).
+
+        Raises:
+            FinnhubAPIError: If API call fails (including 403 for free tier)
+            ValueError: If response is invalid or empty
+        """
+        symbol = symbol.upper()
+        end_date = datetime.now()
+        # Add extra days to account for weekends/holidays
+        start_date = end_date - timedelta(days=int(lookback_days * 1.5))
+        params = {
+            "symbol": symbol,
+            "resolution": resolution,
+            "from": int(start_date.timestamp()),
+            "to": int(end_date.timestamp()),
+            "token": self.config.api_key,
+        }
+
+        try:
+            response = await self.get("/stock/candle", params=params)
+            if response.status_code == 403:
+                raise FinnhubAPIError(
+                    f"Access forbidden for {symbol} candle data. "
+                    "This endpoint requires a paid Finnhub subscription."
+                )
+            response.raise_for_status()
+            data = response.json()
+        except (httpx.HTTPError, CircuitOpenError) as e:
+            raise FinnhubAPIError(f"Failed to fetch candle data: {e}") from e
+
+        return parse_candle_response(data, symbol, lookback_days)
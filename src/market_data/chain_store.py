@@ -0,0 +1,288 @@
+"""
+On-disk option chain snapshot store.
+
+Every chain written here is kept as an append-only columnar snapshot,
+partitioned by symbol and UTC date:
+
+    <root>/<SYMBOL>/<YYYY-MM-DD>/<HHMMSSffffff>.npy    column matrix
+    <root>/<SYMBOL>/<YYYY-MM-DD>/<HHMMSSffffff>.json   metadata
+
+The .npy file holds one float64 row per contract field (see
+chain_columns.NUMERIC_FIELDS) plus is_call, expiration code and IV source
+code rows, with contracts already in ColumnarChain order. Loading maps
+the file read-only, so the numeric columns of a historical chain are
+views into the page cache rather than copies. The metadata file is
+written last; snapshots without it are incomplete and are ignored.
+
+Example:
+    from src.market_data.chain_store import ChainSnapshotStore
+
+    store = ChainSnapshotStore("data/chains")
+    store.write(chain)
+    columns = store.load_columns(store.latest("SPY"))
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from src.models.base import OptionsChain
+from src.models.chain_columns import NUMERIC_FIELDS, ColumnarChain
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+# Extra matrix rows after NUMERIC_FIELDS
+_IS_CALL_ROW = len(NUMERIC_FIELDS)
+_EXPIRATION_ROW = _IS_CALL_ROW + 1
+_IV_SOURCE_ROW = _IS_CALL_ROW + 2
+_ROW_COUNT = _IV_SOURCE_ROW + 1
+
+_STAMP_FORMAT = "%H%M%S%f"
+
+
+def _write_sequence(path: Path) -> int:
+    """Disambiguating suffix of snapshots written in the same microsecond."""
+    _, _, sequence = path.stem.partition("-")
+    return int(sequence) if sequence else 0
+
+
+@dataclass(frozen=True)
+class ChainSnapshot:
+    """
+    A stored option chain snapshot.
+
+    Attributes:
+        symbol: Underlying stock ticker symbol
+        fetched_at: When the chain was written (UTC)
+        path: Path of the column matrix (.npy)
+    """
+
+    symbol: str
+    fetched_at: datetime
+    path: Path
+
+    @property
+    def meta_path(self) -> Path:
+        """Path of the metadata file."""
+        return self.path.with_suffix(".json")
+
+
+class ChainSnapshotStore:
+    """
+    Append-only local store of option chain snapshots.
+
+    Attributes:
+        root: Directory holding the symbol partitions
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory for snapshots (created on first write)
+        """
+        self.root = Path(root)
+
+    def _partition(self, symbol: str, day: str) -> Path:
+        return self.root / symbol.upper() / day
+
+    def write(
+        self,
+        chain: OptionsChain,
+        fetched_at: Optional[datetime] = None,
+        query: Optional[dict[str, Any]] = None,
+    ) -> ChainSnapshot:
+        """
+        Append a chain snapshot.
+
+        Args:
+            chain: Chain to store
+            fetched_at: Fetch time (default: now, UTC)
+            query: Optional request parameters the chain was fetched with
+
+        Returns:
+            The written ChainSnapshot
+        """
+        fetched_at = (fetched_at or datetime.now(timezone.utc)).astimezone(timezone.utc)
+        columns = chain.columns
+        n = len(columns)
+
+        sources = sorted({s for s in columns.iv_source.tolist() if s is not None})
+        source_code = {s: i for i, s in enumerate(sources)}
+        matrix = np.empty((_ROW_COUNT, n), dtype=np.float64)
+        for i, name in enumerate(NUMERIC_FIELDS):
+            matrix[i] = columns.columns[name]
+        matrix[_IS_CALL_ROW] = columns.is_call
+        matrix[_EXPIRATION_ROW] = columns.expiration_codes
+        matrix[_IV_SOURCE_ROW] = [source_code.get(s, -1) for s in columns.iv_source.tolist()]
+
+        partition = self._partition(chain.symbol, fetched_at.date().isoformat())
+        partition.mkdir(parents=True, exist_ok=True)
+        stem = fetched_at.strftime(_STAMP_FORMAT)
+        path = partition / f"{stem}.npy"
+        suffix = 1
+        while path.exists():
+            path = partition / f"{stem}-{suffix}.npy"
+            suffix += 1
+
+        meta = {
+            "version": FORMAT_VERSION,
+            "symbol": chain.symbol,
+            "fetched_at": fetched_at.isoformat(),
+            "retrieved_at": chain.retrieved_at,
+            "underlying_price": chain.underlying_price,
+            "contracts": n,
+            "fields": list(NUMERIC_FIELDS),
+            "expirations": columns.expirations,
+            "iv_sources": sources,
+            "query": query or {},
+        }
+
+        # Write to temporary names and rename, so readers never see partial files
+        tmp = path.with_suffix(".npy.tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, matrix)
+        os.replace(tmp, path)
+        snapshot = ChainSnapshot(symbol=chain.symbol.upper(), fetched_at=fetched_at, path=path)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(meta))
+        os.replace(tmp, snapshot.meta_path)
+
+        logger.debug(f"Stored {chain.symbol} chain snapshot ({n} contracts) at {path}")
+        return snapshot
+
+    def snapshots(self, symbol: str, day: Optional[str] = None) -> list[ChainSnapshot]:
+        """
+        List complete snapshots for a symbol, oldest first.
+
+        Args:
+            symbol: Underlying stock ticker symbol
+            day: Optional UTC date (YYYY-MM-DD) to restrict the listing
+
+        Returns:
+            List of ChainSnapshot
+        """
+        symbol_dir = self.root / symbol.upper()
+        if day is not None:
+            partitions = [symbol_dir / day]
+        elif symbol_dir.is_dir():
+            partitions = sorted(p for p in symbol_dir.iterdir() if p.is_dir())
+        else:
+            partitions = []
+
+        result = []
+        for partition in partitions:
+            if not partition.is_dir():
+                continue
+            for meta_path in sorted(partition.glob("*.json")):
+                path = meta_path.with_suffix(".npy")
+                if not path.exists():
+                    continue
+                stamp = meta_path.stem.split("-")[0]
+                fetched_at = datetime.strptime(
+                    f"{partition.name} {stamp}", f"%Y-%m-%d {_STAMP_FORMAT}"
+                ).replace(tzinfo=timezone.utc)
+                result.append(
+                    ChainSnapshot(symbol=symbol.upper(), fetched_at=fetched_at, path=path)
+                )
+        result.sort(key=lambda s: (s.fetched_at, _write_sequence(s.path)))
+        return result
+
+    def latest(self, symbol: str, as_of: Optional[datetime] = None) -> Optional[ChainSnapshot]:
+        """
+        Most recent snapshot at or before a time.
+
+        Args:
+            symbol: Underlying stock ticker symbol
+            as_of: Cutoff time (default: no cutoff); naive times are taken as UTC
+
+        Returns:
+            ChainSnapshot, or None if there is none
+        """
+        if as_of is not None and as_of.tzinfo is None:
+            as_of = as_of.replace(tzinfo=timezone.utc)
+        candidates = [
+            s for s in self.snapshots(symbol) if as_of is None or s.fetched_at <= as_of
+        ]
+        return candidates[-1] if candidates else None
+
+    def read_meta(self, snapshot: ChainSnapshot) -> dict[str, Any]:
+        """Read a snapshot's metadata."""
+        return json.loads(snapshot.meta_path.read_text())
+
+    def load_columns(self, snapshot: ChainSnapshot) -> ColumnarChain:
+        """
+        Load a snapshot as a ColumnarChain backed by a read-only memory map.
+
+        Args:
+            snapshot: Snapshot to load
+
+        Returns:
+            ColumnarChain whose numeric columns are views into the file
+        """
+        meta = self.read_meta(snapshot)
+        if meta.get("version") != FORMAT_VERSION or meta.get("fields") != list(NUMERIC_FIELDS):
+            raise ValueError(f"Unsupported chain snapshot format: {snapshot.path}")
+
+        # Zero-length arrays cannot be memory-mapped
+        matrix = np.load(snapshot.path, mmap_mode="r" if meta["contracts"] else None)
+        sources = [None, *meta["iv_sources"]]
+        return ColumnarChain(
+            symbol=meta["symbol"],
+            expirations=meta["expirations"],
+            expiration_codes=matrix[_EXPIRATION_ROW].astype(np.int64),
+            is_call=matrix[_IS_CALL_ROW].astype(bool),
+            columns={name: matrix[i] for i, name in enumerate(NUMERIC_FIELDS)},
+            iv_source=np.array(
+                [sources[int(code) + 1] for code in matrix[_IV_SOURCE_ROW]], dtype=object
+            ),
+            presorted=True,
+        )
+
+    def load(self, snapshot: ChainSnapshot) -> OptionsChain:
+        """
+        Load a snapshot as an OptionsChain.
+
+        Contracts are materialized from the mapped columns, ordered by type
+        (calls first), expiration and strike; the columns are attached to
+        the chain.
+
+        Args:
+            snapshot: Snapshot to load
+
+        Returns:
+            OptionsChain
+        """
+        meta = self.read_meta(snapshot)
+        columns = self.load_columns(snapshot)
+        chain = OptionsChain(
+            symbol=meta["symbol"],
+            contracts=[columns.contract(row) for row in range(len(columns))],
+            retrieved_at=meta["retrieved_at"],
+            underlying_price=meta["underlying_price"],
+        )
+        chain.attach_columns(columns)
+        return chain
+
+    def load_latest(self, symbol: str, as_of: Optional[datetime] = None) -> Optional[OptionsChain]:
+        """
+        Load the most recent chain at or before a time.
+
+        Args:
+            symbol: Underlying stock ticker symbol
+            as_of: Cutoff time (default: no cutoff)
+
+        Returns:
+            OptionsChain, or None if no snapshot exists
+        """
+        snapshot = self.latest(symbol, as_of)
+        return self.load(snapshot) if snapshot is not None else None
@@ -23,6 +23,8 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
+from src.api.cache import Cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -100,17 +102,22 @@ class EarningsCalendar:
         cache_ttl_hours: How long to cache earnings data
     """
 
-    def __init__(self, finnhub_client: Any, cache_ttl_hours: int = 24):
+    def __init__(
+        self, finnhub_client: Any, cache_ttl_hours: int = 24, cache: Optional[Cache] = None
+    ):
         """
         Initialize earnings calendar.
 
         Args:
             finnhub_client: FinnhubClient instance for API calls
             cache_ttl_hours: Cache time-to-live in hours (default 24)
+            cache: Optional shared Cache holding the entries (default: a private one)
         """
         self._client = finnhub_client
-        self._cache: dict[str, tuple[list[str], float]] = {}
         self._cache_ttl = cache_ttl_hours * 3600
+        self._cache = (cache if cache is not None else Cache()).namespace(
+            "earnings_dates", self._cache_ttl
+        )
 
     def get_earnings_dates(
         self, symbol: str, from_date: Optional[str] = None, to_date: Optional[str] = None
@@ -130,11 +137,10 @@ class EarningsCalendar:
 
         # Check cache
         cache_key = symbol
-        if cache_key in self._cache:
-            dates, cached_at = self._cache[cache_key]
-            if (datetime.now().timestamp() - cached_at) < self._cache_ttl:
-                logger.debug(f"Cache hit for {symbol} earnings dates")
-                return dates
+        dates = self._cache.lookup(cache_key)
+        if dates is not None:
+            logger.debug(f"Cache hit for {symbol} earnings dates")
+            return dates
 
         # Set default date range
         now = datetime.now()
@@ -147,7 +153,7 @@ class EarningsCalendar:
         try:
             earnings_dates = self._fetch_earnings_from_finnhub(symbol, from_date, to_date)
             # Cache the results
-            self._cache[cache_key] = (earnings_dates, datetime.now().timestamp())
+            self._cache.store(cache_key, earnings_dates)
             logger.info(f"Fetched {len(earnings_dates)} earnings dates for {symbol}")
             return earnings_dates
         except Exception as e:
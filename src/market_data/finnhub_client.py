@@ -16,7 +16,7 @@ for most symbols. Free tier will return 403 Forbidden error.
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any, Optional
 
 import requests
 
@@ -25,6 +25,10 @@ from src.config import FinnhubConfig
 from src.utils import validate_price_data
 from src.analysis.volatility import PriceData
 
+if TYPE_CHECKING:
+    from src.api.circuit_breaker import CircuitBreakerRegistry
+    from src.api.rate_limiter import RateLimiter
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -38,6 +42,131 @@ class FinnhubAPIError(Exception):
     pass
 
 
+def raise_for_finnhub_status(status_code: int) -> None:
+    """
+    Raise FinnhubAPIError for authentication and rate limit responses.
+
+    Shared by the sync and async clients.
+
+    Args:
+        status_code: HTTP status code
+
+    Raises:
+        FinnhubAPIError: For 401 and 429 responses
+    """
+    if status_code == 401:
+        raise FinnhubAPIError(
+            "Authentication failed. Check your API key. "
+            "Get a free API key at https://finnhub.io/register"
+        )
+    elif status_code == 429:
+        raise FinnhubAPIError(
+            "Rate limit exceeded. Finnhub free tier allows 60 calls/minute."
+        )
+
+
+def validate_symbol(symbol: str) -> str:
+    """
+    Validate and normalize a ticker symbol.
+
+    Raises:
+        ValueError: If symbol is invalid
+    """
+    if not symbol or not isinstance(symbol, str):
+        raise ValueError(f"Invalid symbol: {symbol}")
+
+    symbol = symbol.upper().strip()
+    if not symbol.isalnum():
+        raise ValueError(f"Symbol must be alphanumeric: {symbol}")
+    return symbol
+
+
+def parse_candle_response(
+    response: dict[str, Any], symbol: str, requested_days: int
+) -> PriceData:
+    """
+    Parse Finnhub candle response into PriceData.
+
+    Finnhub returns arrays:
+    - t: Unix timestamps
+    - o: Open prices
+    - h: High prices
+    - l: Low prices
+    - c: Close prices
+    - v: Volumes
+    - s: Status ("ok" or "no_data")
+
+    Args:
+        response: API response dictionary
+        symbol: Stock ticker symbol
+        requested_days: Number of days requested
+
+    Returns:
+        PriceData with parsed OHLC data
+
+    Raises:
+        ValueError: If response is invalid or empty
+    """
+    status = response.get("s")
+    if status == "no_data":
+        raise ValueError(f"No price data available for {symbol}")
+    elif status != "ok":
+        raise ValueError(f"Invalid response status: {status}")
+
+    timestamps = response.get("t", [])
+    opens = response.get("o", [])
+    highs = response.get("h", [])
+    lows = response.get("l", [])
+    closes = response.get("c", [])
+    volumes = response.get("v", [])
+
+    if not timestamps or not closes:
+        raise ValueError(f"Empty price data for {symbol}")
+
+    # Verify all arrays have same length
+    lengths = [len(timestamps), len(opens), len(highs), len(lows), len(closes)]
+    if len(set(lengths)) != 1:
+        raise ValueError(f"Inconsistent data array lengths: {lengths}")
+
+    # Convert timestamps to dates and filter to requested window
+    dates = []
+    filtered_opens = []
+    filtered_highs = []
+    filtered_lows = []
+    filtered_closes = []
+    filtered_volumes = []
+
+    # Take the most recent N days
+    n_points = min(len(timestamps), requested_days)
+    start_idx = len(timestamps) - n_points
+
+    for i in range(start_idx, len(timestamps)):
+        date_str = datetime.fromtimestamp(timestamps[i]).strftime("%Y-%m-%d")
+        dates.append(date_str)
+        filtered_opens.append(round(opens[i], 2))
+        filtered_highs.append(round(highs[i], 2))
+        filtered_lows.append(round(lows[i], 2))
+        filtered_closes.append(round(closes[i], 2))
+        if volumes:
+            filtered_volumes.append(int(volumes[i]))
+
+    logger.info(
+        f"Parsed {len(dates)} days of price data for {symbol} ({dates[0]} to {dates[-1]})"
+    )
+
+    # Validate data quality
+    validate_price_data(filtered_opens, filtered_highs, filtered_lows, filtered_closes, symbol)
+
+    return PriceData(
+        dates=dates,
+        opens=filtered_opens,
+        highs=filtered_highs,
+        lows=filtered_lows,
+        closes=filtered_closes,
+        volumes=filtered_volumes if filtered_volumes else None,
+    )
+
+
 class FinnhubClient(BaseAPIClient):
     """
     Client for interacting with Finnhub API.
@@ -52,19 +181,30 @@ class FinnhubClient(BaseAPIClient):
     """
 
     BASE_URL = "https://finnhub.io/api/v1"
-
-    def __init__(self, config: FinnhubConfig):
+    RATE_LIMIT_KEY = "finnhub"
+
+    def __init__(
+        self,
+        config: FinnhubConfig,
+        rate_limiter: Optional["RateLimiter"] = None,
+        circuit_breakers: Optional["CircuitBreakerRegistry"] = None,
+    ):
         """
         Initialize client with configuration.
 
         Args:
             config: FinnhubConfig instance with API credentials and settings
+            rate_limiter: Optional limiter consulted before every request
+            circuit_breakers: Optional per-host breakers consulted before
+                              every request
         """
         # Initialize base client with config settings
         super().__init__(
             max_retries=config.max_retries,
             retry_delay=config.retry_delay,
             timeout=config.timeout,
+            rate_limiter=rate_limiter,
+            circuit_breakers=circuit_breakers,
         )
         self.config = config
 
@@ -87,12 +227,7 @@ class FinnhubClient(BaseAPIClient):
             ValueError: If symbol is invalid
         """
         # Validate symbol
-        if not symbol or not isinstance(symbol, str):
-            raise ValueError(f"Invalid symbol: {symbol}")
-
-        symbol = symbol.upper().strip()
-        if not symbol.isalnum():
-            raise ValueError(f"Symbol must be alphanumeric: {symbol}")
+        symbol = validate_symbol(symbol)
 
         # Construct request
         endpoint = "/stock/option-chain"
@@ -105,15 +240,7 @@ class FinnhubClient(BaseAPIClient):
             response = self.get(endpoint, params=params)
 
             # Check HTTP status for Finnhub-specific errors
-            if response.status_code == 401:
-                raise FinnhubAPIError(
-                    "Authentication failed. Check your API key. "
-                    "Get a free API key at https://finnhub.io/register"
-                )
-            elif response.status_code == 429:
-                raise FinnhubAPIError(
-                    "Rate limit exceeded. Finnhub free tier allows 60 calls/minute."
-                )
+            raise_for_finnhub_status(response.status_code)
 
             response.raise_for_status()
 
@@ -195,87 +322,8 @@ class FinnhubClient(BaseAPIClient):
     def _parse_candle_response(
         self, response: dict[str, Any], symbol: str, requested_days: int
     ) -> PriceData:
-        """
-        Parse Finnhub candle response into PriceData.
-
-        Finnhub returns arrays:
-        - t: Unix timestamps
-        - o: Open prices
-        - h: High prices
-        - l: Low prices
-        - c: Close prices
-        - v: Volumes
-        - s: Status ("ok" or "no_data")
-
-        Args:
-            response: API response dictionary
-            symbol: Stock ticker symbol
-            requested_days: Number of days requested
-
-        Returns:
-            PriceData with parsed OHLC data
-
-        Raises:
-            ValueError: If response is invalid or empty
-        """
-        status = response.get("s")
-        if status == "no_data":
-            raise ValueError(f"No price data available for {symbol}")
-        elif status != "ok":
-            raise ValueError(f"Invalid response status: {status}")
-
-        timestamps = response.get("t", [])
-        opens = response.get("o", [])
-        highs = response.get("h", [])
-        lows = response.get("l", [])
-        closes = response.get("c", [])
-        volumes = response.get("v", [])
-
-        if not timestamps or not closes:
-            raise ValueError(f"Empty price data for {symbol}")
-
-        # Verify all arrays have same length
-        lengths = [len(timestamps), len(opens), len(highs), len(lows), len(closes)]
-        if len(set(lengths)) != 1:
-            raise ValueError(f"Inconsistent data array lengths: {lengths}")
-
-        # Convert timestamps to dates and filter to requested window
-        dates = []
-        filtered_opens = []
-        filtered_highs = []
-        filtered_lows = []
-        filtered_closes = []
-        filtered_volumes = []
-
-        # Take the most recent N days
-        n_points = min(len(timestamps), requested_days)
-        start_idx = len(timestamps) - n_points
-
-        for i in range(start_idx, len(timestamps)):
-            date_str = datetime.fromtimestamp(timestamps[i]).strftime("%Y-%m-%d")
-            dates.append(date_str)
-            filtered_opens.append(round(opens[i], 2))
-            filtered_highs.append(round(highs[i], 2))
-            filtered_lows.append(round(lows[i], 2))
-            filtered_closes.append(round(closes[i], 2))
-            if volumes:
-                filtered_volumes.append(int(volumes[i]))
-
-        logger.info(
-            f"Parsed {len(dates)} days of price data for {symbol} ({dates[0]} to {dates[-1]})"
-        )
-
-        # Validate data quality
-        validate_price_data(filtered_opens, filtered_highs, filtered_lows, filtered_closes, symbol)
-
-        return PriceData(
-            dates=dates,
-            opens=filtered_opens,
-            highs=filtered_highs,
-            lows=filtered_lows,
-            closes=filtered_closes,
-            volumes=filtered_volumes if filtered_volumes else None,
-        )
+        """Parse Finnhub candle response into PriceData (see parse_candle_response)."""
+        return parse_candle_response(response, symbol, requested_days)
 
     def get_earnings_calendar(self, symbol: str, from_date: str, to_date: str) -> list:
         """
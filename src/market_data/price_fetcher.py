@@ -33,6 +33,7 @@ import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Optional
 
+from src.api.cache import Cache
 from src.market_data.finnhub_client import FinnhubClient
 from src.analysis.volatility import PriceData
 
@@ -63,16 +64,25 @@ class CacheEntry:
 
 
 class PriceDataCache:
-    """Simple in-memory cache for price data."""
+    """Bounded cache for price data (a namespace of a shared Cache)."""
 
-    def __init__(self, max_age_seconds: int = 3600):
+    def __init__(
+        self,
+        max_age_seconds: int = 3600,
+        cache: Optional[Cache] = None,
+        namespace: str = "price_data",
+    ):
         """
         Initialize cache.
 
         Args:
             max_age_seconds: Maximum age of cached data in seconds (default: 1 hour)
+            cache: Optional shared Cache holding the entries (default: a private one)
+            namespace: Namespace within the shared Cache
         """
-        self._cache: dict[str, CacheEntry] = {}
+        self._cache = (cache if cache is not None else Cache()).namespace(
+            namespace, max_age_seconds
+        )
         self.max_age_seconds = max_age_seconds
         logger.debug(f"PriceDataCache initialized with max_age={max_age_seconds}s")
 
@@ -88,11 +98,11 @@ class PriceDataCache:
             PriceData if valid cache exists, None otherwise
         """
         cache_key = f"{symbol}:{lookback_days}"
-        entry = self._cache.get(cache_key)
+        data = self._cache.lookup(cache_key)
 
-        if entry and entry.is_valid(self.max_age_seconds):
+        if data is not None:
             logger.debug(f"Cache HIT for {cache_key}")
-            return entry.data
+            return data
 
         logger.debug(f"Cache MISS for {cache_key}")
         return None
@@ -107,9 +117,7 @@ class PriceDataCache:
             data: PriceData to cache
         """
         cache_key = f"{symbol}:{lookback_days}"
-        self._cache[cache_key] = CacheEntry(
-            data=data, timestamp=time.time(), symbol=symbol, lookback_days=lookback_days
-        )
+        self._cache.store(cache_key, data)
         logger.debug(f"Cached price data for {cache_key}")
 
     def clear(self) -> None:
@@ -121,7 +129,7 @@ class PriceDataCache:
         """Clear cached data for a specific symbol."""
         keys_to_remove = [k for k in self._cache if k.startswith(f"{symbol}:")]
         for key in keys_to_remove:
-            del self._cache[key]
+            self._cache.pop(key, None)
         logger.debug(f"Cleared cache for {symbol}")
 
 
@@ -1,6 +1,7 @@
 """Data models for options analysis."""
 
 from .base import OptionContract, OptionsChain
+from .chain_columns import ChainSlice, ColumnarChain
 from .ladder import (
     ALLOCATION_WEIGHTS,
     AllocationStrategy,
@@ -10,6 +11,7 @@ from .ladder import (
     WeeklyExpirationDay,
 )
 from .optimization import (
+    ProbabilityArrays,
     ProbabilityResult,
     ProfileStrikesResult,
     StrikeRecommendation,
@@ -18,6 +20,7 @@ from .optimization import (
 from .overlay import (
     BrokerChecklist,
     CandidateStrike,
+    ExecutionCostArrays,
     ExecutionCostEstimate,
     LLMMemoPayload,
     PortfolioHolding,
@@ -45,6 +48,8 @@ __all__ = [
     # Base
     "OptionContract",
     "OptionsChain",
+    "ColumnarChain",
+    "ChainSlice",
     # Profiles
     "StrikeProfile",
     "PROFILE_SIGMA_RANGES",
@@ -53,6 +58,7 @@ __all__ = [
     # Optimization
     "StrikeResult",
     "ProbabilityResult",
+    "ProbabilityArrays",
     "StrikeRecommendation",
     "ProfileStrikesResult",
     # Strategies
@@ -67,6 +73,7 @@ __all__ = [
     "RejectionDetail",
     "PortfolioHolding",
     "ScannerConfig",
+    "ExecutionCostArrays",
     "ExecutionCostEstimate",
     "CandidateStrike",
     "BrokerChecklist",
@@ -1,7 +1,12 @@
 """Base data models for options chain representation."""
 
-from dataclasses import asdict, dataclass
-from typing import Any, Optional
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .chain_columns import ChainSlice, ColumnarChain
 
 
 @dataclass
@@ -25,6 +30,8 @@ class OptionContract:
         vega: Rate of change of option price relative to volatility
         rho: Rate of change of option price relative to interest rate
         implied_volatility: Market's forecast of likely movement in stock price
+        iv_source: Where implied_volatility came from ("provider" or "solved"),
+            None if not yet classified
     """
 
     symbol: str
@@ -42,6 +49,7 @@ class OptionContract:
     vega: Optional[float] = None
     rho: Optional[float] = None
     implied_volatility: Optional[float] = None
+    iv_source: Optional[str] = None
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -99,15 +107,94 @@ class OptionsChain:
     """
     Represents a complete options chain for a ticker.
 
+    Lookups go through a columnar index (see columns) that is built on
+    first use, so repeated get_calls()/get_by_expiration() calls do not
+    rescan the contract list. Code that changes contracts in place must
+    call invalidate_columns() afterwards.
+
     Attributes:
         symbol: Stock ticker symbol
         contracts: List of all option contracts
         retrieved_at: ISO timestamp when data was retrieved
+        underlying_price: Underlying price reported with the chain (if available)
     """
 
     symbol: str
     contracts: list[OptionContract]
     retrieved_at: str
+    underlying_price: Optional[float] = None
+    _columns: Optional["ColumnarChain"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Bumped when contracts is replaced or invalidate_columns() is called
+    _contracts_version: int = field(default=0, init=False, repr=False, compare=False)
+    _columns_version: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Bump the contracts version when the contracts list is replaced."""
+        if name == "contracts":
+            object.__setattr__(self, "_contracts_version", self._contracts_version + 1)
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle without the columnar view; it is rebuilt on first use."""
+        state = self.__dict__.copy()
+        state.pop("_columns", None)
+        state.pop("_columns_version", None)
+        return state
+
+    @property
+    def columns(self) -> "ColumnarChain":
+        """
+        Columnar view of the contracts, indexed by (type, expiration).
+
+        Built lazily and cached per contracts version. It is rebuilt when
+        the contracts list is replaced; call invalidate_columns() after
+        adding, removing or modifying contracts in place.
+
+        Returns:
+            ColumnarChain over the contracts
+        """
+        if self._columns is None or self._columns_version != self._contracts_version:
+            from .chain_columns import ColumnarChain
+
+            self._columns = ColumnarChain.from_contracts(self.symbol, self.contracts)
+            self._columns_version = self._contracts_version
+        return self._columns
+
+    def attach_columns(self, columns: "ColumnarChain") -> None:
+        """
+        Use prebuilt columns instead of building them from the contracts.
+
+        Parsers that extract the column values while creating contracts
+        call this to skip the second pass. The columns must describe
+        self.contracts.
+
+        Args:
+            columns: ColumnarChain built over self.contracts
+        """
+        if len(columns) != len(self.contracts):
+            raise ValueError(
+                f"Columns have {len(columns)} rows but the chain has {len(self.contracts)} contracts"
+            )
+        self._columns = columns
+        self._columns_version = self._contracts_version
+
+    def invalidate_columns(self) -> None:
+        """Mark the contracts as changed so the columnar view is rebuilt on next use."""
+        self._contracts_version += 1
+        self._columns = None
+
+    def _in_chain_order(self, *slices: "ChainSlice") -> list[OptionContract]:
+        """Contracts covered by the slices, in their original list order."""
+        columns = self.columns
+        rows = np.sort(
+            np.concatenate(
+                [columns.source_index(slice(s.start, s.stop)) for s in slices]
+                or [np.empty(0, dtype=np.int64)]
+            )
+        )
+        return [self.contracts[i] for i in rows.tolist()]
 
     def get_calls(self) -> list[OptionContract]:
         """
@@ -116,7 +203,7 @@ class OptionsChain:
         Returns:
             List of call option contracts
         """
-        return [c for c in self.contracts if c.is_call]
+        return self._in_chain_order(self.columns.type_slice("call"))
 
     def get_puts(self) -> list[OptionContract]:
         """
@@ -125,7 +212,7 @@ class OptionsChain:
         Returns:
             List of put option contracts
         """
-        return [c for c in self.contracts if c.is_put]
+        return self._in_chain_order(self.columns.type_slice("put"))
 
     def get_by_expiration(self, date: str) -> list[OptionContract]:
         """
@@ -137,7 +224,21 @@ class OptionsChain:
         Returns:
             List of contracts expiring on the given date
         """
-        return [c for c in self.contracts if c.expiration_date == date]
+        columns = self.columns
+        return self._in_chain_order(columns.slice("call", date), columns.slice("put", date))
+
+    def get_contracts(self, option_type: str, expiration: str) -> list[OptionContract]:
+        """
+        Get contracts of one type and expiration, sorted by strike.
+
+        Args:
+            option_type: "call" or "put"
+            expiration: Expiration date in YYYY-MM-DD format
+
+        Returns:
+            List of matching contracts
+        """
+        return self.columns.slice(option_type, expiration).contracts()
 
     def get_expirations(self) -> list[str]:
         """
@@ -146,7 +247,7 @@ class OptionsChain:
         Returns:
             Sorted list of unique expiration dates
         """
-        return sorted({c.expiration_date for c in self.contracts})
+        return list(self.columns.expirations)
 
     def get_strikes(self, expiration: Optional[str] = None) -> list[float]:
         """
@@ -158,12 +259,15 @@ class OptionsChain:
         Returns:
             Sorted list of unique strike prices
         """
+        columns = self.columns
         if expiration:
-            contracts = self.get_by_expiration(expiration)
+            strikes = np.concatenate(
+                [columns.slice("call", expiration).strike, columns.slice("put", expiration).strike]
+            )
         else:
-            contracts = self.contracts
+            strikes = columns.columns["strike"]
 
-        return sorted({c.strike for c in contracts})
+        return np.unique(strikes).tolist()
 
     def to_dict(self) -> dict[str, Any]:
         """
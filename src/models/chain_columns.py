@@ -0,0 +1,380 @@
+"""
+Columnar options chain representation.
+
+ColumnarChain stores a chain as one NumPy array per contract field instead
+of a list of OptionContract objects. Rows are sorted by (type, expiration,
+strike), so every (type, expiration) group is a contiguous, strike-sorted
+block. A ChainSlice over one block exposes each field as a zero-copy view,
+and strike ranges within it are found with a binary search.
+
+OptionContract objects are only materialized on request, for the few
+contracts that survive filtering. When the columns were built from existing
+contracts, the original objects are returned instead of copies.
+
+Example:
+    from src.models.chain_columns import ColumnarChain
+
+    columns = ColumnarChain.from_contracts("SPY", contracts)
+    puts = columns.slice("put", "2026-03-20").strike_range(500.0, 560.0)
+    liquid = puts.strike[puts.bid > 0]
+"""
+
+from collections.abc import Iterator, Sequence
+from typing import Any, Optional
+
+import numpy as np
+
+from .base import OptionContract
+
+# Numeric OptionContract fields stored as float64 columns (NaN for None)
+NUMERIC_FIELDS = (
+    "strike",
+    "bid",
+    "ask",
+    "last",
+    "volume",
+    "open_interest",
+    "delta",
+    "gamma",
+    "theta",
+    "vega",
+    "rho",
+    "implied_volatility",
+)
+_INT_FIELDS = ("volume", "open_interest")
+
+
+def _normalize_type(option_type: str) -> bool:
+    """Map an option type name to is_call, rejecting anything else."""
+    kind = option_type.lower()
+    if kind not in ("call", "put"):
+        raise ValueError(f"option_type must be 'call' or 'put', got '{option_type}'")
+    return kind == "call"
+
+
+class ChainSlice:
+    """
+    Zero-copy view over a contiguous block of a ColumnarChain.
+
+    Numeric fields are available as attributes (strike, bid, ask, ...)
+    and are views into the chain's arrays; do not write to them.
+
+    Attributes:
+        chain: The ColumnarChain this slice views
+        start: First row of the slice
+        stop: One past the last row of the slice
+        option_type: "call" or "put"
+        expiration_date: Expiration of every row, or None if the slice
+            spans several expirations
+    """
+
+    def __init__(
+        self,
+        chain: "ColumnarChain",
+        start: int,
+        stop: int,
+        option_type: str,
+        expiration_date: Optional[str] = None,
+    ):
+        self.chain = chain
+        self.start = start
+        self.stop = stop
+        self.option_type = option_type
+        self.expiration_date = expiration_date
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        if name in NUMERIC_FIELDS:
+            return self.chain.columns[name][self.start : self.stop]
+        raise AttributeError(f"'ChainSlice' object has no attribute '{name}'")
+
+    @property
+    def rows(self) -> range:
+        """Chain row numbers covered by the slice."""
+        return range(self.start, self.stop)
+
+    @property
+    def expiration_codes(self) -> np.ndarray:
+        """Index into chain.expirations for each row."""
+        return self.chain.expiration_codes[self.start : self.stop]
+
+    def strike_range(
+        self, low: Optional[float] = None, high: Optional[float] = None
+    ) -> "ChainSlice":
+        """
+        Narrow to strikes in [low, high] with a binary search.
+
+        Only valid on single-expiration slices, whose strikes are sorted.
+
+        Args:
+            low: Lowest strike to keep (None for no lower bound)
+            high: Highest strike to keep (None for no upper bound)
+
+        Returns:
+            ChainSlice over the matching rows
+        """
+        if self.expiration_date is None:
+            raise ValueError("strike_range requires a single-expiration slice")
+        strikes = self.strike
+        lo = 0 if low is None else int(np.searchsorted(strikes, low, side="left"))
+        hi = len(strikes) if high is None else int(np.searchsorted(strikes, high, side="right"))
+        return ChainSlice(
+            self.chain, self.start + lo, self.start + max(lo, hi),
+            self.option_type, self.expiration_date,
+        )
+
+    def contract(self, i: int) -> OptionContract:
+        """Materialize the i-th contract of the slice."""
+        if not 0 <= i < len(self):
+            raise IndexError("ChainSlice index out of range")
+        return self.chain.contract(self.start + i)
+
+    def contracts(self) -> list[OptionContract]:
+        """Materialize every contract in the slice."""
+        return [self.chain.contract(row) for row in self.rows]
+
+    def __iter__(self) -> Iterator[OptionContract]:
+        return (self.chain.contract(row) for row in self.rows)
+
+    def __repr__(self) -> str:
+        return (
+            f"ChainSlice({self.chain.symbol} {self.option_type} "
+            f"{self.expiration_date or 'all'}: {len(self)} contracts)"
+        )
+
+
+class ColumnarChain:
+    """
+    Struct-of-arrays options chain indexed by (type, expiration).
+
+    Attributes:
+        symbol: Underlying stock ticker symbol
+        expirations: Sorted unique expiration dates
+        expiration_codes: Index into expirations per row
+        is_call: True for call rows
+        columns: Field name -> float64 array (NaN where the field is missing)
+        iv_source: IV source tag per row (object array)
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        expirations: list[str],
+        expiration_codes: np.ndarray,
+        is_call: np.ndarray,
+        columns: dict[str, np.ndarray],
+        iv_source: Optional[np.ndarray] = None,
+        source: Optional[Sequence[OptionContract]] = None,
+        source_rows: Optional[np.ndarray] = None,
+        presorted: bool = False,
+    ):
+        """
+        Build the chain from arrays, sorting rows and indexing groups.
+
+        Prefer from_contracts() or from_arrays(); this constructor expects
+        expiration_codes to index into a sorted expirations list.
+
+        Args:
+            symbol: Underlying stock ticker symbol
+            expirations: Sorted unique expiration dates
+            expiration_codes: Index into expirations per row
+            is_call: True for call rows
+            columns: Field name -> array aligned with is_call; must include strike
+            iv_source: Optional IV source tag per row
+            source: Optional contracts the rows were built from
+            source_rows: Position in source for each row (default: row order)
+            presorted: Rows are already in (type, expiration, strike) order;
+                float64 columns are then used as given, without copying
+                (e.g. memory-mapped snapshot arrays)
+        """
+        n = len(is_call)
+        if presorted:
+            order = np.arange(n)
+        else:
+            order = np.lexsort((columns["strike"], expiration_codes, ~is_call))
+
+        def arrange(values: Any, dtype: Any) -> np.ndarray:
+            values = np.asarray(values, dtype=dtype)
+            return values if presorted else np.ascontiguousarray(values[order])
+
+        self.symbol = symbol
+        self.expirations = expirations
+        self.expiration_codes = arrange(expiration_codes, np.int64)
+        self.is_call = arrange(is_call, bool)
+        self.columns = {
+            name: arrange(columns[name], np.float64) if name in columns else np.full(n, np.nan)
+            for name in NUMERIC_FIELDS
+        }
+        self.iv_source = (
+            arrange(iv_source, object)
+            if iv_source is not None
+            else np.full(n, None, dtype=object)
+        )
+        self._source = source
+        self._source_rows = (
+            np.asarray(source_rows)[order] if source_rows is not None else order
+        )
+        self._materialized: dict[int, OptionContract] = {}
+
+        # Group boundaries: calls first, then puts, each by expiration
+        group_key = (~self.is_call).astype(np.int64) * max(len(expirations), 1) + self.expiration_codes
+        starts = np.flatnonzero(np.diff(group_key, prepend=-1)) if n else np.array([], dtype=int)
+        stops = np.append(starts[1:], n)
+        self._groups: dict[tuple[bool, str], tuple[int, int]] = {}
+        for start, stop in zip(starts.tolist(), stops.tolist()):
+            key = (bool(self.is_call[start]), expirations[int(self.expiration_codes[start])])
+            self._groups[key] = (start, stop)
+        self._call_count = int(self.is_call.sum())
+
+    @classmethod
+    def from_contracts(
+        cls, symbol: str, contracts: Sequence[OptionContract]
+    ) -> "ColumnarChain":
+        """
+        Build columns from OptionContract objects.
+
+        The contracts are kept, so materializing a row returns the original
+        object. Columns are a snapshot; rebuild after mutating contracts.
+
+        Args:
+            symbol: Underlying stock ticker symbol
+            contracts: Contracts to index
+
+        Returns:
+            ColumnarChain over the contracts
+        """
+        expirations = sorted({c.expiration_date for c in contracts})
+        code = {exp: i for i, exp in enumerate(expirations)}
+        columns = {
+            name: np.array(
+                [getattr(c, name) for c in contracts], dtype=np.float64
+            ) if contracts else np.empty(0)
+            for name in NUMERIC_FIELDS
+        }
+        return cls(
+            symbol=symbol,
+            expirations=expirations,
+            expiration_codes=np.array(
+                [code[c.expiration_date] for c in contracts], dtype=np.int64
+            ),
+            is_call=np.array([c.is_call for c in contracts], dtype=bool),
+            columns=columns,
+            iv_source=np.array([c.iv_source for c in contracts], dtype=object),
+            source=contracts,
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        symbol: str,
+        expiration_dates: Sequence[str],
+        is_call: Any,
+        **columns: Any,
+    ) -> "ColumnarChain":
+        """
+        Build columns directly from per-field arrays, without contracts.
+
+        Contracts are materialized only when requested.
+
+        Args:
+            symbol: Underlying stock ticker symbol
+            expiration_dates: Expiration per row (YYYY-MM-DD)
+            is_call: True for call rows
+            **columns: Numeric fields (see NUMERIC_FIELDS); strike is required
+
+        Returns:
+            ColumnarChain over the rows
+        """
+        unknown = set(columns) - set(NUMERIC_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown contract fields: {sorted(unknown)}")
+        if "strike" not in columns:
+            raise ValueError("strike is required")
+        expirations, codes = np.unique(np.asarray(expiration_dates, dtype=str), return_inverse=True)
+        return cls(
+            symbol=symbol,
+            expirations=expirations.tolist(),
+            expiration_codes=codes.astype(np.int64),
+            is_call=np.asarray(is_call, dtype=bool),
+            columns={name: np.asarray(values, dtype=np.float64) for name, values in columns.items()},
+        )
+
+    def __len__(self) -> int:
+        return len(self.is_call)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays."""
+        return (
+            sum(a.nbytes for a in self.columns.values())
+            + self.expiration_codes.nbytes
+            + self.is_call.nbytes
+            + self.iv_source.nbytes
+        )
+
+    def type_slice(self, option_type: str) -> ChainSlice:
+        """All rows of one type, ordered by expiration then strike."""
+        if _normalize_type(option_type):
+            return ChainSlice(self, 0, self._call_count, "call")
+        return ChainSlice(self, self._call_count, len(self), "put")
+
+    def slice(self, option_type: str, expiration_date: str) -> ChainSlice:
+        """
+        Rows of one type and expiration, sorted by strike.
+
+        Returns an empty slice if the chain has no such contracts.
+        """
+        is_call = _normalize_type(option_type)
+        kind = "call" if is_call else "put"
+        start, stop = self._groups.get((is_call, expiration_date), (0, 0))
+        return ChainSlice(self, start, stop, kind, expiration_date)
+
+    def slices(self, option_type: str) -> list[ChainSlice]:
+        """One slice per expiration for a type, in expiration order."""
+        is_call = _normalize_type(option_type)
+        return [
+            self.slice(option_type, exp)
+            for exp in self.expirations
+            if (is_call, exp) in self._groups
+        ]
+
+    def source_index(self, rows: Any) -> np.ndarray:
+        """Position in the source contract list for the given rows."""
+        return self._source_rows[rows]
+
+    def contract(self, row: int) -> OptionContract:
+        """
+        Materialize the contract at a row.
+
+        Returns the original object when built from contracts; otherwise
+        builds an OptionContract once and caches it.
+        """
+        if self._source is not None:
+            return self._source[int(self._source_rows[row])]
+        cached = self._materialized.get(row)
+        if cached is None:
+            values: dict[str, Any] = {}
+            for name in NUMERIC_FIELDS:
+                value = float(self.columns[name][row])
+                if value != value:  # NaN marks a missing field
+                    value = None
+                elif name in _INT_FIELDS:
+                    value = int(value)
+                values[name] = value
+            cached = OptionContract(
+                symbol=self.symbol,
+                expiration_date=self.expirations[int(self.expiration_codes[row])],
+                option_type="Call" if self.is_call[row] else "Put",
+                iv_source=self.iv_source[row],
+                **values,
+            )
+            self._materialized[row] = cached
+        return cached
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnarChain({self.symbol}: {len(self)} contracts, "
+            f"{len(self.expirations)} expirations)"
+        )
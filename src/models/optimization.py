@@ -3,6 +3,8 @@
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
 
+import numpy as np
+
 if TYPE_CHECKING:
     from .base import OptionContract
     from .profiles import StrikeProfile
@@ -99,6 +101,38 @@ class ProbabilityResult:
         }
 
 
+@dataclass
+class ProbabilityArrays:
+    """
+    Assignment probabilities for many contracts at once.
+
+    Each array has one entry per contract, in input order. Entries with
+    invalid inputs (non-positive strike, price, volatility or DTE) are NaN.
+
+    Attributes:
+        probability: Probability of ITM at expiration (0-1)
+        d1: Black-Scholes d1 parameter
+        d2: Black-Scholes d2 parameter
+        delta: Option delta (negative for puts)
+        sigma_distance: Distance from current price in sigmas (positive = OTM)
+        time_to_expiry: Time to expiration in years
+        is_call: True for calls, False for puts
+        risk_free_rate: Risk-free interest rate used
+    """
+
+    probability: np.ndarray
+    d1: np.ndarray
+    d2: np.ndarray
+    delta: np.ndarray
+    sigma_distance: np.ndarray
+    time_to_expiry: np.ndarray
+    is_call: np.ndarray
+    risk_free_rate: float
+
+    def __len__(self) -> int:
+        return len(self.probability)
+
+
 @dataclass
 class StrikeRecommendation:
     """
@@ -1,9 +1,12 @@
 """Overlay scanner dataclasses."""
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Optional
 
+import numpy as np
+
 if TYPE_CHECKING:
     from .base import OptionContract
     from .profiles import DeltaBand
@@ -209,6 +212,31 @@ class ExecutionCostEstimate:
         }
 
 
+@dataclass
+class ExecutionCostArrays:
+    """
+    Estimated execution costs for many trades at once.
+
+    Array counterpart of ExecutionCostEstimate, one entry per trade.
+
+    Attributes:
+        gross_premium: Bid price x 100 x contracts
+        commission: Broker fees
+        slippage: Estimated slippage cost
+        net_credit: Gross premium - commission - slippage
+        net_credit_per_share: Net credit / (100 x contracts)
+    """
+
+    gross_premium: np.ndarray
+    commission: np.ndarray
+    slippage: np.ndarray
+    net_credit: np.ndarray
+    net_credit_per_share: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.net_credit)
+
+
 @dataclass
 class CandidateStrike:
     """
@@ -430,6 +458,9 @@ class ScanResult:
         llm_memo_payload: Payload for LLM memo generation
         warnings: General warnings
         error: Error message if scan failed
+
+    Rejected strikes other than the near-misses carry empty rejection_details
+    until resolve_rejections() builds them; to_dict() does so.
     """
 
     symbol: str
@@ -445,9 +476,46 @@ class ScanResult:
     llm_memo_payload: Optional[LLMMemoPayload] = None
     warnings: list[str] = field(default_factory=list)
     error: Optional[str] = None
+    _rejection_builder: Optional[
+        Callable[[CandidateStrike], tuple[list[RejectionDetail], Optional[RejectionDetail]]]
+    ] = field(default=None, init=False, repr=False, compare=False)
+
+    def defer_rejections(
+        self,
+        build: Callable[
+            [CandidateStrike], tuple[list[RejectionDetail], Optional[RejectionDetail]]
+        ],
+    ) -> None:
+        """
+        Build rejected strikes' details when resolve_rejections() asks for them.
+
+        A scan rejects most strikes of a chain but reports why for only a
+        few, so the scanner hands over a builder instead of detail objects.
+
+        Args:
+            build: Returns (rejection_details, binding_constraint) for a rejected strike
+        """
+        self._rejection_builder = build
+
+    def resolve_rejections(self, candidates: Optional[list[CandidateStrike]] = None) -> None:
+        """
+        Fill rejection_details and binding_constraint of rejected strikes.
+
+        Args:
+            candidates: Rejected strikes to resolve (default: all rejected strikes)
+        """
+        build = self._rejection_builder
+        if build is None:
+            return
+        for candidate in self.rejected_strikes if candidates is None else candidates:
+            if not candidate.rejection_details:
+                candidate.rejection_details, candidate.binding_constraint = build(candidate)
+        if candidates is None:
+            self._rejection_builder = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
+        self.resolve_rejections()
         return {
             "symbol": self.symbol,
             "current_price": round(self.current_price, 2),
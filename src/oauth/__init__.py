@@ -13,6 +13,7 @@ Public API:
     SchwabOAuthConfig: OAuth configuration management
     TokenData: Token data structure
     TokenStorage: File-based token persistence
+    TokenFileLock: Cross-process lock around token refresh and save
     TokenManager: Token lifecycle management
     OAuthCoordinator: High-level OAuth interface
 
@@ -39,7 +40,7 @@ from .exceptions import (
     TokenStorageError,
 )
 from .token_manager import TokenManager
-from .token_storage import TokenData, TokenStorage
+from .token_storage import TokenData, TokenFileLock, TokenStorage
 
 __all__ = [
     # Configuration
@@ -47,6 +48,7 @@ __all__ = [
     # Token Storage
     "TokenData",
     "TokenStorage",
+    "TokenFileLock",
     # Token Manager
     "TokenManager",
     # Authorization Server
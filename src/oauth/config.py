@@ -35,6 +35,9 @@ class SchwabOAuthConfig:
         ssl_cert_path: Path to SSL certificate (for HOST callback server)
         ssl_key_path: Path to SSL private key (for HOST callback server)
         refresh_buffer_seconds: Refresh tokens this many seconds before expiry
+        background_refresh_seconds: Background refresher renews tokens this many
+            seconds before expiry (at least refresh_buffer_seconds, at most a
+            token's lifetime less one poll interval)
     """
 
     # Required - from Schwab Dev Portal
@@ -59,6 +62,7 @@ class SchwabOAuthConfig:
 
     # Token refresh settings
     refresh_buffer_seconds: int = 300  # Refresh 5 min before expiry
+    background_refresh_seconds: int = 600  # Background refresh 10 min before expiry
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
@@ -78,6 +82,9 @@ class SchwabOAuthConfig:
         if self.refresh_buffer_seconds < 0:
             raise ConfigurationError("refresh_buffer_seconds cannot be negative")
 
+        if self.background_refresh_seconds < 0:
+            raise ConfigurationError("background_refresh_seconds cannot be negative")
+
     @property
     def callback_url(self) -> str:
         """
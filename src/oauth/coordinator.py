@@ -169,6 +169,19 @@ class OAuthCoordinator:
         """
         return self.token_manager.get_token_status()
 
+    def start_background_refresh(self) -> None:
+        """
+        Renew tokens in the background ahead of expiry.
+
+        Long-running processes (the API server) call this once so that
+        get_access_token() never waits on a refresh.
+        """
+        self.token_manager.start_background_refresh()
+
+    def stop_background_refresh(self) -> None:
+        """Stop the background token refresher."""
+        self.token_manager.stop_background_refresh()
+
     def revoke(self) -> None:
         """
         Revoke current authorization.
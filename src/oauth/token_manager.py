@@ -5,10 +5,16 @@ This module manages the OAuth token lifecycle including:
 - Token exchange (authorization code → access/refresh tokens)
 - Token refresh (refresh token → new access token)
 - Automatic refresh before expiry
+- Background refresh ahead of expiry, so API calls never wait on it
 - Token validation and status checks
+
+Refreshes hold the token storage lock, which other processes sharing the
+token file also take, and re-read the file first: if another process has
+already refreshed, its tokens are used instead of refreshing again.
 """
 
 import logging
+import threading
 import time
 from base64 import b64encode
 from datetime import datetime, timezone
@@ -17,11 +23,21 @@ from typing import Optional
 import requests
 
 from .config import SchwabOAuthConfig
-from .exceptions import TokenExchangeError, TokenNotAvailableError, TokenRefreshError
+from .exceptions import (
+    TokenExchangeError,
+    TokenNotAvailableError,
+    TokenRefreshError,
+    TokenStorageError,
+)
 from .token_storage import TokenData, TokenStorage
 
 logger = logging.getLogger(__name__)
 
+# Background refresher: longest sleep between token file checks, and the
+# wait before retrying a failed refresh
+BACKGROUND_REFRESH_POLL_SECONDS = 60.0
+BACKGROUND_REFRESH_RETRY_SECONDS = 30.0
+
 
 class TokenManager:
     """
@@ -32,6 +48,12 @@ class TokenManager:
     - Refresh access tokens before expiry
     - Provide valid access tokens to API clients
     - Track token status
+
+    Example:
+        manager = TokenManager(config)
+        manager.start_background_refresh()
+        token = manager.get_valid_access_token()  # never waits on a refresh
+        manager.stop_background_refresh()
     """
 
     def __init__(self, config: SchwabOAuthConfig, storage: Optional[TokenStorage] = None):
@@ -45,6 +67,12 @@ class TokenManager:
         self.config = config
         self.storage = storage or TokenStorage(config.token_file)
         self._cached_token: Optional[TokenData] = None
+        # Token file version _cached_token was read from or written to
+        self._token_signature: Optional[tuple[int, int, int]] = None
+        # Serializes expiry checks so threads sharing a client refresh once
+        self._refresh_lock = threading.Lock()
+        self._refresher: Optional[threading.Thread] = None
+        self._stop_refresher = threading.Event()
 
     def exchange_code_for_tokens(self, authorization_code: str) -> TokenData:
         """
@@ -105,8 +133,7 @@ class TokenManager:
             )
 
             # Save tokens
-            self.storage.save(token_data)
-            self._cached_token = token_data
+            self._store_token(token_data)
 
             logger.info("Successfully obtained and saved tokens")
             return token_data
@@ -125,6 +152,8 @@ class TokenManager:
         Refresh access token using refresh token.
 
         Implements exponential backoff retry logic for transient network errors.
+        Holds the storage lock throughout, so processes sharing the token
+        file never spend the same refresh token twice.
 
         Args:
             retry_count: Current retry attempt (used internally)
@@ -137,6 +166,11 @@ class TokenManager:
             TokenRefreshError: If refresh fails after all retries
             TokenNotAvailableError: If no refresh token available
         """
+        with self.storage.lock():
+            return self._refresh_tokens_locked(retry_count, max_retries)
+
+    def _refresh_tokens_locked(self, retry_count: int, max_retries: int) -> TokenData:
+        """refresh_tokens() body; the caller holds the storage lock."""
         current_token = self._get_current_token()
         if not current_token:
             raise TokenNotAvailableError(
@@ -182,7 +216,7 @@ class TokenManager:
                     delay = 2 ** retry_count  # Exponential backoff: 1s, 2s, 4s
                     logger.warning(f"Retrying after {delay}s due to server error")
                     time.sleep(delay)
-                    return self.refresh_tokens(retry_count + 1, max_retries)
+                    return self._refresh_tokens_locked(retry_count + 1, max_retries)
 
                 raise TokenRefreshError(
                     f"Token refresh failed after {max_retries + 1} attempts"
@@ -200,8 +234,7 @@ class TokenManager:
                 issued_at=datetime.now(timezone.utc).isoformat(),
             )
 
-            self.storage.save(token_data)
-            self._cached_token = token_data
+            self._store_token(token_data)
 
             logger.info("Successfully refreshed tokens")
             return token_data
@@ -232,11 +265,15 @@ class TokenManager:
         Get a valid access token, refreshing if necessary.
 
         This is the main method used by API clients. It automatically:
-        - Loads tokens from storage
+        - Loads tokens from storage (again whenever the file changes)
         - Checks expiry
         - Refreshes if needed
         - Returns valid access token
 
+        With the background refresher running, tokens are renewed before
+        they come within refresh_buffer_seconds of expiry, so this returns
+        without waiting on a refresh.
+
         Returns:
             Valid access token string
 
@@ -245,21 +282,107 @@ class TokenManager:
                                    (need to run authorization flow)
         """
         token = self._get_current_token()
+        if token and not token.expires_within(self.config.refresh_buffer_seconds):
+            return token.access_token
 
-        if not token:
-            raise TokenNotAvailableError(
-                "No tokens available. Run authorization flow first."
-            )
+        with self._refresh_lock:
+            token = self._refresh_if_expiring(self.config.refresh_buffer_seconds)
 
-        # Check if refresh needed (token expires soon or already expired)
-        if token.expires_within(self.config.refresh_buffer_seconds):
-            logger.info(
-                f"Token expires soon "
-                f"(within {self.config.refresh_buffer_seconds}s), refreshing..."
-            )
-            token = self.refresh_tokens()
+            if not token:
+                raise TokenNotAvailableError(
+                    "No tokens available. Run authorization flow first."
+                )
+
+            return token.access_token
+
+    def _refresh_if_expiring(self, buffer_seconds: int) -> Optional[TokenData]:
+        """
+        Refresh the token if it expires within buffer_seconds.
+
+        Re-reads the token file under the storage lock first, so a refresh
+        already made by another process is picked up instead of repeated.
 
-        return token.access_token
+        Returns:
+            Current (possibly refreshed) token, or None if there is none
+        """
+        with self.storage.lock():
+            token = self._get_current_token()
+            if token and token.expires_within(buffer_seconds):
+                logger.info(
+                    f"Token expires soon "
+                    f"(within {buffer_seconds}s), refreshing..."
+                )
+                token = self.refresh_tokens()
+            return token
+
+    def start_background_refresh(self) -> None:
+        """
+        Start renewing tokens in a daemon thread ahead of expiry.
+
+        The thread refreshes background_refresh_seconds before expiry and
+        retries failures every BACKGROUND_REFRESH_RETRY_SECONDS, until
+        stop_background_refresh(). Starting it twice is a no-op.
+        """
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        self._stop_refresher.clear()
+        self._refresher = threading.Thread(
+            target=self._background_refresh_loop, name="oauth-token-refresher", daemon=True
+        )
+        self._refresher.start()
+        logger.info("Background token refresh started")
+
+    def stop_background_refresh(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background refresher and wait for it to exit.
+
+        Args:
+            timeout: Longest wait for the thread in seconds (None: no limit)
+        """
+        refresher = self._refresher
+        if refresher is None:
+            return
+        self._stop_refresher.set()
+        refresher.join(timeout)
+        self._refresher = None
+        logger.info("Background token refresh stopped")
+
+    def _background_refresh_loop(self) -> None:
+        """Sleep until each token is due for renewal, then refresh it."""
+        lead = max(self.config.background_refresh_seconds, self.config.refresh_buffer_seconds)
+        while not self._stop_refresher.is_set():
+            try:
+                token = self._get_current_token()
+                if token is None:
+                    delay = BACKGROUND_REFRESH_POLL_SECONDS
+                else:
+                    # A lead as long as the token's lifetime would renew every new token at once
+                    token_lead = min(
+                        lead, max(token.expires_in - BACKGROUND_REFRESH_POLL_SECONDS, 0)
+                    )
+                    due_in = (
+                        token.expires_at - datetime.now(timezone.utc)
+                    ).total_seconds() - token_lead
+                    if due_in <= 0:
+                        with self._refresh_lock:
+                            self._refresh_if_expiring(token_lead)
+                        continue
+                    # Wake periodically to notice tokens refreshed by other processes
+                    delay = min(due_in, BACKGROUND_REFRESH_POLL_SECONDS)
+            except (TokenRefreshError, TokenNotAvailableError, TokenStorageError) as e:
+                logger.warning(
+                    f"Background token refresh failed, retrying in "
+                    f"{BACKGROUND_REFRESH_RETRY_SECONDS:.0f}s: {e}"
+                )
+                delay = BACKGROUND_REFRESH_RETRY_SECONDS
+            except Exception:
+                # Anything else must not end the thread; tokens would silently expire
+                logger.exception(
+                    f"Unexpected error in background token refresh, retrying in "
+                    f"{BACKGROUND_REFRESH_RETRY_SECONDS:.0f}s"
+                )
+                delay = BACKGROUND_REFRESH_RETRY_SECONDS
+            self._stop_refresher.wait(delay)
 
     def is_authorized(self) -> bool:
         """
@@ -309,17 +432,33 @@ class TokenManager:
         """
         self.storage.delete()
         self._cached_token = None
+        self._token_signature = None
         logger.info("Tokens revoked (local)")
 
     def _get_current_token(self) -> Optional[TokenData]:
         """
         Get current token from cache or storage.
 
+        The cache is reloaded when the token file changes on disk, e.g.
+        after another process refreshed the tokens. A deleted file keeps
+        the cached token.
+
         Returns:
             TokenData if available, None otherwise
         """
-        if self._cached_token:
+        signature = self.storage.signature()
+        if self._cached_token and (signature is None or signature == self._token_signature):
             return self._cached_token
 
-        self._cached_token = self.storage.load()
+        token = self.storage.load()
+        if token is not None or self._cached_token is None:
+            self._cached_token = token
+            self._token_signature = signature
         return self._cached_token
+
+    def _store_token(self, token_data: TokenData) -> None:
+        """Save tokens and cache them with the file version just written."""
+        with self.storage.lock():
+            self.storage.save(token_data)
+            self._cached_token = token_data
+            self._token_signature = self.storage.signature()
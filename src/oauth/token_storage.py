@@ -4,10 +4,17 @@ Token storage for Schwab OAuth integration.
 This module provides file-based token persistence with expiry tracking.
 Tokens are stored in plaintext JSON in the project directory for
 devcontainer compatibility (same path accessible to host and container).
+
+Several processes (server, scheduler, CLI runs) can share one token file.
+TokenFileLock serializes refreshes across them: a refresh token is single
+use, so two processes refreshing at once would invalidate each other.
 """
 
 import json
 import logging
+import os
+import tempfile
+import threading
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -15,6 +22,11 @@ from typing import Optional
 
 from .exceptions import TokenStorageError
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: the lock is per process only
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -105,6 +117,64 @@ class TokenData:
         return cls(**data)
 
 
+class TokenFileLock:
+    """
+    Reentrant lock on a token file, held across threads and processes.
+
+    Threads of one process serialize on an RLock; the outermost holder
+    also takes an exclusive flock on a sidecar ``<token_file>.lock`` file,
+    so other processes sharing the token file wait for it. Where fcntl is
+    unavailable only the in-process lock applies.
+
+    Example:
+        with storage.lock():
+            token = storage.load()
+            ...
+            storage.save(new_token)
+    """
+
+    def __init__(self, lock_file: Path):
+        """
+        Initialize the lock.
+
+        Args:
+            lock_file: Sidecar file to flock (created on first use)
+        """
+        self.lock_file = lock_file
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        """Block until this thread holds the lock."""
+        self._thread_lock.acquire()
+        if self._depth == 0 and fcntl is not None:
+            try:
+                fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o600)
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            except OSError as e:
+                self._thread_lock.release()
+                raise TokenStorageError(f"Failed to lock {self.lock_file}: {e}") from e
+            self._fd = fd
+        self._depth += 1
+
+    def release(self) -> None:
+        """Release one level of the lock."""
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+        self._thread_lock.release()
+
+    def __enter__(self) -> "TokenFileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+
 class TokenStorage:
     """
     File-based token storage (plaintext JSON).
@@ -127,6 +197,30 @@ class TokenStorage:
         """
         self.token_file = Path(token_file)
         self._ensure_directory()
+        self._lock = TokenFileLock(self.token_file.with_name(self.token_file.name + ".lock"))
+
+    def lock(self) -> TokenFileLock:
+        """
+        Lock held around a load-refresh-save sequence.
+
+        Returns:
+            The storage's TokenFileLock (use as a context manager)
+        """
+        return self._lock
+
+    def signature(self) -> Optional[tuple[int, int, int]]:
+        """
+        Identify the token file's current version.
+
+        Returns:
+            (inode, mtime_ns, size) of the file, or None if it does not
+            exist. save() replaces the file, so every save changes the inode.
+        """
+        try:
+            stat = self.token_file.stat()
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
 
     def _ensure_directory(self) -> None:
         """Create parent directory if needed."""
@@ -147,23 +241,36 @@ class TokenStorage:
         Writes tokens as JSON with secure permissions (chmod 600).
         File is accessible to both host and container contexts.
 
+        The file is written under the storage lock and replaced atomically,
+        so readers in other processes never see a partial file.
+
         Args:
             token_data: Token data to save
 
         Raises:
             TokenStorageError: If save operation fails
         """
-        try:
-            with open(self.token_file, "w") as f:
-                json.dump(token_data.to_dict(), f, indent=2)
-
-            # Set secure permissions after writing
-            self._set_secure_permissions()
-
-            logger.info(f"Tokens saved to {self.token_file}")
-        except (IOError, OSError) as e:
-            logger.error(f"Failed to save tokens: {e}")
-            raise TokenStorageError(f"Failed to save tokens: {e}") from e
+        with self._lock:
+            tmp_path = None
+            try:
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self.token_file.parent, prefix=f".{self.token_file.name}."
+                )
+                with os.fdopen(fd, "w") as f:
+                    json.dump(token_data.to_dict(), f, indent=2)
+                os.replace(tmp_path, self.token_file)
+                tmp_path = None
+
+                # Set secure permissions after writing
+                self._set_secure_permissions()
+
+                logger.info(f"Tokens saved to {self.token_file}")
+            except (IOError, OSError) as e:
+                logger.error(f"Failed to save tokens: {e}")
+                raise TokenStorageError(f"Failed to save tokens: {e}") from e
+            finally:
+                if tmp_path is not None:
+                    Path(tmp_path).unlink(missing_ok=True)
 
     def load(self) -> Optional[TokenData]:
         """
@@ -2,11 +2,15 @@
 
 import logging
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from .finnhub_client import FinnhubClient
 from .schwab.client import SchwabClient
 from .models import OptionContract, OptionsChain
+from .strategies.iv_solver import ChainIVSummary, ImpliedVolatilitySolver
+
+if TYPE_CHECKING:
+    from .market_data.chain_store import ChainSnapshotStore
 
 logger = logging.getLogger(__name__)
 
@@ -26,23 +30,43 @@ class OptionsChainService:
 
     Schwab is the primary provider. Finnhub support is deprecated and
     will be removed in a future version.
+
+    Contracts with missing or invalid provider IV (Schwab reports -999 on
+    illiquid strikes) get IV solved from their bid/ask mid whenever the
+    underlying price is known.
+
+    With a snapshot store, chains can be replayed from disk instead of the
+    network by passing as_of to get_options_chain().
     """
 
-    def __init__(self, client: SchwabClient | FinnhubClient):
+    def __init__(
+        self,
+        client: SchwabClient | FinnhubClient,
+        iv_solver: Optional[ImpliedVolatilitySolver] = None,
+        solve_iv: bool = True,
+        snapshot_store: Optional["ChainSnapshotStore"] = None,
+    ):
         """
         Initialize service with market data client.
 
         Args:
             client: SchwabClient (recommended) or FinnhubClient (deprecated) for API calls
+            iv_solver: Optional implied volatility solver (uses defaults if None)
+            solve_iv: Whether to fill missing IV on fetched chains
+            snapshot_store: Optional store of previously fetched chains for replay
         """
         self.client = client
         self._is_schwab = isinstance(client, SchwabClient)
+        self.iv_solver = iv_solver or ImpliedVolatilitySolver()
+        self.solve_iv = solve_iv
+        self.snapshot_store = snapshot_store
 
     def get_options_chain(
         self,
         symbol: str,
         contract_type: Optional[str] = None,
         strike_count: Optional[int] = None,
+        as_of: Optional[datetime] = None,
     ) -> OptionsChain:
         """
         Retrieve and parse options chain for a symbol.
@@ -50,7 +74,10 @@ class OptionsChainService:
         Args:
             symbol: Stock ticker symbol
             contract_type: Optional filter by "CALL", "PUT", or None for both (Schwab only)
-            strike_count: Optional number of strikes to return (Schwab only)
+            strike_count: Optional number of strikes to return (Schwab only;
+                ignored when replaying)
+            as_of: Replay the latest stored snapshot at or before this time
+                instead of fetching (requires snapshot_store)
 
         Returns:
             OptionsChain object with parsed contracts
@@ -59,15 +86,21 @@ class OptionsChainService:
             SchwabAPIError or FinnhubAPIError: If API call fails
             DataValidationError: If response is invalid
         """
+        if as_of is not None:
+            return self._load_snapshot(symbol, contract_type, as_of)
+
         logger.info(f"Fetching options chain for {symbol}")
 
         if self._is_schwab:
             # Schwab client returns fully parsed OptionsChain
-            return self.client.get_option_chain(
+            options_chain = self.client.get_option_chain(
                 symbol=symbol,
                 contract_type=contract_type,
                 strike_count=strike_count,
             )
+            if self.solve_iv:
+                self.fill_implied_volatility(options_chain)
+            return options_chain
         else:
             # Legacy Finnhub path - parse raw response
             raw_data = self.client.get_option_chain(symbol)
@@ -86,6 +119,58 @@ class OptionsChainService:
                 retrieved_at=datetime.now(timezone.utc).isoformat(),
             )
 
+    def _load_snapshot(
+        self, symbol: str, contract_type: Optional[str], as_of: datetime
+    ) -> OptionsChain:
+        """
+        Load a stored chain in place of a network fetch.
+
+        Raises:
+            ValueError: If the service has no snapshot store
+            DataValidationError: If no snapshot exists at or before as_of
+        """
+        if self.snapshot_store is None:
+            raise ValueError("as_of requires a snapshot_store")
+
+        options_chain = self.snapshot_store.load_latest(symbol, as_of)
+        if options_chain is None:
+            raise DataValidationError(f"No stored options chain for {symbol} at or before {as_of}")
+        logger.info(f"Replaying {symbol} options chain from {options_chain.retrieved_at}")
+
+        if contract_type:
+            kind = contract_type.lower()
+            options_chain = OptionsChain(
+                symbol=options_chain.symbol,
+                contracts=[c for c in options_chain.contracts if c.option_type.lower() == kind],
+                retrieved_at=options_chain.retrieved_at,
+                underlying_price=options_chain.underlying_price,
+            )
+        if self.solve_iv:
+            self.fill_implied_volatility(options_chain)
+        return options_chain
+
+    def fill_implied_volatility(
+        self, options_chain: OptionsChain, current_price: Optional[float] = None
+    ) -> Optional[ChainIVSummary]:
+        """
+        Solve IV in place for contracts whose provider IV is missing or invalid.
+
+        Every contract is tagged with its iv_source ("provider" or "solved");
+        contracts that cannot be solved end up with implied_volatility=None.
+
+        Args:
+            options_chain: Chain to update
+            current_price: Underlying price (default: options_chain.underlying_price)
+
+        Returns:
+            ChainIVSummary diagnostics, or None if no underlying price is known
+        """
+        price = current_price if current_price is not None else options_chain.underlying_price
+        if not price or price <= 0:
+            logger.debug(f"No underlying price for {options_chain.symbol}, skipping IV solve")
+            return None
+        return self.iv_solver.solve_chain(options_chain, current_price=price)
+
     def _validate_response(self, data: dict[str, Any]) -> None:
         """
         Validate API response structure.
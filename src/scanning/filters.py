@@ -3,15 +3,23 @@ Filtering functions for the overlay scanner.
 
 This module provides functions for filtering candidate strikes based on
 tradability criteria, delta bands, and risk constraints.
+
+compile_filters() applies the same rules to a whole chain at once, as
+boolean masks and margin arrays, so the scanner only builds RejectionDetail
+objects for the strikes it reports.
 """
 
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import numpy as np
 
 from src.models import (
     DELTA_BAND_RANGES,
     CandidateStrike,
     DeltaBand,
+    ExecutionCostArrays,
     RejectionDetail,
     RejectionReason,
     ScannerConfig,
@@ -19,6 +27,20 @@ from src.models import (
 
 logger = logging.getLogger(__name__)
 
+# Checks in the order the scanner applies them (and lists their details)
+FILTER_ORDER: tuple[RejectionReason, ...] = (
+    RejectionReason.ZERO_BID,
+    RejectionReason.LOW_PREMIUM,
+    RejectionReason.WIDE_SPREAD_ABSOLUTE,
+    RejectionReason.WIDE_SPREAD_RELATIVE,
+    RejectionReason.LOW_OPEN_INTEREST,
+    RejectionReason.LOW_VOLUME,
+    RejectionReason.YIELD_TOO_LOW,
+    RejectionReason.FRICTION_TOO_HIGH,
+    RejectionReason.OUTSIDE_DELTA_BAND,
+    RejectionReason.EARNINGS_WEEK,
+)
+
 
 def get_delta_band(delta: float) -> Optional[DeltaBand]:
     """
@@ -330,3 +352,212 @@ def populate_near_miss_details(
 
     # Calculate near-miss score
     candidate.near_miss_score = calculate_near_miss_score(candidate, max_net_credit)
+
+
+@dataclass
+class FilterMasks:
+    """
+    Filter outcome for many candidate strikes, as arrays.
+
+    Row i describes candidate i; column j describes check FILTER_ORDER[j].
+
+    Attributes:
+        failed: Boolean array (candidates x checks), True where the check rejects
+        margins: Array (candidates x checks) of RejectionDetail margins;
+            only meaningful where failed
+    """
+
+    failed: np.ndarray
+    margins: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.failed)
+
+    @property
+    def bits(self) -> np.ndarray:
+        """Rejection bitmask per candidate; bit j is set when FILTER_ORDER[j] rejects."""
+        weights = np.left_shift(1, np.arange(len(FILTER_ORDER), dtype=np.int64))
+        return (self.failed * weights).sum(axis=1)
+
+    @property
+    def rejected(self) -> np.ndarray:
+        """True for candidates failing at least one check."""
+        return self.failed.any(axis=1)
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Number of failed checks per candidate."""
+        return self.failed.sum(axis=1)
+
+    def reasons(self, i: int) -> list[RejectionReason]:
+        """Rejection reasons of candidate i, in check order."""
+        return [FILTER_ORDER[j] for j in np.flatnonzero(self.failed[i]).tolist()]
+
+    def binding(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Binding constraint per candidate, as populate_near_miss_details picks it.
+
+        Returns:
+            Tuple of (check, margin): the first failed check with the smallest
+            margin as an index into FILTER_ORDER (-1 if none failed), and its
+            margin (NaN if none failed)
+        """
+        check = np.full(len(self), -1, dtype=np.int64)
+        margin = np.full(len(self), np.nan)
+        for j in range(len(FILTER_ORDER)):
+            m = self.margins[:, j]
+            take = self.failed[:, j] & ((check < 0) | (m < margin))
+            check[take] = j
+            margin[take] = m[take]
+        return check, margin
+
+    def near_miss_scores(
+        self, total_net_credit: np.ndarray, max_net_credit: float = 100.0
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_near_miss_score.
+
+        Args:
+            total_net_credit: Net credit per candidate
+            max_net_credit: Maximum expected net credit for normalization
+
+        Returns:
+            Near-miss score per candidate (1.0 where nothing failed)
+        """
+        counts = self.counts
+        _, min_margin = self.binding()
+        # fmin/fmax ignore NaN the way min()/max() do with a NaN second argument
+        credit_score = np.fmin(1.0, total_net_credit / max_net_credit) * 0.6
+        rejection_score = np.fmax(0, 1.0 - (counts - 1) * 0.25) * 0.2
+        margin_score = np.fmax(0, 1.0 - min_margin) * 0.2
+        return np.where(counts > 0, credit_score + rejection_score + margin_score, 1.0)
+
+
+def _min_margins(actual: np.ndarray, threshold: Union[np.ndarray, float]) -> np.ndarray:
+    """Vectorized calculate_margin(actual, threshold, "min") margin."""
+    actual, threshold = np.broadcast_arrays(
+        np.asarray(actual, dtype=np.float64), np.asarray(threshold, dtype=np.float64)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.fmax(0, (threshold - actual) / threshold)
+    return np.where(threshold == 0, np.where(actual <= 0, 1.0, 0.0), ratio)
+
+
+def _max_margins(actual: np.ndarray, threshold: float) -> np.ndarray:
+    """Vectorized calculate_margin(actual, threshold, "max") margin."""
+    actual = np.asarray(actual, dtype=np.float64)
+    if threshold == 0:
+        return np.where(actual > 0, 1.0, 0.0)
+    return np.fmax(0, (actual - threshold) / threshold)
+
+
+def compile_filters(
+    config: ScannerConfig,
+    bid: np.ndarray,
+    ask: np.ndarray,
+    open_interest: np.ndarray,
+    volume: np.ndarray,
+    delta: np.ndarray,
+    costs: ExecutionCostArrays,
+    spans_earnings: np.ndarray,
+    current_price: float = 0.0,
+) -> FilterMasks:
+    """
+    Apply every scanner check to many candidate strikes at once.
+
+    Array counterpart of apply_tradability_filters, apply_delta_band_filter
+    and the earnings-week gate: a candidate fails check j exactly when the
+    per-candidate functions report FILTER_ORDER[j], with the same margin.
+
+    Args:
+        config: ScannerConfig with filter thresholds
+        bid: Bid price per candidate
+        ask: Ask price per candidate
+        open_interest: Open interest per candidate (0 if unknown)
+        volume: Volume per candidate (0 if unknown)
+        delta: Call delta per candidate
+        costs: Execution costs per candidate
+        spans_earnings: True where the expiration spans earnings
+        current_price: Current stock price (for yield calculations)
+
+    Returns:
+        FilterMasks with one row per candidate
+    """
+    bid = np.asarray(bid, dtype=np.float64)
+    ask = np.asarray(ask, dtype=np.float64)
+    n = len(bid)
+    failed = np.zeros((n, len(FILTER_ORDER)), dtype=bool)
+    margins = np.zeros((n, len(FILTER_ORDER)))
+
+    def check(
+        reason: RejectionReason, fails: np.ndarray, margin: Union[np.ndarray, float]
+    ) -> None:
+        j = FILTER_ORDER.index(reason)
+        failed[:, j] = fails
+        margins[:, j] = margin
+
+    zero_bid = bid <= 0
+    check(RejectionReason.ZERO_BID, zero_bid, 1.0)
+    check(
+        RejectionReason.LOW_PREMIUM,
+        ~zero_bid & (bid < config.min_bid_price),
+        _min_margins(bid, config.min_bid_price),
+    )
+
+    spread = ask - bid
+    check(
+        RejectionReason.WIDE_SPREAD_ABSOLUTE,
+        spread > config.max_spread_absolute,
+        _max_margins(spread, config.max_spread_absolute),
+    )
+
+    mid = (bid + ask) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        spread_pct = np.where(mid > 0, spread / mid * 100, 100.0)
+    check(
+        RejectionReason.WIDE_SPREAD_RELATIVE,
+        (mid >= config.min_mid_for_relative_spread) & (spread_pct > config.max_spread_relative_pct),
+        _max_margins(spread_pct, config.max_spread_relative_pct),
+    )
+
+    check(
+        RejectionReason.LOW_OPEN_INTEREST,
+        open_interest < config.min_open_interest,
+        _min_margins(open_interest, config.min_open_interest),
+    )
+    check(
+        RejectionReason.LOW_VOLUME,
+        volume < config.min_volume,
+        _min_margins(volume, config.min_volume),
+    )
+
+    if current_price > 0:
+        notional_per_contract = current_price * 100
+        yield_bps = (costs.net_credit_per_share * 100 / notional_per_contract) * 10000
+        check(
+            RejectionReason.YIELD_TOO_LOW,
+            yield_bps < config.min_weekly_yield_bps,
+            _min_margins(yield_bps, config.min_weekly_yield_bps),
+        )
+
+    min_credit_for_friction = config.min_friction_multiple * (costs.commission + costs.slippage)
+    check(
+        RejectionReason.FRICTION_TOO_HIGH,
+        costs.net_credit < min_credit_for_friction,
+        _min_margins(costs.net_credit, min_credit_for_friction),
+    )
+
+    min_delta, max_delta = DELTA_BAND_RANGES[config.delta_band]
+    delta = np.abs(np.asarray(delta, dtype=np.float64))
+    below = delta < min_delta
+    below_margin = (min_delta - delta) / min_delta if min_delta > 0 else 1.0
+    above_margin = (delta - max_delta) / max_delta if max_delta > 0 else 1.0
+    check(
+        RejectionReason.OUTSIDE_DELTA_BAND,
+        ~((min_delta <= delta) & (delta < max_delta)),
+        np.where(below, below_margin, above_margin),
+    )
+
+    check(RejectionReason.EARNINGS_WEEK, np.asarray(spans_earnings, dtype=bool), 1.0)
+
+    return FilterMasks(failed=failed, margins=margins)
@@ -6,27 +6,35 @@ call recommendations with a holdings-driven broker-first workflow.
 """
 
 import logging
+import math
+from datetime import date, timedelta
+from functools import partial
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from ..earnings_calendar import EarningsCalendar
 from ..models import (
     CandidateStrike,
+    ExecutionCostArrays,
     ExecutionCostEstimate,
     OptionsChain,
     PortfolioHolding,
+    ProbabilityArrays,
     RejectionDetail,
     RejectionReason,
     ScannerConfig,
     ScanResult,
     SlippageModel,
 )
+from ..schwab.chain_query import OptionChainQuery
 from ..strike_optimizer import StrikeOptimizer
 from ..utils import calculate_days_to_expiry
 from .filters import (
     apply_delta_band_filter,
     apply_tradability_filters,
+    compile_filters,
     get_delta_band,
-    populate_near_miss_details,
 )
 from .formatters import generate_broker_checklist, generate_llm_memo_payload
 
@@ -106,6 +114,30 @@ class OverlayScanner:
         contracts = int(shares * self.config.overwrite_cap_pct / 100 / 100)
         return max(0, contracts)
 
+    def chain_query(self, symbol: str) -> OptionChainQuery:
+        """
+        Narrowed option chain request holding everything scan_holding uses.
+
+        Only OTM calls expiring within weeks_to_scan weeks are requested,
+        which covers the first weeks_to_scan weekly expirations.
+
+        Example:
+            chain = schwab.get_option_chain(**scanner.chain_query("AAPL").request_kwargs())
+
+        Args:
+            symbol: Underlying stock symbol
+
+        Returns:
+            OptionChainQuery for SchwabClient.get_option_chain()
+        """
+        to_date = date.today() + timedelta(weeks=self.config.weeks_to_scan)
+        return OptionChainQuery(
+            symbol=symbol,
+            contract_type="CALL",
+            strike_range="OTM",
+            to_date=to_date.isoformat(),
+        )
+
     def calculate_execution_cost(
         self, bid: float, ask: float, contracts: int = 1
     ) -> ExecutionCostEstimate:
@@ -146,6 +178,50 @@ class OverlayScanner:
             net_credit_per_share=net_credit_per_share,
         )
 
+    def calculate_execution_costs(
+        self, bid: np.ndarray, ask: np.ndarray, contracts: int = 1
+    ) -> ExecutionCostArrays:
+        """
+        Calculate estimated execution costs for many trades.
+
+        Vectorized counterpart of calculate_execution_cost.
+
+        Args:
+            bid: Bid prices per share
+            ask: Ask prices per share
+            contracts: Number of contracts per trade (default 1)
+
+        Returns:
+            ExecutionCostArrays with one entry per bid/ask pair
+        """
+        bid = np.asarray(bid, dtype=np.float64)
+        ask = np.asarray(ask, dtype=np.float64)
+        gross_premium = bid * 100 * contracts
+        commission = np.full(len(bid), float(self.config.per_contract_fee * contracts))
+
+        spread = ask - bid
+        if self.config.slippage_model in (SlippageModel.NONE, SlippageModel.FULL_SPREAD):
+            slippage_per_share = np.zeros(len(bid))
+        elif self.config.slippage_model == SlippageModel.HALF_SPREAD:
+            slippage_per_share = spread / 2
+        else:  # HALF_SPREAD_CAPPED
+            slippage_per_share = np.minimum(spread / 2, self.config.max_slippage_per_contract)
+
+        slippage = slippage_per_share * 100 * contracts
+        net_credit = gross_premium - commission - slippage
+        if contracts > 0:
+            net_credit_per_share = net_credit / (100 * contracts)
+        else:
+            net_credit_per_share = np.zeros(len(bid))
+
+        return ExecutionCostArrays(
+            gross_premium=gross_premium,
+            commission=commission,
+            slippage=slippage,
+            net_credit=net_credit,
+            net_credit_per_share=net_credit_per_share,
+        )
+
     def compute_delta(
         self,
         strike: float,
@@ -176,6 +252,38 @@ class OverlayScanner:
         )
         return abs(prob_result.delta), prob_result.probability
 
+    def compute_deltas(
+        self,
+        strikes: list[float],
+        current_price: float,
+        volatility: float,
+        days_to_expiry: list[int],
+        option_type: str = "call",
+    ) -> ProbabilityArrays:
+        """
+        Compute Black-Scholes delta, P(ITM) and sigma distance for many strikes.
+
+        Vectorized counterpart of compute_delta: one call scores a whole chain.
+        DTEs below 1 are clamped to 1 day, as in compute_delta.
+
+        Args:
+            strikes: Strike prices
+            current_price: Current stock price
+            volatility: Annualized volatility as decimal
+            days_to_expiry: Days until expiration, one per strike
+            option_type: "call" or "put"
+
+        Returns:
+            ProbabilityArrays (delta is signed; take abs() for call-equivalent delta)
+        """
+        return self.optimizer.calculate_assignment_probabilities(
+            strikes=strikes,
+            current_price=current_price,
+            volatility=volatility,
+            days_to_expiry=[max(1, d) for d in days_to_expiry],
+            option_type=option_type,
+        )
+
     def scan_holding(
         self,
         holding: PortfolioHolding,
@@ -218,18 +326,16 @@ class OverlayScanner:
         result.earnings_dates = earnings_dates
 
         # Get call options
-        calls = options_chain.get_calls()
-        if not calls:
+        columns = options_chain.columns
+        if not len(columns.type_slice("call")):
             result.error = "No call options found in chain"
             return result
 
-        # Get weekly expirations
-        expirations = sorted({c.expiration_date for c in calls})[: self.config.weeks_to_scan]
-
-        recommended = []
-        rejected = []
+        # Collect quotable OTM calls of the weekly expirations, in chain order
+        blocks = []
+        for calls in columns.slices("call")[: self.config.weeks_to_scan]:
+            exp_date = calls.expiration_date
 
-        for exp_date in expirations:
             # Check earnings exclusion
             spans_earnings, earn_date = self.earnings_calendar.expiration_spans_earnings(
                 symbol, exp_date
@@ -243,133 +349,132 @@ class OverlayScanner:
             # Calculate days to expiry (calendar days, not trading days)
             days_to_expiry = calculate_days_to_expiry(exp_date, default=7)
 
-            # Get calls for this expiration
-            exp_calls = [c for c in calls if c.expiration_date == exp_date]
+            # Skip ITM calls and calls without a bid/ask
+            quotable = (calls.strike > current_price) & ~np.isnan(calls.bid) & (calls.ask > 0)
+            rows = calls.start + np.flatnonzero(quotable)
+            rows = rows[np.argsort(columns.source_index(rows), kind="stable")]
+            blocks.append((rows, exp_date, days_to_expiry, spans_earnings, earn_date))
+
+        rows = np.concatenate([b[0] for b in blocks] or [np.empty(0, dtype=np.int64)])
+        pending = [
+            (columns.contract(row), exp_date, days_to_expiry, spans_earnings, earn_date)
+            for block_rows, exp_date, days_to_expiry, spans_earnings, earn_date in blocks
+            for row in block_rows.tolist()
+        ]
+
+        # Compute delta using Black-Scholes model for the whole chain in one call
+        probabilities = self.compute_deltas(
+            strikes=columns.columns["strike"][rows].tolist(),
+            current_price=current_price,
+            volatility=volatility,
+            days_to_expiry=[p[2] for p in pending],
+            option_type="call",
+        )
 
-            for contract in exp_calls:
-                # Skip ITM calls
-                if contract.strike <= current_price:
-                    continue
+        # Run every filter over the chain's columns at once
+        bids = columns.columns["bid"][rows]
+        asks = columns.columns["ask"][rows]
+        costs = self.calculate_execution_costs(bids, asks, contracts_available)
+        masks = compile_filters(
+            self.config,
+            bid=bids,
+            ask=asks,
+            open_interest=np.nan_to_num(columns.columns["open_interest"][rows]),
+            volume=np.nan_to_num(columns.columns["volume"][rows]),
+            delta=probabilities.delta,
+            costs=costs,
+            spans_earnings=np.array([p[3] for p in pending], dtype=bool),
+            current_price=current_price,
+        )
+        is_rejected = masks.rejected.tolist()
 
-                # Skip if no bid/ask
-                if contract.bid is None or contract.ask is None:
-                    continue
+        model_deltas = probabilities.delta.tolist()
+        model_p_itms = probabilities.probability.tolist()
+        sigma_distances = probabilities.sigma_distance.tolist()
 
-                bid = contract.bid or 0
-                ask = contract.ask or 0
+        recommended = []
+        rejected = []
+        rejected_rows = []
 
-                if ask <= 0:
-                    continue
+        for i, pending_call in enumerate(pending):
+            contract, exp_date, days_to_expiry, spans_earnings, earn_date = pending_call
+            bid = contract.bid or 0
+            ask = contract.ask or 0
 
-                mid_price = (bid + ask) / 2
-                spread_absolute = ask - bid
-                spread_relative_pct = (spread_absolute / mid_price * 100) if mid_price > 0 else 100
+            mid_price = (bid + ask) / 2
+            spread_absolute = ask - bid
+            spread_relative_pct = (spread_absolute / mid_price * 100) if mid_price > 0 else 100
 
-                # Compute delta using Black-Scholes model
-                delta_model, p_itm_model = self.compute_delta(
-                    strike=contract.strike,
-                    current_price=current_price,
-                    volatility=volatility,
-                    days_to_expiry=days_to_expiry,
-                    option_type="call",
-                )
+            delta_model = abs(model_deltas[i])
+            p_itm_model = model_p_itms[i]
 
-                # Get chain-provided delta (if available)
-                delta_chain = abs(contract.delta) if contract.delta is not None else None
-                # P(ITM) approximation from chain delta: |delta| for calls
-                p_itm_from_delta = delta_chain if delta_chain is not None else None
-
-                # Primary delta and p_itm use model values (consistent across all strikes)
-                delta = delta_model
-                p_itm = p_itm_model
-
-                # Compute sigma distance for diagnostic
-                try:
-                    sigma_distance = self.optimizer.get_sigma_for_strike(
-                        strike=contract.strike,
-                        current_price=current_price,
-                        volatility=volatility,
-                        days_to_expiry=days_to_expiry,
-                        option_type="call",
-                    )
-                except (ValueError, ZeroDivisionError):
-                    sigma_distance = None
-
-                # Get delta band
-                delta_band = get_delta_band(delta)
-
-                # Calculate execution cost
-                cost_estimate = self.calculate_execution_cost(
-                    bid=bid, ask=ask, contracts=contracts_available
-                )
+            # Get chain-provided delta (if available)
+            delta_chain = abs(contract.delta) if contract.delta is not None else None
+            # P(ITM) approximation from chain delta: |delta| for calls
+            p_itm_from_delta = delta_chain if delta_chain is not None else None
 
-                # Calculate annualized yield
-                position_value = current_price * 100 * contracts_available
-                if position_value > 0 and days_to_expiry > 0:
-                    annualized_yield = (
-                        (cost_estimate.net_credit / position_value) * (365 / days_to_expiry) * 100
-                    )
-                else:
-                    annualized_yield = 0
-
-                candidate = CandidateStrike(
-                    contract=contract,
-                    strike=contract.strike,
-                    expiration_date=exp_date,
-                    delta=delta,
-                    p_itm=p_itm,
-                    sigma_distance=sigma_distance,
-                    bid=bid,
-                    ask=ask,
-                    mid_price=mid_price,
-                    spread_absolute=spread_absolute,
-                    spread_relative_pct=spread_relative_pct,
-                    open_interest=contract.open_interest or 0,
-                    volume=contract.volume or 0,
-                    cost_estimate=cost_estimate,
-                    delta_band=delta_band,
-                    contracts_to_sell=contracts_available,
-                    total_net_credit=cost_estimate.net_credit,
-                    annualized_yield_pct=annualized_yield,
-                    days_to_expiry=days_to_expiry,
-                    delta_model=delta_model,
-                    p_itm_model=p_itm_model,
-                    delta_chain=delta_chain,
-                    p_itm_from_delta=p_itm_from_delta,
-                )
+            # Primary delta and p_itm use model values (consistent across all strikes)
+            delta = delta_model
+            p_itm = p_itm_model
+
+            # Sigma distance for diagnostic (undefined on expiration day)
+            sigma_distance = sigma_distances[i]
+            if days_to_expiry <= 0 or math.isnan(sigma_distance):
+                sigma_distance = None
 
-                # Apply tradability filters (returns tuple of reasons and details)
-                rejection_reasons, rejection_details = apply_tradability_filters(
-                    candidate, self.config, current_price
+            # Get delta band
+            delta_band = get_delta_band(delta)
+
+            # Calculate execution cost
+            cost_estimate = self.calculate_execution_cost(
+                bid=bid, ask=ask, contracts=contracts_available
+            )
+
+            # Calculate annualized yield
+            position_value = current_price * 100 * contracts_available
+            if position_value > 0 and days_to_expiry > 0:
+                annualized_yield = (
+                    (cost_estimate.net_credit / position_value) * (365 / days_to_expiry) * 100
                 )
+            else:
+                annualized_yield = 0
+
+            candidate = CandidateStrike(
+                contract=contract,
+                strike=contract.strike,
+                expiration_date=exp_date,
+                delta=delta,
+                p_itm=p_itm,
+                sigma_distance=sigma_distance,
+                bid=bid,
+                ask=ask,
+                mid_price=mid_price,
+                spread_absolute=spread_absolute,
+                spread_relative_pct=spread_relative_pct,
+                open_interest=contract.open_interest or 0,
+                volume=contract.volume or 0,
+                cost_estimate=cost_estimate,
+                delta_band=delta_band,
+                contracts_to_sell=contracts_available,
+                total_net_credit=cost_estimate.net_credit,
+                annualized_yield_pct=annualized_yield,
+                days_to_expiry=days_to_expiry,
+                delta_model=delta_model,
+                p_itm_model=p_itm_model,
+                delta_chain=delta_chain,
+                p_itm_from_delta=p_itm_from_delta,
+            )
+
+            if spans_earnings:
+                candidate.warnings.append(f"Expiration spans earnings on {earn_date}")
 
-                # Check delta band filter
-                delta_detail = apply_delta_band_filter(candidate, self.config)
-                if delta_detail:
-                    rejection_reasons.append(RejectionReason.OUTSIDE_DELTA_BAND)
-                    rejection_details.append(delta_detail)
-
-                # Check earnings if applicable
-                if spans_earnings:
-                    rejection_reasons.append(RejectionReason.EARNINGS_WEEK)
-                    rejection_details.append(
-                        RejectionDetail(
-                            reason=RejectionReason.EARNINGS_WEEK,
-                            actual_value=1.0,
-                            threshold=0.0,
-                            margin=1.0,  # Hard gate - no partial margin
-                            margin_display=f"earnings on {earn_date} before {exp_date}",
-                        )
-                    )
-                    candidate.warnings.append(f"Expiration spans earnings on {earn_date}")
-
-                if rejection_reasons:
-                    candidate.rejection_reasons = rejection_reasons
-                    candidate.rejection_details = rejection_details
-                    candidate.is_recommended = False
-                    rejected.append(candidate)
-                else:
-                    recommended.append(candidate)
+            if is_rejected[i]:
+                candidate.rejection_reasons = masks.reasons(i)
+                candidate.is_recommended = False
+                rejected.append(candidate)
+                rejected_rows.append(i)
+            else:
+                recommended.append(candidate)
 
         # Sort recommended by net credit (highest first)
         recommended.sort(key=lambda c: c.total_net_credit, reverse=True)
@@ -377,8 +482,9 @@ class OverlayScanner:
         # Calculate near-miss scores for rejected candidates
         max_net_credit = max((c.total_net_credit for c in rejected), default=100.0) or 100.0
 
-        for candidate in rejected:
-            populate_near_miss_details(candidate, max_net_credit)
+        scores = masks.near_miss_scores(costs.net_credit, max_net_credit)[rejected_rows]
+        for candidate, score in zip(rejected, scores.tolist()):
+            candidate.near_miss_score = score
 
         # Get top 5 near-miss candidates (sorted by score, highest first)
         near_misses = sorted(rejected, key=lambda c: c.near_miss_score, reverse=True)[:5]
@@ -387,6 +493,19 @@ class OverlayScanner:
         result.rejected_strikes = rejected
         result.near_miss_candidates = near_misses
 
+        # Details are built only for the candidates someone looks at
+        earnings_by_expiration = {
+            exp_date: earn_date for _, exp_date, _, spans, earn_date in blocks if spans
+        }
+        result.defer_rejections(
+            partial(
+                self._rejection_details,
+                current_price=current_price,
+                earnings_by_expiration=earnings_by_expiration,
+            )
+        )
+        result.resolve_rejections(near_misses)
+
         # Generate broker checklist and LLM memo for top recommendation
         if recommended:
             top = recommended[0]
@@ -420,6 +539,50 @@ class OverlayScanner:
 
         return result
 
+    def _rejection_details(
+        self,
+        candidate: CandidateStrike,
+        current_price: float,
+        earnings_by_expiration: dict[str, str],
+    ) -> tuple[list[RejectionDetail], Optional[RejectionDetail]]:
+        """
+        Rejection details and binding constraint of a rejected candidate.
+
+        Runs the per-candidate filters that compile_filters() mirrors, so the
+        details list the reasons the masks reported, in the same order.
+
+        Args:
+            candidate: Rejected CandidateStrike
+            current_price: Current stock price
+            earnings_by_expiration: Earnings date of each expiration that spans one
+
+        Returns:
+            Tuple of (rejection_details, binding_constraint)
+        """
+        _, details = apply_tradability_filters(candidate, self.config, current_price)
+
+        delta_detail = apply_delta_band_filter(candidate, self.config)
+        if delta_detail:
+            details.append(delta_detail)
+
+        earnings_date = earnings_by_expiration.get(candidate.expiration_date)
+        if earnings_date is not None:
+            details.append(
+                RejectionDetail(
+                    reason=RejectionReason.EARNINGS_WEEK,
+                    actual_value=1.0,
+                    threshold=0.0,
+                    margin=1.0,  # Hard gate - no partial margin
+                    margin_display=(
+                        f"earnings on {earnings_date} before {candidate.expiration_date}"
+                    ),
+                )
+            )
+
+        # Binding constraint: smallest margin, as populate_near_miss_details picks it
+        binding = min(details, key=lambda d: d.margin) if details else None
+        return details, binding
+
     def scan_portfolio(
         self,
         holdings: list[PortfolioHolding],
@@ -5,22 +5,38 @@ This module provides integration with Charles Schwab's Trading and Market Data A
 using OAuth 2.0 authentication. It includes:
 
 - SchwabClient: Authenticated HTTP client for API calls
+- AsyncSchwabClient: Asyncio variant for concurrent market data requests
 - Market data endpoints: quotes, options chains
 - Account data endpoints: accounts, positions
-- Data models: SchwabAccount, SchwabPosition
+- sync_accounts: concurrent position sync across all accounts
+- Data models: SchwabAccount, SchwabPosition, SchwabQuoteBatch, SchwabAccountSync
 
 Authentication is handled automatically via the OAuth module.
 """
 
+from .account_sync import sync_accounts
+from .async_client import AsyncSchwabClient
 from .client import SchwabClient
 from .exceptions import SchwabAPIError, SchwabAuthenticationError
-from .models import SchwabAccount, SchwabAccountBalances, SchwabPosition
+from .models import (
+    SchwabAccount,
+    SchwabAccountBalances,
+    SchwabAccountSync,
+    SchwabHolding,
+    SchwabPosition,
+    SchwabQuoteBatch,
+)
 
 __all__ = [
+    "AsyncSchwabClient",
     "SchwabClient",
     "SchwabAPIError",
     "SchwabAuthenticationError",
     "SchwabAccount",
     "SchwabAccountBalances",
+    "SchwabAccountSync",
+    "SchwabHolding",
     "SchwabPosition",
+    "SchwabQuoteBatch",
+    "sync_accounts",
 ]
@@ -0,0 +1,151 @@
+"""
+Bulk position sync across linked accounts.
+
+Fetching positions one account at a time makes startup wait for every
+round trip in turn. sync_accounts() lists the accounts once, then fetches
+the positions of all accounts concurrently through AsyncSchwabClient and
+consolidates them into one holdings view.
+
+Accounts whose summary has not changed since the previous sync are not
+fetched again. The change check compares cash balances from the account
+list, which a sync needs anyway: trades, assignments and transfers all
+move cash, while price moves do not. Events that leave cash untouched
+(options expiring worthless) are picked up once the previous sync is
+older than max_age_seconds.
+
+Example:
+    sync = sync_accounts(client)
+    ...
+    sync = sync_accounts(client, previous=sync)  # refetches changed accounts only
+    for symbol, holding in sync.holdings().items():
+        print(symbol, holding.quantity, holding.accounts)
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional, Union
+
+from src.api.async_base_client import DEFAULT_MAX_CONCURRENCY
+from src.constants import ACCOUNT_SYNC_MAX_AGE_SECONDS
+
+from .async_client import AsyncSchwabClient
+from .client import SchwabClient
+from .exceptions import SchwabAPIError, SchwabAuthenticationError
+from .models import SchwabAccount, SchwabAccountSync
+
+logger = logging.getLogger(__name__)
+
+
+def account_fingerprint(account: SchwabAccount) -> str:
+    """
+    Change check of an account summary from SchwabClient.get_accounts().
+
+    Args:
+        account: Account summary (positions are not needed)
+
+    Returns:
+        String that changes when the account's cash or status changes
+    """
+    balances = account.balances
+    return (
+        f"{account.account_type}|{account.is_closing_only}|"
+        f"{balances.cash_balance:.2f}|{balances.total_cash:.2f}"
+    )
+
+
+def sync_accounts(
+    client: SchwabClient,
+    previous: Optional[SchwabAccountSync] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_age_seconds: float = ACCOUNT_SYNC_MAX_AGE_SECONDS,
+) -> SchwabAccountSync:
+    """
+    Fetch positions for every account, skipping unchanged ones.
+
+    An account whose fetch fails keeps its positions from the previous
+    sync (if any) and is listed in errors; it is fetched again next time.
+
+    Args:
+        client: Authenticated SchwabClient
+        previous: Result of the last sync, to skip unchanged accounts
+        max_concurrency: Maximum number of position requests in flight
+        max_age_seconds: Refetch unchanged accounts synced longer ago
+
+    Returns:
+        SchwabAccountSync with every account's positions
+
+    Raises:
+        SchwabAuthenticationError: If authentication fails
+        SchwabAPIError: If the account list cannot be fetched
+    """
+    summaries = client.get_accounts()
+    now = time.time()
+
+    sync = SchwabAccountSync()
+    to_fetch: list[str] = []
+    for summary in summaries:
+        number = summary.account_number
+        fingerprint = account_fingerprint(summary)
+        if (
+            previous is not None
+            and number in previous.accounts
+            and number not in previous.errors
+            and previous.fingerprints.get(number) == fingerprint
+            and now - previous.synced_at.get(number, 0.0) < max_age_seconds
+        ):
+            sync.accounts[number] = previous.accounts[number]
+            sync.fingerprints[number] = fingerprint
+            sync.synced_at[number] = previous.synced_at[number]
+            sync.skipped.append(number)
+        else:
+            sync.fingerprints[number] = fingerprint
+            to_fetch.append(number)
+
+    for number, result in _fetch_positions(client, to_fetch, max_concurrency).items():
+        if isinstance(result, Exception):
+            logger.error(f"Failed to sync positions for account {number}: {result}")
+            sync.errors[number] = str(result)
+            if previous is not None and number in previous.accounts:
+                sync.accounts[number] = previous.accounts[number]
+                sync.synced_at[number] = previous.synced_at.get(number, 0.0)
+            continue
+        sync.accounts[number] = result
+        sync.synced_at[number] = now
+        sync.refreshed.append(number)
+
+    logger.info(
+        f"Synced {len(summaries)} account(s): {len(sync.refreshed)} refreshed, "
+        f"{len(sync.skipped)} unchanged, {len(sync.errors)} failed"
+    )
+    return sync
+
+
+def _fetch_positions(
+    client: SchwabClient, account_hashes: list[str], max_concurrency: int
+) -> dict[str, Union[SchwabAccount, Exception]]:
+    """Fetch accounts' positions concurrently, or one by one inside an event loop."""
+    if not account_hashes:
+        return {}
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        # Cannot block inside a running loop; fall back to sequential fetches
+        logger.debug("Event loop running, fetching account positions sequentially")
+        results: dict[str, Union[SchwabAccount, Exception]] = {}
+        for account_hash in account_hashes:
+            try:
+                results[account_hash] = client.get_account_positions(account_hash)
+            except SchwabAuthenticationError:
+                raise
+            except SchwabAPIError as e:
+                results[account_hash] = e
+        return results
+
+    async def gather() -> dict[str, Union[SchwabAccount, Exception]]:
+        async with AsyncSchwabClient(client, max_concurrency=max_concurrency) as async_client:
+            return await async_client.gather_account_positions(account_hashes)
+
+    return asyncio.run(gather())
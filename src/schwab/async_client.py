@@ -0,0 +1,401 @@
+"""
+Asyncio Schwab API client with bounded concurrency.
+
+AsyncSchwabClient issues market data requests concurrently over httpx,
+with at most ``max_concurrency`` requests in flight. It wraps a
+SchwabClient and shares its OAuth coordinator, response cache, snapshot
+store, single-flight registry, request builders, parsers and error
+mapping, so a chain fetched asynchronously is a cache hit for the sync
+client and vice versa, and a chain being fetched by one is joined by the
+other rather than requested twice.
+
+Typical use is fanning out option chain fetches for a scan:
+
+    async with AsyncSchwabClient(schwab_client, max_concurrency=8) as client:
+        chains = await client.gather_chains(["AAPL", "MSFT", "F"])
+
+An instance is bound to one event loop (see AsyncBaseAPIClient).
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any, Optional, Union
+
+import httpx
+
+from src.analysis.volatility_models import PriceData
+from src.api.async_base_client import DEFAULT_MAX_CONCURRENCY, AsyncBaseAPIClient
+from src.api.cache import CacheNamespace
+from src.api.circuit_breaker import CircuitOpenError
+from src.api.single_flight import SingleFlight
+from src.models.base import OptionsChain
+
+from . import endpoints
+from .client import SchwabClient, option_chain_request, price_history_request
+from .exceptions import (
+    SchwabAPIError,
+    SchwabAuthenticationError,
+    SchwabInvalidSymbolError,
+    raise_for_schwab_status,
+)
+from .models import SchwabAccount, SchwabQuoteBatch
+from .parsers import parse_schwab_account, parse_schwab_price_history
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSchwabClient(AsyncBaseAPIClient):
+    """
+    Asyncio client for Schwab market data APIs.
+
+    Attributes:
+        client: Wrapped SchwabClient providing auth, cache and snapshot store
+    """
+
+    BASE_URL = SchwabClient.BASE_URL
+    RATE_LIMIT_KEY = SchwabClient.RATE_LIMIT_KEY
+
+    def __init__(
+        self,
+        client: Optional[SchwabClient] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize async Schwab client.
+
+        Args:
+            client: SchwabClient to share auth, cache, retry settings, rate
+                    limiter and circuit breakers with
+                    (creates default if not provided)
+            max_concurrency: Maximum number of requests in flight at once
+            transport: Optional httpx transport (e.g. httpx.MockTransport in tests)
+        """
+        self.client = client or SchwabClient()
+        super().__init__(
+            max_retries=self.client.max_retries,
+            retry_delay=self.client.retry_delay,
+            timeout=self.client.timeout,
+            max_concurrency=max_concurrency,
+            transport=transport,
+            rate_limiter=self.client.rate_limiter,
+            circuit_breakers=self.client.circuit_breakers,
+        )
+
+    def _handle_error_response(self, response: httpx.Response) -> None:
+        """Map Schwab error responses to exceptions, as the sync client does."""
+        raise_for_schwab_status(
+            response.status_code, response.is_success, response.text, response.url
+        )
+
+    async def _request(
+        self, method: str, endpoint: str, params: Optional[dict[str, Any]] = None
+    ) -> httpx.Response:
+        """
+        Make authenticated HTTP request to Schwab API.
+
+        Raises:
+            SchwabAuthenticationError: If authentication fails (401)
+            SchwabRateLimitError: If rate limit exceeded (429)
+            SchwabInvalidSymbolError: If symbol not found (404)
+            SchwabAPIError: For other API errors
+        """
+        auth_headers = self.client._get_auth_headers()
+        url = self._get_full_url(endpoint)
+
+        try:
+            response = await self._make_request_with_retry(
+                method, url, params=params, headers=auth_headers
+            )
+        except (httpx.HTTPError, CircuitOpenError) as e:
+            logger.error(f"Request failed: {e}")
+            raise SchwabAPIError(f"Request to Schwab API failed: {e}") from e
+
+        self._handle_error_response(response)
+        return response
+
+    async def get(self, endpoint: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """
+        Make authenticated GET request.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            JSON response as dictionary
+        """
+        response = await self._request("GET", endpoint, params=params)
+        return response.json()
+
+    async def get_quotes(self, symbols: list[str], use_cache: bool = True) -> SchwabQuoteBatch:
+        """
+        Get real-time quotes for many symbols, fetching chunks concurrently.
+
+        Same contract as SchwabClient.get_quotes().
+
+        Args:
+            symbols: Stock symbols (duplicates are ignored)
+            use_cache: Whether to use cached data if available (default: True)
+
+        Returns:
+            SchwabQuoteBatch with quotes in the get_quote() format
+
+        Raises:
+            SchwabAuthenticationError: If authentication fails
+        """
+        batch = SchwabQuoteBatch()
+        chunks, led, joined = self.client._pending_quote_chunks(symbols, use_cache, batch)
+
+        async def fetch(chunk: list[str]) -> Any:
+            logger.info(f"Fetching quotes for {len(chunk)} symbols")
+            return await self.get(endpoints.MARKETDATA_QUOTES, params={"symbols": ",".join(chunk)})
+
+        try:
+            responses = await asyncio.gather(
+                *(fetch(c) for c in chunks), return_exceptions=True
+            )
+            for chunk, result in zip(chunks, responses):
+                if isinstance(result, SchwabAuthenticationError):
+                    raise result
+                elif isinstance(result, SchwabInvalidSymbolError):
+                    # 404 when none of the chunk's symbols exist
+                    batch.invalid_symbols.extend(chunk)
+                elif isinstance(result, SchwabAPIError):
+                    logger.error(f"Failed to fetch quotes for {len(chunk)} symbols: {result}")
+                    batch.errors.update({symbol: str(result) for symbol in chunk})
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    self.client._collect_quotes(batch, chunk, result)
+        except BaseException as e:
+            self.client._finish_quote_flights(led, batch, e)
+            raise
+        self.client._finish_quote_flights(led, batch)
+
+        for symbol, call in joined.items():
+            try:
+                outcome = await SingleFlight.wait_async(call)
+            except Exception as e:
+                outcome = e
+            SchwabClient._add_joined_quote(batch, symbol, outcome)
+
+        if batch.invalid_symbols:
+            logger.warning(f"Symbols not found in quote response: {batch.invalid_symbols}")
+        return batch
+
+    async def get_option_chain(
+        self,
+        symbol: str,
+        contract_type: Optional[str] = None,
+        strike_count: Optional[int] = None,
+        include_quotes: bool = True,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        use_cache: bool = True,
+        strike_range: Optional[str] = None,
+    ) -> OptionsChain:
+        """
+        Get options chain for a symbol.
+
+        Same arguments and errors as SchwabClient.get_option_chain().
+
+        Returns:
+            OptionsChain object with contracts parsed to internal format
+        """
+        query, params = option_chain_request(
+            symbol, contract_type, strike_count, include_quotes, from_date, to_date, strike_range
+        )
+
+        async def fetch() -> OptionsChain:
+            narrowed = self.client._narrow_cached_chain(query) if use_cache else None
+            if narrowed is not None:
+                return narrowed
+            return await self._fetch_option_chain(symbol, query.cache_key, params)
+
+        return await self._cached_or_fetch(
+            self.client.chain_cache, query.cache_key, use_cache, fetch
+        )
+
+    async def _cached_or_fetch(
+        self,
+        namespace: CacheNamespace,
+        key: str,
+        use_cache: bool,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return a cached response, or await fetch() for it.
+
+        Same as SchwabClient._cached_or_fetch(); calls in flight on the
+        wrapped client's threads are joined too.
+        """
+        if use_cache:
+            cached = self.client._cached(namespace, key)
+            if cached is not None:
+                return cached
+
+        async def lead() -> Any:
+            # A call that finished since the cache check above may have stored it
+            if use_cache:
+                cached = self.client._cached(namespace, key)
+                if cached is not None:
+                    return cached
+            return await fetch()
+
+        return await self.client.single_flight.do_async(namespace.name, key, lead)
+
+    async def _fetch_option_chain(
+        self, symbol: str, cache_key: str, params: dict[str, Any]
+    ) -> OptionsChain:
+        """Fetch and cache one option chain."""
+        logger.info(f"Fetching options chain for {symbol}")
+        try:
+            response = await self._request("GET", endpoints.MARKETDATA_OPTION_CHAINS, params)
+        except SchwabInvalidSymbolError:
+            raise
+        except SchwabAPIError as e:
+            logger.error(f"Failed to fetch options chain for {symbol}: {e}")
+            raise
+
+        options_chain = SchwabClient._parse_option_chain_response(symbol, response)
+        if self.client.snapshot_store is not None:
+            self.client._store_snapshot(options_chain, params)
+        self.client._cache_result(self.client.chain_cache, cache_key, options_chain)
+        return options_chain
+
+    async def gather_chains(
+        self, symbols: list[str], **kwargs: Any
+    ) -> dict[str, Union[OptionsChain, Exception]]:
+        """
+        Fetch option chains for many symbols concurrently.
+
+        Wall-clock time is bounded by max_concurrency (and the API rate
+        limit) rather than the sum of round trips. A failure for one symbol
+        does not cancel the others.
+
+        Args:
+            symbols: Underlying symbols (duplicates are ignored)
+            **kwargs: Passed to get_option_chain() for every symbol
+
+        Returns:
+            Dict of symbol to OptionsChain, or the exception raised for it
+
+        Raises:
+            SchwabAuthenticationError: If authentication fails
+        """
+        unique = list(dict.fromkeys(symbols))
+        results = await asyncio.gather(
+            *(self.get_option_chain(symbol, **kwargs) for symbol in unique),
+            return_exceptions=True,
+        )
+        chains: dict[str, Union[OptionsChain, Exception]] = {}
+        for symbol, result in zip(unique, results):
+            if isinstance(result, SchwabAuthenticationError):
+                raise result
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            chains[symbol] = result
+
+        failed = [s for s, r in chains.items() if isinstance(r, Exception)]
+        logger.info(f"Fetched {len(unique) - len(failed)}/{len(unique)} option chains")
+        return chains
+
+    async def get_account_positions(self, account_hash: str) -> SchwabAccount:
+        """
+        Get account details including positions for a specific account.
+
+        Same arguments and errors as SchwabClient.get_account_positions().
+
+        Returns:
+            SchwabAccount object with positions
+        """
+        logger.info(f"Fetching positions for account {account_hash}")
+        endpoint = endpoints.ACCOUNT_DETAILS.format(accountHash=account_hash)
+        try:
+            response_data = await self.get(endpoint, params={"fields": "positions"})
+        except SchwabAPIError as e:
+            logger.error(f"Failed to fetch positions for account {account_hash}: {e}")
+            raise
+        return parse_schwab_account(response_data)
+
+    async def gather_account_positions(
+        self, account_hashes: list[str]
+    ) -> dict[str, Union[SchwabAccount, Exception]]:
+        """
+        Fetch positions for many accounts concurrently.
+
+        Each account is parsed as soon as its response arrives. A failure
+        for one account does not cancel the others.
+
+        Args:
+            account_hashes: Encrypted account numbers (duplicates are ignored)
+
+        Returns:
+            Dict of account hash to SchwabAccount, or the exception raised for it
+
+        Raises:
+            SchwabAuthenticationError: If authentication fails
+        """
+        unique = list(dict.fromkeys(account_hashes))
+        results = await asyncio.gather(
+            *(self.get_account_positions(account_hash) for account_hash in unique),
+            return_exceptions=True,
+        )
+        accounts: dict[str, Union[SchwabAccount, Exception]] = {}
+        for account_hash, result in zip(unique, results):
+            if isinstance(result, SchwabAuthenticationError):
+                raise result
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            accounts[account_hash] = result
+        return accounts
+
+    async def get_price_history(
+        self,
+        symbol: str,
+        period_type: str = "month",
+        period: int = 3,
+        frequency_type: str = "daily",
+        frequency: int = 1,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        use_cache: bool = True,
+    ) -> PriceData:
+        """
+        Get historical price data for a symbol.
+
+        Same arguments and errors as SchwabClient.get_price_history().
+
+        Returns:
+            PriceData object with OHLCV data
+        """
+        symbol = symbol.upper()
+        cache_key, params = price_history_request(
+            symbol, period_type, period, frequency_type, frequency, start_date, end_date
+        )
+        return await self._cached_or_fetch(
+            self.client.price_history_cache,
+            cache_key,
+            use_cache,
+            lambda: self._fetch_price_history(symbol, cache_key, params),
+        )
+
+    async def _fetch_price_history(
+        self, symbol: str, cache_key: str, params: dict[str, Any]
+    ) -> PriceData:
+        """Fetch and cache price history."""
+        logger.info(f"Fetching price history for {symbol}")
+        try:
+            response_data = await self.get(endpoints.MARKETDATA_PRICE_HISTORY, params=params)
+            price_data = parse_schwab_price_history(symbol, response_data)
+        except SchwabInvalidSymbolError:
+            raise
+        except SchwabAPIError as e:
+            logger.error(f"Failed to fetch price history for {symbol}: {e}")
+            raise
+
+        self.client._cache_result(self.client.price_history_cache, cache_key, price_data)
+        return price_data
@@ -0,0 +1,274 @@
+"""
+Fast parser for Schwab option-chain payloads.
+
+Option chains for indexes and ETFs run to tens of megabytes of JSON with
+about fifty fields per contract, of which the internal model keeps ten.
+This module decodes the response body and builds the OptionsChain, plus
+its columnar index, in a single pass over the contracts.
+
+Decoders are pluggable:
+
+- "orjson" (used automatically when the package is installed) decodes
+  bytes directly and is the fastest option.
+- "json" (stdlib) compacts the chain during decoding: each strike map is
+  reduced to (strike, fields) rows as soon as it is decoded, so the full
+  per-contract dict tree is never alive at once and peak memory drops.
+
+Payloads orjson rejects (for example bare NaN literals) fall back to the
+stdlib decoder. The result is identical to parse_schwab_option_chain()
+on the decoded dict.
+
+Example:
+    from src.schwab.chain_parser import parse_option_chain_payload
+
+    chain = parse_option_chain_payload("SPY", response.content)
+"""
+
+import json
+import logging
+from collections.abc import Callable, Iterable, Mapping
+from datetime import datetime
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from src.models.base import OptionContract, OptionsChain
+from src.models.chain_columns import ColumnarChain
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+Payload = Union[bytes, bytearray, memoryview, str]
+JSONDecoder = Callable[[Payload], Any]
+
+# OptionContract fields kept per contract, in row order
+ROW_FIELDS = (
+    "bid",
+    "ask",
+    "last",
+    "volume",
+    "open_interest",
+    "implied_volatility",
+    "delta",
+    "gamma",
+    "theta",
+    "vega",
+)
+
+
+class _StrikeRows(list):
+    """A strike map already reduced to (strike, row) pairs during decoding."""
+
+
+def _contract_row(data: dict[str, Any]) -> tuple:
+    """Extract ROW_FIELDS from a Schwab contract, exactly as parse_schwab_contract does."""
+    return (
+        data.get("bid", 0.0),
+        data.get("ask", 0.0),
+        data.get("last", 0.0),
+        data.get("totalVolume", 0),
+        data.get("openInterest", 0),
+        data.get("volatility", 0.0) / 100.0,  # Schwab returns as percentage
+        data.get("delta", 0.0),
+        data.get("gamma", 0.0),
+        data.get("theta", 0.0),
+        data.get("vega", 0.0),
+    )
+
+
+def _compact_strike_map(obj: dict[str, Any]) -> Any:
+    """
+    object_hook that reduces strike maps ({"155.0": [contract, ...]}) to rows.
+
+    Anything that is not a non-empty map of numeric keys to lists of
+    objects is returned unchanged.
+    """
+    if not obj:
+        return obj
+    for value in obj.values():
+        if type(value) is not list:
+            return obj
+    try:
+        strikes = [(float(key), value) for key, value in obj.items()]
+    except ValueError:
+        return obj
+    for _, contracts in strikes:
+        for data in contracts:
+            if type(data) is not dict:
+                return obj
+    return _StrikeRows(
+        (strike, _contract_row(data)) for strike, contracts in strikes for data in contracts
+    )
+
+
+def _decode_stdlib(payload: Payload) -> Any:
+    """Decode with the stdlib, compacting strike maps as they are decoded."""
+    if isinstance(payload, memoryview):
+        payload = payload.tobytes()
+    return json.loads(payload, object_hook=_compact_strike_map)
+
+
+def _decode_orjson(payload: Payload) -> Any:
+    """Decode with orjson, falling back to the stdlib for non-standard JSON."""
+    try:
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        logger.debug("orjson rejected option chain payload, falling back to json")
+        return _decode_stdlib(payload)
+
+
+_DECODERS: dict[str, JSONDecoder] = {"json": _decode_stdlib}
+if orjson is not None:
+    _DECODERS["orjson"] = _decode_orjson
+
+DEFAULT_DECODER = "orjson" if orjson is not None else "json"
+
+
+def available_decoders() -> list[str]:
+    """Names of the registered JSON decoders."""
+    return sorted(_DECODERS)
+
+
+def register_decoder(name: str, decoder: JSONDecoder) -> None:
+    """
+    Register a JSON decoder.
+
+    Args:
+        name: Decoder name used with parse_option_chain_payload(decoder=...)
+        decoder: Callable taking bytes or str and returning the decoded object
+    """
+    _DECODERS[name] = decoder
+
+
+def get_decoder(name: Optional[str] = None) -> JSONDecoder:
+    """
+    Look up a registered decoder.
+
+    Args:
+        name: Decoder name (default: DEFAULT_DECODER)
+
+    Returns:
+        The decoder callable
+
+    Raises:
+        ValueError: If no decoder is registered under that name
+    """
+    name = name or DEFAULT_DECODER
+    if name not in _DECODERS:
+        raise ValueError(f"Unknown JSON decoder '{name}'. Available: {available_decoders()}")
+    return _DECODERS[name]
+
+
+def _strike_rows(strikes: Any) -> Iterable[tuple[float, tuple]]:
+    """(strike, row) pairs for a strike map, compacted or not."""
+    if isinstance(strikes, _StrikeRows):
+        return strikes
+    return (
+        (float(strike_price), _contract_row(data))
+        for strike_price, option_list in strikes.items()
+        for data in option_list
+    )
+
+
+def build_option_chain(symbol: str, data: Mapping[str, Any]) -> OptionsChain:
+    """
+    Build an OptionsChain, with its columnar index, from a decoded payload.
+
+    Accepts both plain dicts and payloads decoded by this module's stdlib
+    decoder. Contracts are emitted calls first, then puts, in payload
+    order, as parse_schwab_option_chain does.
+
+    Args:
+        symbol: Underlying symbol
+        data: Decoded Schwab option chain response
+
+    Returns:
+        OptionsChain with columns already attached
+    """
+    contracts: list[OptionContract] = []
+    strikes: list[float] = []
+    rows: list[tuple] = []
+    expiration_dates: list[str] = []
+    calls = 0
+
+    for option_type, map_key in (("Call", "callExpDateMap"), ("Put", "putExpDateMap")):
+        for exp_date_key, strike_map in data.get(map_key, {}).items():
+            # exp_date_key format: "2026-02-21:30" (expiration:daysToExpiration)
+            exp_date = exp_date_key.split(":")[0]
+            start = len(contracts)
+            for strike, row in _strike_rows(strike_map):
+                contracts.append(
+                    OptionContract(
+                        symbol=symbol,
+                        expiration_date=exp_date,
+                        strike=strike,
+                        option_type=option_type,
+                        bid=row[0],
+                        ask=row[1],
+                        last=row[2],
+                        volume=row[3],
+                        open_interest=row[4],
+                        implied_volatility=row[5],
+                        delta=row[6],
+                        gamma=row[7],
+                        theta=row[8],
+                        vega=row[9],
+                    )
+                )
+                strikes.append(strike)
+                rows.append(row)
+            expiration_dates.extend([exp_date] * (len(contracts) - start))
+        if option_type == "Call":
+            calls = len(contracts)
+
+    chain = OptionsChain(
+        symbol=symbol,
+        contracts=contracts,
+        retrieved_at=datetime.now().isoformat(),
+        underlying_price=data.get("underlyingPrice"),
+    )
+
+    # Columns from the extracted rows, so the chain never rescans its contracts
+    try:
+        values = np.array(rows, dtype=np.float64).reshape(len(rows), len(ROW_FIELDS))
+    except (TypeError, ValueError):
+        logger.debug(f"Non-numeric fields in {symbol} chain; columns will be built on demand")
+        return chain
+
+    expirations, codes = np.unique(np.asarray(expiration_dates, dtype=str), return_inverse=True)
+    columns = {name: values[:, i] for i, name in enumerate(ROW_FIELDS)}
+    columns["strike"] = np.asarray(strikes, dtype=np.float64)
+    is_call = np.zeros(len(contracts), dtype=bool)
+    is_call[:calls] = True
+    chain.attach_columns(
+        ColumnarChain(
+            symbol=symbol,
+            expirations=expirations.tolist(),
+            expiration_codes=codes.astype(np.int64),
+            is_call=is_call,
+            columns=columns,
+            source=contracts,
+        )
+    )
+    return chain
+
+
+def parse_option_chain_payload(
+    symbol: str, payload: Payload, decoder: Optional[str] = None
+) -> OptionsChain:
+    """
+    Parse a raw Schwab option chain response body.
+
+    Args:
+        symbol: Underlying symbol
+        payload: Response body (bytes or str)
+        decoder: Registered decoder name (default: orjson if installed, else json)
+
+    Returns:
+        OptionsChain with contracts in internal format and columns attached
+    """
+    return build_option_chain(symbol, get_decoder(decoder)(payload))
@@ -0,0 +1,273 @@
+"""
+Narrowed option-chain requests.
+
+Full chains for large underlyings run to thousands of contracts, most of
+which the engines discard: ITM strikes, expirations beyond max_dte and
+strikes far outside the profile's sigma range. OptionChainQuery describes
+the slice of a chain to request, so only that slice is sent, parsed and
+cached.
+
+A cached chain can answer any query it covers: narrow() cuts a wider
+chain down to what the narrower query would have returned.
+
+Example:
+    from src.schwab.chain_query import OptionChainQuery
+
+    query = OptionChainQuery.envelope(
+        "AAPL", current_price=185.0, volatility=0.28,
+        max_sigma=2.0, max_dte=14, strike_spacing=2.5,
+    )
+    chain = client.get_option_chain(**query.request_kwargs())
+"""
+
+import math
+from dataclasses import dataclass, fields
+from datetime import date, timedelta
+from typing import Any, Optional
+
+import numpy as np
+
+from src.constants import CHAIN_FETCH_STRIKE_PADDING
+from src.models.base import OptionsChain
+from src.models.chain_columns import ChainSlice
+
+# Schwab "range" values narrow() can reproduce from a wider chain
+NARROWABLE_RANGES = ("ITM", "OTM")
+
+
+@dataclass(frozen=True)
+class OptionChainQuery:
+    """
+    Filters of one option chain request.
+
+    Attributes:
+        symbol: Underlying stock symbol
+        contract_type: "CALL", "PUT", or None for both
+        strike_count: Strikes returned above and below the money (None for all)
+        strike_range: Schwab moneyness filter ("ITM", "OTM", ...; None for all)
+        from_date: First expiration to return (YYYY-MM-DD)
+        to_date: Last expiration to return (YYYY-MM-DD)
+    """
+
+    symbol: str
+    contract_type: Optional[str] = None
+    strike_count: Optional[int] = None
+    strike_range: Optional[str] = None
+    from_date: Optional[str] = None
+    to_date: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        # Normalize case so equivalent queries share a cache key
+        if self.contract_type:
+            object.__setattr__(self, "contract_type", self.contract_type.upper())
+        if self.strike_range:
+            object.__setattr__(self, "strike_range", self.strike_range.upper())
+
+    @classmethod
+    def envelope(
+        cls,
+        symbol: str,
+        current_price: float,
+        volatility: float,
+        max_sigma: float,
+        max_dte: int,
+        contract_type: Optional[str] = None,
+        expiration_date: Optional[str] = None,
+        strike_spacing: Optional[float] = None,
+    ) -> "OptionChainQuery":
+        """
+        Smallest request holding every OTM strike within max_sigma.
+
+        The strike bound is the call side's sigma distance at max_dte (the
+        widest point of the envelope), converted to a strike count with
+        strike_spacing. Without a known spacing the strike count is left
+        open and only type, moneyness and expirations are narrowed.
+
+        Args:
+            symbol: Underlying stock symbol
+            current_price: Current stock price
+            volatility: Annualized volatility as decimal
+            max_sigma: Widest sigma distance the caller will consider
+            max_dte: Maximum days to expiration
+            contract_type: "CALL", "PUT", or None for both
+            expiration_date: Single expiration to request instead of the
+                max_dte window
+            strike_spacing: Finest strike increment of the symbol's chain
+
+        Returns:
+            OptionChainQuery for the envelope
+        """
+        if expiration_date:
+            from_date, to_date = expiration_date, expiration_date
+        else:
+            from_date = None
+            to_date = (date.today() + timedelta(days=max_dte)).isoformat()
+
+        strike_count = None
+        if strike_spacing and strike_spacing > 0 and current_price > 0 and volatility > 0:
+            years = max(max_dte, 1) / 365.0
+            max_move = current_price * math.expm1(max_sigma * volatility * math.sqrt(years))
+            strike_count = math.ceil(max_move / strike_spacing) + CHAIN_FETCH_STRIKE_PADDING
+
+        return cls(
+            symbol=symbol,
+            contract_type=contract_type,
+            strike_count=strike_count,
+            strike_range="OTM",
+            from_date=from_date,
+            to_date=to_date,
+        )
+
+    @property
+    def cache_key(self) -> str:
+        """Key of the query's chain in the client's chain cache."""
+        key = (
+            f"{self.symbol}_{self.contract_type}_{self.strike_count}_"
+            f"{self.from_date}_{self.to_date}"
+        )
+        if self.strike_range:
+            key += f"_{self.strike_range}"
+        return key
+
+    @classmethod
+    def from_cache_key(cls, symbol: str, cache_key: str) -> Optional["OptionChainQuery"]:
+        """
+        Recover the query behind a chain cache key.
+
+        Args:
+            symbol: Underlying symbol the key must belong to
+            cache_key: Key built by cache_key
+
+        Returns:
+            OptionChainQuery, or None if the key is not one of symbol's chains
+        """
+        prefix = f"{symbol}_"
+        if not cache_key.startswith(prefix):
+            return None
+        parts = [None if p == "None" else p for p in cache_key[len(prefix) :].split("_")]
+        if len(parts) not in (4, 5):
+            return None
+        contract_type, strike_count, from_date, to_date = parts[:4]
+        try:
+            count = int(strike_count) if strike_count is not None else None
+        except ValueError:
+            return None
+        return cls(
+            symbol=symbol,
+            contract_type=contract_type,
+            strike_count=count,
+            strike_range=parts[4] if len(parts) == 5 else None,
+            from_date=from_date,
+            to_date=to_date,
+        )
+
+    def request_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments of get_option_chain() for this query."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def params(self, include_quotes: bool = True) -> dict[str, Any]:
+        """Query parameters of the Schwab option chain endpoint."""
+        params: dict[str, Any] = {
+            "symbol": self.symbol,
+            "includeQuotes": str(include_quotes).lower(),
+        }
+        if self.contract_type:
+            params["contractType"] = self.contract_type
+        if self.strike_count:
+            params["strikeCount"] = self.strike_count
+        if self.strike_range:
+            params["range"] = self.strike_range
+        if self.from_date:
+            params["fromDate"] = self.from_date
+        if self.to_date:
+            params["toDate"] = self.to_date
+        return params
+
+    def covers(self, other: "OptionChainQuery") -> bool:
+        """
+        Whether this query's chain holds every contract other's would.
+
+        Args:
+            other: Narrower query to answer
+
+        Returns:
+            True if narrow() on this query's chain can answer other
+        """
+        if self.symbol != other.symbol:
+            return False
+        if self.contract_type and self.contract_type != other.contract_type:
+            return False
+        if self.strike_range not in (None, "ALL") and self.strike_range != other.strike_range:
+            return False
+        if other.strike_range not in (None, "ALL", *NARROWABLE_RANGES) and (
+            self.strike_range != other.strike_range
+        ):
+            return False
+        if self.strike_count and (not other.strike_count or other.strike_count > self.strike_count):
+            return False
+        if self.from_date and (not other.from_date or other.from_date < self.from_date):
+            return False
+        return not (self.to_date and (not other.to_date or other.to_date > self.to_date))
+
+    def narrow(self, options_chain: OptionsChain) -> OptionsChain:
+        """
+        Cut a chain from a covering query down to this query.
+
+        Moneyness and strike-count filters need the chain's underlying
+        price; without it those filters are skipped and the result may
+        hold extra strikes.
+
+        Args:
+            options_chain: Chain fetched for a query that covers this one
+
+        Returns:
+            New OptionsChain with the matching contracts, in chain order
+        """
+        columns = options_chain.columns
+        price = options_chain.underlying_price
+        types = ["call", "put"]
+        if self.contract_type:
+            types = [self.contract_type.lower()]
+
+        rows = []
+        for option_type in types:
+            for chain_slice in columns.slices(option_type):
+                expiration = chain_slice.expiration_date
+                if self.from_date and expiration < self.from_date:
+                    continue
+                if self.to_date and expiration > self.to_date:
+                    continue
+                if price:
+                    chain_slice = self._narrow_strikes(chain_slice, price)
+                rows.append(columns.source_index(slice(chain_slice.start, chain_slice.stop)))
+
+        keep = np.sort(np.concatenate(rows or [np.empty(0, dtype=np.int64)]))
+        return OptionsChain(
+            symbol=options_chain.symbol,
+            contracts=[options_chain.contracts[i] for i in keep.tolist()],
+            retrieved_at=options_chain.retrieved_at,
+            underlying_price=price,
+        )
+
+    def _narrow_strikes(self, chain_slice: ChainSlice, price: float) -> ChainSlice:
+        """Apply the strike count and moneyness filters to one expiration."""
+        at_money = int(np.searchsorted(chain_slice.strike, price))
+        low, high = 0, len(chain_slice)
+        if self.strike_count:
+            low = max(0, at_money - self.strike_count)
+            high = min(high, at_money + self.strike_count)
+
+        is_call = chain_slice.option_type == "call"
+        if self.strike_range == "OTM":
+            # Calls above the money, puts below it
+            low, high = (max(low, at_money), high) if is_call else (low, min(high, at_money))
+        elif self.strike_range == "ITM":
+            low, high = (low, min(high, at_money)) if is_call else (max(low, at_money), high)
+
+        return ChainSlice(
+            chain_slice.chain,
+            chain_slice.start + low,
+            chain_slice.start + max(low, high),
+            chain_slice.option_type,
+            chain_slice.expiration_date,
+        )
@@ -14,14 +14,17 @@ OAuth tokens. Tokens are automatically refreshed when expired.
 """
 
 import logging
-import time
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 import requests
 
 from src.api.base_client import BaseAPIClient
+from src.api.cache import Cache, CacheNamespace
+from src.api.single_flight import SingleFlight
 from src.constants import (
+    CACHE_MAX_CHAIN_ENTRIES,
     CACHE_TTL_QUOTE_SECONDS,
     CACHE_TTL_OPTIONS_CHAIN_SECONDS,
     CACHE_TTL_PRICE_HISTORY_SECONDS,
@@ -32,13 +35,15 @@ from src.volatility_models import PriceData
 from src.oauth.exceptions import TokenNotAvailableError
 
 from . import endpoints
+from .chain_parser import parse_option_chain_payload
+from .chain_query import OptionChainQuery
 from .exceptions import (
     SchwabAPIError,
     SchwabAuthenticationError,
     SchwabInvalidSymbolError,
-    SchwabRateLimitError,
+    raise_for_schwab_status,
 )
-from .models import SchwabAccount, SchwabAccountBalances, SchwabPosition
+from .models import SchwabAccount, SchwabAccountBalances, SchwabPosition, SchwabQuoteBatch
 from .parsers import (
     parse_schwab_account,
     parse_schwab_balances,
@@ -46,11 +51,83 @@ from .parsers import (
     parse_schwab_option_chain,
     parse_schwab_position,
     parse_schwab_price_history,
+    parse_schwab_quote,
 )
 
+if TYPE_CHECKING:
+    from src.api.circuit_breaker import CircuitBreakerRegistry
+    from src.api.rate_limiter import RateLimiter
+    from src.market_data.chain_store import ChainSnapshotStore
+
 logger = logging.getLogger(__name__)
 
 
+def option_chain_request(
+    symbol: str,
+    contract_type: Optional[str] = None,
+    strike_count: Optional[int] = None,
+    include_quotes: bool = True,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    strike_range: Optional[str] = None,
+) -> tuple[OptionChainQuery, Dict[str, Any]]:
+    """
+    Build the query and query parameters of an option chain request.
+
+    Returns:
+        Tuple of (query, params); query.cache_key keys the chain cache
+    """
+    query = OptionChainQuery(
+        symbol=symbol,
+        contract_type=contract_type,
+        strike_count=strike_count,
+        strike_range=strike_range,
+        from_date=from_date,
+        to_date=to_date,
+    )
+    return query, query.params(include_quotes)
+
+
+def price_history_request(
+    symbol: str,
+    period_type: str,
+    period: int,
+    frequency_type: str,
+    frequency: int,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> tuple[str, Dict[str, Any]]:
+    """
+    Build the cache key and query parameters of a price history request.
+
+    Args:
+        symbol: Upper-cased stock symbol
+
+    Returns:
+        Tuple of (cache_key, params)
+    """
+    cache_key = (
+        f"{symbol}_{period_type}_{period}_{frequency_type}_{frequency}_"
+        f"{start_date}_{end_date}"
+    )
+    params: Dict[str, Any] = {
+        "symbol": symbol,
+        "periodType": period_type,
+        "period": period,
+        "frequencyType": frequency_type,
+        "frequency": frequency,
+    }
+
+    # Add date parameters if provided
+    if start_date:
+        # Schwab expects milliseconds since epoch
+        params["startDate"] = int(start_date.timestamp() * 1000)
+    if end_date:
+        params["endDate"] = int(end_date.timestamp() * 1000)
+
+    return cache_key, params
+
+
 class SchwabClient(BaseAPIClient):
     """
     Authenticated HTTP client for Schwab APIs.
@@ -84,12 +161,19 @@ class SchwabClient(BaseAPIClient):
     # Schwab API version prefix
     API_VERSION = "/v1"
 
+    RATE_LIMIT_KEY = "schwab"
+
     def __init__(
         self,
         oauth_coordinator: Optional[OAuthCoordinator] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
         enable_cache: bool = True,
+        snapshot_store: Optional["ChainSnapshotStore"] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+        cache: Optional[Cache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        circuit_breakers: Optional["CircuitBreakerRegistry"] = None,
     ):
         """
         Initialize Schwab API client.
@@ -100,14 +184,38 @@ class SchwabClient(BaseAPIClient):
             max_retries: Maximum number of retries for transient errors
             retry_delay: Base delay between retries in seconds (exponential backoff)
             enable_cache: Whether to enable in-memory response caching
+            snapshot_store: Optional store that keeps every fetched option chain
+            rate_limiter: Optional limiter consulted before every request
+            cache: Optional response cache to share (default: a private
+                   in-memory Cache)
+            single_flight: Optional registry coalescing identical in-flight
+                           fetches (default: a private one)
+            circuit_breakers: Optional per-host breakers that fail requests
+                              fast while Schwab is down
         """
         # Initialize base client
-        super().__init__(max_retries=max_retries, retry_delay=retry_delay, timeout=30)
+        super().__init__(
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            timeout=30,
+            rate_limiter=rate_limiter,
+            circuit_breakers=circuit_breakers,
+        )
 
         self.oauth = oauth_coordinator or OAuthCoordinator()
         self.enable_cache = enable_cache
-        # Use simple dict for in-memory caching with timestamps
-        self.cache: Dict[str, tuple[Any, float]] = {} if enable_cache else {}
+        # Bounded response cache with one namespace (and TTL) per kind of data
+        self.cache = cache if cache is not None else Cache()
+        self.quote_cache = self.cache.namespace("schwab_quote", CACHE_TTL_QUOTE_SECONDS)
+        self.chain_cache = self.cache.namespace(
+            "schwab_chain", CACHE_TTL_OPTIONS_CHAIN_SECONDS, max_entries=CACHE_MAX_CHAIN_ENTRIES
+        )
+        self.price_history_cache = self.cache.namespace(
+            "schwab_price_history", CACHE_TTL_PRICE_HISTORY_SECONDS
+        )
+        # Concurrent cache misses for the same key share one fetch
+        self.single_flight = single_flight if single_flight is not None else SingleFlight()
+        self.snapshot_store = snapshot_store
 
         logger.info("SchwabClient initialized")
 
@@ -143,31 +251,9 @@ class SchwabClient(BaseAPIClient):
             SchwabInvalidSymbolError: For 404 errors
             SchwabAPIError: For other errors
         """
-        if response.status_code == 401:
-            logger.error(f"Authentication failed (401): {response.text}")
-            raise SchwabAuthenticationError(
-                "Authentication failed. OAuth token may be expired or revoked. "
-                "Re-authorize on HOST: python scripts/authorize_schwab_host.py --revoke && "
-                "python scripts/authorize_schwab_host.py"
-            )
-
-        elif response.status_code == 429:
-            logger.warning("Rate limit exceeded (429)")
-            raise SchwabRateLimitError(
-                "Schwab API rate limit exceeded. Please wait before retrying."
-            )
-
-        elif response.status_code == 404:
-            logger.warning(f"Resource not found (404): {response.url}")
-            raise SchwabInvalidSymbolError(
-                f"Resource not found. Check symbol or endpoint"
-            )
-
-        elif not response.ok:
-            logger.error(f"API error ({response.status_code}): {response.text}")
-            raise SchwabAPIError(
-                f"Schwab API error ({response.status_code}): {response.text}"
-            )
+        raise_for_schwab_status(
+            response.status_code, response.ok, response.text, response.url
+        )
 
     def _request(
         self,
@@ -290,16 +376,12 @@ class SchwabClient(BaseAPIClient):
             quote = client.get_quote("AAPL")
             print(f"Last price: ${quote['lastPrice']}")
         """
-        # Check cache first
-        if use_cache and self.enable_cache:
-            cache_key = f"schwab_quote_{symbol}"
-            if cache_key in self.cache:
-                cached_data, cached_time = self.cache[cache_key]
-                age_seconds = time.time() - cached_time
-                if age_seconds < CACHE_TTL_QUOTE_SECONDS:
-                    logger.debug(f"Using cached quote for {symbol} (age: {age_seconds:.1f}s)")
-                    return cached_data
+        return self._cached_or_fetch(
+            self.quote_cache, symbol, use_cache, lambda: self._fetch_quote(symbol)
+        )
 
+    def _fetch_quote(self, symbol: str) -> Dict[str, Any]:
+        """Fetch and cache one quote."""
         # Fetch from API
         logger.info(f"Fetching quote for {symbol}")
 
@@ -310,26 +392,14 @@ class SchwabClient(BaseAPIClient):
         try:
             response_data = self.get(endpoint, params=params)
 
-            # Response format: {symbol: {quote: {...}, extended: {...}, ...}}
-            # Extract the data for our symbol
-            symbol_data = response_data.get(symbol)
-            if not symbol_data:
+            quote_data = parse_schwab_quote(response_data, symbol)
+            if quote_data is None:
                 raise SchwabInvalidSymbolError(
                     f"Symbol {symbol} not found in response"
                 )
 
-            # Extract the quote data from the nested 'quote' dictionary
-            # Schwab response has: {quote: {lastPrice, closePrice, ...}, extended: {...}, ...}
-            quote_data = symbol_data.get("quote", {})
-
-            # Merge in some useful top-level fields for completeness
-            quote_data["symbol"] = symbol_data.get("symbol", symbol)
-            quote_data["quoteType"] = symbol_data.get("quoteType")
-            quote_data["realtime"] = symbol_data.get("realtime")
-
             # Cache the result (5 minute TTL for quotes)
-            if self.enable_cache:
-                self.cache[f"schwab_quote_{symbol}"] = (quote_data, time.time())
+            self._cache_result(self.quote_cache, symbol, quote_data)
 
             return quote_data
 
@@ -339,6 +409,252 @@ class SchwabClient(BaseAPIClient):
             logger.error(f"Failed to fetch quote for {symbol}: {e}")
             raise
 
+    def get_quotes(self, symbols: List[str], use_cache: bool = True) -> SchwabQuoteBatch:
+        """
+        Get real-time quotes for many symbols with as few requests as possible.
+
+        Cached quotes are reused; the rest are requested in chunks of
+        MARKETDATA_QUOTES_MAX_SYMBOLS and every returned quote fills the
+        per-symbol cache used by get_quote(). Symbols another call is
+        fetching at the same moment are joined instead of requested again.
+        Invalid symbols and failed chunks are reported in the result instead
+        of raising.
+
+        Args:
+            symbols: Stock symbols (duplicates are ignored)
+            use_cache: Whether to use cached data if available (default: True)
+
+        Returns:
+            SchwabQuoteBatch with quotes in the get_quote() format
+
+        Raises:
+            SchwabAuthenticationError: If authentication fails
+
+        Example:
+            batch = client.get_quotes(["AAPL", "MSFT", "F"])
+            for symbol, quote in batch.quotes.items():
+                print(f"{symbol}: ${quote['lastPrice']}")
+        """
+        batch = SchwabQuoteBatch()
+        chunks, led, joined = self._pending_quote_chunks(symbols, use_cache, batch)
+        try:
+            for chunk in chunks:
+                logger.info(f"Fetching quotes for {len(chunk)} symbols")
+
+                try:
+                    response_data = self.get(
+                        endpoints.MARKETDATA_QUOTES, params={"symbols": ",".join(chunk)}
+                    )
+                except SchwabAuthenticationError:
+                    raise
+                except SchwabInvalidSymbolError:
+                    # 404 when none of the chunk's symbols exist
+                    batch.invalid_symbols.extend(chunk)
+                    continue
+                except SchwabAPIError as e:
+                    logger.error(f"Failed to fetch quotes for {len(chunk)} symbols: {e}")
+                    batch.errors.update({symbol: str(e) for symbol in chunk})
+                    continue
+
+                self._collect_quotes(batch, chunk, response_data)
+        except BaseException as e:
+            self._finish_quote_flights(led, batch, e)
+            raise
+        self._finish_quote_flights(led, batch)
+
+        for symbol, call in joined.items():
+            try:
+                outcome = call.result()
+            except BaseException as e:
+                outcome = e
+            self._add_joined_quote(batch, symbol, outcome)
+
+        if batch.invalid_symbols:
+            logger.warning(f"Symbols not found in quote response: {batch.invalid_symbols}")
+        return batch
+
+    def _cached(self, namespace: CacheNamespace, key: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            namespace: Cache namespace (sets the TTL)
+            key: Key within the namespace
+
+        Returns:
+            Cached value, or None if caching is disabled, missing or stale
+        """
+        if not self.enable_cache:
+            return None
+        cached = namespace.lookup(key)
+        if cached is not None:
+            logger.debug(f"Using cached {namespace.name} {key}")
+        return cached
+
+    def _cache_result(self, namespace: CacheNamespace, key: str, value: Any) -> None:
+        """Cache a response if caching is enabled."""
+        if self.enable_cache:
+            namespace.store(key, value)
+
+    def _cached_or_fetch(
+        self, namespace: CacheNamespace, key: str, use_cache: bool, fetch: Callable[[], Any]
+    ) -> Any:
+        """
+        Return a cached response, or fetch() it.
+
+        Concurrent calls for the same key share one fetch() and its outcome
+        (see SingleFlight).
+
+        Args:
+            namespace: Cache namespace (also the single-flight namespace)
+            key: Key within the namespace
+            use_cache: Whether to use cached data if available
+            fetch: Fetches and caches the response
+
+        Returns:
+            Cached or fetched response
+        """
+        if use_cache:
+            cached = self._cached(namespace, key)
+            if cached is not None:
+                return cached
+
+        def lead() -> Any:
+            # A call that finished since the cache check above may have stored it
+            if use_cache:
+                cached = self._cached(namespace, key)
+                if cached is not None:
+                    return cached
+            return fetch()
+
+        return self.single_flight.do(namespace.name, key, lead)
+
+    def _pending_quote_chunks(
+        self, symbols: List[str], use_cache: bool, batch: SchwabQuoteBatch
+    ) -> Tuple[List[List[str]], Dict[str, Future], Dict[str, Future]]:
+        """
+        Fill a batch from the quote cache and chunk the symbols left to fetch.
+
+        Symbols another caller is already fetching are joined instead of
+        fetched again. The caller leads the fetch of the chunked symbols and
+        must pass their calls to _finish_quote_flights().
+
+        Args:
+            symbols: Stock symbols (duplicates are ignored)
+            use_cache: Whether to use cached data if available
+            batch: Batch receiving the cached quotes
+
+        Returns:
+            (chunks, led, joined): chunks of at most MARKETDATA_QUOTES_MAX_SYMBOLS
+            symbols to fetch, the calls led for them and the in-flight calls
+            joined, by symbol
+        """
+        led: Dict[str, Future] = {}
+        joined: Dict[str, Future] = {}
+        for symbol in dict.fromkeys(symbols):
+            cached = (
+                self._cached(self.quote_cache, symbol)
+                if use_cache
+                else None
+            )
+            if cached is not None:
+                batch.quotes[symbol] = cached
+                continue
+            call, leader = self.single_flight.begin(self.quote_cache.name, symbol)
+            if not leader:
+                joined[symbol] = call
+                continue
+            # A call that finished since the cache check may have stored it
+            cached = self._cached(self.quote_cache, symbol) if use_cache else None
+            if cached is not None:
+                batch.quotes[symbol] = cached
+                self.single_flight.finish(self.quote_cache.name, symbol, call, value=cached)
+            else:
+                led[symbol] = call
+
+        pending = list(led)
+        chunk_size = endpoints.MARKETDATA_QUOTES_MAX_SYMBOLS
+        chunks = [pending[start : start + chunk_size] for start in range(0, len(pending), chunk_size)]
+        return chunks, led, joined
+
+    def _finish_quote_flights(
+        self,
+        led: Dict[str, Future],
+        batch: SchwabQuoteBatch,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Publish the outcome of every led symbol to the callers that joined it.
+
+        Args:
+            led: Calls led, by symbol (from _pending_quote_chunks())
+            batch: Batch holding the fetched quotes, invalid symbols and errors
+            error: Exception that aborted the batch, for symbols not fetched yet
+        """
+        invalid = set(batch.invalid_symbols)
+        for symbol, call in led.items():
+            if symbol in batch.quotes:
+                self.single_flight.finish(
+                    self.quote_cache.name, symbol, call, value=batch.quotes[symbol]
+                )
+                continue
+            if symbol in invalid:
+                failure: BaseException = SchwabInvalidSymbolError(f"Symbol {symbol} not found")
+            elif symbol in batch.errors:
+                failure = SchwabAPIError(batch.errors[symbol])
+            else:
+                failure = error or SchwabAPIError(f"Quote for {symbol} was not fetched")
+            self.single_flight.finish(self.quote_cache.name, symbol, call, error=failure)
+
+    @staticmethod
+    def _add_joined_quote(batch: SchwabQuoteBatch, symbol: str, outcome: Any) -> None:
+        """
+        Add the outcome of a joined quote fetch to a batch.
+
+        Raises:
+            SchwabAuthenticationError: If the joined fetch failed authentication
+        """
+        if isinstance(outcome, SchwabInvalidSymbolError):
+            batch.invalid_symbols.append(symbol)
+        elif isinstance(outcome, SchwabAuthenticationError):
+            raise outcome
+        elif isinstance(outcome, BaseException):
+            batch.errors[symbol] = str(outcome)
+        else:
+            batch.quotes[symbol] = outcome
+
+    def _collect_quotes(
+        self, batch: SchwabQuoteBatch, chunk: List[str], response_data: Dict[str, Any]
+    ) -> None:
+        """Add a chunk's quotes to a batch and the cache; missing symbols are invalid."""
+        for symbol in chunk:
+            quote_data = parse_schwab_quote(response_data, symbol)
+            if quote_data is None:
+                batch.invalid_symbols.append(symbol)
+                continue
+            batch.quotes[symbol] = quote_data
+            self._cache_result(self.quote_cache, symbol, quote_data)
+
+    @staticmethod
+    def _parse_option_chain_response(symbol: str, response: Any) -> OptionsChain:
+        """
+        Parse an option chain response (requests or httpx).
+
+        The raw body is decoded straight into contracts and columns; chains
+        for indexes and ETFs are megabytes of JSON.
+        """
+        body = response.content
+        if isinstance(body, (bytes, bytearray)):
+            return parse_option_chain_payload(symbol, body)
+        return parse_schwab_option_chain(symbol, response.json())
+
+    def _store_snapshot(self, options_chain: OptionsChain, params: Dict[str, Any]) -> None:
+        """Append a fetched chain to the snapshot store; storage errors are not fatal."""
+        try:
+            self.snapshot_store.write(options_chain, query=params)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to store {options_chain.symbol} chain snapshot: {e}")
+
     def get_option_chain(
         self,
         symbol: str,
@@ -348,10 +664,14 @@ class SchwabClient(BaseAPIClient):
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
         use_cache: bool = True,
+        strike_range: Optional[str] = None,
     ) -> OptionsChain:
         """
         Get options chain for a symbol.
 
+        A cached chain for a wider request (see OptionChainQuery.covers)
+        answers a narrower one without a network call.
+
         Args:
             symbol: Underlying stock symbol (e.g., "AAPL")
             contract_type: Filter by "CALL", "PUT", or None for both (default: None)
@@ -360,6 +680,8 @@ class SchwabClient(BaseAPIClient):
             from_date: Start date for expiration filter (YYYY-MM-DD)
             to_date: End date for expiration filter (YYYY-MM-DD)
             use_cache: Whether to use cached data if available (default: True)
+            strike_range: Filter by moneyness, "ITM", "OTM", "NTM", ...
+                (default: None for all)
 
         Returns:
             OptionsChain object with contracts parsed to internal format
@@ -373,46 +695,62 @@ class SchwabClient(BaseAPIClient):
             chain = client.get_option_chain("AAPL", contract_type="CALL", strike_count=10)
             print(f"Found {len(chain.contracts)} call contracts")
         """
-        # Build cache key
-        cache_params = f"{symbol}_{contract_type}_{strike_count}_{from_date}_{to_date}"
-        cache_key = f"schwab_chain_{cache_params}"
-
-        # Check cache first
-        if use_cache and self.enable_cache:
-            if cache_key in self.cache:
-                cached_data, cached_time = self.cache[cache_key]
-                age_seconds = time.time() - cached_time
-                if age_seconds < CACHE_TTL_OPTIONS_CHAIN_SECONDS:
-                    logger.debug(f"Using cached options chain for {symbol} (age: {age_seconds:.1f}s)")
-                    return cached_data
-
-        # Build request parameters
-        params: Dict[str, Any] = {
-            "symbol": symbol,
-            "includeQuotes": str(include_quotes).lower(),
-        }
-
-        if contract_type:
-            params["contractType"] = contract_type.upper()
-        if strike_count:
-            params["strikeCount"] = strike_count
-        if from_date:
-            params["fromDate"] = from_date
-        if to_date:
-            params["toDate"] = to_date
+        query, params = option_chain_request(
+            symbol, contract_type, strike_count, include_quotes, from_date, to_date, strike_range
+        )
 
+        def fetch() -> OptionsChain:
+            narrowed = self._narrow_cached_chain(query) if use_cache else None
+            if narrowed is not None:
+                return narrowed
+            return self._fetch_option_chain(symbol, query.cache_key, params)
+
+        return self._cached_or_fetch(self.chain_cache, query.cache_key, use_cache, fetch)
+
+    def _narrow_cached_chain(self, query: OptionChainQuery) -> Optional[OptionsChain]:
+        """
+        Answer a query from a fresh cached chain that covers it.
+
+        The narrowed chain is cached under the query's key with the wider
+        chain's fetch time, so it expires with it.
+
+        Returns:
+            Narrowed OptionsChain, or None if no cached chain covers the query
+        """
+        if not self.enable_cache:
+            return None
+        for key in self.chain_cache.keys_with_prefix(f"{query.symbol}_"):
+            if key == query.cache_key:
+                continue
+            cached_query = OptionChainQuery.from_cache_key(query.symbol, key)
+            if cached_query is None or not cached_query.covers(query):
+                continue
+            entry = self.chain_cache.lookup_entry(key)
+            if entry is None:
+                continue
+            wider, stored_at = entry
+            narrowed = query.narrow(wider)
+            logger.debug(f"Narrowed cached chain {key} to {query.cache_key}")
+            self.chain_cache.store(query.cache_key, narrowed, stored_at)
+            return narrowed
+        return None
+
+    def _fetch_option_chain(
+        self, symbol: str, cache_key: str, params: Dict[str, Any]
+    ) -> OptionsChain:
+        """Fetch and cache one option chain."""
         # Fetch from API
         logger.info(f"Fetching options chain for {symbol}")
 
         try:
-            response_data = self.get(endpoints.MARKETDATA_OPTION_CHAINS, params=params)
+            response = self._request("GET", endpoints.MARKETDATA_OPTION_CHAINS, params=params)
+            options_chain = self._parse_option_chain_response(symbol, response)
 
-            # Parse Schwab format to internal OptionsChain
-            options_chain = parse_schwab_option_chain(symbol, response_data)
+            if self.snapshot_store is not None:
+                self._store_snapshot(options_chain, params)
 
             # Cache the result (15 minute TTL for options chains)
-            if self.enable_cache:
-                self.cache[cache_key] = (options_chain, time.time())
+            self._cache_result(self.chain_cache, cache_key, options_chain)
 
             return options_chain
 
@@ -532,38 +870,21 @@ class SchwabClient(BaseAPIClient):
         """
         symbol = symbol.upper()
 
-        # Build cache key
-        cache_params = (
-            f"{symbol}_{period_type}_{period}_{frequency_type}_{frequency}_"
-            f"{start_date}_{end_date}"
+        cache_key, params = price_history_request(
+            symbol, period_type, period, frequency_type, frequency, start_date, end_date
         )
-        cache_key = f"schwab_price_history_{cache_params}"
-
-        # Check cache first
-        if use_cache and self.enable_cache:
-            if cache_key in self.cache:
-                cached_data, cached_time = self.cache[cache_key]
-                age_seconds = time.time() - cached_time
-                if age_seconds < CACHE_TTL_PRICE_HISTORY_SECONDS:
-                    logger.debug(f"Using cached price history for {symbol} (age: {age_seconds:.1f}s)")
-                    return cached_data
-
-        # Build request parameters
-        params: Dict[str, Any] = {
-            "symbol": symbol,
-            "periodType": period_type,
-            "period": period,
-            "frequencyType": frequency_type,
-            "frequency": frequency,
-        }
-
-        # Add date parameters if provided
-        if start_date:
-            # Schwab expects milliseconds since epoch
-            params["startDate"] = int(start_date.timestamp() * 1000)
-        if end_date:
-            params["endDate"] = int(end_date.timestamp() * 1000)
 
+        return self._cached_or_fetch(
+            self.price_history_cache,
+            cache_key,
+            use_cache,
+            lambda: self._fetch_price_history(symbol, cache_key, params),
+        )
+
+    def _fetch_price_history(
+        self, symbol: str, cache_key: str, params: Dict[str, Any]
+    ) -> PriceData:
+        """Fetch and cache price history."""
         # Fetch from API
         logger.info(f"Fetching price history for {symbol}")
         logger.debug(f"Price history params: {params}")
@@ -576,8 +897,7 @@ class SchwabClient(BaseAPIClient):
             price_data = parse_schwab_price_history(symbol, response_data)
 
             # Cache the result (24-hour TTL for price history, matching AlphaVantage)
-            if self.enable_cache:
-                self.cache[cache_key] = (price_data, time.time())
+            self._cache_result(self.price_history_cache, cache_key, price_data)
 
             return price_data
 
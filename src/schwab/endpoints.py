@@ -17,6 +17,9 @@ MARKETDATA_MARKET_HOURS = "/marketdata/v1/markets"
 MARKETDATA_INSTRUMENTS = "/marketdata/v1/instruments"
 MARKETDATA_PRICE_HISTORY = "/marketdata/v1/pricehistory"
 
+# Maximum symbols per MARKETDATA_QUOTES request
+MARKETDATA_QUOTES_MAX_SYMBOLS = 500
+
 # Account & Trading Endpoints
 ACCOUNTS = "/trader/v1/accounts"
 ACCOUNT_DETAILS = "/trader/v1/accounts/{accountHash}"
@@ -1,5 +1,9 @@
 """Exceptions for Schwab API client."""
 
+import logging
+
+logger = logging.getLogger(__name__)
+
 
 class SchwabAPIError(Exception):
     """Base exception for Schwab API errors."""
@@ -34,3 +38,48 @@ class SchwabInvalidSymbolError(SchwabAPIError):
     """Invalid or unknown symbol."""
 
     pass
+
+
+def raise_for_schwab_status(status_code: int, ok: bool, text: str, url: object) -> None:
+    """
+    Map a Schwab HTTP error status to the matching exception.
+
+    Shared by the sync and async clients so both raise the same errors.
+
+    Args:
+        status_code: HTTP status code
+        ok: Whether the HTTP stack considers the response successful
+        text: Response body, for error messages
+        url: Request URL, for log messages
+
+    Raises:
+        SchwabAuthenticationError: For 401 errors
+        SchwabRateLimitError: For 429 errors
+        SchwabInvalidSymbolError: For 404 errors
+        SchwabAPIError: For other errors
+    """
+    if status_code == 401:
+        logger.error(f"Authentication failed (401): {text}")
+        raise SchwabAuthenticationError(
+            "Authentication failed. OAuth token may be expired or revoked. "
+            "Re-authorize on HOST: python scripts/authorize_schwab_host.py --revoke && "
+            "python scripts/authorize_schwab_host.py"
+        )
+
+    elif status_code == 429:
+        logger.warning("Rate limit exceeded (429)")
+        raise SchwabRateLimitError(
+            "Schwab API rate limit exceeded. Please wait before retrying."
+        )
+
+    elif status_code == 404:
+        logger.warning(f"Resource not found (404): {url}")
+        raise SchwabInvalidSymbolError(
+            "Resource not found. Check symbol or endpoint"
+        )
+
+    elif not ok:
+        logger.error(f"API error ({status_code}): {text}")
+        raise SchwabAPIError(
+            f"Schwab API error ({status_code}): {text}"
+        )
@@ -6,7 +6,7 @@ These models handle the Schwab API response format and provide a clean
 interface for working with Schwab account information.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
@@ -186,3 +186,129 @@ class SchwabAccount:
             f"SchwabAccount({self.account_type} ***{self.account_number[-4:]}: "
             f"{len(self.positions)} positions, ${self.balances.account_value:,.2f})"
         )
+
+
+@dataclass
+class SchwabQuoteBatch:
+    """
+    Result of a multi-symbol quote request.
+
+    Symbols are reported individually: a bad symbol or a failed request
+    for one chunk does not fail the rest of the batch.
+
+    Attributes:
+        quotes: Symbol -> quote data (same format as SchwabClient.get_quote)
+        invalid_symbols: Symbols Schwab did not recognize
+        errors: Symbol -> error message for chunks whose request failed
+    """
+
+    quotes: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    invalid_symbols: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the quote for a symbol.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Quote data, or None if the symbol was invalid or failed
+        """
+        return self.quotes.get(symbol)
+
+    @property
+    def failed_symbols(self) -> List[str]:
+        """Symbols without a quote, invalid or failed."""
+        return self.invalid_symbols + list(self.errors)
+
+
+@dataclass
+class SchwabHolding:
+    """
+    One security's position summed across accounts.
+
+    Attributes:
+        symbol: Security symbol
+        asset_type: Asset type (EQUITY, OPTION, etc.)
+        quantity: Total shares/contracts held
+        market_value: Total market value
+        cost_basis: Total cost (average price times quantity, per account)
+        accounts: Account numbers holding the security
+    """
+
+    symbol: str
+    asset_type: Optional[str]
+    quantity: float = 0.0
+    market_value: float = 0.0
+    cost_basis: float = 0.0
+    accounts: List[str] = field(default_factory=list)
+
+    @property
+    def average_price(self) -> float:
+        """Average cost per share across accounts."""
+        return self.cost_basis / self.quantity if self.quantity else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary for JSON serialization.
+
+        Returns:
+            Dictionary representation of the holding
+        """
+        return {
+            "symbol": self.symbol,
+            "asset_type": self.asset_type,
+            "quantity": self.quantity,
+            "market_value": self.market_value,
+            "cost_basis": self.cost_basis,
+            "average_price": self.average_price,
+            "accounts": list(self.accounts),
+        }
+
+
+@dataclass
+class SchwabAccountSync:
+    """
+    Positions of every account, as of one sync.
+
+    Pass a sync back to sync_accounts() as ``previous`` and accounts whose
+    summary has not changed are reused instead of fetched again.
+
+    Attributes:
+        accounts: Account number -> account with positions
+        fingerprints: Account number -> change check of its summary
+        synced_at: Account number -> time.time() its positions were fetched
+        refreshed: Accounts whose positions were fetched in this sync
+        skipped: Accounts reused unchanged from the previous sync
+        errors: Account number -> error message for failed fetches
+    """
+
+    accounts: Dict[str, SchwabAccount] = field(default_factory=dict)
+    fingerprints: Dict[str, str] = field(default_factory=dict)
+    synced_at: Dict[str, float] = field(default_factory=dict)
+    refreshed: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def holdings(self) -> Dict[str, SchwabHolding]:
+        """
+        Consolidate positions across accounts by symbol.
+
+        Returns:
+            Symbol -> SchwabHolding, in first-seen order
+        """
+        holdings: Dict[str, SchwabHolding] = {}
+        for account_number, account in self.accounts.items():
+            for position in account.positions:
+                holding = holdings.get(position.symbol)
+                if holding is None:
+                    holding = SchwabHolding(position.symbol, position.asset_type)
+                    holdings[position.symbol] = holding
+                holding.quantity += position.quantity
+                holding.market_value += position.market_value
+                holding.cost_basis += position.average_price * position.quantity
+                if account_number not in holding.accounts:
+                    holding.accounts.append(account_number)
+        return holdings
@@ -8,7 +8,7 @@ responses into structured objects.
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from src.models.base import OptionContract, OptionsChain
 from src.volatility_models import PriceData
@@ -62,6 +62,7 @@ def parse_schwab_option_chain(
         symbol=symbol,
         contracts=contracts,
         retrieved_at=datetime.now().isoformat(),
+        underlying_price=data.get("underlyingPrice"),
     )
 
 
@@ -188,6 +189,34 @@ def parse_schwab_balances(data: Dict[str, Any]) -> SchwabAccountBalances:
     )
 
 
+def parse_schwab_quote(
+    response_data: Dict[str, Any], symbol: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Extract one symbol's quote from a quotes endpoint response.
+
+    Args:
+        response_data: Response format {symbol: {quote: {...}, extended: {...}, ...}}
+        symbol: Stock symbol
+
+    Returns:
+        Quote data, or None if the symbol is not in the response
+    """
+    symbol_data = response_data.get(symbol)
+    if not isinstance(symbol_data, dict) or not symbol_data:
+        return None
+
+    # Extract the quote data from the nested 'quote' dictionary
+    # Schwab response has: {quote: {lastPrice, closePrice, ...}, extended: {...}, ...}
+    quote_data = symbol_data.get("quote", {})
+
+    # Merge in some useful top-level fields for completeness
+    quote_data["symbol"] = symbol_data.get("symbol", symbol)
+    quote_data["quoteType"] = symbol_data.get("quoteType")
+    quote_data["realtime"] = symbol_data.get("realtime")
+    return quote_data
+
+
 def parse_schwab_price_history(
     symbol: str, data: Dict[str, Any]
 ) -> PriceData:
@@ -17,22 +17,27 @@ from src.server.models.position import (
     RiskAssessmentResponse,
 )
 from src.server.services.position_service import PositionMonitorService
+from src.server.services.provider_registry import ProviderRegistry, get_providers
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["positions"])
 
 
-def get_position_service(db: Session = Depends(get_db)) -> PositionMonitorService:
+def get_position_service(
+    db: Session = Depends(get_db),
+    providers: ProviderRegistry = Depends(get_providers),
+) -> PositionMonitorService:
     """Dependency for position monitor service.
 
     Args:
         db: Database session
+        providers: Shared market data providers
 
     Returns:
         PositionMonitorService instance
     """
-    return PositionMonitorService(db)
+    return PositionMonitorService(db, providers=providers)
 
 
 @router.get(
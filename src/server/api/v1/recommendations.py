@@ -16,6 +16,7 @@ from src.server.models.recommendation import (
     BatchRecommendationResponse,
     RecommendationResponse,
 )
+from src.server.services.provider_registry import ProviderRegistry, get_providers
 from src.server.services.recommendation_service import RecommendationService
 
 logger = logging.getLogger(__name__)
@@ -38,6 +39,7 @@ def get_recommendation(
     use_cache: bool = Query(True, description="Use cached recommendations"),
     max_dte: int = Query(14, description="Maximum days to expiration search window", ge=1, le=90),
     db: Session = Depends(get_db),
+    providers: ProviderRegistry = Depends(get_providers),
 ) -> RecommendationResponse:
     """Generate options recommendation for a wheel position.
 
@@ -52,6 +54,7 @@ def get_recommendation(
         expiration_date: Optional target expiration date (YYYY-MM-DD)
         use_cache: Whether to use cached recommendations (default: True)
         db: Database session dependency
+        providers: Shared market data providers
 
     Returns:
         Recommendation response with trade details
@@ -70,7 +73,7 @@ def get_recommendation(
         >>>   "premium_per_share": 2.50
         >>> }
     """
-    service = RecommendationService(db)
+    service = RecommendationService(db, providers=providers)
     try:
         recommendation = service.get_recommendation(
             wheel_id, expiration_date, use_cache, max_dte=max_dte
@@ -101,6 +104,7 @@ def get_recommendation(
 def get_batch_recommendations(
     request: BatchRecommendationRequest,
     db: Session = Depends(get_db),
+    providers: ProviderRegistry = Depends(get_providers),
 ) -> BatchRecommendationResponse:
     """Generate recommendations for multiple symbols.
 
@@ -111,6 +115,7 @@ def get_batch_recommendations(
     Args:
         request: Batch recommendation request with symbols and options
         db: Database session dependency
+        providers: Shared market data providers
 
     Returns:
         Batch response with recommendations and errors
@@ -127,7 +132,7 @@ def get_batch_recommendations(
         >>>   "errors": {"INVALID": "Symbol not found"}
         >>> }
     """
-    service = RecommendationService(db)
+    service = RecommendationService(db, providers=providers)
 
     recommendations, errors = service.get_batch_recommendations(
         symbols=request.symbols,
@@ -157,7 +162,10 @@ def get_batch_recommendations(
     summary="Clear recommendation cache",
     description="Clear all cached recommendations",
 )
-def clear_recommendation_cache(db: Session = Depends(get_db)):
+def clear_recommendation_cache(
+    db: Session = Depends(get_db),
+    providers: ProviderRegistry = Depends(get_providers),
+):
     """Clear all cached recommendations.
 
     Useful when market conditions change significantly or after
@@ -165,6 +173,7 @@ def clear_recommendation_cache(db: Session = Depends(get_db)):
 
     Args:
         db: Database session dependency
+        providers: Shared market data providers
 
     Returns:
         No content (204)
@@ -173,7 +182,7 @@ def clear_recommendation_cache(db: Session = Depends(get_db)):
         >>> DELETE /api/v1/wheels/recommend/cache
         >>> Status: 204 No Content
     """
-    service = RecommendationService(db)
+    service = RecommendationService(db, providers=providers)
     service.clear_cache()
     logger.info("Recommendation cache cleared")
     return None
@@ -6,9 +6,11 @@ and health check endpoints.
 
 import logging
 from datetime import datetime
+from typing import Any
 
 from fastapi import APIRouter, status
 
+from src.api.rate_limiter import shared_rate_limiter
 from src.server.api.v1 import (
     performance,
     portfolios,
@@ -22,6 +24,7 @@ from src.server.api.v1 import (
 from src.server.config import settings
 from src.server.database.session import check_database_connection
 from src.server.models.common import InfoResponse
+from src.server.services.provider_registry import get_provider_registry
 
 logger = logging.getLogger(__name__)
 
@@ -76,3 +79,53 @@ async def get_info() -> InfoResponse:
         database_connected=db_connected,
         timestamp=datetime.utcnow(),
     )
+
+
+@router.get(
+    "/rate-limits",
+    status_code=status.HTTP_200_OK,
+    summary="Get client-side rate limiter metrics",
+    description="Returns per-budget request, throttle and wait counters for this process",
+)
+async def get_rate_limits() -> dict[str, dict[str, float]]:
+    """Get client-side rate limiter metrics.
+
+    Budgets are shared by every process on the host; the counters cover
+    requests made by this server process only.
+
+    Returns:
+        Counters (requests, throttled, total_wait_seconds, max_wait_seconds)
+        keyed by budget, e.g. "schwab"
+    """
+    return shared_rate_limiter().metrics()
+
+
+@router.get(
+    "/cache-stats",
+    status_code=status.HTTP_200_OK,
+    summary="Get response cache metrics",
+    description=(
+        "Returns entry count, per-namespace hit, miss and eviction counters "
+        "and the number of fetches coalesced with identical in-flight ones"
+    ),
+)
+async def get_cache_stats() -> dict[str, Any]:
+    """Get response cache metrics.
+
+    Covers the cache shared by this process's market data clients.
+
+    Returns:
+        Dict with "entries" (total entries held), "max_entries",
+        "namespaces" (hits, misses, evictions, expirations keyed by
+        namespace, e.g. "schwab_quote") and "single_flight" (executed and
+        coalesced fetches of the Schwab client, by the same namespaces)
+    """
+    registry = get_provider_registry()
+    cache = registry.cache
+    schwab_client = registry.schwab_client
+    return {
+        "entries": len(cache),
+        "max_entries": getattr(cache.backend, "max_entries", None),
+        "namespaces": cache.stats(),
+        "single_flight": schwab_client.single_flight.stats() if schwab_client else {},
+    }
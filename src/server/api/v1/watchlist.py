@@ -10,6 +10,7 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
+from src.constants import RECOMMENDATION_TOP_K
 from src.server.database.session import get_db
 from src.server.models.watchlist import (
     OpportunityCountResponse,
@@ -18,6 +19,7 @@ from src.server.models.watchlist import (
     WatchlistItemCreate,
     WatchlistItemResponse,
 )
+from src.server.services.provider_registry import ProviderRegistry, get_providers
 from src.server.services.watchlist_service import WatchlistService
 
 logger = logging.getLogger(__name__)
@@ -25,15 +27,32 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["watchlist"])
 
 
+def get_watchlist_service(
+    db: Session = Depends(get_db),
+    providers: ProviderRegistry = Depends(get_providers),
+) -> WatchlistService:
+    """Dependency for watchlist service.
+
+    Args:
+        db: Database session
+        providers: Shared market data providers
+
+    Returns:
+        WatchlistService instance
+    """
+    return WatchlistService(db, providers=providers)
+
+
 @router.get(
     "/watchlist",
     response_model=List[WatchlistItemResponse],
     status_code=status.HTTP_200_OK,
     summary="List watchlist symbols",
 )
-def list_watchlist(db: Session = Depends(get_db)) -> List[WatchlistItemResponse]:
+def list_watchlist(
+    service: WatchlistService = Depends(get_watchlist_service),
+) -> List[WatchlistItemResponse]:
     """List all symbols on the watchlist."""
-    service = WatchlistService(db)
     return service.list_watchlist()
 
 
@@ -45,10 +64,9 @@ def list_watchlist(db: Session = Depends(get_db)) -> List[WatchlistItemResponse]
 )
 def add_to_watchlist(
     item: WatchlistItemCreate,
-    db: Session = Depends(get_db),
+    service: WatchlistService = Depends(get_watchlist_service),
 ) -> WatchlistItemResponse:
     """Add a symbol to the watchlist for opportunity scanning."""
-    service = WatchlistService(db)
     try:
         return service.add_symbol(item.symbol, item.notes)
     except ValueError as e:
@@ -64,10 +82,9 @@ def add_to_watchlist(
 )
 def remove_from_watchlist(
     symbol: str,
-    db: Session = Depends(get_db),
+    service: WatchlistService = Depends(get_watchlist_service),
 ):
     """Remove a symbol from the watchlist and its opportunities."""
-    service = WatchlistService(db)
     removed = service.remove_symbol(symbol)
     if not removed:
         raise HTTPException(
@@ -89,10 +106,9 @@ def list_opportunities(
     profile: Optional[str] = Query(None, description="Filter by profile"),
     unread_only: bool = Query(False, description="Only show unread"),
     limit: int = Query(100, ge=1, le=500, description="Max results"),
-    db: Session = Depends(get_db),
+    service: WatchlistService = Depends(get_watchlist_service),
 ) -> List[OpportunityResponse]:
     """List scanned opportunities with optional filters."""
-    service = WatchlistService(db)
     return service.get_opportunities(
         symbol=symbol,
         direction=direction,
@@ -109,10 +125,9 @@ def list_opportunities(
     summary="Get unread opportunity count",
 )
 def get_opportunity_count(
-    db: Session = Depends(get_db),
+    service: WatchlistService = Depends(get_watchlist_service),
 ) -> OpportunityCountResponse:
     """Get count of unread opportunities (for badge display)."""
-    service = WatchlistService(db)
     return OpportunityCountResponse(unread_count=service.get_unread_count())
 
 
@@ -123,10 +138,9 @@ def get_opportunity_count(
 )
 def mark_opportunity_read(
     opportunity_id: int,
-    db: Session = Depends(get_db),
+    service: WatchlistService = Depends(get_watchlist_service),
 ):
     """Mark a single opportunity as read."""
-    service = WatchlistService(db)
     found = service.mark_read(opportunity_id)
     if not found:
         raise HTTPException(
@@ -142,10 +156,9 @@ def mark_opportunity_read(
     summary="Mark all opportunities as read",
 )
 def mark_all_opportunities_read(
-    db: Session = Depends(get_db),
+    service: WatchlistService = Depends(get_watchlist_service),
 ):
     """Mark all opportunities as read."""
-    service = WatchlistService(db)
     service.mark_all_read()
     return None
 
@@ -157,12 +170,16 @@ def mark_all_opportunities_read(
     summary="Trigger manual scan",
 )
 def trigger_scan(
-    db: Session = Depends(get_db),
+    force: bool = Query(False, description="Rescan symbols whose inputs are unchanged"),
+    top_k: int = Query(
+        RECOMMENDATION_TOP_K, ge=1, le=100,
+        description="Opportunities kept per symbol, direction and profile",
+    ),
+    service: WatchlistService = Depends(get_watchlist_service),
 ) -> ScanResultResponse:
     """Trigger a manual scan of all watchlist symbols."""
-    service = WatchlistService(db)
     try:
-        result = service.scan_all()
+        result = service.scan_all(force=force, top_k=top_k)
         return ScanResultResponse(**result)
     except Exception as e:
         logger.error(f"Manual scan failed: {e}", exc_info=True)
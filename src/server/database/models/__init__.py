@@ -14,6 +14,7 @@ Models:
     PluginConfig: Configuration for dynamically loaded plugins
     WatchlistItem: Symbol on the user's opportunity scanning watchlist
     Opportunity: Scanned option-selling opportunity from watchlist scanner
+    SymbolVolatilityState: Incremental per-symbol volatility state
 """
 
 from .job_execution import JobExecution
@@ -24,6 +25,7 @@ from .portfolio import Portfolio
 from .scheduler import SchedulerConfig
 from .snapshot import Snapshot
 from .trade import Trade
+from .volatility_state import SymbolVolatilityState
 from .watchlist import WatchlistItem
 from .wheel import Wheel
 
@@ -38,4 +40,5 @@ __all__ = [
     "PluginConfig",
     "WatchlistItem",
     "Opportunity",
+    "SymbolVolatilityState",
 ]
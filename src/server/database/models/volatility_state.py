@@ -0,0 +1,86 @@
+"""Volatility state database model.
+
+Stores the incremental volatility state for a symbol so scheduled jobs can
+apply new daily bars instead of recomputing from the full price history.
+"""
+
+import json
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Float, Integer, String, Text
+
+from src.analysis.volatility_state import VolatilityState
+from src.server.database.session import Base
+
+
+class SymbolVolatilityState(Base):
+    """Persisted incremental volatility state for one symbol.
+
+    Mirrors src.analysis.volatility_state.VolatilityState, one row per
+    symbol. The returns buffer holds at most long_window - 1 values.
+
+    Attributes:
+        id: Unique identifier
+        symbol: Stock ticker symbol (unique)
+        short_window: Short close-to-close window in price points
+        long_window: Long close-to-close window in price points
+        ewma_lambda: EWMA decay factor
+        last_date: Date of the last bar applied (YYYY-MM-DD)
+        last_close: Close of the last bar applied
+        bars: Total bars applied since the state was created
+        short_sum: Sum of log returns in the short window
+        short_sum_sq: Sum of squared log returns in the short window
+        long_sum: Sum of log returns in the long window
+        long_sum_sq: Sum of squared log returns in the long window
+        ewma_variance: EWMA of squared daily log returns
+        returns: JSON list of the most recent log returns, oldest first
+        updated_at: Timestamp of the last update
+    """
+
+    __tablename__ = "volatility_states"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    symbol = Column(String, nullable=False, unique=True, index=True)
+    short_window = Column(Integer, nullable=False)
+    long_window = Column(Integer, nullable=False)
+    ewma_lambda = Column(Float, nullable=False)
+    last_date = Column(String, nullable=True)
+    last_close = Column(Float, nullable=True)
+    bars = Column(Integer, nullable=False, default=0)
+    short_sum = Column(Float, nullable=False, default=0.0)
+    short_sum_sq = Column(Float, nullable=False, default=0.0)
+    long_sum = Column(Float, nullable=False, default=0.0)
+    long_sum_sq = Column(Float, nullable=False, default=0.0)
+    ewma_variance = Column(Float, nullable=True)
+    returns = Column(Text, nullable=False, default="[]")  # JSON list of floats
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_state(self) -> VolatilityState:
+        """Convert to an in-memory VolatilityState."""
+        return VolatilityState(
+            short_window=self.short_window,
+            long_window=self.long_window,
+            ewma_lambda=self.ewma_lambda,
+            last_date=self.last_date,
+            last_close=self.last_close,
+            bars=self.bars,
+            short_sum=self.short_sum,
+            short_sum_sq=self.short_sum_sq,
+            long_sum=self.long_sum,
+            long_sum_sq=self.long_sum_sq,
+            ewma_variance=self.ewma_variance,
+            returns=json.loads(self.returns or "[]"),
+        )
+
+    def apply_state(self, state: VolatilityState) -> None:
+        """Copy an in-memory VolatilityState into this row."""
+        data = state.to_dict()
+        data["returns"] = json.dumps(data["returns"])
+        for key, value in data.items():
+            setattr(self, key, value)
+
+    def __repr__(self) -> str:
+        return (
+            f"<SymbolVolatilityState(symbol={self.symbol}, "
+            f"last_date={self.last_date}, bars={self.bars})>"
+        )
@@ -18,6 +18,8 @@ class WatchlistItem(Base):
         symbol: Stock ticker symbol (unique, indexed)
         notes: Optional user notes about this symbol
         created_at: Timestamp when symbol was added to watchlist
+        scan_fingerprint: Fingerprint of the inputs of the last completed scan
+        scanned_at: Timestamp of the opportunities from the last completed scan
     """
 
     __tablename__ = "watchlist"
@@ -26,6 +28,8 @@ class WatchlistItem(Base):
     symbol = Column(String, nullable=False, unique=True, index=True)
     notes = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    scan_fingerprint = Column(String, nullable=True)
+    scanned_at = Column(DateTime, nullable=True)
 
     def __repr__(self) -> str:
         return f"<WatchlistItem(id={self.id}, symbol={self.symbol})>"
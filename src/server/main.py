@@ -17,6 +17,7 @@ from src.server import __version__
 from src.server.api.v1.router import router as v1_router
 from src.server.config import settings
 from src.server.models.common import HealthResponse
+from src.server.services.provider_registry import get_provider_registry, set_provider_registry
 from src.server.services.scheduler_service import get_scheduler_service
 from src.server.tasks.task_loader import register_core_tasks
 
@@ -61,6 +62,12 @@ async def startup_event():
     logger.info(f"Debug mode: {settings.debug}")
     logger.info(f"Database path: {settings.database_path}")
 
+    # Create the shared market data clients before any request or task needs them
+    try:
+        get_provider_registry()
+    except Exception as e:
+        logger.error(f"Failed to initialize provider registry: {e}", exc_info=True)
+
     # Initialize and start scheduler
     try:
         scheduler = get_scheduler_service()
@@ -91,6 +98,12 @@ async def shutdown_event():
     except Exception as e:
         logger.error(f"Error during scheduler shutdown: {e}", exc_info=True)
 
+    # Close the shared market data clients once no task can use them
+    try:
+        set_provider_registry(None)
+    except Exception as e:
+        logger.error(f"Error closing provider registry: {e}", exc_info=True)
+
 
 @app.get(
     "/health",
@@ -71,4 +71,6 @@ class ScanResultResponse(BaseModel):
 
     opportunities_found: int
     symbols_scanned: int
+    symbols_skipped: int = 0
     errors: dict[str, str] = Field(default_factory=dict)
+    timings: dict[str, float] = Field(default_factory=dict)
@@ -116,6 +116,29 @@ class OpportunityRepository:
         logger.info(f"Purged {count} stale opportunities older than {max_age_hours}h")
         return count
 
+    def restamp(self, scans: dict[str, datetime], scanned_at: datetime) -> int:
+        """Move earlier scans' opportunities to a new scan time.
+
+        Used when a symbol's rescan would reproduce them unchanged, so they
+        stay current instead of being reinserted.
+
+        Args:
+            scans: Dict mapping symbol to the scanned_at of its opportunities
+            scanned_at: New scan timestamp
+
+        Returns:
+            Number of opportunities updated
+        """
+        count = 0
+        for symbol, previous in scans.items():
+            count += (
+                self.db.query(Opportunity)
+                .filter(and_(Opportunity.symbol == symbol, Opportunity.scanned_at == previous))
+                .update({"scanned_at": scanned_at}, synchronize_session=False)
+            )
+        self.db.commit()
+        return count
+
     def delete_all_for_symbol(self, symbol: str) -> int:
         """Delete all opportunities for a symbol.
 
@@ -0,0 +1,78 @@
+"""Repository for incremental volatility state data access operations."""
+
+import logging
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from src.analysis.volatility_state import VolatilityState
+from src.server.database.models.volatility_state import SymbolVolatilityState
+
+logger = logging.getLogger(__name__)
+
+
+class VolatilityStateRepository:
+    """Repository for per-symbol volatility state."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_by_symbol(self, symbol: str) -> Optional[SymbolVolatilityState]:
+        """Get the stored state row for a symbol."""
+        return (
+            self.db.query(SymbolVolatilityState)
+            .filter(SymbolVolatilityState.symbol == symbol.upper())
+            .first()
+        )
+
+    def get_states(self, symbols: list[str]) -> dict[str, VolatilityState]:
+        """Load the stored states for several symbols in one query.
+
+        Returns:
+            Dict mapping symbol to VolatilityState; symbols without state are omitted
+        """
+        rows = (
+            self.db.query(SymbolVolatilityState)
+            .filter(SymbolVolatilityState.symbol.in_([s.upper() for s in symbols]))
+            .all()
+        )
+        return {row.symbol: row.to_state() for row in rows}
+
+    def save_states(self, states: dict[str, VolatilityState]) -> int:
+        """Insert or update states for several symbols in one commit.
+
+        Returns:
+            Number of states saved
+        """
+        if not states:
+            return 0
+
+        existing = {
+            row.symbol: row
+            for row in self.db.query(SymbolVolatilityState)
+            .filter(SymbolVolatilityState.symbol.in_(list(states)))
+            .all()
+        }
+        for symbol, state in states.items():
+            row = existing.get(symbol)
+            if row is None:
+                row = SymbolVolatilityState(symbol=symbol)
+                self.db.add(row)
+            row.apply_state(state)
+
+        self.db.commit()
+        return len(states)
+
+    def delete(self, symbol: str) -> bool:
+        """Delete the stored state for a symbol.
+
+        Returns:
+            True if deleted, False if not found
+        """
+        row = self.get_by_symbol(symbol)
+        if not row:
+            return False
+        self.db.delete(row)
+        self.db.commit()
+        logger.info(f"Deleted volatility state for {symbol}")
+        return True
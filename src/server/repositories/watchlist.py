@@ -1,6 +1,7 @@
 """Repository for watchlist data access operations."""
 
 import logging
+from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy.orm import Session
@@ -69,3 +70,25 @@ class WatchlistRepository:
             .filter(WatchlistItem.symbol == symbol.upper())
             .first()
         )
+
+    def record_scans(self, scans: dict[str, tuple[str, datetime]]) -> int:
+        """Store the fingerprint and time of each symbol's completed scan.
+
+        Args:
+            scans: Dict mapping symbol to (scan_fingerprint, scanned_at)
+
+        Returns:
+            Number of watchlist items updated
+        """
+        if not scans:
+            return 0
+
+        items = (
+            self.db.query(WatchlistItem)
+            .filter(WatchlistItem.symbol.in_(list(scans)))
+            .all()
+        )
+        for item in items:
+            item.scan_fingerprint, item.scanned_at = scans[item.symbol]
+        self.db.commit()
+        return len(items)
@@ -6,10 +6,12 @@ the PositionMonitor class and converting between ORM and CLI models.
 
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy.orm import Session
 
+from src.api.circuit_breaker import shared_circuit_breakers
+from src.api.rate_limiter import shared_rate_limiter
 from src.price_fetcher import SchwabPriceDataFetcher
 from src.schwab.client import SchwabClient
 from src.server.database.models.trade import Trade
@@ -26,6 +28,9 @@ from src.wheel.models import PositionStatus, TradeRecord, WheelPosition
 from src.wheel.monitor import PositionMonitor
 from src.wheel.state import WheelState
 
+if TYPE_CHECKING:
+    from src.server.services.provider_registry import ProviderRegistry
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +52,7 @@ class PositionMonitorService:
         db: Session,
         schwab_client: Optional[SchwabClient] = None,
         price_fetcher: Optional[SchwabPriceDataFetcher] = None,
+        providers: Optional["ProviderRegistry"] = None,
     ):
         """Initialize position monitor service.
 
@@ -54,17 +60,29 @@ class PositionMonitorService:
             db: SQLAlchemy database session
             schwab_client: Optional Schwab client for price data
             price_fetcher: Optional price fetcher for fallback
+            providers: Optional shared provider registry; its monitor (and quote
+                cache) is reused unless a client or fetcher is given explicitly
         """
         self.db = db
         self.wheel_repo = WheelRepository(db)
         self.trade_repo = TradeRepository(db)
 
+        if providers is not None and not schwab_client and not price_fetcher:
+            self.schwab_client = providers.schwab_client
+            self.price_fetcher = providers.price_fetcher
+            self.monitor = providers.position_monitor
+            return
+
         # Auto-initialize Schwab client if not provided
         if schwab_client:
             self.schwab_client = schwab_client
+        elif providers is not None:
+            self.schwab_client = providers.schwab_client
         else:
             try:
-                self.schwab_client = SchwabClient()
+                self.schwab_client = SchwabClient(
+                    rate_limiter=shared_rate_limiter(), circuit_breakers=shared_circuit_breakers()
+                )
             except Exception as e:
                 logger.warning(f"Failed to initialize SchwabClient: {e}")
                 self.schwab_client = None
@@ -159,18 +177,27 @@ class PositionMonitorService:
             )
 
         # Get positions with open trades
-        positions = []
+        open_wheels = []
         for wheel in wheels:
             trade = self.trade_repo.get_open_trade_for_wheel(wheel.id)
-            if not trade:
-                continue
+            if trade:
+                open_wheels.append((wheel, trade))
 
+        # One batched quote request instead of one per position
+        refreshed = self.prefetch_quotes(
+            [wheel.symbol for wheel, _ in open_wheels], force_refresh=force_refresh
+        )
+
+        positions = []
+        for wheel, trade in open_wheels:
             try:
                 # Convert and get status
                 cli_position = self._convert_wheel_to_cli(wheel)
                 cli_trade = self._convert_trade_to_cli(trade)
                 status = self.monitor.get_position_status(
-                    cli_position, cli_trade, force_refresh=force_refresh
+                    cli_position,
+                    cli_trade,
+                    force_refresh=force_refresh and wheel.symbol not in refreshed,
                 )
 
                 # Apply filters
@@ -235,19 +262,29 @@ class PositionMonitorService:
             )
 
         # Get positions
-        positions = []
+        open_wheels = []
         for trade in open_trades:
             wheel = self.wheel_repo.get_wheel(trade.wheel_id)
             if not wheel:
                 logger.warning(f"Wheel {trade.wheel_id} not found for trade {trade.id}")
                 continue
+            open_wheels.append((wheel, trade))
 
+        # One batched quote request instead of one per position
+        refreshed = self.prefetch_quotes(
+            [wheel.symbol for wheel, _ in open_wheels], force_refresh=force_refresh
+        )
+
+        positions = []
+        for wheel, trade in open_wheels:
             try:
                 # Convert and get status
                 cli_position = self._convert_wheel_to_cli(wheel)
                 cli_trade = self._convert_trade_to_cli(trade)
                 status = self.monitor.get_position_status(
-                    cli_position, cli_trade, force_refresh=force_refresh
+                    cli_position,
+                    cli_trade,
+                    force_refresh=force_refresh and wheel.symbol not in refreshed,
                 )
 
                 # Apply filters
@@ -281,6 +318,20 @@ class PositionMonitorService:
             low_risk_count=low_risk_count,
         )
 
+    def prefetch_quotes(
+        self, symbols: list[str], force_refresh: bool = False
+    ) -> set[str]:
+        """Warm the monitor's quote cache for many symbols with batched requests.
+
+        Args:
+            symbols: Stock tickers
+            force_refresh: Refetch symbols that are already cached
+
+        Returns:
+            Symbols whose cached quote was refreshed
+        """
+        return self.monitor.prefetch_quotes(symbols, force_refresh=force_refresh)
+
     def get_risk_assessment(
         self, wheel_id: int, force_refresh: bool = False
     ) -> RiskAssessmentResponse:
@@ -0,0 +1,166 @@
+"""Application-scoped market data providers.
+
+Services used to build their own SchwabClient per instance, and instances
+are created per request and per scheduled task, so every call started
+with a cold connection pool, a fresh token load and empty quote and chain
+caches. The ProviderRegistry owns one client per provider, plus the price
+fetcher and position monitor wrapping them, for the whole process. It is
+created in the FastAPI startup event, reused by scheduled tasks, and
+injected into route handlers with Depends(get_providers).
+
+With WHEEL_PERSISTENT_CACHE set, the registry's cache is the on-disk one
+the CLI uses, so the server and CLI runs answer from each other's entries.
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+from src.api.cache import PERSISTENT_CACHE_ENV, Cache, persistent_cache
+from src.api.circuit_breaker import shared_circuit_breakers
+from src.api.rate_limiter import shared_rate_limiter
+from src.config import FinnhubConfig
+from src.market_data.finnhub_client import FinnhubClient
+from src.market_data.price_fetcher import PriceDataCache, SchwabPriceDataFetcher
+from src.schwab.client import SchwabClient
+from src.wheel.monitor import PositionMonitor
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderRegistry:
+    """Process-wide market data clients and their caches.
+
+    Attributes:
+        cache: Bounded response cache shared by the clients below
+        schwab_client: Shared Schwab client (None if not configured)
+        finnhub_client: Shared Finnhub client (None if not configured)
+        price_fetcher: Shared price fetcher over schwab_client
+        position_monitor: Shared position monitor over the clients above
+    """
+
+    def __init__(
+        self,
+        schwab_client: Optional[SchwabClient] = None,
+        finnhub_client: Optional[FinnhubClient] = None,
+        cache: Optional[Cache] = None,
+    ):
+        """Initialize the registry with existing clients.
+
+        Args:
+            schwab_client: Optional Schwab client
+            finnhub_client: Optional Finnhub client
+            cache: Response cache for the price fetcher (default: the Schwab
+                client's cache, so one entry limit bounds both)
+        """
+        if cache is None:
+            cache = getattr(schwab_client, "cache", None)
+        self.cache = cache if isinstance(cache, Cache) else Cache()
+        self.schwab_client = schwab_client
+        self.finnhub_client = finnhub_client
+        self.price_fetcher = (
+            SchwabPriceDataFetcher(schwab_client, cache=PriceDataCache(cache=self.cache))
+            if schwab_client
+            else None
+        )
+        self.position_monitor = PositionMonitor(
+            schwab_client=schwab_client, price_fetcher=self.price_fetcher
+        )
+
+    @classmethod
+    def from_environment(cls) -> "ProviderRegistry":
+        """Build clients from the configured credentials.
+
+        Missing credentials leave the provider disabled rather than failing,
+        as the services did. The cache is the persistent one if
+        WHEEL_PERSISTENT_CACHE is set.
+
+        Returns:
+            ProviderRegistry
+        """
+        cache = persistent_cache() if os.environ.get(PERSISTENT_CACHE_ENV) else Cache()
+        try:
+            schwab_client = SchwabClient(
+                rate_limiter=shared_rate_limiter(),
+                circuit_breakers=shared_circuit_breakers(),
+                cache=cache,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to initialize SchwabClient: {e}")
+            schwab_client = None
+
+        if schwab_client is not None:
+            # Renew tokens ahead of expiry so requests never wait on a refresh
+            try:
+                schwab_client.oauth.start_background_refresh()
+            except Exception as e:
+                logger.warning(f"Failed to start background token refresh: {e}")
+
+        finnhub_client = None
+        try:
+            finnhub_api_key = os.environ.get("FINNHUB_API_KEY", "")
+            if finnhub_api_key:
+                finnhub_client = FinnhubClient(
+                    FinnhubConfig(api_key=finnhub_api_key),
+                    rate_limiter=shared_rate_limiter(),
+                    circuit_breakers=shared_circuit_breakers(),
+                )
+            else:
+                logger.warning("FINNHUB_API_KEY not set, FinnhubClient disabled")
+        except Exception as e:
+            logger.warning(f"Failed to initialize FinnhubClient: {e}")
+
+        return cls(schwab_client=schwab_client, finnhub_client=finnhub_client, cache=cache)
+
+    def close(self) -> None:
+        """Stop the token refresher and close the clients' HTTP sessions."""
+        if self.schwab_client is not None:
+            try:
+                self.schwab_client.oauth.stop_background_refresh()
+            except Exception as e:
+                logger.warning(f"Failed to stop background token refresh: {e}")
+        for client in (self.schwab_client, self.finnhub_client):
+            if client is not None:
+                client.close()
+
+
+# Global provider registry instance
+_provider_registry: Optional[ProviderRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_provider_registry() -> ProviderRegistry:
+    """Get the global provider registry, creating it on first use.
+
+    Returns:
+        ProviderRegistry instance
+    """
+    global _provider_registry
+    with _registry_lock:
+        if _provider_registry is None:
+            _provider_registry = ProviderRegistry.from_environment()
+            logger.info("Provider registry initialized")
+        return _provider_registry
+
+
+def set_provider_registry(registry: Optional[ProviderRegistry]) -> None:
+    """Replace the global provider registry, closing the previous one.
+
+    Args:
+        registry: New registry, or None to build one again on next use
+    """
+    global _provider_registry
+    with _registry_lock:
+        previous, _provider_registry = _provider_registry, registry
+    if previous is not None and previous is not registry:
+        previous.close()
+
+
+def get_providers() -> ProviderRegistry:
+    """FastAPI dependency for the provider registry.
+
+    Returns:
+        ProviderRegistry instance
+    """
+    return get_provider_registry()
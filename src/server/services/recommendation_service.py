@@ -7,10 +7,12 @@ using the RecommendEngine with API-friendly interfaces, caching, and error handl
 import logging
 import os
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy.orm import Session
 
+from src.api.circuit_breaker import CircuitState, shared_circuit_breakers
+from src.api.rate_limiter import shared_rate_limiter
 from src.config import FinnhubConfig
 from src.market_data.finnhub_client import FinnhubClient
 from src.market_data.price_fetcher import SchwabPriceDataFetcher
@@ -22,6 +24,9 @@ from src.wheel.models import WheelPosition as CLIWheelPosition
 from src.wheel.recommend import RecommendEngine
 from src.wheel.state import WheelState
 
+if TYPE_CHECKING:
+    from src.server.services.provider_registry import ProviderRegistry
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,12 +47,18 @@ class RecommendationService:
         _cache_ttl: Time-to-live for cached recommendations
     """
 
-    def __init__(self, db: Session, schwab_client: Optional[SchwabClient] = None):
+    def __init__(
+        self,
+        db: Session,
+        schwab_client: Optional[SchwabClient] = None,
+        providers: Optional["ProviderRegistry"] = None,
+    ):
         """Initialize recommendation service.
 
         Args:
             db: SQLAlchemy database session
             schwab_client: Optional Schwab API client
+            providers: Optional shared provider registry supplying the clients
         """
         self.db = db
         self.wheel_repo = WheelRepository(db)
@@ -55,35 +66,50 @@ class RecommendationService:
         # Initialize external clients - handle missing credentials gracefully for testing
         if schwab_client:
             self.schwab_client = schwab_client
+        elif providers is not None:
+            self.schwab_client = providers.schwab_client
         else:
             try:
-                self.schwab_client = SchwabClient()
+                self.schwab_client = SchwabClient(
+                    rate_limiter=shared_rate_limiter(), circuit_breakers=shared_circuit_breakers()
+                )
             except Exception as e:
                 logger.warning(f"Failed to initialize SchwabClient: {e}")
                 self.schwab_client = None
 
         # Initialize other clients
-        self.price_fetcher = (
-            SchwabPriceDataFetcher(self.schwab_client)
-            if self.schwab_client
-            else None
-        )
-        try:
-            finnhub_api_key = os.environ.get("FINNHUB_API_KEY", "")
-            if finnhub_api_key:
-                self.finnhub_client = FinnhubClient(FinnhubConfig(api_key=finnhub_api_key))
-            else:
-                logger.warning("FINNHUB_API_KEY not set, FinnhubClient disabled")
+        if providers is not None and self.schwab_client is providers.schwab_client:
+            self.price_fetcher = providers.price_fetcher
+        else:
+            self.price_fetcher = (
+                SchwabPriceDataFetcher(self.schwab_client)
+                if self.schwab_client
+                else None
+            )
+        if providers is not None:
+            self.finnhub_client = providers.finnhub_client
+        else:
+            try:
+                finnhub_api_key = os.environ.get("FINNHUB_API_KEY", "")
+                if finnhub_api_key:
+                    self.finnhub_client = FinnhubClient(
+                        FinnhubConfig(api_key=finnhub_api_key),
+                        rate_limiter=shared_rate_limiter(),
+                        circuit_breakers=shared_circuit_breakers(),
+                    )
+                else:
+                    logger.warning("FINNHUB_API_KEY not set, FinnhubClient disabled")
+                    self.finnhub_client = None
+            except Exception as e:
+                logger.warning(f"Failed to initialize FinnhubClient: {e}")
                 self.finnhub_client = None
-        except Exception as e:
-            logger.warning(f"Failed to initialize FinnhubClient: {e}")
-            self.finnhub_client = None
 
         # Initialize recommendation engine
         self.recommend_engine = RecommendEngine(
             finnhub_client=self.finnhub_client,
             price_fetcher=self.price_fetcher,
             schwab_client=self.schwab_client,
+            cache=providers.cache if providers is not None else None,
         )
 
         # Simple in-memory cache: {(wheel_id, expiration_date): (recommendation, timestamp)}
@@ -196,6 +222,14 @@ class RecommendationService:
         recommendations = []
         errors = {}
 
+        # Fail the batch at once rather than symbol by symbol while Schwab is down
+        if (
+            self.schwab_client is not None
+            and self.schwab_client.circuit_state() is CircuitState.OPEN
+        ):
+            logger.warning(f"Schwab API unavailable (circuit open), skipping {len(symbols)} symbols")
+            return [], dict.fromkeys(symbols, "Schwab API unavailable (circuit open)")
+
         for symbol in symbols:
             try:
                 # Find wheel for this symbol
@@ -0,0 +1,304 @@
+"""Service layer for incremental volatility estimation.
+
+Keeps a persisted VolatilityState per symbol and advances it with the bars
+that arrived since the previous run, so scheduled scans answer volatility
+in constant time per symbol instead of recomputing the full lookback.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from src.analysis.volatility import VolatilityCalculator, VolatilityConfig
+from src.analysis.volatility_models import PriceData
+from src.analysis.volatility_panel import PanelVolatilityCalculator, VolatilityPanel
+from src.analysis.volatility_state import VolatilityState
+from src.server.repositories.volatility_state import VolatilityStateRepository
+from src.server.tasks.market_hours import get_open_session_date
+
+logger = logging.getLogger(__name__)
+
+# Bars fetched to advance an existing state (covers a long weekend plus holidays)
+INCREMENTAL_LOOKBACK_DAYS = 10
+
+
+class VolatilityStateService:
+    """Service for persisted incremental volatility.
+
+    Attributes:
+        db: SQLAlchemy database session
+        repo: Volatility state data access
+        price_fetcher: Price data fetcher (None disables the service)
+        calculator: Calculator used to answer from state
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        price_fetcher=None,
+        config: Optional[VolatilityConfig] = None,
+    ):
+        """Initialize volatility state service.
+
+        Args:
+            db: SQLAlchemy database session
+            price_fetcher: Fetcher with fetch_price_data(symbol, lookback_days)
+            config: Optional volatility configuration (windows, annualization)
+        """
+        self.db = db
+        self.repo = VolatilityStateRepository(db)
+        self.price_fetcher = price_fetcher
+        self.calculator = VolatilityCalculator(config)
+
+    @property
+    def rebuild_lookback_days(self) -> int:
+        """Calendar days fetched for a full recompute; enough to fill the long window."""
+        return self.calculator.config.long_window * 3 // 2
+
+    def get_volatilities(self, symbols: list[str]) -> dict[str, float]:
+        """Get the realized volatility for several symbols.
+
+        Each stored state is advanced with the bars since its last_date.
+        Symbols without state or with state for different windows are
+        rebuilt together by rebuild_many, and symbols whose last_date is
+        older than the incremental fetch are rebuilt from a full history
+        one by one. All updated states are saved in one commit.
+
+        A bar for today's session is skipped until the market has closed:
+        its close is still moving, and a state never revisits a date it
+        has already applied.
+
+        The value is the short-window close-to-close estimate that
+        RecommendEngine uses; the long window is tracked for validation.
+
+        Args:
+            symbols: Stock ticker symbols
+
+        Returns:
+            Dict mapping symbol to volatility; symbols that could not be
+            estimated are omitted
+        """
+        if self.price_fetcher is None or not symbols:
+            return {}
+
+        states = self.load_states(symbols)
+        updated: dict[str, VolatilityState] = {}
+        volatilities: dict[str, float] = {}
+
+        rebuild = [s for s in symbols if self.needs_rebuild(states.get(s))]
+        for symbol, (state, volatility) in self.rebuild_many(rebuild).items():
+            updated[symbol] = state
+            volatilities[symbol] = volatility
+
+        for symbol in symbols:
+            if symbol in rebuild:
+                continue
+            try:
+                updated[symbol], volatilities[symbol] = self.advance(symbol, states.get(symbol))
+            except Exception as e:
+                logger.warning(f"Incremental volatility failed for {symbol}: {e}")
+
+        self.save_states(updated)
+        return volatilities
+
+    def load_states(self, symbols: list[str]) -> dict[str, VolatilityState]:
+        """Load the stored states for several symbols in one query."""
+        return self.repo.get_states(symbols)
+
+    def advance(
+        self, symbol: str, state: Optional[VolatilityState]
+    ) -> tuple[VolatilityState, float]:
+        """Advance one symbol's state with its new bars and answer its volatility.
+
+        Only fetches prices and never touches the database session, so
+        several symbols can be advanced concurrently; pass the results to
+        save_states afterwards.
+
+        Args:
+            symbol: Stock ticker symbol
+            state: Stored state from load_states, or None to build one
+
+        Returns:
+            Tuple of (advanced state, short-window realized volatility)
+
+        Raises:
+            ValueError: If no price fetcher is configured
+        """
+        if self.price_fetcher is None:
+            raise ValueError("No price fetcher configured for volatility state")
+        state = self._advance(symbol, state)
+        return state, self.calculator.calculate_from_state(
+            state, window=self.calculator.config.short_window
+        ).volatility
+
+    def rebuild_many(
+        self, symbols: list[str], workers: int = 1
+    ) -> dict[str, tuple[VolatilityState, float]]:
+        """Rebuild several symbols' states from full history in one panel pass.
+
+        Histories are fetched by up to workers threads, then every symbol's
+        short-window volatility comes from a single PanelVolatilityCalculator
+        call over the batch and each state is built from the same bars. Like
+        advance, never touches the database session; pass the states to
+        save_states afterwards.
+
+        Args:
+            symbols: Stock ticker symbols to rebuild
+            workers: Threads fetching price history concurrently
+
+        Returns:
+            Dict mapping symbol to (rebuilt state, short-window realized
+            volatility); symbols whose history could not be fetched or is
+            too short are omitted
+
+        Raises:
+            ValueError: If no price fetcher is configured
+        """
+        if self.price_fetcher is None:
+            raise ValueError("No price fetcher configured for volatility state")
+        if not symbols:
+            return {}
+
+        def fetch(symbol: str) -> PriceData:
+            dates, closes = self._settled_bars(
+                self.price_fetcher.fetch_price_data(
+                    symbol, lookback_days=self.rebuild_lookback_days
+                )
+            )
+            return PriceData(dates=dates, closes=closes)
+
+        histories: dict[str, PriceData] = {}
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(symbols))), thread_name_prefix="vol-history"
+        ) as pool:
+            futures = {symbol: pool.submit(fetch, symbol) for symbol in symbols}
+            for symbol, future in futures.items():
+                try:
+                    histories[symbol] = future.result()
+                except Exception as e:
+                    logger.warning(f"Fetching price history failed for {symbol}: {e}")
+
+        histories = {symbol: data for symbol, data in histories.items() if data.dates}
+        if not histories:
+            return {}
+
+        config = self.calculator.config
+        panel = VolatilityPanel.from_price_data(histories)
+        volatilities = (
+            PanelVolatilityCalculator(config)
+            .calculate(panel, window=config.short_window)
+            .to_dict("close_to_close")
+        )
+        return {
+            symbol: (VolatilityState.from_price_data(histories[symbol], config), volatility)
+            for symbol, volatility in volatilities.items()
+        }
+
+    def needs_rebuild(self, state: Optional[VolatilityState]) -> bool:
+        """Whether a stored state cannot be advanced and needs a full history."""
+        config = self.calculator.config
+        return (
+            state is None
+            or state.last_date is None
+            or state.short_window != config.short_window
+            or state.long_window != config.long_window
+        )
+
+    def save_states(self, states: dict[str, VolatilityState]) -> int:
+        """Save advanced states in one commit.
+
+        Returns:
+            Number of states saved
+        """
+        return self.repo.save_states(states)
+
+    def rebuild(self, symbol: str) -> VolatilityState:
+        """Recompute a symbol's state from full history and save it.
+
+        Returns:
+            The rebuilt VolatilityState
+        """
+        symbol = symbol.upper()
+        state = self._full_recompute(symbol)
+        self.repo.save_states({symbol: state})
+        return state
+
+    def validate(self, symbol: str) -> dict:
+        """Compare a symbol's stored state against a full recompute.
+
+        Only the windowed close-to-close volatilities are compared; the EWMA
+        depends on every bar since the state was created and is reported
+        for reference.
+
+        Returns:
+            Dict with stored and recomputed volatilities and the largest
+            absolute difference
+
+        Raises:
+            ValueError: If the symbol has no stored state
+        """
+        symbol = symbol.upper()
+        row = self.repo.get_by_symbol(symbol)
+        if row is None:
+            raise ValueError(f"No volatility state stored for {symbol}")
+
+        stored = row.to_state()
+        recomputed = self._full_recompute(symbol, through=stored.last_date)
+        config = self.calculator.config
+
+        result = {"symbol": symbol, "last_date": stored.last_date, "stored": {}, "recomputed": {}}
+        for window in (config.short_window, config.long_window):
+            for name, state in (("stored", stored), ("recomputed", recomputed)):
+                result[name][window] = self.calculator.calculate_from_state(
+                    state, window=window
+                ).volatility
+        for name, state in (("stored", stored), ("recomputed", recomputed)):
+            if state.ewma_variance is not None:
+                result[name]["ewma"] = self.calculator.calculate_from_state(
+                    state, method="ewma"
+                ).volatility
+
+        result["max_abs_diff"] = max(
+            abs(result["stored"][w] - result["recomputed"][w])
+            for w in (config.short_window, config.long_window)
+        )
+        return result
+
+    def _advance(self, symbol: str, state: Optional[VolatilityState]) -> VolatilityState:
+        """Apply new bars to a stored state, rebuilding it when it cannot be advanced."""
+        if self.needs_rebuild(state):
+            return self._full_recompute(symbol)
+
+        dates, closes = self._settled_bars(
+            self.price_fetcher.fetch_price_data(symbol, lookback_days=INCREMENTAL_LOOKBACK_DAYS)
+        )
+        if state.last_date not in dates:
+            logger.info(f"Volatility state for {symbol} is older than recent bars, rebuilding")
+            return self._full_recompute(symbol)
+
+        applied = state.update_many(dates, closes)
+        logger.debug(f"Applied {applied} new bars to volatility state for {symbol}")
+        return state
+
+    def _full_recompute(self, symbol: str, through: Optional[str] = None) -> VolatilityState:
+        """Build a fresh state from full history, optionally stopping at a date."""
+        dates, closes = self._settled_bars(
+            self.price_fetcher.fetch_price_data(symbol, lookback_days=self.rebuild_lookback_days)
+        )
+        state = VolatilityState.from_config(self.calculator.config)
+        for date, close in zip(dates, closes):
+            if through is not None and date > through:
+                break
+            state.update(date, close)
+        return state
+
+    @staticmethod
+    def _settled_bars(data: PriceData) -> tuple[list[str], list[float]]:
+        """Drop bars of the current session while its close is not final."""
+        open_session = get_open_session_date()
+        if open_session is None:
+            return data.dates, data.closes
+        settled = [i for i, date in enumerate(data.dates) if date < open_session]
+        return [data.dates[i] for i in settled], [data.closes[i] for i in settled]
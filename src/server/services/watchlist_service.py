@@ -6,12 +6,23 @@ and opportunity storage/retrieval.
 
 import logging
 import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from sqlalchemy.orm import Session
 
+from src.api.circuit_breaker import CircuitState, shared_circuit_breakers
+from src.api.rate_limiter import shared_rate_limiter
 from src.config import FinnhubConfig
+from src.constants import (
+    RECOMMENDATION_TOP_K,
+    SCAN_FETCH_WORKERS,
+    SCAN_SCORE_WORKERS,
+    SCAN_SYMBOL_TIMEOUT_SECONDS,
+    SCAN_WRITE_BATCH_SIZE,
+)
 from src.market_data.finnhub_client import FinnhubClient
 from src.market_data.price_fetcher import SchwabPriceDataFetcher
 from src.models.profiles import StrikeProfile
@@ -20,7 +31,11 @@ from src.server.database.models.opportunity import Opportunity
 from src.server.database.models.watchlist import WatchlistItem
 from src.server.repositories.opportunity import OpportunityRepository
 from src.server.repositories.watchlist import WatchlistRepository
-from src.wheel.recommend import RecommendEngine
+from src.server.services.volatility_service import VolatilityStateService
+from src.wheel.recommend import RecommendEngine, ScanInputs
+
+if TYPE_CHECKING:
+    from src.server.services.provider_registry import ProviderRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -35,9 +50,15 @@ class WatchlistService:
         watchlist_repo: Watchlist data access
         opportunity_repo: Opportunity data access
         recommend_engine: Core recommendation engine for scanning
+        volatility_service: Persisted incremental volatility per symbol
     """
 
-    def __init__(self, db: Session, schwab_client: Optional[SchwabClient] = None):
+    def __init__(
+        self,
+        db: Session,
+        schwab_client: Optional[SchwabClient] = None,
+        providers: Optional["ProviderRegistry"] = None,
+    ):
         self.db = db
         self.watchlist_repo = WatchlistRepository(db)
         self.opportunity_repo = OpportunityRepository(db)
@@ -45,30 +66,50 @@ class WatchlistService:
         # Initialize clients (same pattern as RecommendationService)
         if schwab_client:
             self._schwab = schwab_client
+        elif providers is not None:
+            self._schwab = providers.schwab_client
         else:
             try:
-                self._schwab = SchwabClient()
+                self._schwab = SchwabClient(
+                    rate_limiter=shared_rate_limiter(), circuit_breakers=shared_circuit_breakers()
+                )
             except Exception as e:
                 logger.warning(f"Failed to initialize SchwabClient: {e}")
                 self._schwab = None
 
-        price_fetcher = (
-            SchwabPriceDataFetcher(self._schwab) if self._schwab else None
-        )
+        if providers is not None and self._schwab is providers.schwab_client:
+            price_fetcher = providers.price_fetcher
+        else:
+            price_fetcher = (
+                SchwabPriceDataFetcher(self._schwab) if self._schwab else None
+            )
 
-        try:
-            finnhub_api_key = os.environ.get("FINNHUB_API_KEY", "")
-            if finnhub_api_key:
-                finnhub_client = FinnhubClient(FinnhubConfig(api_key=finnhub_api_key))
-            else:
+        if providers is not None:
+            finnhub_client = providers.finnhub_client
+        else:
+            try:
+                finnhub_api_key = os.environ.get("FINNHUB_API_KEY", "")
+                if finnhub_api_key:
+                    finnhub_client = FinnhubClient(
+                        FinnhubConfig(api_key=finnhub_api_key),
+                        rate_limiter=shared_rate_limiter(),
+                        circuit_breakers=shared_circuit_breakers(),
+                    )
+                else:
+                    finnhub_client = None
+            except Exception:
                 finnhub_client = None
-        except Exception:
-            finnhub_client = None
 
         self.recommend_engine = RecommendEngine(
             finnhub_client=finnhub_client,
             price_fetcher=price_fetcher,
             schwab_client=self._schwab,
+            cache=providers.cache if providers is not None else None,
+        )
+        self.volatility_service = VolatilityStateService(
+            db,
+            price_fetcher=price_fetcher,
+            config=self.recommend_engine.volatility_calculator.config,
         )
 
     # --- Watchlist CRUD ---
@@ -93,90 +134,295 @@ class WatchlistService:
         self,
         profiles: Optional[List[StrikeProfile]] = None,
         max_dte: int = 45,
+        fetch_workers: int = SCAN_FETCH_WORKERS,
+        score_workers: int = SCAN_SCORE_WORKERS,
+        symbol_timeout: float = SCAN_SYMBOL_TIMEOUT_SECONDS,
+        write_batch_size: int = SCAN_WRITE_BATCH_SIZE,
+        force: bool = False,
+        top_k: Optional[int] = RECOMMENDATION_TOP_K,
     ) -> dict:
         """Scan all watchlist symbols for opportunities.
 
+        Symbols are scanned as a pipeline: a pool of fetch_workers threads
+        fetches each symbol's price, volatility and chain (I/O-bound, paced
+        by the shared rate limiter; volatility comes from advancing the
+        symbol's stored VolatilityState, saved once the scan is done), a
+        separate pool of score_workers threads scores them, and this thread
+        alone writes opportunities to the database in batches of
+        write_batch_size. Fetching keeps going while earlier symbols are
+        scored, so the scan takes about as long as the rate limit allows
+        rather than the sum of every symbol's round trips. Symbols without
+        a stored state are rebuilt together before the pipeline starts
+        (see VolatilityStateService.rebuild_many).
+
+        A symbol not scored within symbol_timeout seconds of its fetch
+        starting is abandoned and reported in errors.
+
+        A symbol whose fetched inputs match the fingerprint of its last
+        completed scan (see ScanInputs.fingerprint) is not scored again:
+        the opportunities that scan stored are kept and restamped with this
+        scan's time. force rescans every symbol regardless.
+
         Args:
             profiles: Risk profiles to scan (defaults to conservative + aggressive)
             max_dte: Maximum days to expiration
+            fetch_workers: Threads fetching market data
+            score_workers: Threads scoring fetched chains
+            symbol_timeout: Seconds allowed per symbol, from fetch to score
+            write_batch_size: Opportunities inserted per transaction
+            force: Rescan symbols whose inputs are unchanged
+            top_k: Opportunities kept per symbol, direction and profile
+                (None = every candidate)
 
         Returns:
-            Dict with symbols_scanned, opportunities_found, errors
+            Dict with symbols_scanned, symbols_skipped (unchanged since the
+            last scan), opportunities_found (new this scan), errors and
+            timings (seconds per stage: prepare, fetch, score, write, total;
+            fetch and score are summed over symbols)
         """
         if profiles is None:
             profiles = DEFAULT_PROFILES
 
+        scan_start = time.monotonic()
+        timings = {"prepare": 0.0, "fetch": 0.0, "score": 0.0, "write": 0.0, "total": 0.0}
+
         watchlist = self.watchlist_repo.list_all()
         if not watchlist:
             logger.info("Watchlist is empty, nothing to scan")
-            return {"symbols_scanned": 0, "opportunities_found": 0, "errors": {}}
+            return {
+                "symbols_scanned": 0,
+                "symbols_skipped": 0,
+                "opportunities_found": 0,
+                "errors": {},
+                "timings": timings,
+            }
 
         # Purge stale opportunities before inserting new ones
         self.opportunity_repo.purge_stale(max_age_hours=24)
 
         errors: dict[str, str] = {}
         total_found = 0
-
-        for item in watchlist:
+        symbols = [item.symbol for item in watchlist]
+
+        # Fail the whole scan at once rather than symbol by symbol while Schwab is down
+        if self._schwab is not None and self._schwab.circuit_state() is CircuitState.OPEN:
+            message = "Schwab API unavailable (circuit open), scan skipped"
+            logger.warning(f"{message}: {len(symbols)} symbols")
+            timings["total"] = time.monotonic() - scan_start
+            return {
+                "symbols_scanned": 0,
+                "symbols_skipped": 0,
+                "opportunities_found": 0,
+                "errors": dict.fromkeys(symbols, message),
+                "timings": timings,
+            }
+
+        # Stored volatility states; fetch workers advance them with the new bars only
+        states: dict = {}
+        try:
+            states = self.volatility_service.load_states(symbols)
+        except Exception as e:
+            logger.warning(f"Loading volatility states failed, rebuilding from history: {e}")
+
+        # Symbols without a usable state are rebuilt together in one panel pass
+        rebuilt: dict = {}
+        if self.volatility_service.price_fetcher is not None:
+            rebuild = [s for s in symbols if self.volatility_service.needs_rebuild(states.get(s))]
             try:
-                recs = self.recommend_engine.scan_opportunities(
-                    symbol=item.symbol,
-                    profiles=profiles,
-                    max_dte=max_dte,
-                )
-
-                if not recs:
-                    logger.info(f"No opportunities found for {item.symbol}")
-                    continue
-
-                # Convert WheelRecommendation objects to Opportunity ORM objects
-                now = datetime.utcnow()
-                opps = []
-                for r in recs:
-                    # Determine profile string from the recommendation's sigma distance
-                    profile_str = self._profile_from_recommendation(r, profiles)
-                    opps.append(
-                        Opportunity(
-                            symbol=r.symbol,
-                            direction=r.direction,
-                            profile=profile_str,
-                            strike=r.strike,
-                            expiration_date=r.expiration_date,
-                            premium_per_share=r.premium_per_share,
-                            total_premium=r.total_premium,
-                            p_itm=r.p_itm,
-                            sigma_distance=r.sigma_distance,
-                            annualized_yield_pct=r.annualized_yield_pct,
-                            bias_score=r.bias_score,
-                            dte=r.dte,
-                            current_price=r.current_price,
-                            bid=r.bid,
-                            ask=r.ask,
-                            is_read=False,
-                            scanned_at=now,
-                        )
-                    )
-
-                self.opportunity_repo.bulk_create(opps)
-                total_found += len(opps)
-                logger.info(f"Found {len(opps)} opportunities for {item.symbol}")
-
+                rebuilt = self.volatility_service.rebuild_many(rebuild, workers=fetch_workers)
             except Exception as e:
-                logger.error(f"Failed to scan {item.symbol}: {e}", exc_info=True)
-                errors[item.symbol] = str(e)
+                logger.warning(f"Batch volatility rebuild failed, rebuilding per symbol: {e}")
+        advanced: dict = {symbol: state for symbol, (state, _) in rebuilt.items()}
 
+        # Fetch every chain concurrently; missing chains are fetched per symbol
+        chains: dict = {}
+        if len(symbols) > 1:
+            try:
+                chains = self.recommend_engine.prefetch_options_chains(symbols, max_dte=max_dte)
+            except Exception as e:
+                logger.warning(f"Concurrent chain fetch failed, falling back per symbol: {e}")
+
+        timings["prepare"] = time.monotonic() - scan_start
+
+        # Set by the fetch worker, so queued symbols are not on the clock yet
+        started: dict[str, float] = {}
+
+        def fetch(symbol: str) -> tuple[tuple[ScanInputs, str], float]:
+            started[symbol] = time.monotonic()
+            volatility = None
+            if symbol in rebuilt:
+                volatility = rebuilt[symbol][1]
+            elif self.volatility_service.price_fetcher is not None:
+                try:
+                    state, volatility = self.volatility_service.advance(symbol, states.get(symbol))
+                    advanced[symbol] = state
+                except Exception as e:
+                    logger.warning(f"Incremental volatility failed for {symbol}: {e}")
+            inputs = self.recommend_engine.fetch_scan_inputs(
+                symbol=symbol,
+                profiles=profiles,
+                max_dte=max_dte,
+                volatility=volatility,
+                options_chain=chains.get(symbol),
+            )
+            fingerprint = inputs.fingerprint(profiles, max_dte, top_k)
+            return (inputs, fingerprint), time.monotonic() - started[symbol]
+
+        def score(symbol: str, inputs: ScanInputs) -> tuple[list, float]:
+            score_start = time.monotonic()
+            recs = self.recommend_engine.scan_opportunities(
+                symbol=symbol,
+                profiles=profiles,
+                max_dte=max_dte,
+                volatility=inputs.volatility,
+                options_chain=inputs.options_chain,
+                current_price=inputs.current_price,
+                top_k=top_k,
+            )
+            return recs, time.monotonic() - score_start
+
+        previous_scans = {item.symbol: item for item in watchlist}
+        fingerprints: dict[str, str] = {}
+        completed: dict[str, tuple[str, datetime]] = {}  # symbol -> (fingerprint, scanned_at)
+        unchanged: dict[str, datetime] = {}  # symbol -> scanned_at of its reused opportunities
+        pending_writes: list[Opportunity] = []
+
+        def flush() -> None:
+            batch = pending_writes[:]
+            pending_writes.clear()
+            write_start = time.monotonic()
+            self.opportunity_repo.bulk_create(batch)
+            timings["write"] += time.monotonic() - write_start
+
+        fetch_pool = ThreadPoolExecutor(max_workers=fetch_workers, thread_name_prefix="scan-fetch")
+        score_pool = ThreadPoolExecutor(max_workers=score_workers, thread_name_prefix="scan-score")
+        in_flight: dict[Future, tuple[str, str]] = {
+            fetch_pool.submit(fetch, symbol): (symbol, "fetch") for symbol in symbols
+        }
+        try:
+            while in_flight:
+                deadlines = [
+                    started[symbol] + symbol_timeout
+                    for symbol, _ in in_flight.values()
+                    if symbol in started
+                ]
+                wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                done, _ = wait(in_flight, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    symbol, stage = in_flight.pop(future)
+                    try:
+                        value, elapsed = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to scan {symbol}: {e}", exc_info=True)
+                        errors[symbol] = str(e)
+                        continue
+                    timings[stage] += elapsed
+
+                    if stage == "fetch":
+                        inputs, fingerprint = value
+                        previous = previous_scans[symbol]
+                        if (
+                            not force
+                            and previous.scanned_at is not None
+                            and previous.scan_fingerprint == fingerprint
+                        ):
+                            logger.info(f"Inputs unchanged for {symbol}, reusing last scan")
+                            unchanged[symbol] = previous.scanned_at
+                            continue
+                        fingerprints[symbol] = fingerprint
+                        in_flight[score_pool.submit(score, symbol, inputs)] = (symbol, "score")
+                        continue
+
+                    scanned_at = datetime.utcnow()
+                    completed[symbol] = (fingerprints[symbol], scanned_at)
+                    if not value:
+                        logger.info(f"No opportunities found for {symbol}")
+                        continue
+                    opps = self._opportunities_from_recommendations(value, profiles, scanned_at)
+                    pending_writes.extend(opps)
+                    total_found += len(opps)
+                    logger.info(f"Found {len(opps)} opportunities for {symbol}")
+                    if len(pending_writes) >= write_batch_size:
+                        flush()
+
+                now = time.monotonic()
+                for future, (symbol, stage) in list(in_flight.items()):
+                    if symbol in started and now - started[symbol] >= symbol_timeout:
+                        del in_flight[future]
+                        future.cancel()
+                        logger.error(f"Scan of {symbol} timed out during {stage}")
+                        errors[symbol] = f"Timed out after {symbol_timeout:.0f}s ({stage})"
+        finally:
+            # Abandon timed-out work; its threads finish in the background
+            fetch_pool.shutdown(wait=False, cancel_futures=True)
+            score_pool.shutdown(wait=False, cancel_futures=True)
+
+        if pending_writes:
+            flush()
+
+        # Only states whose fetch finished; abandoned workers may still be advancing theirs
+        try:
+            self.volatility_service.save_states(dict(advanced))
+        except Exception as e:
+            logger.warning(f"Saving volatility states failed: {e}")
+
+        # Record fingerprints only once the scan's opportunities are stored
+        if unchanged:
+            restamped_at = datetime.utcnow()
+            self.opportunity_repo.restamp(unchanged, restamped_at)
+            completed.update(
+                (symbol, (previous_scans[symbol].scan_fingerprint, restamped_at))
+                for symbol in unchanged
+            )
+        self.watchlist_repo.record_scans(completed)
+
+        timings["total"] = time.monotonic() - scan_start
         result = {
             "symbols_scanned": len(watchlist),
+            "symbols_skipped": len(unchanged),
             "opportunities_found": total_found,
             "errors": errors,
+            "timings": timings,
         }
         logger.info(
-            f"Scan complete: {result['symbols_scanned']} symbols, "
+            f"Scan complete: {result['symbols_scanned']} symbols "
+            f"({result['symbols_skipped']} unchanged), "
             f"{result['opportunities_found']} opportunities, "
-            f"{len(errors)} errors"
+            f"{len(errors)} errors in {timings['total']:.1f}s "
+            f"(prepare {timings['prepare']:.1f}s, fetch {timings['fetch']:.1f}s, "
+            f"score {timings['score']:.1f}s, write {timings['write']:.1f}s)"
         )
         return result
 
+    def _opportunities_from_recommendations(
+        self, recs: list, profiles: List[StrikeProfile], scanned_at: datetime
+    ) -> List[Opportunity]:
+        """Convert WheelRecommendation objects to Opportunity ORM objects."""
+        return [
+            Opportunity(
+                symbol=r.symbol,
+                direction=r.direction,
+                # Determine profile string from the recommendation's sigma distance
+                profile=self._profile_from_recommendation(r, profiles),
+                strike=r.strike,
+                expiration_date=r.expiration_date,
+                premium_per_share=r.premium_per_share,
+                total_premium=r.total_premium,
+                p_itm=r.p_itm,
+                sigma_distance=r.sigma_distance,
+                annualized_yield_pct=r.annualized_yield_pct,
+                bias_score=r.bias_score,
+                dte=r.dte,
+                current_price=r.current_price,
+                bid=r.bid,
+                ask=r.ask,
+                is_read=False,
+                scanned_at=scanned_at,
+            )
+            for r in recs
+        ]
+
     def _profile_from_recommendation(self, rec, profiles: List[StrikeProfile]) -> str:
         """Determine the profile string for a recommendation based on its sigma distance.
 
@@ -58,10 +58,7 @@ def is_market_open(now: Optional[datetime] = None) -> bool:
 
     # Check if within trading hours
     current_time = now.time()
-    if current_time < MARKET_OPEN_TIME or current_time >= MARKET_CLOSE_TIME:
-        return False
-
-    return True
+    return MARKET_OPEN_TIME <= current_time < MARKET_CLOSE_TIME
 
 
 def should_run_task(task_name: str, now: Optional[datetime] = None) -> bool:
@@ -195,3 +192,31 @@ def get_next_market_close(now: Optional[datetime] = None) -> datetime:
         next_close = next_close + timedelta(days=1)
 
     return next_close
+
+
+def get_open_session_date(now: Optional[datetime] = None) -> Optional[str]:
+    """Get the date of today's session if its close is not final yet.
+
+    Daily bars dated on this session are partial until the market closes;
+    callers that persist closes should skip them.
+
+    Args:
+        now: Optional datetime to check (defaults to current time)
+
+    Returns:
+        Today's date (YYYY-MM-DD, Eastern) before the close on a weekday,
+        otherwise None
+
+    Note:
+        This does not account for market holidays or early closures.
+    """
+    if now is None:
+        now = datetime.now(EASTERN)
+    elif now.tzinfo is None:
+        now = pytz.utc.localize(now).astimezone(EASTERN)
+    else:
+        now = now.astimezone(EASTERN)
+
+    if now.weekday() in MARKET_CLOSED_DAYS or now.time() >= MARKET_CLOSE_TIME:
+        return None
+    return now.date().isoformat()
@@ -18,6 +18,7 @@ from src.server.database.session import get_session_factory
 from src.server.repositories.trade import TradeRepository
 from src.server.repositories.wheel import WheelRepository
 from src.server.services.position_service import PositionMonitorService
+from src.server.services.provider_registry import get_provider_registry
 from src.server.services.recommendation_service import RecommendationService
 from src.server.tasks.execution_logger import log_execution
 from src.server.tasks.market_hours import is_market_open
@@ -30,7 +31,8 @@ def price_refresh_task():
     """Refresh prices for all open positions.
 
     Runs every 5 minutes during market hours to update position caches
-    with current market prices. Batches API calls to minimize rate limits.
+    with current market prices. Quotes for all positions are fetched with
+    batched requests to minimize rate limits.
 
     Only runs if market is open.
     """
@@ -44,7 +46,7 @@ def price_refresh_task():
 
     try:
         # Get position service
-        position_service = PositionMonitorService(db)
+        position_service = PositionMonitorService(db, providers=get_provider_registry())
 
         # Get all open positions (force refresh to fetch new prices)
         result = position_service.get_all_open_positions(force_refresh=True)
@@ -81,7 +83,7 @@ def daily_snapshot_task():
         # Get repositories
         trade_repo = TradeRepository(db)
         wheel_repo = WheelRepository(db)
-        position_service = PositionMonitorService(db)
+        position_service = PositionMonitorService(db, providers=get_provider_registry())
 
         # Get all open trades
         open_trades = trade_repo.list_open_trades()
@@ -89,10 +91,15 @@ def daily_snapshot_task():
         snapshots_created = 0
         today = datetime.utcnow().date()
 
+        # Fetch quotes for every open position in one batched request
+        wheels = {trade.wheel_id: wheel_repo.get_wheel(trade.wheel_id) for trade in open_trades}
+        position_service.prefetch_quotes(
+            [wheel.symbol for wheel in wheels.values() if wheel]
+        )
+
         for trade in open_trades:
             try:
-                # Get wheel
-                wheel = wheel_repo.get_wheel(trade.wheel_id)
+                wheel = wheels[trade.wheel_id]
                 if not wheel:
                     continue
 
@@ -156,7 +163,7 @@ def risk_monitoring_task():
 
     try:
         # Get position service
-        position_service = PositionMonitorService(db)
+        position_service = PositionMonitorService(db, providers=get_provider_registry())
 
         # Get all open positions
         result = position_service.get_all_open_positions(force_refresh=False)
@@ -216,11 +223,12 @@ def opportunity_scanning_task():
     try:
         from src.server.services.watchlist_service import WatchlistService
 
-        service = WatchlistService(db)
+        service = WatchlistService(db, providers=get_provider_registry())
         result = service.scan_all()
 
         logger.info(
-            f"Opportunity scanning complete: {result['symbols_scanned']} symbols scanned, "
+            f"Opportunity scanning complete: {result['symbols_scanned']} symbols scanned "
+            f"({result['symbols_skipped']} unchanged), "
             f"{result['opportunities_found']} opportunities found, "
             f"{len(result['errors'])} errors"
         )
@@ -5,6 +5,7 @@ This package contains modules for analyzing and building options strategies:
 - covered_strategies: Covered calls, cash-secured puts, wheel strategy
 - strike_optimizer: Strike price optimization and probability calculations
 - ladder_builder: Multi-week position laddering
+- iv_solver: Batch implied volatility solver for options chains
 
 All classes and functions are re-exported at the package level for convenience.
 """
@@ -22,6 +23,15 @@ from src.strategies.strike_optimizer import StrikeOptimizer
 # Import from ladder_builder
 from src.strategies.ladder_builder import LadderBuilder
 
+# Import from iv_solver
+from src.strategies.iv_solver import (
+    IV_SOURCE_PROVIDER,
+    IV_SOURCE_SOLVED,
+    ChainIVSummary,
+    ImpliedVolatilitySolver,
+    IVSolveResult,
+)
+
 __all__ = [
     # covered_strategies
     "CoveredCallAnalyzer",
@@ -31,4 +41,10 @@ __all__ = [
     "StrikeOptimizer",
     # ladder_builder
     "LadderBuilder",
+    # iv_solver
+    "IV_SOURCE_PROVIDER",
+    "IV_SOURCE_SOLVED",
+    "ChainIVSummary",
+    "ImpliedVolatilitySolver",
+    "IVSolveResult",
 ]
@@ -35,6 +35,7 @@ Example:
 """
 
 import logging
+import math
 from typing import Optional
 
 from src.warnings import DEFAULT_MAX_BID_ASK_SPREAD_PCT as MAX_BID_ASK_SPREAD_PCT
@@ -113,6 +114,7 @@ class CoveredCallAnalyzer:
         shares: int = 100,
         cost_basis: Optional[float] = None,
         earnings_dates: Optional[list[str]] = None,
+        probability: Optional[tuple[float, float]] = None,
     ) -> CoveredCallResult:
         """
         Analyze a covered call position.
@@ -124,6 +126,8 @@ class CoveredCallAnalyzer:
             shares: Number of shares (default 100 per contract)
             cost_basis: Original purchase price (default: current_price)
             earnings_dates: List of earnings dates to check (YYYY-MM-DD)
+            probability: Precomputed (sigma_distance, assignment_probability),
+                e.g. from StrikeOptimizer.calculate_assignment_probabilities
 
         Returns:
             CoveredCallResult with all metrics
@@ -184,27 +188,31 @@ class CoveredCallAnalyzer:
         assignment_prob = None
         profile = None
 
-        try:
-            sigma_distance = self.optimizer.get_sigma_for_strike(
-                strike=contract.strike,
-                current_price=current_price,
-                volatility=volatility,
-                days_to_expiry=max(1, days_to_expiry),
-                option_type="call",
-            )
+        if probability is not None:
+            sigma_distance, assignment_prob = probability
+            profile = self.optimizer.get_profile_for_sigma(sigma_distance)
+        else:
+            try:
+                sigma_distance = self.optimizer.get_sigma_for_strike(
+                    strike=contract.strike,
+                    current_price=current_price,
+                    volatility=volatility,
+                    days_to_expiry=max(1, days_to_expiry),
+                    option_type="call",
+                )
 
-            prob_result = self.optimizer.calculate_assignment_probability(
-                strike=contract.strike,
-                current_price=current_price,
-                volatility=volatility,
-                days_to_expiry=max(1, days_to_expiry),
-                option_type="call",
-            )
-            assignment_prob = prob_result.probability
+                prob_result = self.optimizer.calculate_assignment_probability(
+                    strike=contract.strike,
+                    current_price=current_price,
+                    volatility=volatility,
+                    days_to_expiry=max(1, days_to_expiry),
+                    option_type="call",
+                )
+                assignment_prob = prob_result.probability
 
-            profile = self.optimizer.get_profile_for_sigma(sigma_distance)
-        except (ValueError, ZeroDivisionError) as e:
-            warnings.append(f"Could not calculate probability: {e}")
+                profile = self.optimizer.get_profile_for_sigma(sigma_distance)
+            except (ValueError, ZeroDivisionError) as e:
+                warnings.append(f"Could not calculate probability: {e}")
 
         # Check liquidity warnings
         add_liquidity_warnings(contract, warnings, MIN_OPEN_INTEREST, MAX_BID_ASK_SPREAD_PCT)
@@ -283,16 +291,24 @@ class CoveredCallAnalyzer:
             logger.warning("No call contracts found for recommendations")
             return []
 
-        results = []
-        for contract in calls:
-            # Skip ITM calls
-            if contract.strike <= current_price:
-                continue
+        # Skip ITM calls and zero or low premium (PRD tradability gate)
+        calls = [
+            c for c in calls if c.strike > current_price and c.bid and c.bid >= min_premium
+        ]
 
-            # Skip zero or low premium (PRD tradability gate)
-            if not contract.bid or contract.bid < min_premium:
-                continue
+        # Sigma distance and P(ITM) for every strike in one vectorized call
+        probabilities = self.optimizer.calculate_assignment_probabilities(
+            strikes=[c.strike for c in calls],
+            current_price=current_price,
+            volatility=volatility,
+            days_to_expiry=[max(1, calculate_days_to_expiry(c.expiration_date)) for c in calls],
+            option_type="call",
+        )
 
+        results = []
+        for contract, sigma_distance, p_itm in zip(
+            calls, probabilities.sigma_distance.tolist(), probabilities.probability.tolist()
+        ):
             try:
                 result = self.analyze(
                     contract=contract,
@@ -300,6 +316,7 @@ class CoveredCallAnalyzer:
                     volatility=volatility,
                     shares=shares,
                     cost_basis=cost_basis,
+                    probability=None if math.isnan(sigma_distance) else (sigma_distance, p_itm),
                 )
 
                 # Filter by profile if specified
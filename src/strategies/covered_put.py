@@ -35,6 +35,7 @@ Example:
 """
 
 import logging
+import math
 from typing import Optional
 
 from src.constants import MAX_BID_ASK_SPREAD_PCT, MIN_BID_PRICE, MIN_OPEN_INTEREST
@@ -107,6 +108,7 @@ class CoveredPutAnalyzer:
         volatility: float,
         earnings_dates: Optional[list[str]] = None,
         ex_dividend_dates: Optional[list[str]] = None,
+        probability: Optional[tuple[float, float]] = None,
     ) -> CoveredPutResult:
         """
         Analyze a cash-secured put position.
@@ -117,6 +119,8 @@ class CoveredPutAnalyzer:
             volatility: Annualized volatility for calculations
             earnings_dates: List of earnings dates to check (YYYY-MM-DD)
             ex_dividend_dates: List of ex-dividend dates to check (YYYY-MM-DD)
+            probability: Precomputed (sigma_distance, assignment_probability),
+                e.g. from StrikeOptimizer.calculate_assignment_probabilities
 
         Returns:
             CoveredPutResult with all metrics
@@ -185,27 +189,31 @@ class CoveredPutAnalyzer:
         assignment_prob = None
         profile = None
 
-        try:
-            sigma_distance = self.optimizer.get_sigma_for_strike(
-                strike=contract.strike,
-                current_price=current_price,
-                volatility=volatility,
-                days_to_expiry=max(1, days_to_expiry),
-                option_type="put",
-            )
+        if probability is not None:
+            sigma_distance, assignment_prob = probability
+            profile = self.optimizer.get_profile_for_sigma(sigma_distance)
+        else:
+            try:
+                sigma_distance = self.optimizer.get_sigma_for_strike(
+                    strike=contract.strike,
+                    current_price=current_price,
+                    volatility=volatility,
+                    days_to_expiry=max(1, days_to_expiry),
+                    option_type="put",
+                )
 
-            prob_result = self.optimizer.calculate_assignment_probability(
-                strike=contract.strike,
-                current_price=current_price,
-                volatility=volatility,
-                days_to_expiry=max(1, days_to_expiry),
-                option_type="put",
-            )
-            assignment_prob = prob_result.probability
+                prob_result = self.optimizer.calculate_assignment_probability(
+                    strike=contract.strike,
+                    current_price=current_price,
+                    volatility=volatility,
+                    days_to_expiry=max(1, days_to_expiry),
+                    option_type="put",
+                )
+                assignment_prob = prob_result.probability
 
-            profile = self.optimizer.get_profile_for_sigma(sigma_distance)
-        except (ValueError, ZeroDivisionError) as e:
-            warnings.append(f"Could not calculate probability: {e}")
+                profile = self.optimizer.get_profile_for_sigma(sigma_distance)
+            except (ValueError, ZeroDivisionError) as e:
+                warnings.append(f"Could not calculate probability: {e}")
 
         # Check liquidity warnings
         add_liquidity_warnings(contract, warnings, MIN_OPEN_INTEREST, MAX_BID_ASK_SPREAD_PCT)
@@ -288,19 +296,30 @@ class CoveredPutAnalyzer:
             logger.warning("No put contracts found for recommendations")
             return []
 
-        results = []
-        for contract in puts:
-            # Skip ITM puts
-            if contract.strike >= current_price:
-                continue
+        # Skip ITM puts and zero or low premium (PRD tradability gate)
+        puts = [
+            c for c in puts if c.strike < current_price and c.bid and c.bid >= min_premium
+        ]
 
-            # Skip zero or low premium (PRD tradability gate)
-            if not contract.bid or contract.bid < min_premium:
-                continue
+        # Sigma distance and P(ITM) for every strike in one vectorized call
+        probabilities = self.optimizer.calculate_assignment_probabilities(
+            strikes=[c.strike for c in puts],
+            current_price=current_price,
+            volatility=volatility,
+            days_to_expiry=[max(1, calculate_days_to_expiry(c.expiration_date)) for c in puts],
+            option_type="put",
+        )
 
+        results = []
+        for contract, sigma_distance, p_itm in zip(
+            puts, probabilities.sigma_distance.tolist(), probabilities.probability.tolist()
+        ):
             try:
                 result = self.analyze(
-                    contract=contract, current_price=current_price, volatility=volatility
+                    contract=contract,
+                    current_price=current_price,
+                    volatility=volatility,
+                    probability=None if math.isnan(sigma_distance) else (sigma_distance, p_itm),
                 )
 
                 # Filter by profile if specified
@@ -0,0 +1,410 @@
+"""
+Implied volatility solver for options chains.
+
+Providers often return unusable implied volatility on illiquid strikes
+(Schwab sends -999, which parses to -9.99, or zero). This module inverts
+Black-Scholes from the bid/ask mid for every such contract in one
+vectorized pass, so downstream consumers such as
+extract_atm_implied_volatility see a usable IV instead of skipping the
+strike.
+
+The solver runs safeguarded Newton iterations on all contracts at once.
+Each contract keeps a [low, high] volatility bracket that always contains
+the root. Any Newton step that leaves the bracket, or that has a
+vanishing vega, becomes a bisection step, so every contract whose price
+is attainable converges.
+
+Example:
+    from src.strategies.iv_solver import ImpliedVolatilitySolver
+
+    solver = ImpliedVolatilitySolver()
+    summary = solver.solve_chain(chain, current_price=185.50)
+    print(summary.to_dict())
+"""
+
+import logging
+import math
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import numpy as np
+
+from src.constants import DEFAULT_RISK_FREE_RATE
+from src.models import OptionsChain
+from src.utils import calculate_days_to_expiry
+
+from .strike_optimizer import norm_cdf
+
+logger = logging.getLogger(__name__)
+
+IV_SOURCE_PROVIDER = "provider"
+IV_SOURCE_SOLVED = "solved"
+
+# Per-contract solver status codes
+STATUS_CONVERGED = "converged"
+STATUS_NO_QUOTE = "no_quote"
+STATUS_INVALID_INPUT = "invalid_input"
+STATUS_BELOW_BOUNDS = "below_bounds"
+STATUS_ABOVE_BOUNDS = "above_bounds"
+STATUS_MAX_ITERATIONS = "max_iterations"
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2 * math.pi)
+
+
+def black_scholes_price(
+    current_price: np.ndarray,
+    strikes: np.ndarray,
+    time_to_expiry: np.ndarray,
+    volatility: np.ndarray,
+    is_call: np.ndarray,
+    risk_free_rate: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized Black-Scholes price and vega for European options.
+
+    Args:
+        current_price: Underlying price(s)
+        strikes: Strike prices
+        time_to_expiry: Time to expiration in years
+        volatility: Annualized volatility as decimal
+        is_call: True for calls, False for puts
+        risk_free_rate: Annual risk-free rate
+
+    Returns:
+        Tuple of (price, vega) arrays; vega is per 1.00 change in volatility
+    """
+    sqrt_t = np.sqrt(time_to_expiry)
+    vol_sqrt_t = volatility * sqrt_t
+    d1 = (
+        np.log(current_price / strikes) + (risk_free_rate + 0.5 * volatility**2) * time_to_expiry
+    ) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    discounted_strike = strikes * np.exp(-risk_free_rate * time_to_expiry)
+
+    call = current_price * norm_cdf(d1) - discounted_strike * norm_cdf(d2)
+    # Put-call parity keeps deep OTM puts as accurate as calls
+    price = np.where(is_call, call, call - current_price + discounted_strike)
+    vega = current_price * sqrt_t * _INV_SQRT_2PI * np.exp(-0.5 * d1 * d1)
+    return price, vega
+
+
+@dataclass
+class IVSolveResult:
+    """
+    Per-contract output of ImpliedVolatilitySolver.solve.
+
+    Attributes:
+        implied_volatility: Solved IV as decimal (NaN where not converged)
+        converged: Whether each contract converged
+        iterations: Iterations used per contract
+        price_error: |model price - target price| at the final volatility
+        status: Status code per contract (see STATUS_* constants)
+    """
+
+    implied_volatility: np.ndarray
+    converged: np.ndarray
+    iterations: np.ndarray
+    price_error: np.ndarray
+    status: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.implied_volatility)
+
+    def status_counts(self) -> dict[str, int]:
+        """Count contracts per status code."""
+        return dict(Counter(self.status.tolist()))
+
+
+@dataclass
+class ChainIVSummary:
+    """
+    Diagnostics for filling implied volatility on a whole chain.
+
+    Attributes:
+        total: Contracts in the chain
+        provider: Contracts keeping the provider's IV
+        solved: Contracts whose IV was solved from the mid
+        failed: Contracts left without IV
+        max_iterations: Most iterations any contract needed
+        max_price_error: Largest |model - mid| among solved contracts
+        elapsed_ms: Wall time for the solve
+        status_counts: Solver status per attempted contract
+    """
+
+    total: int
+    provider: int
+    solved: int
+    failed: int
+    max_iterations: int = 0
+    max_price_error: float = 0.0
+    elapsed_ms: float = 0.0
+    status_counts: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging or serialization."""
+        return {
+            "total": self.total,
+            "provider": self.provider,
+            "solved": self.solved,
+            "failed": self.failed,
+            "max_iterations": self.max_iterations,
+            "max_price_error": self.max_price_error,
+            "elapsed_ms": round(self.elapsed_ms, 3),
+            "status_counts": self.status_counts,
+        }
+
+
+class ImpliedVolatilitySolver:
+    """
+    Batch Black-Scholes implied volatility solver.
+
+    Attributes:
+        risk_free_rate: Annual risk-free rate
+        min_volatility: Lower end of the search bracket
+        max_volatility: Upper end of the search bracket; provider IVs above
+            this are treated as bad data
+        price_tolerance: Convergence tolerance on price, in dollars per share
+        max_iterations: Iteration cap per contract
+    """
+
+    def __init__(
+        self,
+        risk_free_rate: Optional[float] = None,
+        min_volatility: float = 0.001,
+        max_volatility: float = 5.0,
+        price_tolerance: float = 1e-6,
+        max_iterations: int = 100,
+    ):
+        """
+        Initialize the solver.
+
+        Args:
+            risk_free_rate: Annual risk-free rate (default: 0.05 = 5%)
+            min_volatility: Lower bracket bound (default: 0.1%)
+            max_volatility: Upper bracket bound (default: 500%)
+            price_tolerance: Price tolerance in dollars per share
+            max_iterations: Maximum Newton/bisection iterations
+        """
+        if not 0 < min_volatility < max_volatility:
+            raise ValueError("Require 0 < min_volatility < max_volatility")
+        self.risk_free_rate = DEFAULT_RISK_FREE_RATE if risk_free_rate is None else risk_free_rate
+        self.min_volatility = min_volatility
+        self.max_volatility = max_volatility
+        self.price_tolerance = price_tolerance
+        self.max_iterations = max_iterations
+
+    def solve(
+        self,
+        prices: Any,
+        current_price: Any,
+        strikes: Any,
+        days_to_expiry: Any,
+        is_call: Any,
+    ) -> IVSolveResult:
+        """
+        Solve implied volatility for many contracts at once.
+
+        Arguments broadcast against each other. Prices outside the range
+        attainable within [min_volatility, max_volatility], for example
+        below intrinsic value, are reported with a status instead of raising.
+
+        Args:
+            prices: Target option prices (typically the bid/ask mid)
+            current_price: Underlying price(s)
+            strikes: Strike prices
+            days_to_expiry: Calendar days to expiration
+            is_call: True for calls, False for puts
+
+        Returns:
+            IVSolveResult with one entry per contract
+        """
+        target, spot, strike, days, call = np.broadcast_arrays(
+            np.asarray(prices, dtype=np.float64),
+            np.asarray(current_price, dtype=np.float64),
+            np.asarray(strikes, dtype=np.float64),
+            np.asarray(days_to_expiry, dtype=np.float64),
+            np.asarray(is_call, dtype=bool),
+        )
+        target, spot, strike, days, call = (
+            np.ravel(a).copy() for a in (target, spot, strike, days, call)
+        )
+        n = target.size
+        T = days / 365.0
+
+        iv = np.full(n, np.nan)
+        converged = np.zeros(n, dtype=bool)
+        iterations = np.zeros(n, dtype=np.int64)
+        price_error = np.full(n, np.nan)
+        status = np.full(n, STATUS_MAX_ITERATIONS, dtype=object)
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            quoted = np.isfinite(target) & (target > 0)
+            valid = (spot > 0) & (strike > 0) & (T > 0) & np.isfinite(spot * strike * T)
+            status[~quoted] = STATUS_NO_QUOTE
+            status[quoted & ~valid] = STATUS_INVALID_INPUT
+            active = quoted & valid
+
+            # The root is bracketed only if the target lies between the bracket prices
+            lo = np.full(n, self.min_volatility)
+            hi = np.full(n, self.max_volatility)
+            price_lo, _ = black_scholes_price(spot, strike, T, lo, call, self.risk_free_rate)
+            price_hi, _ = black_scholes_price(spot, strike, T, hi, call, self.risk_free_rate)
+            below = active & (target < price_lo - self.price_tolerance)
+            above = active & (target > price_hi + self.price_tolerance)
+            status[below] = STATUS_BELOW_BOUNDS
+            status[above] = STATUS_ABOVE_BOUNDS
+            active &= ~(below | above)
+
+            # Brenner-Subrahmanyam ATM approximation as the starting point
+            sigma = np.sqrt(2 * math.pi / T) * target / spot
+            sigma = np.clip(
+                np.where(np.isfinite(sigma), sigma, 0.3),
+                2 * self.min_volatility,
+                0.5 * self.max_volatility,
+            )
+
+            for _ in range(self.max_iterations):
+                idx = np.flatnonzero(active)
+                if idx.size == 0:
+                    break
+
+                s = sigma[idx]
+                model, vega = black_scholes_price(
+                    spot[idx], strike[idx], T[idx], s, call[idx], self.risk_free_rate
+                )
+                diff = model - target[idx]
+                iterations[idx] += 1
+                price_error[idx] = np.abs(diff)
+
+                done = (np.abs(diff) <= self.price_tolerance) | (hi[idx] - lo[idx] <= 1e-12)
+                finished = idx[done]
+                iv[finished] = s[done]
+                converged[finished] = True
+                status[finished] = STATUS_CONVERGED
+                active[finished] = False
+
+                # Keep the bracket around the root; price is increasing in volatility
+                lo[idx] = np.where(diff < 0, s, lo[idx])
+                hi[idx] = np.where(diff > 0, s, hi[idx])
+
+                step = s - diff / vega
+                bisect = ~np.isfinite(step) | (step <= lo[idx]) | (step >= hi[idx])
+                sigma[idx] = np.where(bisect, 0.5 * (lo[idx] + hi[idx]), step)
+
+        return IVSolveResult(
+            implied_volatility=iv,
+            converged=converged,
+            iterations=iterations,
+            price_error=price_error,
+            status=status.astype(str),
+        )
+
+    def is_valid_provider_iv(self, value: Optional[float]) -> bool:
+        """Whether a provider-supplied IV is usable (finite and within the bracket)."""
+        return (
+            value is not None
+            and math.isfinite(value)
+            and self.min_volatility <= value <= self.max_volatility
+        )
+
+    def solve_chain(
+        self,
+        options_chain: OptionsChain,
+        current_price: Optional[float] = None,
+        replace_provider: bool = False,
+    ) -> ChainIVSummary:
+        """
+        Fill implied volatility in place for every contract in a chain.
+
+        Contracts with a usable provider IV keep it and are tagged
+        IV_SOURCE_PROVIDER. All others, or all contracts if
+        replace_provider is set, are solved from the bid/ask mid in one
+        batch. Converged ones are tagged IV_SOURCE_SOLVED. Contracts that
+        cannot be solved are left with implied_volatility=None and no tag,
+        so bad provider values such as -9.99 no longer reach consumers.
+
+        Contracts already tagged by an earlier call are left untouched, so
+        solving a cached chain again is cheap. Inputs are read from the
+        chain's columns and results are written back to both the columns
+        and the contracts, so the columns stay attached to the chain.
+
+        Args:
+            options_chain: Chain to update in place
+            current_price: Underlying price (default: options_chain.underlying_price)
+            replace_provider: Solve every contract, ignoring provider IV
+
+        Returns:
+            ChainIVSummary with counts and convergence diagnostics
+
+        Raises:
+            ValueError: If no underlying price is available
+        """
+        start = time.perf_counter()
+        price = current_price if current_price is not None else options_chain.underlying_price
+        if price is None or price <= 0:
+            raise ValueError("An underlying price is required to solve implied volatility")
+
+        columns = options_chain.columns
+        iv = columns.columns["implied_volatility"]
+        tags = columns.iv_source
+        if replace_provider:
+            pending = np.ones(len(columns), dtype=bool)
+        else:
+            untagged = np.equal(tags, None)
+            # NaN (missing) and out-of-bracket values such as -9.99 fail both bounds
+            with np.errstate(invalid="ignore"):
+                provider = untagged & (iv >= self.min_volatility) & (iv <= self.max_volatility)
+            pending = untagged & ~provider
+            provider_rows = np.flatnonzero(provider)
+            tags[provider_rows] = IV_SOURCE_PROVIDER
+            for row in provider_rows.tolist():
+                columns.contract(row).iv_source = IV_SOURCE_PROVIDER
+
+        summary = ChainIVSummary(total=len(options_chain.contracts), provider=0, solved=0, failed=0)
+        rows = np.flatnonzero(pending)
+        if len(rows):
+            dte = np.array(
+                [calculate_days_to_expiry(exp) for exp in columns.expirations], dtype=np.float64
+            )
+            bid = columns.columns["bid"][rows]
+            ask = columns.columns["ask"][rows]
+            with np.errstate(invalid="ignore"):
+                mids = np.where((bid >= 0) & (ask >= bid), (bid + ask) / 2, np.nan)
+            result = self.solve(
+                prices=mids,
+                current_price=price,
+                strikes=columns.columns["strike"][rows],
+                days_to_expiry=dte[columns.expiration_codes[rows]],
+                is_call=columns.is_call[rows],
+            )
+
+            # Write the solved IVs into the columns and the contracts they index
+            solved = np.where(result.converged, result.implied_volatility, np.nan)
+            if not iv.flags.writeable:
+                # Columns loaded from a snapshot are read-only memory maps
+                iv = columns.columns["implied_volatility"] = iv.copy()
+            iv[rows] = solved
+            tags[rows] = np.where(result.converged, IV_SOURCE_SOLVED, None)
+            for row, value, ok in zip(rows.tolist(), solved.tolist(), result.converged.tolist()):
+                contract = columns.contract(row)
+                contract.implied_volatility = value if ok else None
+                contract.iv_source = IV_SOURCE_SOLVED if ok else None
+
+            summary.status_counts = result.status_counts()
+            if result.converged.any():
+                summary.max_iterations = int(result.iterations.max())
+                summary.max_price_error = float(result.price_error[result.converged].max())
+
+        summary.provider = int(np.count_nonzero(tags == IV_SOURCE_PROVIDER))
+        summary.solved = int(np.count_nonzero(tags == IV_SOURCE_SOLVED))
+        summary.failed = summary.total - summary.provider - summary.solved
+        summary.elapsed_ms = (time.perf_counter() - start) * 1000
+
+        logger.info(
+            f"IV for {options_chain.symbol}: {summary.provider} provider, "
+            f"{summary.solved} solved, {summary.failed} unavailable "
+            f"({summary.elapsed_ms:.1f} ms)"
+        )
+        return summary
@@ -337,15 +337,8 @@ class LadderBuilder:
             option_type=option_type,
         ).theoretical_strike
 
-        # Get contracts for this expiration
-        if option_type == "call":
-            contracts = [
-                c for c in options_chain.get_calls() if c.expiration_date == expiration_date
-            ]
-        else:
-            contracts = [
-                c for c in options_chain.get_puts() if c.expiration_date == expiration_date
-            ]
+        # Get contracts for this expiration (indexed lookup, sorted by strike)
+        contracts = options_chain.get_contracts(option_type, expiration_date)
 
         if not contracts:
             return None
@@ -22,11 +22,18 @@ Assignment Probability (Black-Scholes):
     where:
         d2 = [ln(S/K) + (r - sigma^2/2)T] / (sigma sqrt(T))
         N() = Standard normal CDF
+
+Whole chains are scored with calculate_assignment_probabilities, which
+evaluates the same formulas over arrays of strikes, DTEs, volatilities and
+option types in one vectorized call.
 """
 
 import logging
 import math
-from typing import Optional
+from collections.abc import Sequence
+from typing import Optional, Union
+
+import numpy as np
 
 from src.constants import (
     DEFAULT_RISK_FREE_RATE,
@@ -37,6 +44,7 @@ from src.constants import (
 from src.models import (
     PROFILE_SIGMA_RANGES,
     OptionsChain,
+    ProbabilityArrays,
     ProbabilityResult,
     ProfileStrikesResult,
     StrikeProfile,
@@ -51,14 +59,76 @@ logger = logging.getLogger(__name__)
 # Re-export models for backward compatibility
 __all__ = [
     "StrikeOptimizer",
+    "norm_cdf",
     "StrikeProfile",
     "PROFILE_SIGMA_RANGES",
     "StrikeResult",
     "ProbabilityResult",
+    "ProbabilityArrays",
     "StrikeRecommendation",
     "ProfileStrikesResult",
 ]
 
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+# Rational approximations for erf/erfc (Cephes ndtr.c), accurate to double precision
+_ERF_T = [
+    9.60497373987051638749e0, 9.00260197203842689217e1, 2.23200534594684319226e3,
+    7.00332514112805075473e3, 5.55923013010394962768e4,
+]
+_ERF_U = [
+    1.0, 3.35617141647503099647e1, 5.21357949780152679795e2, 4.59432382970980127987e3,
+    2.26290000613890934246e4, 4.92673942608635921086e4,
+]
+_ERFC_P = [
+    2.46196981473530512524e-10, 5.64189564831068821977e-1, 7.46321056442269912687e0,
+    4.86371970985681366614e1, 1.96520832956077098242e2, 5.26445194995477358631e2,
+    9.34528527171957607540e2, 1.02755188689515710272e3, 5.57535335369399327526e2,
+]
+_ERFC_Q = [
+    1.0, 1.32281951154744992508e1, 8.67072140885989742329e1, 3.54937778887819891062e2,
+    9.75708501743205489753e2, 1.82390916687909736289e3, 2.24633760818710981792e3,
+    1.65666309194161350182e3, 5.57535340817727675546e2,
+]
+_ERFC_R = [
+    5.64189583547755073984e-1, 1.27536670759978104416e0, 5.01905042251180477414e0,
+    6.16021097993053585195e0, 7.40974269950448939160e0, 2.97886665372100240670e0,
+]
+_ERFC_S = [
+    1.0, 2.26052863220117276590e0, 9.39603524938001434673e0, 1.20489539808096656605e1,
+    1.70814450747565897222e1, 9.60896809063285878198e0, 3.36907645100081516050e0,
+]
+
+
+def _erf(x: np.ndarray) -> np.ndarray:
+    """Vectorized error function, matching math.erf to within 1 ulp."""
+    a = np.abs(x)
+    z = x * x
+    with np.errstate(over="ignore", invalid="ignore"):
+        small = x * np.polyval(_ERF_T, z) / np.polyval(_ERF_U, z)
+        erfc = np.exp(-z) * np.where(
+            a < 8,
+            np.polyval(_ERFC_P, a) / np.polyval(_ERFC_Q, a),
+            np.polyval(_ERFC_R, a) / np.polyval(_ERFC_S, a),
+        )
+    return np.where(a < 1, small, np.sign(x) * (1 - erfc))
+
+
+def norm_cdf(x: ArrayLike) -> np.ndarray:
+    """
+    Vectorized standard normal cumulative distribution function.
+
+    Same formula as StrikeOptimizer._norm_cdf: N(x) = 0.5 * (1 + erf(x / sqrt(2))).
+
+    Args:
+        x: Value or array of values to evaluate
+
+    Returns:
+        Array of probabilities that a standard normal RV is <= x
+    """
+    x = np.asarray(x, dtype=np.float64)
+    return 0.5 * (1 + _erf(x / math.sqrt(2)))
+
 
 class StrikeOptimizer:
     """
@@ -343,6 +413,79 @@ class StrikeOptimizer:
             option_type=option_type,
         )
 
+    def calculate_assignment_probabilities(
+        self,
+        strikes: ArrayLike,
+        current_price: ArrayLike,
+        volatility: ArrayLike,
+        days_to_expiry: ArrayLike,
+        option_type: Union[str, Sequence[str]] = "call",
+    ) -> ProbabilityArrays:
+        """
+        Calculate P(ITM), Greeks and sigma distance for many contracts at once.
+
+        Vectorized counterpart of calculate_assignment_probability and
+        get_sigma_for_strike. Arguments broadcast against each other, so a
+        whole chain can be scored against one price and volatility.
+
+        Invalid entries (non-positive strike, price, volatility or DTE)
+        produce NaN instead of raising, so one bad contract does not fail
+        the whole chain.
+
+        Args:
+            strikes: Strike prices
+            current_price: Current stock price(s)
+            volatility: Annualized volatility(ies) as decimal
+            days_to_expiry: Days until expiration
+            option_type: "call", "put", or a sequence of them per contract
+
+        Returns:
+            ProbabilityArrays with one entry per contract
+
+        Raises:
+            ValueError: If an option type is not "call" or "put"
+        """
+        if isinstance(option_type, str):
+            types = np.array([option_type.lower()])
+        else:
+            types = np.char.lower(np.asarray(option_type, dtype=str))
+        unknown = set(types.tolist()) - {"call", "put"}
+        if unknown:
+            raise ValueError(f"Option type must be 'call' or 'put', got {sorted(unknown)[0]}")
+
+        strike, price, vol, days, is_call = np.broadcast_arrays(
+            np.asarray(strikes, dtype=np.float64),
+            np.asarray(current_price, dtype=np.float64),
+            np.asarray(volatility, dtype=np.float64),
+            np.asarray(days_to_expiry, dtype=np.float64),
+            types == "call",
+        )
+
+        valid = (strike > 0) & (price > 0) & (vol > 0) & (days > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            T = np.where(valid, days / 365.0, np.nan)
+            vol_sqrt_t = vol * np.sqrt(T)
+            log_moneyness = np.log(np.where(valid, price / strike, np.nan))
+
+            d1 = (log_moneyness + (self.risk_free_rate + 0.5 * vol**2) * T) / vol_sqrt_t
+            d2 = d1 - vol_sqrt_t
+            n_d1 = norm_cdf(d1)
+
+            probability = np.where(is_call, norm_cdf(d2), norm_cdf(-d2))
+            delta = np.where(is_call, n_d1, n_d1 - 1)
+            sigma_distance = np.where(is_call, -log_moneyness, log_moneyness) / vol_sqrt_t
+
+        return ProbabilityArrays(
+            probability=probability,
+            d1=d1,
+            d2=d2,
+            delta=delta,
+            sigma_distance=sigma_distance,
+            time_to_expiry=T,
+            is_call=is_call,
+            risk_free_rate=self.risk_free_rate,
+        )
+
     @staticmethod
     def _norm_cdf(x: float) -> float:
         """
@@ -485,25 +628,29 @@ class StrikeOptimizer:
         # Calculate days to expiry (calendar days, not trading days)
         days_to_expiry = calculate_days_to_expiry(expiration_date)
 
-        recommendations = []
+        # Skip ITM options
+        if option_type == "call":
+            contracts = [c for c in contracts if c.strike > current_price]
+        else:
+            contracts = [c for c in contracts if c.strike < current_price]
 
-        for contract in contracts:
-            # Skip ITM options
-            if option_type == "call" and contract.strike <= current_price:
-                continue
-            if option_type == "put" and contract.strike >= current_price:
-                continue
+        # Sigma distance and P(ITM) for every strike in one vectorized call
+        probabilities = self.calculate_assignment_probabilities(
+            strikes=[c.strike for c in contracts],
+            current_price=current_price,
+            volatility=volatility,
+            days_to_expiry=days_to_expiry,
+            option_type=option_type,
+        )
 
-            # Calculate sigma distance
-            try:
-                sigma_distance = self.get_sigma_for_strike(
-                    strike=contract.strike,
-                    current_price=current_price,
-                    volatility=volatility,
-                    days_to_expiry=days_to_expiry,
-                    option_type=option_type,
-                )
-            except (ValueError, ZeroDivisionError):
+        recommendations = []
+
+        for contract, sigma_distance, assignment_prob in zip(
+            contracts,
+            probabilities.sigma_distance.tolist(),
+            probabilities.probability.tolist(),
+        ):
+            if math.isnan(sigma_distance):
                 continue
 
             # Filter by profile if specified
@@ -511,19 +658,6 @@ class StrikeOptimizer:
             if profile and contract_profile != profile:
                 continue
 
-            # Calculate assignment probability
-            try:
-                prob_result = self.calculate_assignment_probability(
-                    strike=contract.strike,
-                    current_price=current_price,
-                    volatility=volatility,
-                    days_to_expiry=days_to_expiry,
-                    option_type=option_type,
-                )
-                assignment_prob = prob_result.probability
-            except (ValueError, ZeroDivisionError):
-                assignment_prob = 0.0
-
             # Calculate mid price and spread
             bid = contract.bid
             ask = contract.ask
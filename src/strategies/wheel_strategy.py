@@ -47,6 +47,8 @@ from src.models import (
     WheelRecommendation,
     WheelState,
 )
+from src.strategies.covered_call import CoveredCallAnalyzer
+from src.strategies.covered_put import CoveredPutAnalyzer
 from src.strategies.strike_optimizer import StrikeOptimizer, StrikeProfile
 from src.utils import calculate_days_to_expiry
 from src.warnings import add_liquidity_warnings, check_early_assignment_risk, check_earnings_warning
@@ -12,11 +12,14 @@ from typing import Optional
 
 import click
 
+from src.api.cache import persistent_cache
+from src.api.circuit_breaker import shared_circuit_breakers
+from src.api.rate_limiter import shared_rate_limiter
 from src.config import FinnhubConfig
 from src.finnhub_client import FinnhubClient
 from src.oauth.config import SchwabOAuthConfig
 from src.oauth.coordinator import OAuthCoordinator
-from src.price_fetcher import SchwabPriceDataFetcher
+from src.price_fetcher import PriceDataCache, SchwabPriceDataFetcher
 from src.schwab.client import SchwabClient
 
 from ..api_client import APIConnectionError, WheelStrategyAPIClient
@@ -25,6 +28,7 @@ from ..manager import WheelManager
 
 # Import command groups
 from .analysis_commands import history, performance, recommend, refresh, update
+from .cache_commands import cache
 from .position_commands import import_shares, init, list_wheels, status
 from .trade_commands import archive, close, expire, record
 from .portfolio_commands import portfolio
@@ -71,6 +75,12 @@ class CLIContext:
     default=None,
     help="Force API mode or direct database mode",
 )
+@click.option(
+    "--persistent-cache/--no-persistent-cache",
+    "persistent_cache_enabled",
+    default=None,
+    help="Keep API responses in an on-disk cache shared across runs",
+)
 @click.option(
     "--config-file",
     type=click.Path(exists=True),
@@ -84,6 +94,7 @@ def cli(
     output_json: bool,
     api_url: Optional[str],
     api_mode: Optional[bool],
+    persistent_cache_enabled: Optional[bool],
     config_file: Optional[str],
 ) -> None:
     """
@@ -116,6 +127,12 @@ def cli(
         config.json_output = True
     if api_mode is not None:
         config.use_api_mode = api_mode
+    if persistent_cache_enabled is not None:
+        config.persistent_cache = persistent_cache_enabled
+
+    # Cache maintenance needs neither API credentials nor the database
+    if ctx.invoked_subcommand == "cache":
+        return
 
     # Load API configurations for direct mode
     finnhub_client = None
@@ -135,10 +152,19 @@ def cli(
                 click.echo("+ Schwab credentials loaded from environment")
 
         oauth = OAuthCoordinator(config=oauth_config)
-        schwab_client = SchwabClient(oauth_coordinator=oauth)
-        price_fetcher = SchwabPriceDataFetcher(schwab_client, enable_cache=True)
+        schwab_client = SchwabClient(
+            oauth_coordinator=oauth,
+            rate_limiter=shared_rate_limiter(),
+            circuit_breakers=shared_circuit_breakers(),
+            cache=persistent_cache() if config.persistent_cache else None,
+        )
+        price_fetcher = SchwabPriceDataFetcher(
+            schwab_client, cache=PriceDataCache(cache=schwab_client.cache), enable_cache=True
+        )
         if config.verbose:
             click.echo("+ Schwab client configured for price and options data")
+            if config.persistent_cache:
+                click.echo(f"+ Persistent cache at {schwab_client.cache.backend.path}")
     except Exception as e:
         click.echo(f"Error: Schwab client initialization failed: {e}", err=True)
         click.echo("Please run: python scripts/authorize_schwab_host.py", err=True)
@@ -147,7 +173,11 @@ def cli(
     # Initialize Finnhub client for earnings calendar (optional)
     try:
         finnhub_config = FinnhubConfig.from_file()
-        finnhub_client = FinnhubClient(finnhub_config)
+        finnhub_client = FinnhubClient(
+            finnhub_config,
+            rate_limiter=shared_rate_limiter(),
+            circuit_breakers=shared_circuit_breakers(),
+        )
         if config.verbose:
             click.echo("+ Finnhub client configured (earnings calendar)")
     except (FileNotFoundError, ValueError) as e:
@@ -161,6 +191,7 @@ def cli(
         finnhub_client=finnhub_client,
         price_fetcher=price_fetcher,
         schwab_client=schwab_client,
+        cache=schwab_client.cache,
     )
 
     # Initialize API client if API mode is enabled
@@ -229,6 +260,9 @@ cli.add_command(refresh)
 # Register portfolio commands
 cli.add_command(portfolio)
 
+# Register cache commands
+cli.add_command(cache)
+
 
 def main() -> None:
     """Main entry point for the CLI."""
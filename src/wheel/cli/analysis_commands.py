@@ -27,13 +27,19 @@ from .utils import (
 @click.argument("symbol", required=False)
 @click.option("--all", "all_symbols", is_flag=True, help="All active wheels")
 @click.option("--max-dte", type=int, default=None, help="Max days to expiration (default: from config)")
+@click.option(
+    "--top", type=click.IntRange(min=1), default=1, help="Show the best N candidates (default: 1)"
+)
 @click.pass_context
-def recommend(ctx: click.Context, symbol: Optional[str], all_symbols: bool, max_dte: Optional[int]) -> None:
+def recommend(
+    ctx: click.Context, symbol: Optional[str], all_symbols: bool, max_dte: Optional[int], top: int
+) -> None:
     """
     Get recommendation for next option to sell.
 
     Example: wheel recommend AAPL
     Example: wheel recommend AAPL --max-dte 30
+    Example: wheel recommend AAPL --top 5
     """
     cli_ctx = get_cli_context(ctx)
     manager = get_manager(ctx)
@@ -51,6 +57,11 @@ def recommend(ctx: click.Context, symbol: Optional[str], all_symbols: bool, max_
                 click.echo("Note: --all flag not fully supported in API mode yet")
                 click.echo("Falling back to direct mode...")
                 _recommend_direct_mode(manager, symbol, all_symbols, verbose, effective_max_dte)
+            elif top > 1:
+                # The API returns a single recommendation
+                click.echo("Note: --top not supported in API mode yet")
+                click.echo("Falling back to direct mode...")
+                _recommend_direct_mode(manager, symbol, all_symbols, verbose, effective_max_dte, top)
             elif symbol:
                 # Get wheel by symbol
                 wheel = cli_ctx.api_client.get_wheel_by_symbol(symbol.upper())
@@ -95,17 +106,22 @@ def recommend(ctx: click.Context, symbol: Optional[str], all_symbols: bool, max_
             # Fall back to direct mode
             if cli_ctx.verbose:
                 click.echo(f"! API unavailable, using direct mode: {e}", err=True)
-            _recommend_direct_mode(manager, symbol, all_symbols, verbose, effective_max_dte)
+            _recommend_direct_mode(manager, symbol, all_symbols, verbose, effective_max_dte, top)
         except APIError as e:
             print_error(str(e))
             sys.exit(1)
     else:
         # Direct mode
-        _recommend_direct_mode(manager, symbol, all_symbols, verbose, effective_max_dte)
+        _recommend_direct_mode(manager, symbol, all_symbols, verbose, effective_max_dte, top)
 
 
 def _recommend_direct_mode(
-    manager, symbol: Optional[str], all_symbols: bool, verbose: bool, max_dte: int = 14
+    manager,
+    symbol: Optional[str],
+    all_symbols: bool,
+    verbose: bool,
+    max_dte: int = 14,
+    top: int = 1,
 ):
     """Handle recommendations in direct mode.
 
@@ -115,6 +131,7 @@ def _recommend_direct_mode(
         all_symbols: Get all recommendations
         verbose: Verbose output
         max_dte: Maximum days to expiration search window
+        top: Number of ranked candidates to show for a symbol
     """
     if all_symbols:
         recs = manager.get_all_recommendations(max_dte=max_dte)
@@ -125,8 +142,12 @@ def _recommend_direct_mode(
             print_recommendation(rec, verbose)
     elif symbol:
         try:
-            rec = manager.get_recommendation(symbol.upper(), max_dte=max_dte)
-            print_recommendation(rec, verbose)
+            if top > 1:
+                for rec in manager.get_recommendations(symbol.upper(), max_dte=max_dte, limit=top):
+                    print_recommendation(rec, verbose)
+            else:
+                rec = manager.get_recommendation(symbol.upper(), max_dte=max_dte)
+                print_recommendation(rec, verbose)
         except SymbolNotFoundError as e:
             print_error(str(e))
             sys.exit(1)
@@ -0,0 +1,100 @@
+"""
+Persistent cache commands for the wheel CLI.
+
+This module provides commands for inspecting and purging the on-disk API
+response cache used with --persistent-cache. They need no API credentials.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from src.api.cache import CACHE_DB_ENV, persistent_cache, persistent_cache_path
+
+from .utils import print_success
+
+
+def _format_size(size_bytes: int) -> str:
+    """Format a file size for display."""
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    if size_bytes < 1024 * 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    return f"{size_bytes / (1024 * 1024):.1f} MB"
+
+
+@click.command("status")
+@click.pass_context
+def cache_status(ctx: click.Context) -> None:
+    """
+    Show the persistent cache's size and entries.
+
+    Example: wheel cache status
+    """
+    path = ctx.obj["cache_path"]
+    if not path.exists():
+        click.echo(f"No persistent cache at {path}")
+        return
+
+    cache = persistent_cache(path)
+    counts = cache.entry_counts()
+
+    click.secho("=== Persistent Cache ===", bold=True)
+    click.echo(f"File:    {path}")
+    click.echo(f"Size:    {_format_size(cache.backend.size_bytes())}")
+    click.echo(f"Entries: {len(cache)} / {cache.backend.max_entries}")
+    for name in sorted(counts):
+        click.echo(f"  {name:<24}{counts[name]:>6}")
+
+
+@click.command("purge")
+@click.option("--expired", "expired_only", is_flag=True, help="Only drop expired entries")
+@click.option("--namespace", help="Only drop entries of this namespace (e.g. schwab_chain)")
+@click.pass_context
+def cache_purge(ctx: click.Context, expired_only: bool, namespace: Optional[str]) -> None:
+    """
+    Drop entries from the persistent cache.
+
+    Example: wheel cache purge --expired
+    """
+    path = ctx.obj["cache_path"]
+    if not path.exists():
+        click.echo(f"No persistent cache at {path}")
+        return
+
+    if expired_only and namespace:
+        raise click.UsageError("--expired and --namespace cannot be combined")
+
+    cache = persistent_cache(path)
+    if expired_only:
+        dropped = cache.purge_expired()
+        print_success(f"Dropped {dropped} expired entries")
+    else:
+        dropped = cache.clear(namespace)
+        scope = f" from {namespace}" if namespace else ""
+        print_success(f"Dropped {dropped} entries{scope}")
+
+
+# Create cache command group
+@click.group("cache")
+@click.option(
+    "--path",
+    type=click.Path(dir_okay=False),
+    help="Cache file (default: ~/.wheel_strategy/cache.db)",
+    envvar=CACHE_DB_ENV,
+)
+@click.pass_context
+def cache(ctx: click.Context, path: Optional[str]) -> None:
+    """
+    Inspect or purge the persistent API response cache.
+
+    Enable the cache with --persistent-cache or WHEEL_PERSISTENT_CACHE.
+    """
+    ctx.ensure_object(dict)
+    ctx.obj["cache_path"] = persistent_cache_path() if path is None else Path(path).expanduser()
+
+
+# Register subcommands
+cache.add_command(cache_status)
+cache.add_command(cache_purge)
@@ -36,6 +36,7 @@ class WheelStrategyConfig:
         max_dte: Maximum days to expiration for recommendation search window
         verbose: Enable verbose logging
         json_output: Output in JSON format
+        persistent_cache: Keep API responses in an on-disk cache shared across runs
     """
 
     def __init__(
@@ -48,6 +49,7 @@ class WheelStrategyConfig:
         max_dte: int = 14,
         verbose: bool = False,
         json_output: bool = False,
+        persistent_cache: bool = False,
     ):
         """Initialize configuration.
 
@@ -60,6 +62,7 @@ class WheelStrategyConfig:
             max_dte: Maximum days to expiration for recommendation search window
             verbose: Enable verbose logging
             json_output: Output in JSON format
+            persistent_cache: Keep API responses in an on-disk cache shared across runs
 
         Example:
             >>> config = WheelStrategyConfig(
@@ -75,6 +78,7 @@ class WheelStrategyConfig:
         self.max_dte = max_dte
         self.verbose = verbose
         self.json_output = json_output
+        self.persistent_cache = persistent_cache
 
         self._validate()
 
@@ -227,6 +231,9 @@ class WheelStrategyConfig:
         json_output = os.getenv("WHEEL_JSON_OUTPUT") is not None or cli_config.get(
             "json_output", False
         )
+        persistent_cache = os.getenv("WHEEL_PERSISTENT_CACHE") is not None or cli_config.get(
+            "persistent_cache", False
+        )
 
         try:
             return cls(
@@ -238,6 +245,7 @@ class WheelStrategyConfig:
                 max_dte=max_dte,
                 verbose=verbose,
                 json_output=json_output,
+                persistent_cache=persistent_cache,
             )
         except Exception as e:
             raise ConfigurationError(f"Invalid configuration: {e}") from e
@@ -275,6 +283,7 @@ class WheelStrategyConfig:
             "cli": {
                 "verbose": self.verbose,
                 "json_output": self.json_output,
+                "persistent_cache": self.persistent_cache,
             },
         }
 
@@ -309,6 +318,7 @@ class WheelStrategyConfig:
             "cli": {
                 "verbose": self.verbose,
                 "json_output": self.json_output,
+                "persistent_cache": self.persistent_cache,
             },
         }
 
@@ -331,7 +341,8 @@ class WheelStrategyConfig:
             f"default_profile={self.default_profile!r}, "
             f"max_dte={self.max_dte}, "
             f"verbose={self.verbose}, "
-            f"json_output={self.json_output}"
+            f"json_output={self.json_output}, "
+            f"persistent_cache={self.persistent_cache}"
             ")"
         )
 
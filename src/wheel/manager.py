@@ -11,6 +11,8 @@ import sqlite3
 from datetime import datetime
 from typing import Optional
 
+from src.api.cache import Cache
+from src.constants import RECOMMENDATION_TOP_K
 from src.finnhub_client import FinnhubClient
 from src.models.profiles import StrikeProfile
 from src.price_fetcher import SchwabPriceDataFetcher
@@ -64,6 +66,7 @@ class WheelManager:
         finnhub_client: Optional[FinnhubClient] = None,
         price_fetcher: Optional[PriceFetcher] = None,
         schwab_client: Optional[SchwabClient] = None,
+        cache: Optional[Cache] = None,
     ):
         """
         Initialize the wheel manager.
@@ -73,9 +76,12 @@ class WheelManager:
             finnhub_client: Optional FinnhubClient for live data (earnings calendar)
             price_fetcher: Optional price data fetcher (AlphaVantage or Schwab)
             schwab_client: Optional SchwabClient for market data
+            cache: Optional shared Cache for earnings dates
         """
         self.repository = WheelRepository(db_path)
-        self.recommend_engine = RecommendEngine(finnhub_client, price_fetcher, schwab_client)
+        self.recommend_engine = RecommendEngine(
+            finnhub_client, price_fetcher, schwab_client, cache=cache
+        )
         self.performance_tracker = PerformanceTracker(self.repository)
         self.monitor = PositionMonitor(schwab_client, price_fetcher)
         self.schwab = schwab_client
@@ -309,6 +315,32 @@ class WheelManager:
 
         return self.recommend_engine.get_recommendation(wheel, max_dte=max_dte)
 
+    def get_recommendations(
+        self, symbol: str, max_dte: int = 14, limit: int = RECOMMENDATION_TOP_K
+    ) -> list[WheelRecommendation]:
+        """
+        Get the best few ranked recommendations based on current state.
+
+        Args:
+            symbol: Stock ticker symbol
+            max_dte: Maximum days to expiration for search window
+            limit: Maximum number of recommendations
+
+        Returns:
+            List of WheelRecommendation, best first
+
+        Raises:
+            SymbolNotFoundError: If wheel doesn't exist
+            InvalidStateError: If wheel has open position
+        """
+        symbol = symbol.upper()
+        wheel = self.repository.get_wheel(symbol)
+
+        if not wheel:
+            raise SymbolNotFoundError(f"No wheel found for {symbol}")
+
+        return self.recommend_engine.get_recommendations(wheel, max_dte=max_dte, top_k=limit)
+
     def get_all_recommendations(self, max_dte: int = 14) -> list[WheelRecommendation]:
         """
         Get recommendations for all active wheels without open positions.
@@ -320,19 +352,25 @@ class WheelManager:
             List of WheelRecommendation for each eligible wheel
         """
         recommendations = []
-        wheels = self.repository.list_wheels(active_only=True)
+        wheels = [
+            w for w in self.repository.list_wheels(active_only=True) if not w.has_open_position
+        ]
+
+        # Fetch every chain concurrently; missing chains are fetched per wheel
+        chains = self.recommend_engine.prefetch_options_chains(
+            [w.symbol for w in wheels], max_dte=max_dte
+        )
 
         for wheel in wheels:
-            if not wheel.has_open_position:
-                try:
-                    rec = self.recommend_engine.get_recommendation(
-                        wheel, max_dte=max_dte
-                    )
-                    recommendations.append(rec)
-                except Exception as e:
-                    logger.warning(
-                        f"Could not get recommendation for {wheel.symbol}: {e}"
-                    )
+            try:
+                rec = self.recommend_engine.get_recommendation(
+                    wheel, options_chain=chains.get(wheel.symbol), max_dte=max_dte
+                )
+                recommendations.append(rec)
+            except Exception as e:
+                logger.warning(
+                    f"Could not get recommendation for {wheel.symbol}: {e}"
+                )
 
         return recommendations
 
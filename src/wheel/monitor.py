@@ -148,7 +148,8 @@ class PositionMonitor:
         """
         Get status for all open positions.
 
-        Efficiently batches API calls and respects caching.
+        Quotes are fetched with one batched request (see prefetch_quotes)
+        and respect caching.
 
         Args:
             positions: List of wheel positions
@@ -160,6 +161,12 @@ class PositionMonitor:
         """
         results = []
 
+        # One batched quote request instead of one per position
+        refreshed = self.prefetch_quotes(
+            [p.symbol for p in positions if p.has_monitorable_position],
+            force_refresh=force_refresh,
+        )
+
         for position in positions:
             if not position.has_monitorable_position:
                 continue
@@ -173,7 +180,9 @@ class PositionMonitor:
                 continue
 
             try:
-                status = self.get_position_status(position, trade, force_refresh)
+                status = self.get_position_status(
+                    position, trade, force_refresh and position.symbol not in refreshed
+                )
                 results.append((position, trade, status))
             except Exception as e:
                 # Log error but continue with other positions
@@ -213,8 +222,84 @@ class PositionMonitor:
             risk_level=status.risk_level,
         )
 
+    def prefetch_quotes(
+        self, symbols: list[str], force_refresh: bool = False
+    ) -> set[str]:
+        """
+        Fill the quote cache for many symbols with batched Schwab requests.
+
+        Symbols already cached are skipped unless force_refresh=True.
+        Symbols the batch could not price are left to the per-symbol
+        fetch (and its fallback) in _fetch_quote_data.
+
+        Args:
+            symbols: Stock tickers
+            force_refresh: Refetch symbols that are already cached
+
+        Returns:
+            Symbols whose cached quote was refreshed
+        """
+        if not self.schwab_client:
+            return set()
+
+        now = datetime.now()
+        pending = [
+            symbol
+            for symbol in dict.fromkeys(symbols)
+            if force_refresh
+            or symbol not in self._cache
+            or (now - self._cache[symbol][1]).total_seconds()
+            >= CACHE_TTL_POSITION_STATUS_SECONDS
+        ]
+        if not pending:
+            return set()
+
+        try:
+            batch = self.schwab_client.get_quotes(pending, use_cache=not force_refresh)
+        except Exception as e:
+            logger.warning(f"Failed to fetch batched quotes from Schwab: {e}")
+            return set()
+
+        refreshed = set()
+        for symbol, quote in batch.quotes.items():
+            quote_data = self._quote_data_from_schwab(quote)
+            if quote_data is not None:
+                self._cache[symbol] = (quote_data, now)
+                refreshed.add(symbol)
+
+        logger.debug(
+            f"Prefetched {len(refreshed)}/{len(pending)} quotes"
+            + (f", unavailable: {batch.failed_symbols}" if batch.failed_symbols else "")
+        )
+        return refreshed
+
     # Private helper methods
 
+    def _quote_data_from_schwab(
+        self, quote: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build monitor quote data from a Schwab quote.
+
+        Args:
+            quote: Quote in SchwabClient.get_quote format
+
+        Returns:
+            Dict with lastPrice and OHLC keys, or None if no usable price
+        """
+        last_price = (
+            quote.get("lastPrice") or quote.get("closePrice") or quote.get("bidPrice")
+        )
+        if not last_price:
+            return None
+        return {
+            "lastPrice": last_price,
+            "openPrice": quote.get("openPrice"),
+            "highPrice": quote.get("highPrice"),
+            "lowPrice": quote.get("lowPrice"),
+            "closePrice": quote.get("closePrice"),
+        }
+
     def _fetch_quote_data(
         self, symbol: str, force_refresh: bool = False
     ) -> Dict[str, Any]:
@@ -252,21 +337,11 @@ class PositionMonitor:
             try:
                 quote = self.schwab_client.get_quote(symbol)
                 # Build quote data from Schwab response
-                last_price = (
-                    quote.get("lastPrice")
-                    or quote.get("closePrice")
-                    or quote.get("bidPrice")
-                )
-                if last_price:
-                    quote_data = {
-                        "lastPrice": last_price,
-                        "openPrice": quote.get("openPrice"),
-                        "highPrice": quote.get("highPrice"),
-                        "lowPrice": quote.get("lowPrice"),
-                        "closePrice": quote.get("closePrice"),
-                    }
+                quote_data = self._quote_data_from_schwab(quote)
+                if quote_data is not None:
                     logger.debug(
-                        f"Fetched quote from Schwab for {symbol}: ${last_price:.2f}"
+                        f"Fetched quote from Schwab for {symbol}: "
+                        f"${quote_data['lastPrice']:.2f}"
                     )
             except Exception as e:
                 logger.warning(f"Failed to fetch quote from Schwab for {symbol}: {e}")
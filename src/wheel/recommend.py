@@ -5,20 +5,36 @@ This module generates biased recommendations that favor premium collection
 over assignment by preferring further OTM strikes and shorter expirations.
 """
 
+import asyncio
+import hashlib
+import heapq
 import logging
-from datetime import datetime
-from typing import Optional
-
+import math
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from src.analysis.volatility_vectorized import VectorizedVolatilityCalculator
+from src.api.cache import Cache
+from src.constants import (
+    RECOMMENDATION_TOP_K,
+    SCAN_FINGERPRINT_PRICE_BUCKET_PCT,
+    SCAN_FINGERPRINT_VOL_BUCKET,
+)
 from src.covered_strategies import CoveredCallAnalyzer, CoveredPutAnalyzer
 from src.earnings_calendar import EarningsCalendar
 from src.finnhub_client import FinnhubClient
 from src.models import PROFILE_SIGMA_RANGES, OptionsChain, StrikeProfile
 from src.options_service import OptionsChainService
 from src.price_fetcher import SchwabPriceDataFetcher
+from src.schwab.async_client import AsyncSchwabClient
+from src.schwab.chain_query import OptionChainQuery
 from src.schwab.client import SchwabClient
+from src.strategies.iv_solver import ImpliedVolatilitySolver
 from src.strike_optimizer import StrikeOptimizer
 from src.utils import calculate_days_to_expiry
-from src.volatility import VolatilityCalculator
 
 # Type alias for price fetcher
 PriceFetcher = SchwabPriceDataFetcher
@@ -39,6 +55,101 @@ PITM_WARNING_THRESHOLDS: dict[StrikeProfile, float] = {
 }
 
 
+def _collection_bias_score(sigma_distance, dte, p_itm):
+    """
+    Collection bias score of one contract, or of arrays of contracts.
+
+    Higher sigma distance, lower DTE and lower P(ITM) score higher.
+    """
+    # Normalize factors to 0-1 scale
+    sigma_score = np.minimum(sigma_distance / 2.5, 1.0)  # Cap at 2.5 sigma
+    dte_score = 1.0 - np.minimum(dte / 45, 1.0)  # Prefer < 45 DTE
+    pitm_score = 1.0 - p_itm  # Lower P(ITM) = higher score
+
+    # Weighted combination favoring low assignment probability
+    return 0.4 * sigma_score + 0.3 * dte_score + 0.3 * pitm_score
+
+
+class ScanInputs(NamedTuple):
+    """Market data scan_opportunities needs for one symbol."""
+
+    current_price: float
+    volatility: float
+    options_chain: OptionsChain
+
+    def fingerprint(self, profiles: list, max_dte: int, top_k: Optional[int] = None) -> str:
+        """Digest of the inputs that decide a scan's result.
+
+        Combines the price and volatility, each rounded to a bucket, with
+        the bid/ask of the contracts the scan can recommend: OTM contracts
+        with a bid, expiring within max_dte, whose sigma distance falls in
+        one of the scanned profile bands. Quotes outside those bands do not
+        change the digest. Two scans with the same fingerprint on the same
+        day produce the same opportunities, up to moves smaller than a
+        bucket.
+
+        Args:
+            profiles: List of StrikeProfile enums scanned
+            max_dte: Maximum days to expiration scanned
+            top_k: Candidates kept per direction and profile (None = all)
+
+        Returns:
+            Hex digest
+        """
+        today = date.today()
+        bucket_width = math.log1p(SCAN_FINGERPRINT_PRICE_BUCKET_PCT / 100)
+        price_bucket = (
+            math.floor(math.log(self.current_price) / bucket_width) if self.current_price > 0 else 0
+        )
+        vol_bucket = math.floor(self.volatility / SCAN_FINGERPRINT_VOL_BUCKET)
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            f"{today.isoformat()}|{max_dte}|{top_k}|{','.join(p.value for p in profiles)}|"
+            f"{price_bucket}|{vol_bucket}".encode()
+        )
+        # The contracts _eligible_contracts keeps, cut to the profile bands;
+        # sigma distance does not depend on the risk-free rate
+        bands = [PROFILE_SIGMA_RANGES[p] for p in profiles]
+        optimizer = StrikeOptimizer()
+        quotes = []
+        for direction in ("put", "call"):
+            for chain_slice in self.options_chain.columns.slices(direction):
+                dte = calculate_days_to_expiry(chain_slice.expiration_date)
+                if not 0 < dte <= max_dte:
+                    continue
+                if direction == "call":
+                    otm = chain_slice.strike_range(low=np.nextafter(self.current_price, np.inf))
+                else:
+                    otm = chain_slice.strike_range(high=np.nextafter(self.current_price, -np.inf))
+                sigma = np.asarray(
+                    optimizer.calculate_assignment_probabilities(
+                        strikes=otm.strike,
+                        current_price=self.current_price,
+                        volatility=self.volatility,
+                        days_to_expiry=dte,
+                        option_type=direction,
+                    ).sigma_distance,
+                    dtype=float,
+                )
+                scanned = otm.bid > 0
+                with np.errstate(invalid="ignore"):
+                    scanned &= np.logical_or.reduce(
+                        [(sigma >= low) & (sigma <= high) for low, high in bands]
+                    )
+                quotes.extend(
+                    (direction, chain_slice.expiration_date, strike, bid, ask)
+                    for strike, bid, ask in zip(
+                        otm.strike[scanned].tolist(),
+                        otm.bid[scanned].tolist(),
+                        otm.ask[scanned].tolist(),
+                    )
+                )
+        for direction, expiration, strike, bid, ask in sorted(quotes):
+            digest.update(f"|{direction}{expiration}{strike:.2f}:{bid:.2f}/{ask:.2f}".encode())
+        return digest.hexdigest()
+
+
 class RecommendEngine:
     """
     Generates biased recommendations favoring premium collection.
@@ -56,6 +167,7 @@ class RecommendEngine:
         finnhub_client: Optional[FinnhubClient] = None,
         price_fetcher: Optional[PriceFetcher] = None,
         schwab_client: Optional[SchwabClient] = None,
+        cache: Optional[Cache] = None,
     ):
         """
         Initialize the recommendation engine.
@@ -64,25 +176,31 @@ class RecommendEngine:
             finnhub_client: Optional FinnhubClient for earnings calendar
             price_fetcher: Optional price data fetcher (AlphaVantage or Schwab)
             schwab_client: Optional SchwabClient for market data and options
+            cache: Optional shared Cache for earnings dates
         """
         self.finnhub = finnhub_client
         self.price_fetcher = price_fetcher
         self.schwab = schwab_client
+        self.cache = cache
 
         # Initialize core components
         self.strike_optimizer = StrikeOptimizer()
-        self.volatility_calculator = VolatilityCalculator()
+        self.volatility_calculator = VectorizedVolatilityCalculator()
         self.call_analyzer = CoveredCallAnalyzer(self.strike_optimizer)
         self.put_analyzer = CoveredPutAnalyzer(self.strike_optimizer)
+        self.iv_solver = ImpliedVolatilitySolver()
 
         # Earnings calendar (lazy initialized)
         self._earnings_calendar: Optional[EarningsCalendar] = None
 
+        # Finest strike increment seen per symbol, for narrowed chain requests
+        self._strike_spacing: dict[str, float] = {}
+
     @property
     def earnings_calendar(self) -> Optional[EarningsCalendar]:
         """Lazy-initialized earnings calendar."""
         if self._earnings_calendar is None and self.finnhub is not None:
-            self._earnings_calendar = EarningsCalendar(self.finnhub)
+            self._earnings_calendar = EarningsCalendar(self.finnhub, cache=self.cache)
         return self._earnings_calendar
 
     def get_recommendation(
@@ -114,6 +232,39 @@ class RecommendEngine:
             InvalidStateError: If position has open trade (cannot recommend)
             DataFetchError: If market data cannot be fetched
         """
+        return self.get_recommendations(
+            position, options_chain, current_price, volatility, expiration_date, max_dte, top_k=1
+        )[0]
+
+    def get_recommendations(
+        self,
+        position: WheelPosition,
+        options_chain: Optional[OptionsChain] = None,
+        current_price: Optional[float] = None,
+        volatility: Optional[float] = None,
+        expiration_date: Optional[str] = None,
+        max_dte: int = 14,
+        top_k: Optional[int] = RECOMMENDATION_TOP_K,
+    ) -> list[WheelRecommendation]:
+        """
+        Generate the best few biased recommendations for the next trade.
+
+        Args:
+            position: Current wheel position
+            options_chain: Optional pre-fetched options chain
+            current_price: Optional current stock price
+            volatility: Optional volatility override
+            expiration_date: Optional specific expiration to target
+            max_dte: Maximum days to expiration for search window
+            top_k: Maximum number of recommendations (None = every candidate)
+
+        Returns:
+            Non-empty list of WheelRecommendation, best first
+
+        Raises:
+            InvalidStateError: If position has open trade (cannot recommend)
+            DataFetchError: If market data cannot be fetched or nothing qualifies
+        """
         # Validate state
         if position.has_open_position:
             raise InvalidStateError(
@@ -133,15 +284,22 @@ class RecommendEngine:
             )
 
         # Fetch market data if not provided
-        if options_chain is None:
-            options_chain = self._fetch_options_chain(position.symbol)
-
         if current_price is None:
             current_price = self._fetch_current_price(position.symbol)
 
         if volatility is None:
             volatility = self._estimate_volatility(position.symbol, current_price)
 
+        # Only the slice of the chain this recommendation can use is fetched
+        if options_chain is None:
+            options_chain = self._fetch_options_chain(
+                position.symbol,
+                self._chain_query(
+                    position.symbol, current_price, volatility, [position.profile], max_dte,
+                    contract_type=direction.upper(), expiration_date=expiration_date,
+                ),
+            )
+
         # Log market data context for diagnostics
         logger.info(
             "Recommendation inputs for %s: price=%.2f, volatility=%.2f, "
@@ -160,6 +318,7 @@ class RecommendEngine:
             expiration_date=expiration_date,
             position=position,
             max_dte=max_dte,
+            top_k=top_k,
         )
 
         if not candidates:
@@ -177,27 +336,146 @@ class RecommendEngine:
         # Add warnings
         self._add_warnings(biased, position.symbol)
 
-        # Return best recommendation
-        return biased[0]
+        return biased
 
-    def _fetch_options_chain(self, symbol: str) -> OptionsChain:
-        """Fetch options chain from API."""
+    def _fetch_options_chain(
+        self, symbol: str, query: Optional[OptionChainQuery] = None
+    ) -> OptionsChain:
+        """
+        Fetch options chain from API.
+
+        Args:
+            symbol: Stock ticker symbol
+            query: Optional narrowed request (Schwab only; see _chain_query)
+        """
         # Prefer Schwab, fall back to Finnhub
         if self.schwab is not None:
             try:
                 # Schwab client has options chain built-in
-                return self.schwab.get_option_chain(symbol)
+                if query is not None:
+                    options_chain = self.schwab.get_option_chain(**query.request_kwargs())
+                else:
+                    options_chain = self.schwab.get_option_chain(symbol)
             except Exception as e:
                 raise DataFetchError(f"Failed to fetch options chain for {symbol}: {e}")
+            self._record_strike_spacing(symbol, options_chain)
+            # Schwab chains carry the underlying price, so bad IV is solved inline
+            if options_chain.underlying_price:
+                self.iv_solver.solve_chain(options_chain)
+            return options_chain
         elif self.finnhub is not None:
             try:
-                service = OptionsChainService(self.finnhub)
+                service = OptionsChainService(self.finnhub, iv_solver=self.iv_solver)
                 return service.get_options_chain(symbol)
             except Exception as e:
                 raise DataFetchError(f"Failed to fetch options chain for {symbol}: {e}")
         else:
             raise DataFetchError("No market data client configured (need Schwab or Finnhub)")
 
+    def prefetch_options_chains(
+        self, symbols: list[str], max_concurrency: int = 8, max_dte: Optional[int] = None
+    ) -> dict[str, OptionsChain]:
+        """
+        Fetch option chains for several symbols concurrently.
+
+        Uses AsyncSchwabClient over the engine's SchwabClient, so the chains
+        also land in its cache, with at most max_concurrency requests in
+        flight. Bad IV is solved as in _fetch_options_chain. Symbols that
+        fail are left out; callers fetch those one at a time and get the
+        usual DataFetchError.
+
+        With max_dte, only OTM contracts expiring within max_dte days are
+        requested; strike bounds need each symbol's price and are left open.
+
+        Args:
+            symbols: Stock ticker symbols
+            max_concurrency: Maximum number of requests in flight at once
+            max_dte: Optional maximum days to expiration to request
+
+        Returns:
+            Dictionary mapping symbol to OptionsChain for the symbols fetched
+        """
+        if not isinstance(self.schwab, SchwabClient) or len(symbols) < 2:
+            return {}
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Cannot block inside a running loop; fall back to sequential fetches
+            logger.debug("Event loop running, skipping concurrent chain prefetch")
+            return {}
+
+        request: dict = {}
+        if max_dte is not None:
+            to_date = (date.today() + timedelta(days=max_dte)).isoformat()
+            request = {"strike_range": "OTM", "to_date": to_date}
+
+        async def gather() -> dict:
+            async with AsyncSchwabClient(self.schwab, max_concurrency=max_concurrency) as client:
+                return await client.gather_chains(symbols, **request)
+
+        try:
+            results = asyncio.run(gather())
+        except Exception as e:
+            logger.warning(f"Concurrent options chain fetch failed: {e}")
+            return {}
+
+        chains: dict[str, OptionsChain] = {}
+        for symbol, result in results.items():
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to prefetch options chain for {symbol}: {result}")
+                continue
+            self._record_strike_spacing(symbol, result)
+            if result.underlying_price:
+                self.iv_solver.solve_chain(result)
+            chains[symbol] = result
+        return chains
+
+    def _chain_query(
+        self,
+        symbol: str,
+        current_price: float,
+        volatility: float,
+        profiles: list[StrikeProfile],
+        max_dte: int,
+        contract_type: Optional[str] = None,
+        expiration_date: Optional[str] = None,
+    ) -> OptionChainQuery:
+        """
+        Smallest chain request that still holds every candidate.
+
+        Covers the OTM strikes out to the widest sigma bound of the profiles
+        and the expirations _get_candidates considers. Strikes are bounded
+        only once the symbol's strike spacing is known from an earlier chain.
+        """
+        max_sigma = max(PROFILE_SIGMA_RANGES[profile][1] for profile in profiles)
+        if expiration_date:
+            max_dte = max(max_dte, calculate_days_to_expiry(expiration_date))
+        return OptionChainQuery.envelope(
+            symbol,
+            current_price=current_price,
+            volatility=volatility,
+            max_sigma=max_sigma,
+            max_dte=max_dte,
+            contract_type=contract_type,
+            expiration_date=expiration_date,
+            strike_spacing=self._strike_spacing.get(symbol),
+        )
+
+    def _record_strike_spacing(self, symbol: str, options_chain: OptionsChain) -> None:
+        """Remember the finest strike increment of a fetched chain."""
+        try:
+            strikes = np.asarray(options_chain.get_strikes(), dtype=np.float64)
+        except (AttributeError, TypeError, ValueError):
+            return
+        gaps = np.diff(strikes[~np.isnan(strikes)])
+        gaps = gaps[gaps > 0]
+        if len(gaps):
+            spacing = float(gaps.min())
+            known = self._strike_spacing.get(symbol)
+            self._strike_spacing[symbol] = spacing if known is None else min(known, spacing)
+
     def _fetch_current_price(self, symbol: str) -> float:
         """Fetch current stock price."""
         if self.price_fetcher is None:
@@ -221,198 +499,237 @@ class RecommendEngine:
         try:
             price_data = self.price_fetcher.fetch_price_data(symbol, lookback_days=30)
             if price_data:
-                result = self.volatility_calculator.calculate_from_price_data(
-                    price_data, method="close_to_close"
-                )
-                return result.volatility
+                return self.volatility_calculator.calculate_close_to_close(
+                    price_data.closes, dates=price_data.dates
+                ).volatility
         except Exception as e:
             logger.warning(f"Failed to calculate volatility for {symbol}: {e}")
 
         return 0.30  # Default to 30%
 
-    def _get_candidates(
+    def _eligible_contracts(
         self,
         options_chain: OptionsChain,
         current_price: float,
         volatility: float,
         direction: str,
-        profile: StrikeProfile,
         expiration_date: Optional[str],
-        position: WheelPosition,
-        max_dte: int = 14,
-    ) -> list[WheelRecommendation]:
+        max_dte: int,
+    ) -> "_EligibleContracts":
         """
-        Get candidate options within the profile's sigma range.
+        Compute every profile-independent quantity of a direction's contracts.
 
-        Biases toward the outer edge of the range (further OTM).
+        OTM contracts with a bid inside the expiration window get their DTE,
+        sigma distance, P(ITM) and annualized yield computed once, so any
+        number of profile bands can be cut from the result by range lookup.
         """
-        candidates: list[WheelRecommendation] = []
-
-        # Diagnostic counters
-        skipped_itm = 0
-        skipped_no_bid = 0
-        skipped_expired = 0
-        skipped_sigma_calc = 0
-        skipped_sigma_range = 0
-        skipped_no_capital = 0
+        eligible = _EligibleContracts()
 
-        # Get profile sigma range
-        min_sigma, max_sigma = PROFILE_SIGMA_RANGES[profile]
-
-        # Get contracts of the right type
-        if direction == "put":
-            all_contracts = options_chain.get_puts()
-        else:
-            all_contracts = options_chain.get_calls()
+        # Strike-sorted column slices per expiration; no contract objects are built
+        columns = options_chain.columns
+        slices = columns.slices(direction)
 
         logger.info(
             "Candidate search: %d total %s contracts in chain",
-            len(all_contracts), direction,
+            sum(len(s) for s in slices), direction,
         )
 
         # Filter by expiration if specified
         if expiration_date:
-            contracts = [c for c in all_contracts if c.expiration_date == expiration_date]
+            slices = [s for s in slices if s.expiration_date == expiration_date]
             logger.info(
                 "Filtering to expiration %s: %d contracts",
-                expiration_date, len(contracts),
+                expiration_date, sum(len(s) for s in slices),
             )
         else:
             # Get available expirations and filter by max_dte window
-            expirations = sorted({c.expiration_date for c in all_contracts})
+            expirations = [s.expiration_date for s in slices]
             if not expirations:
                 logger.info("No expirations found in %s chain", direction)
-                return []
+                return eligible
 
             # Filter to expirations within max_dte days
-            target_expirations = [
-                exp for exp in expirations
-                if 0 < calculate_days_to_expiry(exp) <= max_dte
+            slices = [
+                s for s in slices
+                if 0 < calculate_days_to_expiry(s.expiration_date) <= max_dte
             ]
+            target_expirations = [s.expiration_date for s in slices]
             if not target_expirations:
                 logger.info(
                     "No expirations within %d-day window (available: %s)",
                     max_dte, [str(e) for e in expirations[:5]],
                 )
-                return []
+                return eligible
 
-            contracts = [c for c in all_contracts if c.expiration_date in target_expirations]
             logger.info(
                 "Targeting expirations within %d days: %s (%d of %d available): %d contracts",
                 max_dte, [str(e) for e in target_expirations],
-                len(target_expirations), len(expirations), len(contracts),
+                len(target_expirations), len(expirations), sum(len(s) for s in slices),
             )
+        eligible.evaluated = sum(len(s) for s in slices)
+
+        # Cheap gates per expiration on the column views; DTE is computed once each
+        eligible_strikes = []
+        eligible_bids = []
+        eligible_asks = []
+        eligible_dtes = []
+        for chain_slice in slices:
+            # Strikes are sorted, so the OTM side is one binary search away
+            if direction == "call":
+                otm = chain_slice.strike_range(low=np.nextafter(current_price, np.inf))
+            else:
+                otm = chain_slice.strike_range(high=np.nextafter(current_price, -np.inf))
+            eligible.skipped_itm += len(chain_slice) - len(otm)
 
-        for contract in contracts:
-            # Skip ITM options
-            if direction == "call" and contract.strike <= current_price:
-                skipped_itm += 1
-                continue
-            if direction == "put" and contract.strike >= current_price:
-                skipped_itm += 1
-                continue
-
-            # Skip zero bid (no premium)
-            if contract.bid is None or contract.bid <= 0:
-                skipped_no_bid += 1
-                continue
+            # Skip zero bid (no premium); missing bids are NaN
+            has_bid = otm.bid > 0
+            eligible.skipped_no_bid += int(len(otm) - has_bid.sum())
 
-            # Calculate days to expiry
-            dte = calculate_days_to_expiry(contract.expiration_date)
+            dte = calculate_days_to_expiry(chain_slice.expiration_date)
             if dte <= 0:
-                skipped_expired += 1
+                eligible.skipped_expired += int(has_bid.sum())
                 continue
 
-            # Calculate sigma distance
-            try:
-                sigma_distance = self.strike_optimizer.get_sigma_for_strike(
-                    strike=contract.strike,
-                    current_price=current_price,
-                    volatility=volatility,
-                    days_to_expiry=max(1, dte),
-                    option_type=direction,
-                )
-            except (ValueError, ZeroDivisionError):
-                skipped_sigma_calc += 1
-                continue
+            eligible_strikes.append(otm.strike[has_bid])
+            eligible_bids.append(otm.bid[has_bid])
+            eligible_asks.append(otm.ask[has_bid])
+            eligible_dtes.append(np.full(int(has_bid.sum()), dte))
+            eligible.expirations.extend([chain_slice.expiration_date] * int(has_bid.sum()))
 
-            # Filter by profile range
-            if sigma_distance < min_sigma or sigma_distance > max_sigma:
-                logger.debug(
-                    "Strike %.2f (exp %s): sigma=%.2f outside range [%.1f, %.1f]",
-                    contract.strike, contract.expiration_date,
-                    sigma_distance, min_sigma, max_sigma,
-                )
-                skipped_sigma_range += 1
-                continue
+        strikes = np.concatenate(eligible_strikes or [np.empty(0)])
+        bids = np.concatenate(eligible_bids or [np.empty(0)])
+        asks = np.concatenate(eligible_asks or [np.empty(0)])
+        dtes = np.concatenate(eligible_dtes or [np.empty(0, dtype=np.int64)])
 
-            # Calculate probability
-            try:
-                prob_result = self.strike_optimizer.calculate_assignment_probability(
-                    strike=contract.strike,
-                    current_price=current_price,
-                    volatility=volatility,
-                    days_to_expiry=max(1, dte),
-                    option_type=direction,
-                )
-                p_itm = prob_result.probability
-            except (ValueError, ZeroDivisionError):
-                p_itm = 0.0
+        # Sigma distance and P(ITM) for every eligible contract in one vectorized call
+        probabilities = self.strike_optimizer.calculate_assignment_probabilities(
+            strikes=strikes,
+            current_price=current_price,
+            volatility=volatility,
+            days_to_expiry=np.maximum(dtes, 1),
+            option_type=direction,
+        )
+        sigma = np.asarray(probabilities.sigma_distance, dtype=float)
+
+        # Annualized yield of one contract (the same for any contract count)
+        collateral = (strikes if direction == "put" else np.full(len(strikes), current_price)) * 100
+        with np.errstate(divide="ignore", invalid="ignore"):
+            yields = np.where(
+                (collateral > 0) & (dtes > 0),
+                (bids * 100 / collateral) * (365 / np.maximum(dtes, 1)) * 100,
+                0.0,
+            )
+
+        eligible.strikes = strikes.tolist()
+        eligible.bids = bids.tolist()
+        eligible.asks = asks.tolist()
+        eligible.dtes = dtes.tolist()
+        eligible.sigma_distance = sigma.tolist()
+        eligible.p_itm = np.asarray(probabilities.probability, dtype=float).tolist()
+        eligible.annualized_yield = yields.tolist()
+        with np.errstate(invalid="ignore"):
+            eligible.bias_score = _collection_bias_score(
+                sigma, dtes, np.asarray(probabilities.probability, dtype=float)
+            ).tolist()
+
+        # Contracts by sigma distance, for band lookups; NaN sigma never matches
+        valid = np.flatnonzero(~np.isnan(sigma))
+        eligible.skipped_sigma_calc = len(sigma) - len(valid)
+        eligible.by_sigma = valid[np.argsort(sigma[valid], kind="stable")]
+        eligible.sorted_sigma = sigma[eligible.by_sigma]
+        return eligible
+
+    def _get_candidates(
+        self,
+        options_chain: OptionsChain,
+        current_price: float,
+        volatility: float,
+        direction: str,
+        profile: StrikeProfile,
+        expiration_date: Optional[str],
+        position: WheelPosition,
+        max_dte: int = 14,
+        eligible: Optional["_EligibleContracts"] = None,
+        top_k: Optional[int] = None,
+    ) -> list[WheelRecommendation]:
+        """
+        Get candidate options within the profile's sigma range.
+
+        Biases toward the outer edge of the range (further OTM).
 
+        Pass eligible (from _eligible_contracts() with the same chain,
+        price, volatility, direction, expiration and max_dte) to share one
+        pass over the chain between profiles.
+
+        With top_k, contracts are ranked by collection bias score on the
+        eligible columns and recommendations are built for the top_k best
+        only, so wide chains do not allocate one object per contract.
+        """
+        if eligible is None:
+            eligible = self._eligible_contracts(
+                options_chain, current_price, volatility, direction, expiration_date, max_dte
+            )
+
+        candidates: list[WheelRecommendation] = []
+        skipped_no_capital = 0
+
+        # Get profile sigma range
+        min_sigma, max_sigma = PROFILE_SIGMA_RANGES[profile]
+        in_band = eligible.band(min_sigma, max_sigma)
+        skipped_sigma_range = len(eligible.by_sigma) - len(in_band)
+
+        # (index, contracts available) per tradeable contract, in chain order
+        accepted: list[tuple[int, int]] = []
+        for i in in_band:
             # Calculate contracts available
             if direction == "put":
-                contracts_available = position.contracts_from_capital(contract.strike)
+                contracts_available = position.contracts_from_capital(eligible.strikes[i])
             else:
                 contracts_available = position.contracts_from_shares
 
             if contracts_available <= 0:
                 skipped_no_capital += 1
                 continue
+            accepted.append((i, contracts_available))
 
-            # Calculate premium
-            premium_per_share = contract.bid
-            total_premium = premium_per_share * contracts_available * 100
+        # Bounded heap; ties keep chain order, as in _apply_collection_bias
+        if top_k is not None and len(accepted) > top_k:
+            scores = eligible.bias_score
+            accepted = heapq.nlargest(top_k, accepted, key=lambda a: scores[a[0]])
 
-            # Calculate annualized yield
-            if direction == "put":
-                collateral = contract.strike * 100 * contracts_available
-            else:
-                collateral = current_price * 100 * contracts_available
-
-            if collateral > 0 and dte > 0:
-                annualized_yield = (total_premium / collateral) * (365 / dte) * 100
-            else:
-                annualized_yield = 0.0
+        for i, contracts_available in accepted:
+            strike = eligible.strikes[i]
+            bid = eligible.bids[i]
+            ask = eligible.asks[i]
 
             rec = WheelRecommendation(
                 symbol=position.symbol,
                 direction=direction,
-                strike=contract.strike,
-                expiration_date=contract.expiration_date,
-                premium_per_share=premium_per_share,
+                strike=strike,
+                expiration_date=eligible.expirations[i],
+                premium_per_share=bid,
                 contracts=contracts_available,
-                total_premium=total_premium,
-                sigma_distance=sigma_distance,
-                p_itm=p_itm,
-                annualized_yield_pct=annualized_yield,
-                dte=dte,
+                total_premium=bid * contracts_available * 100,
+                sigma_distance=eligible.sigma_distance[i],
+                p_itm=eligible.p_itm[i],
+                annualized_yield_pct=eligible.annualized_yield[i],
+                dte=eligible.dtes[i],
                 current_price=current_price,
-                bid=contract.bid,
-                ask=contract.ask if contract.ask else 0.0,
+                bid=bid,
+                ask=ask if ask > 0 else 0.0,
             )
             candidates.append(rec)
 
         # Log filtering summary
-        total_evaluated = len(contracts)
         logger.info(
             "Candidate filtering for %s %ss (price=%.2f, sigma range=%.1f-%.1f): "
-            "%d evaluated -> %d candidates | "
+            "%d evaluated -> %d candidates, %d kept | "
             "Rejected: %d ITM, %d no-bid, %d expired, %d sigma-calc-error, "
             "%d outside-sigma-range, %d insufficient-capital",
             position.symbol, direction, current_price, min_sigma, max_sigma,
-            total_evaluated, len(candidates),
-            skipped_itm, skipped_no_bid, skipped_expired,
-            skipped_sigma_calc, skipped_sigma_range, skipped_no_capital,
+            eligible.evaluated, len(in_band) - skipped_no_capital, len(candidates),
+            eligible.skipped_itm, eligible.skipped_no_bid, eligible.skipped_expired,
+            eligible.skipped_sigma_calc, skipped_sigma_range, skipped_no_capital,
         )
         if candidates:
             sigma_values = [c.sigma_distance for c in candidates]
@@ -440,13 +757,7 @@ class RecommendEngine:
         - Lower P(ITM) = better (less assignment/exercise risk)
         """
         for c in candidates:
-            # Normalize factors to 0-1 scale
-            sigma_score = min(c.sigma_distance / 2.5, 1.0)  # Cap at 2.5 sigma
-            dte_score = 1.0 - min(c.dte / 45, 1.0)  # Prefer < 45 DTE
-            pitm_score = 1.0 - c.p_itm  # Lower P(ITM) = higher score
-
-            # Weighted combination favoring low assignment probability
-            c.bias_score = 0.4 * sigma_score + 0.3 * dte_score + 0.3 * pitm_score
+            c.bias_score = float(_collection_bias_score(c.sigma_distance, c.dte, c.p_itm))
 
         return sorted(candidates, key=lambda c: c.bias_score, reverse=True)
 
@@ -495,34 +806,95 @@ class RecommendEngine:
                     f"Short DTE ({c.dte} days) - limited time for adjustment"
                 )
 
+    def fetch_scan_inputs(
+        self,
+        symbol: str,
+        profiles: list,
+        max_dte: int = 45,
+        volatility: Optional[float] = None,
+        options_chain: Optional[OptionsChain] = None,
+    ) -> ScanInputs:
+        """Fetch the price, volatility and chain scan_opportunities works on.
+
+        This is the I/O-bound half of a scan; callers that overlap fetching
+        with scoring run it separately and pass the result to
+        scan_opportunities.
+
+        Args:
+            symbol: Stock ticker symbol
+            profiles: List of StrikeProfile enums the chain must cover
+            max_dte: Maximum days to expiration for search window
+            volatility: Optional precomputed volatility
+            options_chain: Optional pre-fetched options chain
+
+        Returns:
+            ScanInputs for the symbol
+        """
+        current_price = self._fetch_current_price(symbol)
+        if volatility is None:
+            volatility = self._estimate_volatility(symbol, current_price)
+        if options_chain is None:
+            options_chain = self._fetch_options_chain(
+                symbol, self._chain_query(symbol, current_price, volatility, profiles, max_dte)
+            )
+        return ScanInputs(current_price, volatility, options_chain)
+
     def scan_opportunities(
         self,
         symbol: str,
         profiles: list,
         max_dte: int = 45,
+        volatility: Optional[float] = None,
+        options_chain: Optional[OptionsChain] = None,
+        current_price: Optional[float] = None,
+        top_k: Optional[int] = RECOMMENDATION_TOP_K,
     ) -> list[WheelRecommendation]:
         """Scan both puts and calls across given profiles for a symbol.
 
-        Fetches options chain + price ONCE, then loops over (direction, profile)
-        pairs using synthetic WheelPosition objects. Normalizes results to 1 contract.
+        Fetches options chain + price ONCE and computes DTE, sigma distance,
+        P(ITM) and yield for each direction's contracts once; each profile
+        then takes its sigma band of those contracts, using synthetic
+        WheelPosition objects. Normalizes results to 1 contract.
 
         Args:
             symbol: Stock ticker symbol
             profiles: List of StrikeProfile enums to scan
             max_dte: Maximum days to expiration for search window
+            volatility: Optional precomputed volatility
+            options_chain: Optional pre-fetched options chain (e.g. from prefetch_options_chains)
+            current_price: Optional current price; with volatility and
+                options_chain (e.g. from fetch_scan_inputs) nothing is fetched
+            top_k: Candidates kept per direction and profile (None = all)
 
         Returns:
             List of WheelRecommendation sorted by bias_score descending.
             Each recommendation is normalized to 1 contract.
         """
-        # Fetch market data once
-        options_chain = self._fetch_options_chain(symbol)
-        current_price = self._fetch_current_price(symbol)
-        volatility = self._estimate_volatility(symbol, current_price)
+        # Fetch market data once; the chain request covers every profile
+        if current_price is None:
+            current_price = self._fetch_current_price(symbol)
+        if volatility is None:
+            volatility = self._estimate_volatility(symbol, current_price)
+        if options_chain is None:
+            options_chain = self._fetch_options_chain(
+                symbol, self._chain_query(symbol, current_price, volatility, profiles, max_dte)
+            )
 
         all_candidates: list[WheelRecommendation] = []
 
         for direction in ["put", "call"]:
+            # One pass over the chain per direction; profiles only differ in sigma band
+            try:
+                eligible = self._eligible_contracts(
+                    options_chain, current_price, volatility, direction, None, max_dte
+                )
+            except Exception as e:
+                logger.warning(
+                    "scan_opportunities sweep failed for %s %s, scanning per profile: %s",
+                    symbol, direction, e,
+                )
+                eligible = None
+
             for profile in profiles:
                 # Create synthetic position
                 if direction == "put":
@@ -550,6 +922,8 @@ class RecommendEngine:
                         expiration_date=None,
                         position=synthetic,
                         max_dte=max_dte,
+                        eligible=eligible,
+                        top_k=top_k,
                     )
                 except Exception as e:
                     logger.warning(
@@ -591,6 +965,7 @@ class RecommendEngine:
         current_price: Optional[float] = None,
         volatility: Optional[float] = None,
         limit: int = 5,
+        max_dte: int = 14,
     ) -> list[WheelRecommendation]:
         """
         Get multiple ranked recommendations for a position.
@@ -601,48 +976,49 @@ class RecommendEngine:
             current_price: Optional current stock price
             volatility: Optional volatility override
             limit: Maximum number of recommendations
+            max_dte: Maximum days to expiration for search window
 
         Returns:
             List of WheelRecommendation sorted by bias score
+            (empty if the position cannot be recommended on)
         """
         try:
-            # Get one recommendation first to validate state
-            rec = self.get_recommendation(
-                position, options_chain, current_price, volatility
+            return self.get_recommendations(
+                position, options_chain, current_price, volatility, max_dte=max_dte, top_k=limit
             )
-            # The internal candidates are sorted, so we can return multiple
-            # by re-running the internal logic
         except (InvalidStateError, DataFetchError):
             return []
 
-        # Re-fetch to get all candidates
-        if options_chain is None and self.finnhub:
-            options_chain = self._fetch_options_chain(position.symbol)
 
-        if current_price is None and self.price_fetcher:
-            current_price = self._fetch_current_price(position.symbol)
-        elif current_price is None:
-            current_price = rec.current_price
-
-        if volatility is None:
-            volatility = self._estimate_volatility(position.symbol, current_price)
-
-        direction = "put" if position.state == WheelState.CASH else "call"
-
-        candidates = self._get_candidates(
-            options_chain=options_chain,
-            current_price=current_price,
-            volatility=volatility,
-            direction=direction,
-            profile=position.profile,
-            expiration_date=None,
-            position=position,
-        )
-
-        if not candidates:
-            return [rec]  # Return single recommendation if no more found
+@dataclass
+class _EligibleContracts:
+    """
+    One direction's OTM contracts with a bid, with profile-independent metrics.
 
-        biased = self._apply_collection_bias(candidates)
-        self._add_warnings(biased, position.symbol)
+    Per-contract lists are in chain order (expiration, then strike);
+    by_sigma holds the indices of contracts with a valid sigma distance,
+    ordered by it, so a profile's band is two binary searches away.
+    """
 
-        return biased[:limit]
+    strikes: list = field(default_factory=list)
+    bids: list = field(default_factory=list)
+    asks: list = field(default_factory=list)
+    dtes: list = field(default_factory=list)
+    expirations: list = field(default_factory=list)
+    sigma_distance: list = field(default_factory=list)
+    p_itm: list = field(default_factory=list)
+    annualized_yield: list = field(default_factory=list)
+    bias_score: list = field(default_factory=list)
+    by_sigma: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    sorted_sigma: np.ndarray = field(default_factory=lambda: np.empty(0))
+    evaluated: int = 0
+    skipped_itm: int = 0
+    skipped_no_bid: int = 0
+    skipped_expired: int = 0
+    skipped_sigma_calc: int = 0
+
+    def band(self, min_sigma: float, max_sigma: float) -> list[int]:
+        """Indices of contracts with min_sigma <= sigma <= max_sigma, in chain order."""
+        low = int(np.searchsorted(self.sorted_sigma, min_sigma, side="left"))
+        high = int(np.searchsorted(self.sorted_sigma, max_sigma, side="right"))
+        return np.sort(self.by_sigma[low:high]).tolist()
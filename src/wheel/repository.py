@@ -4,7 +4,7 @@ import logging
 import os
 import sqlite3
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import date, datetime
 from typing import Iterator, Optional
 
 from src.models.profiles import StrikeProfile
@@ -81,6 +81,15 @@ class TestSchwabOAuthConfig:
                 client_id="id", client_secret="secret", refresh_buffer_seconds=-1
             )
 
+    def test_config_validates_negative_background_refresh(self):
+        """Config validates background_refresh_seconds is non-negative."""
+        with pytest.raises(
+            ConfigurationError, match="background_refresh_seconds cannot be negative"
+        ):
+            SchwabOAuthConfig(
+                client_id="id", client_secret="secret", background_refresh_seconds=-1
+            )
+
     def test_callback_url_property(self):
         """callback_url property generates correct URL."""
         config = SchwabOAuthConfig(
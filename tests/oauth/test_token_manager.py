@@ -1,6 +1,9 @@
 """Tests for OAuth token manager module."""
 
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from unittest import mock
 
@@ -339,6 +342,30 @@ class TestTokenManager:
         assert token == "refreshed_token"
         mock_post.assert_called_once()
 
+    @mock.patch("requests.post")
+    def test_get_valid_access_token_refreshes_once_across_threads(
+        self, mock_post, config, temp_storage, expired_token_data
+    ):
+        """Threads sharing a manager refresh an expired token only once."""
+        temp_storage.save(expired_token_data)
+
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "access_token": "refreshed_token",
+            "refresh_token": "refreshed_refresh",
+            "token_type": "Bearer",
+            "expires_in": 1800,
+        }
+        mock_post.return_value = mock_response
+
+        manager = TokenManager(config, storage=temp_storage)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            tokens = list(pool.map(lambda _: manager.get_valid_access_token(), range(8)))
+
+        assert tokens == ["refreshed_token"] * 8
+        mock_post.assert_called_once()
+
     def test_get_valid_access_token_raises_if_no_tokens(self, config):
         """get_valid_access_token raises TokenNotAvailableError if no tokens."""
         manager = TokenManager(config)
@@ -415,3 +442,114 @@ class TestTokenManager:
         token2 = manager.get_valid_access_token()
 
         assert token1 == token2 == "valid_access_token"
+
+    def test_reloads_token_when_file_changes(
+        self, config, temp_storage, valid_token_data
+    ):
+        """Tokens saved by another process replace the cached token."""
+        temp_storage.save(valid_token_data)
+        manager = TokenManager(config, storage=temp_storage)
+        assert manager.get_valid_access_token() == "valid_access_token"
+
+        # Another process refreshes and rewrites the shared file
+        valid_token_data.access_token = "other_process_token"
+        TokenStorage(str(temp_storage.token_file)).save(valid_token_data)
+
+        assert manager.get_valid_access_token() == "other_process_token"
+
+    @mock.patch("requests.post")
+    def test_refresh_skipped_when_file_already_refreshed(
+        self, mock_post, config, temp_storage, expired_token_data, valid_token_data
+    ):
+        """A refresh made by another process is used instead of refreshing again."""
+        temp_storage.save(expired_token_data)
+        manager = TokenManager(config, storage=temp_storage)
+        manager._get_current_token()
+
+        TokenStorage(str(temp_storage.token_file)).save(valid_token_data)
+
+        assert manager.get_valid_access_token() == "valid_access_token"
+        mock_post.assert_not_called()
+
+    @mock.patch("requests.post")
+    def test_background_refresh_renews_ahead_of_expiry(
+        self, mock_post, config, temp_storage, valid_token_data
+    ):
+        """The background refresher renews tokens before the request path would."""
+        # 10 minutes left: outside the 5 minute buffer, inside a 15 minute lead
+        config.background_refresh_seconds = 900
+        valid_token_data.issued_at = (
+            datetime.now(timezone.utc) - timedelta(minutes=20)
+        ).isoformat()
+        temp_storage.save(valid_token_data)
+
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "access_token": "refreshed_token",
+            "refresh_token": "refreshed_refresh",
+            "token_type": "Bearer",
+            "expires_in": 3600,
+        }
+        mock_post.return_value = mock_response
+        refreshed = threading.Event()
+        mock_post.side_effect = lambda *a, **kw: (refreshed.set(), mock_response)[1]
+
+        manager = TokenManager(config, storage=temp_storage)
+        manager.start_background_refresh()
+        try:
+            assert refreshed.wait(5)
+        finally:
+            manager.stop_background_refresh(timeout=5)
+
+        mock_post.assert_called_once()
+        assert manager.get_valid_access_token() == "refreshed_token"
+        assert temp_storage.load().access_token == "refreshed_token"
+
+    @mock.patch("requests.post")
+    def test_background_lead_is_clamped_below_token_lifetime(
+        self, mock_post, config, temp_storage, valid_token_data
+    ):
+        """A lead longer than a token's lifetime does not renew a new token at once."""
+        config.background_refresh_seconds = 7200
+        temp_storage.save(valid_token_data)
+
+        manager = TokenManager(config, storage=temp_storage)
+        manager.start_background_refresh()
+        time.sleep(0.2)
+        manager.stop_background_refresh(timeout=5)
+
+        mock_post.assert_not_called()
+
+    def test_background_refresh_survives_unexpected_errors(self, config, temp_storage):
+        """Unexpected errors are logged and retried instead of ending the thread."""
+        manager = TokenManager(config, storage=temp_storage)
+        failed = threading.Event()
+
+        def fail():
+            failed.set()
+            raise RuntimeError("boom")
+
+        with mock.patch.object(manager, "_get_current_token", side_effect=fail):
+            manager.start_background_refresh()
+            try:
+                assert failed.wait(5)
+                time.sleep(0.1)
+                assert manager._refresher.is_alive()
+            finally:
+                manager.stop_background_refresh(timeout=5)
+
+    @mock.patch("requests.post")
+    def test_background_refresh_leaves_fresh_tokens(
+        self, mock_post, config, temp_storage, valid_token_data
+    ):
+        """Tokens outside the background lead are not refreshed."""
+        temp_storage.save(valid_token_data)
+
+        manager = TokenManager(config, storage=temp_storage)
+        manager.start_background_refresh()
+        manager.start_background_refresh()  # no-op while running
+        manager.stop_background_refresh(timeout=5)
+
+        mock_post.assert_not_called()
+        assert manager._refresher is None
@@ -372,3 +372,33 @@ class TestTokenStorage:
         assert loaded.expires_in == sample_token_data.expires_in
         assert loaded.scope == sample_token_data.scope
         assert loaded.issued_at == sample_token_data.issued_at
+
+    def test_save_replaces_file_atomically(self, temp_token_file, sample_token_data):
+        """save() leaves no temporary files behind and changes the signature."""
+        storage = TokenStorage(temp_token_file)
+        storage.save(sample_token_data)
+        first = storage.signature()
+
+        storage.save(sample_token_data)
+
+        assert storage.signature() != first
+        temp_prefix = f".{Path(temp_token_file).name}."
+        siblings = [p.name for p in Path(temp_token_file).parent.iterdir()]
+        assert not [name for name in siblings if name.startswith(temp_prefix)]
+
+    def test_signature_none_when_file_missing(self):
+        """signature() is None when there is no token file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            assert TokenStorage(f"{tmpdir}/tokens.json").signature() is None
+
+    def test_lock_is_reentrant(self, temp_token_file, sample_token_data):
+        """save() can run while the caller already holds the storage lock."""
+        storage = TokenStorage(temp_token_file)
+
+        with storage.lock():
+            with storage.lock():
+                storage.save(sample_token_data)
+
+        assert storage.load().access_token == sample_token_data.access_token
+        assert Path(temp_token_file + ".lock").exists()
+        Path(temp_token_file + ".lock").unlink()
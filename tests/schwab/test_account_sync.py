@@ -0,0 +1,169 @@
+"""Tests for bulk position sync across accounts."""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from src.schwab.account_sync import account_fingerprint, sync_accounts
+from src.schwab.async_client import AsyncSchwabClient
+from src.schwab.client import SchwabClient
+from src.schwab.exceptions import SchwabAPIError, SchwabAuthenticationError
+from src.schwab.parsers import parse_schwab_account
+
+
+def account_body(number: str, cash: float = 1000.0, positions=()) -> dict:
+    """Schwab account response with the given cash and (symbol, quantity, price) positions."""
+    return {
+        "securitiesAccount": {
+            "accountNumber": number,
+            "type": "MARGIN",
+            "currentBalances": {"cashBalance": cash, "totalCash": cash, "liquidationValue": 5000.0},
+            "positions": [
+                {
+                    "instrument": {"symbol": symbol, "assetType": "EQUITY"},
+                    "longQuantity": quantity,
+                    "averagePrice": price,
+                    "marketValue": quantity * price,
+                }
+                for symbol, quantity, price in positions
+            ],
+        }
+    }
+
+
+@pytest.fixture
+def bodies():
+    """Account number -> positions response served by the fake API."""
+    return {
+        "A1": account_body("A1", positions=[("AAPL", 100, 150.0), ("F", 200, 12.0)]),
+        "B2": account_body("B2", cash=500.0, positions=[("AAPL", 50, 160.0)]),
+    }
+
+
+@pytest.fixture
+def client(bodies):
+    """SchwabClient whose account list and position requests are faked."""
+    oauth = mock.Mock()
+    oauth.get_authorization_header.return_value = {"Authorization": "Bearer test_token"}
+    client = SchwabClient(oauth_coordinator=oauth, enable_cache=False)
+    client.get_accounts = mock.Mock(
+        side_effect=lambda: [parse_schwab_account(body) for body in bodies.values()]
+    )
+    return client
+
+
+@pytest.fixture
+def fetched(bodies):
+    """Patch async position requests; returns the list of fetched endpoints."""
+    calls = []
+
+    async def fake_get(self, endpoint, params=None):
+        calls.append(endpoint)
+        await asyncio.sleep(0)
+        number = endpoint.rsplit("/", 1)[-1]
+        if number not in bodies:
+            raise SchwabAPIError("boom")
+        return bodies[number]
+
+    with mock.patch.object(AsyncSchwabClient, "get", fake_get):
+        yield calls
+
+
+class TestSyncAccounts:
+    """Tests for sync_accounts()."""
+
+    def test_fetches_every_account(self, client, fetched):
+        sync = sync_accounts(client)
+
+        assert sorted(sync.refreshed) == ["A1", "B2"]
+        assert sync.skipped == [] and sync.errors == {}
+        assert len(fetched) == 2
+        assert [p.symbol for p in sync.accounts["A1"].positions] == ["AAPL", "F"]
+
+    def test_consolidated_holdings(self, client, fetched):
+        holdings = sync_accounts(client).holdings()
+
+        aapl = holdings["AAPL"]
+        assert aapl.quantity == 150
+        assert aapl.market_value == 100 * 150.0 + 50 * 160.0
+        assert aapl.average_price == pytest.approx((100 * 150.0 + 50 * 160.0) / 150)
+        assert aapl.accounts == ["A1", "B2"]
+        assert holdings["F"].accounts == ["A1"]
+
+    def test_unchanged_accounts_skipped(self, client, fetched, bodies):
+        first = sync_accounts(client)
+        bodies["B2"] = account_body("B2", cash=200.0, positions=[("AAPL", 60, 160.0)])
+
+        second = sync_accounts(client, previous=first)
+
+        assert second.skipped == ["A1"]
+        assert second.refreshed == ["B2"]
+        assert len(fetched) == 3
+        assert second.accounts["A1"] is first.accounts["A1"]
+        assert second.holdings()["AAPL"].quantity == 160
+
+    def test_stale_accounts_refetched(self, client, fetched):
+        first = sync_accounts(client)
+
+        second = sync_accounts(client, previous=first, max_age_seconds=0)
+
+        assert sorted(second.refreshed) == ["A1", "B2"]
+        assert len(fetched) == 4
+
+    def test_failed_account_keeps_previous_positions(self, client, fetched, bodies):
+        first = sync_accounts(client)
+        # B2 changed but its position request now fails
+        client.get_accounts.side_effect = lambda: [
+            parse_schwab_account(bodies["A1"]),
+            parse_schwab_account(account_body("B2", cash=100.0)),
+        ]
+        del bodies["B2"]
+
+        second = sync_accounts(client, previous=first)
+
+        assert set(second.errors) == {"B2"}
+        assert second.accounts["B2"] is first.accounts["B2"]
+        # Next sync retries the failed account even if its summary is unchanged
+        bodies["B2"] = account_body("B2", cash=100.0)
+        third = sync_accounts(client, previous=second)
+        assert third.refreshed == ["B2"]
+
+    def test_auth_failure_raises(self, client):
+        async def fail(self, endpoint, params=None):
+            raise SchwabAuthenticationError("expired")
+
+        with mock.patch.object(AsyncSchwabClient, "get", fail):
+            with pytest.raises(SchwabAuthenticationError):
+                sync_accounts(client)
+
+    def test_sequential_inside_event_loop(self, client, bodies):
+        client.get_account_positions = mock.Mock(
+            side_effect=lambda number: parse_schwab_account(bodies[number])
+        )
+
+        async def main():
+            return sync_accounts(client)
+
+        sync = asyncio.run(main())
+
+        assert sorted(sync.refreshed) == ["A1", "B2"]
+        assert client.get_account_positions.call_count == 2
+
+
+class TestAccountFingerprint:
+    """Tests for account_fingerprint()."""
+
+    def test_ignores_market_value(self):
+        body = account_body("A1")
+        moved = account_body("A1")
+        moved["securitiesAccount"]["currentBalances"]["liquidationValue"] = 9999.0
+
+        assert account_fingerprint(parse_schwab_account(body)) == account_fingerprint(
+            parse_schwab_account(moved)
+        )
+
+    def test_changes_with_cash(self):
+        assert account_fingerprint(parse_schwab_account(account_body("A1", 10.0))) != (
+            account_fingerprint(parse_schwab_account(account_body("A1", 20.0)))
+        )
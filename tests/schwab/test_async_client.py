@@ -0,0 +1,268 @@
+"""Tests for the asyncio Schwab client."""
+
+import asyncio
+import json
+import time
+from unittest import mock
+
+import httpx
+import pytest
+
+from src.api.circuit_breaker import CircuitBreakerRegistry, CircuitState
+from src.schwab.async_client import AsyncSchwabClient
+from src.schwab.client import SchwabClient
+from src.schwab.exceptions import (
+    SchwabAPIError,
+    SchwabAuthenticationError,
+    SchwabRateLimitError,
+)
+
+
+def chain_body(symbol: str) -> dict:
+    """Minimal Schwab option chain response with one put."""
+    return {
+        "symbol": symbol,
+        "underlyingPrice": 100.0,
+        "callExpDateMap": {},
+        "putExpDateMap": {
+            "2026-11-20:35": {
+                "95.0": [
+                    {
+                        "putCall": "PUT",
+                        "strikePrice": 95.0,
+                        "expirationDate": "2026-11-20T20:00:00.000+00:00",
+                        "bid": 1.0,
+                        "ask": 1.1,
+                        "volatility": 30.0,
+                    }
+                ]
+            }
+        },
+    }
+
+
+@pytest.fixture
+def schwab():
+    """SchwabClient with mocked OAuth and cache enabled."""
+    oauth = mock.Mock()
+    oauth.get_authorization_header.return_value = {"Authorization": "Bearer test_token"}
+    return SchwabClient(oauth_coordinator=oauth, retry_delay=0)
+
+
+def run(client: AsyncSchwabClient, coro_fn):
+    """Run a coroutine against a client and close it."""
+
+    async def main():
+        async with client:
+            return await coro_fn(client)
+
+    return asyncio.run(main())
+
+
+class TestAsyncSchwabClient:
+    """Tests for AsyncSchwabClient."""
+
+    def test_gather_chains_bounded_concurrency(self, schwab):
+        """Chains are fetched concurrently with at most max_concurrency in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return httpx.Response(200, json=chain_body(request.url.params["symbol"]))
+
+        symbols = [f"S{i}" for i in range(8)]
+        client = AsyncSchwabClient(
+            schwab, max_concurrency=4, transport=httpx.MockTransport(handler)
+        )
+
+        start = time.perf_counter()
+        chains = run(client, lambda c: c.gather_chains(symbols))
+        elapsed = time.perf_counter() - start
+
+        assert peak == 4
+        assert elapsed < 8 * 0.05
+        assert list(chains) == symbols
+        assert chains["S3"].symbol == "S3"
+        assert chains["S3"].contracts[0].strike == 95.0
+
+    def test_gather_chains_reports_failures_per_symbol(self, schwab):
+        """One failing symbol does not cancel the others."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params["symbol"] == "BAD":
+                return httpx.Response(429, text="slow down")
+            return httpx.Response(200, json=chain_body(request.url.params["symbol"]))
+
+        client = AsyncSchwabClient(schwab, transport=httpx.MockTransport(handler))
+        chains = run(client, lambda c: c.gather_chains(["AAPL", "BAD", "AAPL"]))
+
+        assert set(chains) == {"AAPL", "BAD"}
+        assert isinstance(chains["BAD"], SchwabRateLimitError)
+        assert chains["AAPL"].underlying_price == 100.0
+
+    def test_gather_chains_raises_on_auth_failure(self, schwab):
+        """Authentication failures propagate instead of being reported per symbol."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(401, text="expired"))
+        client = AsyncSchwabClient(schwab, transport=transport)
+
+        with pytest.raises(SchwabAuthenticationError):
+            run(client, lambda c: c.gather_chains(["AAPL", "MSFT"]))
+
+    def test_shares_cache_with_sync_client(self, schwab):
+        """Async fetches fill the sync client's cache under the same keys."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(200, json=chain_body("AAPL"))
+
+        client = AsyncSchwabClient(schwab, transport=httpx.MockTransport(handler))
+        chain = run(client, lambda c: c.get_option_chain("AAPL"))
+
+        with mock.patch.object(schwab, "_request") as sync_request:
+            assert schwab.get_option_chain("AAPL") is chain
+        sync_request.assert_not_called()
+
+        client = AsyncSchwabClient(schwab, transport=httpx.MockTransport(handler))
+        assert run(client, lambda c: c.get_option_chain("AAPL")) is chain
+        assert calls == ["/marketdata/v1/chains"]
+
+    def test_coalesces_concurrent_fetches(self, schwab):
+        """Concurrent fetches of one chain, including a cache-bypassing one, share a request."""
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.params["symbol"])
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=chain_body("AAPL"))
+
+        async def fetch_three(c):
+            return await asyncio.gather(
+                c.get_option_chain("AAPL"),
+                c.get_option_chain("AAPL"),
+                c.get_option_chain("AAPL", use_cache=False),
+            )
+
+        client = AsyncSchwabClient(schwab, transport=httpx.MockTransport(handler))
+        chains = run(client, fetch_three)
+
+        assert calls == ["AAPL"]
+        assert chains[0] is chains[1] is chains[2]
+        assert schwab.single_flight.stats()["schwab_chain"] == {"executed": 1, "coalesced": 2}
+
+    def test_sends_auth_header_and_params(self, schwab):
+        """Requests carry the OAuth header and the sync client's query parameters."""
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen["auth"] = request.headers["Authorization"]
+            seen["params"] = dict(request.url.params)
+            return httpx.Response(200, json=chain_body("AAPL"))
+
+        client = AsyncSchwabClient(schwab, transport=httpx.MockTransport(handler))
+        run(client, lambda c: c.get_option_chain("AAPL", contract_type="put", strike_count=10))
+
+        assert seen["auth"] == "Bearer test_token"
+        assert seen["params"] == {
+            "symbol": "AAPL",
+            "includeQuotes": "true",
+            "contractType": "PUT",
+            "strikeCount": "10",
+        }
+
+    def test_retries_server_errors(self, schwab):
+        """5xx responses are retried, then mapped to SchwabAPIError."""
+        statuses = iter([503, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            status = next(statuses, 500)
+            return httpx.Response(status, json=chain_body("AAPL"))
+
+        client = AsyncSchwabClient(schwab, transport=httpx.MockTransport(handler))
+        assert run(client, lambda c: c.get_option_chain("AAPL")).symbol == "AAPL"
+
+        schwab.cache.clear()
+        schwab.max_retries = 1
+        client = AsyncSchwabClient(schwab, transport=httpx.MockTransport(handler))
+        with pytest.raises(SchwabAPIError, match="500"):
+            run(client, lambda c: c.get_option_chain("AAPL"))
+
+    def test_rate_limit_reservation_does_not_block_loop(self, schwab):
+        """A slow reservation (e.g. a locked bucket file) runs off the event loop."""
+        ticks = []
+        ticks_during_reserve = []
+
+        def reserve(*args):
+            before = len(ticks)
+            time.sleep(0.2)
+            ticks_during_reserve.append(len(ticks) - before)
+            return 0.0
+
+        schwab.rate_limiter = mock.Mock()
+        schwab.rate_limiter.reserve.side_effect = reserve
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=chain_body("AAPL"))
+
+        async def ticker():
+            for _ in range(20):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def fetch_while_ticking(client):
+            chain, _ = await asyncio.gather(client.get_option_chain("AAPL"), ticker())
+            return chain
+
+        client = AsyncSchwabClient(schwab, transport=httpx.MockTransport(handler))
+        assert run(client, fetch_while_ticking).symbol == "AAPL"
+
+        assert ticks_during_reserve and ticks_during_reserve[0] > 0
+
+    def test_open_circuit_fails_fast(self, schwab):
+        """Once the circuit opens, requests fail without reaching the network."""
+        requests_seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_seen.append(request)
+            return httpx.Response(503, text="down")
+
+        schwab.circuit_breakers = CircuitBreakerRegistry(failure_threshold=2)
+        client = AsyncSchwabClient(schwab, transport=httpx.MockTransport(handler))
+        with pytest.raises(SchwabAPIError, match="Circuit open"):
+            run(client, lambda c: c.get_option_chain("AAPL"))
+        assert len(requests_seen) == 2
+        assert client.circuit_state() is CircuitState.OPEN
+
+        client = AsyncSchwabClient(schwab, transport=httpx.MockTransport(handler))
+        with pytest.raises(SchwabAPIError, match="Circuit open"):
+            run(client, lambda c: c.get_option_chain("MSFT"))
+        assert len(requests_seen) == 2
+
+    def test_get_quotes_chunks_concurrently(self, schwab):
+        """Quote chunks are requested in parallel and merged into one batch."""
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            symbols = request.url.params["symbols"].split(",")
+            requested.append(symbols)
+            body = {s: {"symbol": s, "quote": {"lastPrice": 10.0}} for s in symbols if s != "ZZZ"}
+            return httpx.Response(200, content=json.dumps(body))
+
+        client = AsyncSchwabClient(schwab, transport=httpx.MockTransport(handler))
+        with mock.patch("src.schwab.client.endpoints.MARKETDATA_QUOTES_MAX_SYMBOLS", 2):
+            batch = run(client, lambda c: c.get_quotes(["AAPL", "MSFT", "ZZZ"]))
+
+        assert sorted(map(tuple, requested)) == [("AAPL", "MSFT"), ("ZZZ",)]
+        assert set(batch.quotes) == {"AAPL", "MSFT"}
+        assert batch.invalid_symbols == ["ZZZ"]
+        assert schwab.get_quote("MSFT")["lastPrice"] == 10.0
+
+    def test_rejects_invalid_concurrency(self, schwab):
+        """max_concurrency must be positive."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            AsyncSchwabClient(schwab, max_concurrency=0)
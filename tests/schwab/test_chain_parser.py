@@ -0,0 +1,226 @@
+"""Tests for the fast Schwab option-chain parser."""
+
+import json
+import math
+import random
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from src.schwab.chain_parser import (
+    DEFAULT_DECODER,
+    available_decoders,
+    build_option_chain,
+    get_decoder,
+    parse_option_chain_payload,
+    register_decoder,
+)
+from src.schwab.parsers import parse_schwab_option_chain
+
+
+def _contract(put_call, bid, **extra):
+    """A Schwab contract with the fields the API returns besides the parsed ones."""
+    data = {
+        "putCall": put_call,
+        "symbol": "AAPL  260221C00155000",
+        "description": "AAPL Feb 21 2026 155 Call",
+        "exchangeName": "OPR",
+        "bid": bid,
+        "ask": bid + 0.1,
+        "last": bid,
+        "mark": bid + 0.05,
+        "bidSize": 10,
+        "askSize": 12,
+        "totalVolume": 1000,
+        "openInterest": 5000,
+        "volatility": 25.5,
+        "delta": 0.35,
+        "gamma": 0.05,
+        "theta": -0.02,
+        "vega": 0.15,
+        "rho": 0.01,
+        "optionDeliverablesList": [
+            {"symbol": "AAPL", "assetType": "STOCK", "deliverableUnits": 100.0}
+        ],
+        "strikePrice": 155.0,
+        "daysToExpiration": 30,
+        "inTheMoney": False,
+    }
+    data.update(extra)
+    return data
+
+
+@pytest.fixture
+def chain_payload():
+    """Schwab chain covering missing fields, -999 IV, nulls and integer prices."""
+    return {
+        "symbol": "AAPL",
+        "status": "SUCCESS",
+        "underlying": {"symbol": "AAPL", "bid": 150.2, "ask": 150.3, "last": 150.25},
+        "underlyingPrice": 150.25,
+        "callExpDateMap": {
+            "2026-02-21:30": {
+                "150.0": [_contract("CALL", 4.1)],
+                "155.0": [_contract("CALL", 2.5, volatility=-999.0)],
+                "160.0": [_contract("CALL", 0, ask=0, last=0, delta=None)],
+            },
+            "2026-03-20:57": {
+                "155.0": [_contract("CALL", 3.2), _contract("CALL", 3.25, symbol="AAPL2")],
+            },
+        },
+        "putExpDateMap": {
+            "2026-02-21:30": {
+                "145.0": [{"bid": 1.8, "ask": 1.9}],
+                "150.0": [_contract("PUT", 3.0, totalVolume=0, openInterest=0)],
+            },
+        },
+    }
+
+
+@pytest.fixture
+def large_payload():
+    """A generated multi-expiration chain."""
+    rng = random.Random(3)
+    payload = {"symbol": "SPY", "underlyingPrice": 500.0, "callExpDateMap": {}, "putExpDateMap": {}}
+    for map_key, put_call in (("callExpDateMap", "CALL"), ("putExpDateMap", "PUT")):
+        for day in range(1, 30, 7):
+            strikes = {}
+            for k in range(40):
+                strike = 480 + k * 1.0
+                strikes[f"{strike:.1f}"] = [
+                    _contract(
+                        put_call,
+                        round(rng.uniform(0, 10), 2),
+                        volatility=rng.choice([-999.0, rng.uniform(5, 60)]),
+                        totalVolume=rng.randint(0, 5000),
+                    )
+                ]
+            payload[map_key][f"2026-11-{day:02d}:{day}"] = strikes
+    return payload
+
+
+def _assert_same_chain(chain, reference):
+    assert chain.symbol == reference.symbol
+    assert chain.underlying_price == reference.underlying_price
+    assert chain.contracts == reference.contracts
+    for actual, expected in zip(chain.contracts, reference.contracts):
+        assert type(actual.volume) is type(expected.volume)
+        assert type(actual.bid) is type(expected.bid)
+
+
+class TestEquivalence:
+    """The fast parser matches parse_schwab_option_chain exactly."""
+
+    @pytest.mark.parametrize("decoder", available_decoders())
+    @pytest.mark.parametrize("fixture_name", ["chain_payload", "large_payload"])
+    def test_matches_reference_parser(self, request, fixture_name, decoder):
+        """Every decoder yields the same contracts as the dict-based parser."""
+        payload = request.getfixturevalue(fixture_name)
+        body = json.dumps(payload).encode()
+
+        reference = parse_schwab_option_chain(payload["symbol"], json.loads(body))
+        chain = parse_option_chain_payload(payload["symbol"], body, decoder=decoder)
+
+        _assert_same_chain(chain, reference)
+
+    @pytest.mark.parametrize("decoder", available_decoders())
+    def test_columns_match_rebuilt_columns(self, large_payload, decoder):
+        """Attached columns equal columns built from the contracts."""
+        chain = parse_option_chain_payload(
+            "SPY", json.dumps(large_payload).encode(), decoder=decoder
+        )
+        attached = chain.columns
+        chain.invalidate_columns()
+        rebuilt = chain.columns
+
+        assert attached is not rebuilt
+        assert attached.expirations == rebuilt.expirations
+        for name, values in rebuilt.columns.items():
+            np.testing.assert_array_equal(attached.columns[name], values)
+        assert attached.slice("put", "2026-11-08").contracts() == rebuilt.slice(
+            "put", "2026-11-08"
+        ).contracts()
+
+    def test_accepts_str_payload(self, chain_payload):
+        """Text bodies parse like bytes."""
+        chain = parse_option_chain_payload("AAPL", json.dumps(chain_payload), decoder="json")
+        assert len(chain.contracts) == 7
+
+    def test_build_from_plain_dict(self, chain_payload):
+        """build_option_chain accepts an already decoded dict."""
+        reference = parse_schwab_option_chain("AAPL", chain_payload)
+        _assert_same_chain(build_option_chain("AAPL", chain_payload), reference)
+
+    def test_empty_chain(self):
+        """Chains without contracts parse to an empty OptionsChain."""
+        body = json.dumps({"symbol": "X", "callExpDateMap": {}, "putExpDateMap": {}})
+        chain = parse_option_chain_payload("X", body)
+        assert chain.contracts == []
+        assert chain.underlying_price is None
+
+    def test_nan_literals(self):
+        """Non-standard NaN literals are accepted, falling back to the stdlib if needed."""
+        body = (
+            b'{"underlyingPrice": 10.0, "callExpDateMap": {"2026-02-21:30": '
+            b'{"10.0": [{"bid": 0.5, "ask": 0.6, "delta": NaN}]}}}'
+        )
+        chain = parse_option_chain_payload("X", body)
+        assert math.isnan(chain.contracts[0].delta)
+        assert chain.contracts[0].bid == 0.5
+
+
+class TestDecoders:
+    """Decoder registry."""
+
+    def test_default_decoder_registered(self):
+        """The default decoder is always available."""
+        assert DEFAULT_DECODER in available_decoders()
+        assert "json" in available_decoders()
+
+    def test_unknown_decoder(self):
+        """Unknown decoder names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown JSON decoder"):
+            get_decoder("nope")
+
+    def test_register_decoder(self, chain_payload):
+        """Custom decoders can be registered and selected."""
+        calls = []
+
+        def decoder(payload):
+            calls.append(len(payload))
+            return json.loads(payload)
+
+        register_decoder("test-json", decoder)
+        chain = parse_option_chain_payload(
+            "AAPL", json.dumps(chain_payload).encode(), decoder="test-json"
+        )
+
+        assert calls
+        assert len(chain.contracts) == 7
+
+
+class TestClientIntegration:
+    """SchwabClient decodes the raw response body."""
+
+    @mock.patch("src.schwab.client.requests.Session.request")
+    def test_get_option_chain_parses_raw_body(self, mock_request, chain_payload):
+        """get_option_chain parses response.content without response.json()."""
+        from src.schwab.client import SchwabClient
+
+        coordinator = mock.Mock()
+        coordinator.get_authorization_header.return_value = {
+            "Authorization": "Bearer test_token"
+        }
+        client = SchwabClient(coordinator, enable_cache=False)
+
+        response = mock.Mock()
+        response.status_code = 200
+        response.ok = True
+        response.content = json.dumps(chain_payload).encode()
+        mock_request.return_value = response
+
+        chain = client.get_option_chain("AAPL", use_cache=False)
+
+        response.json.assert_not_called()
+        _assert_same_chain(chain, parse_schwab_option_chain("AAPL", chain_payload))
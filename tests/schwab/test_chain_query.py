@@ -0,0 +1,185 @@
+"""Tests for narrowed option-chain requests."""
+
+import time
+from datetime import date, timedelta
+from unittest import mock
+
+import pytest
+
+from src.models.base import OptionContract, OptionsChain
+from src.schwab.chain_query import OptionChainQuery
+from src.schwab.client import SchwabClient
+
+
+def _chain(price=100.0, strikes=range(80, 121, 5), expirations=("2026-03-06", "2026-03-20")):
+    """Calls and puts at every strike and expiration, underlying at price."""
+    contracts = [
+        OptionContract(
+            symbol="AAPL",
+            strike=float(strike),
+            expiration_date=expiration,
+            option_type=option_type,
+            bid=1.0,
+            ask=1.1,
+        )
+        for expiration in expirations
+        for option_type in ("Call", "Put")
+        for strike in strikes
+    ]
+    return OptionsChain(
+        symbol="AAPL", contracts=contracts, retrieved_at="2026-02-01T00:00:00",
+        underlying_price=price,
+    )
+
+
+class TestOptionChainQuery:
+    """Tests for OptionChainQuery."""
+
+    def test_cache_key_round_trip(self):
+        query = OptionChainQuery("AAPL", "put", 12, "otm", None, "2026-03-20")
+        assert query.cache_key == "AAPL_PUT_12_None_2026-03-20_OTM"
+        assert OptionChainQuery.from_cache_key("AAPL", query.cache_key) == query
+
+    def test_unfiltered_key_is_unchanged(self):
+        """Keys of unfiltered requests match those cached before range existed."""
+        assert OptionChainQuery("AAPL").cache_key == "AAPL_None_None_None_None"
+
+    def test_from_cache_key_rejects_other_symbols(self):
+        assert OptionChainQuery.from_cache_key("AAP", "AAPL_None_None_None_None") is None
+
+    def test_params(self):
+        params = OptionChainQuery("AAPL", "CALL", 5, "OTM", "2026-03-01", "2026-03-20").params()
+        assert params == {
+            "symbol": "AAPL",
+            "includeQuotes": "true",
+            "contractType": "CALL",
+            "strikeCount": 5,
+            "range": "OTM",
+            "fromDate": "2026-03-01",
+            "toDate": "2026-03-20",
+        }
+
+    def test_envelope(self):
+        query = OptionChainQuery.envelope(
+            "AAPL", current_price=100.0, volatility=0.30, max_sigma=2.0, max_dte=30,
+            contract_type="PUT", strike_spacing=1.0,
+        )
+        assert query.contract_type == "PUT"
+        assert query.strike_range == "OTM"
+        assert query.from_date is None
+        assert query.to_date == (date.today() + timedelta(days=30)).isoformat()
+        # 100 * (exp(2 * 0.3 * sqrt(30/365)) - 1) = 18.8 dollars, plus padding
+        assert query.strike_count == 21
+
+    def test_envelope_without_spacing_leaves_strikes_open(self):
+        query = OptionChainQuery.envelope(
+            "AAPL", current_price=100.0, volatility=0.30, max_sigma=2.0, max_dte=30
+        )
+        assert query.strike_count is None
+
+    def test_envelope_for_one_expiration(self):
+        query = OptionChainQuery.envelope(
+            "AAPL", 100.0, 0.30, 2.0, 30, expiration_date="2026-03-20"
+        )
+        assert (query.from_date, query.to_date) == ("2026-03-20", "2026-03-20")
+
+    @pytest.mark.parametrize(
+        "wide, narrow, expected",
+        [
+            (OptionChainQuery("AAPL"), OptionChainQuery("AAPL", "PUT", 5, "OTM", None, "2026-03-20"), True),
+            (OptionChainQuery("AAPL", "PUT"), OptionChainQuery("AAPL", "CALL"), False),
+            (OptionChainQuery("AAPL", strike_count=10), OptionChainQuery("AAPL", strike_count=5), True),
+            (OptionChainQuery("AAPL", strike_count=5), OptionChainQuery("AAPL", strike_count=10), False),
+            (OptionChainQuery("AAPL", strike_count=5), OptionChainQuery("AAPL"), False),
+            (OptionChainQuery("AAPL", strike_range="OTM"), OptionChainQuery("AAPL"), False),
+            (OptionChainQuery("AAPL"), OptionChainQuery("AAPL", strike_range="NTM"), False),
+            (OptionChainQuery("AAPL", to_date="2026-03-20"), OptionChainQuery("AAPL", to_date="2026-03-06"), True),
+            (OptionChainQuery("AAPL", to_date="2026-03-06"), OptionChainQuery("AAPL", to_date="2026-03-20"), False),
+            (OptionChainQuery("AAPL", from_date="2026-03-06"), OptionChainQuery("AAPL"), False),
+            (OptionChainQuery("MSFT"), OptionChainQuery("AAPL"), False),
+        ],
+    )
+    def test_covers(self, wide, narrow, expected):
+        assert wide.covers(narrow) is expected
+
+    def test_narrow_type_range_and_dates(self):
+        query = OptionChainQuery("AAPL", "CALL", strike_range="OTM", to_date="2026-03-06")
+        narrowed = query.narrow(_chain())
+
+        assert {c.expiration_date for c in narrowed.contracts} == {"2026-03-06"}
+        assert all(c.is_call for c in narrowed.contracts)
+        assert [c.strike for c in narrowed.contracts] == [100.0, 105.0, 110.0, 115.0, 120.0]
+        assert narrowed.underlying_price == 100.0
+
+    def test_narrow_strike_count(self):
+        query = OptionChainQuery("AAPL", "PUT", strike_count=2, from_date="2026-03-20")
+        narrowed = query.narrow(_chain(price=101.0))
+        assert [c.strike for c in narrowed.contracts] == [95.0, 100.0, 105.0, 110.0]
+
+    def test_narrow_keeps_chain_order(self):
+        chain = _chain()
+        narrowed = OptionChainQuery("AAPL", strike_range="OTM").narrow(chain)
+        positions = [chain.contracts.index(c) for c in narrowed.contracts]
+        assert positions == sorted(positions)
+
+
+class TestCachedNarrowing:
+    """SchwabClient answers narrower requests from a wider cached chain."""
+
+    @pytest.fixture
+    def client(self):
+        oauth = mock.Mock()
+        oauth.get_authorization_header.return_value = {"Authorization": "Bearer test_token"}
+        return SchwabClient(oauth_coordinator=oauth, enable_cache=True)
+
+    @mock.patch("src.schwab.client.requests.Session.request")
+    def test_narrow_request_served_from_full_chain(self, mock_request, client):
+        stored_at = time.time() - 60
+        client.chain_cache["AAPL_None_None_None_None"] = (_chain(), stored_at)
+
+        chain = client.get_option_chain(
+            "AAPL", contract_type="CALL", strike_range="OTM", to_date="2026-03-06"
+        )
+
+        mock_request.assert_not_called()
+        assert [c.strike for c in chain.contracts] == [100.0, 105.0, 110.0, 115.0, 120.0]
+        # The narrowed chain is cached and expires with the full one
+        key = "AAPL_CALL_None_None_2026-03-06_OTM"
+        assert client.chain_cache[key] == (chain, stored_at)
+
+    @mock.patch("src.schwab.client.requests.Session.request")
+    def test_narrowing_reads_only_the_symbols_entries(self, mock_request, client):
+        client.chain_cache["AAPL_None_None_None_None"] = (_chain(), time.time())
+        client.chain_cache["AAPLX_None_None_None_None"] = (_chain(), time.time())
+        client.chain_cache["MSFT_None_None_None_None"] = (_chain(), time.time())
+        backend_get = mock.Mock(wraps=client.cache.backend.get)
+        client.cache.backend.get = backend_get
+
+        client.get_option_chain("AAPL", contract_type="CALL", to_date="2026-03-06")
+
+        mock_request.assert_not_called()
+        read = [c.args[0].split("\x1f", 1)[1] for c in backend_get.call_args_list]
+        assert read.count("AAPL_None_None_None_None") == 1
+        assert not [k for k in read if k.startswith(("AAPLX_", "MSFT_"))]
+
+    @mock.patch("src.schwab.client.requests.Session.request")
+    def test_wider_request_is_fetched(self, mock_request, client):
+        client.chain_cache["AAPL_PUT_None_None_None"] = (_chain(), time.time())
+        response = mock.Mock(status_code=200, ok=True, content=None)
+        response.json.return_value = {"symbol": "AAPL", "callExpDateMap": {}, "putExpDateMap": {}}
+        mock_request.return_value = response
+
+        client.get_option_chain("AAPL")
+
+        mock_request.assert_called_once()
+
+    @mock.patch("src.schwab.client.requests.Session.request")
+    def test_use_cache_false_skips_narrowing(self, mock_request, client):
+        client.chain_cache["AAPL_None_None_None_None"] = (_chain(), time.time())
+        response = mock.Mock(status_code=200, ok=True, content=None)
+        response.json.return_value = {"symbol": "AAPL", "callExpDateMap": {}, "putExpDateMap": {}}
+        mock_request.return_value = response
+
+        client.get_option_chain("AAPL", contract_type="CALL", use_cache=False)
+
+        mock_request.assert_called_once()
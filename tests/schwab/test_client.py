@@ -119,7 +119,7 @@ class TestSchwabClient:
             client._request("GET", "/marketdata/quotes")
 
     @mock.patch("src.schwab.client.requests.Session.request")
-    @mock.patch("src.schwab.client.time.sleep")  # Mock sleep to speed up test
+    @mock.patch("src.api.base_client.time.sleep")  # Mock sleep to speed up test
     def test_request_retries_on_500(self, mock_sleep, mock_request, client):
         """_request retries on 500 server error."""
         # First two calls fail with 500, third succeeds
@@ -141,7 +141,7 @@ class TestSchwabClient:
         assert mock_sleep.call_count == 2  # Slept twice (after first two failures)
 
     @mock.patch("src.schwab.client.requests.Session.request")
-    @mock.patch("src.schwab.client.time.sleep")
+    @mock.patch("src.api.base_client.time.sleep")
     def test_request_fails_after_max_retries(self, mock_sleep, mock_request, client):
         """_request fails after max retries on 500."""
         mock_response = mock.Mock()
@@ -167,7 +167,7 @@ class TestSchwabClient:
 
         mock_request.side_effect = [requests.exceptions.Timeout(), mock_response]
 
-        with mock.patch("src.schwab.client.time.sleep"):
+        with mock.patch("src.api.base_client.time.sleep"):
             response = client._request("GET", "/marketdata/quotes")
 
         assert response.status_code == 200
@@ -187,7 +187,7 @@ class TestSchwabClient:
             mock_response,
         ]
 
-        with mock.patch("src.schwab.client.time.sleep"):
+        with mock.patch("src.api.base_client.time.sleep"):
             response = client._request("GET", "/marketdata/quotes")
 
         assert response.status_code == 200
@@ -234,22 +234,22 @@ class TestSchwabClient:
 
     @mock.patch("src.schwab.client.requests.Session.request")
     def test_exponential_backoff_timing(self, mock_request, client):
-        """Retry delay increases exponentially."""
+        """Retry delays grow with decorrelated jitter."""
         mock_response = mock.Mock()
         mock_response.status_code = 500
         mock_response.ok = False
         mock_response.text = "Error"
         mock_request.return_value = mock_response
 
-        with mock.patch("src.schwab.client.time.sleep") as mock_sleep:
+        with mock.patch("src.api.base_client.time.sleep") as mock_sleep:
             with pytest.raises(SchwabAPIError):
                 client._request("GET", "/test")
 
-            # Check exponential backoff: 0.1s, 0.2s
-            calls = mock_sleep.call_args_list
-            assert len(calls) == 2
-            assert calls[0][0][0] == 0.1  # First retry: 0.1 * 2^0
-            assert calls[1][0][0] == 0.2  # Second retry: 0.1 * 2^1
+            # Each delay is between the base and three times the previous one
+            delays = [c[0][0] for c in mock_sleep.call_args_list]
+            assert len(delays) == 2
+            assert 0.1 <= delays[0] <= 0.3
+            assert 0.1 <= delays[1] <= delays[0] * 3
 
 
 class TestSchwabClientPriceHistory:
@@ -1,5 +1,7 @@
 """Tests for Schwab market data endpoints."""
 
+import threading
+import time
 from datetime import datetime
 from unittest import mock
 
@@ -133,20 +135,71 @@ class TestMarketDataEndpoints:
         with pytest.raises(SchwabInvalidSymbolError, match="not found in response"):
             client.get_quote("INVALID")
 
-    @mock.patch("src.schwab.client.time")
     @mock.patch("src.schwab.client.requests.Session.request")
-    def test_get_quote_uses_cache(self, mock_request, mock_time, client_with_cache, mock_quote_response):
+    def test_get_quotes_batches_symbols(
+        self, mock_request, client_with_cache, mock_quote_response
+    ):
+        """get_quotes() fetches many symbols in one request and caches each."""
+        msft = {
+            "symbol": "MSFT",
+            "quoteType": "NBBO",
+            "realtime": True,
+            "quote": {"lastPrice": 410.0},
+        }
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.ok = True
+        mock_response.json.return_value = {
+            **mock_quote_response,
+            "MSFT": msft,
+            "errors": {"invalidSymbols": ["BAD"]},
+        }
+        mock_request.return_value = mock_response
+
+        batch = client_with_cache.get_quotes(["AAPL", "MSFT", "BAD", "AAPL"])
+
+        mock_request.assert_called_once()
+        assert mock_request.call_args.kwargs["params"] == {"symbols": "AAPL,MSFT,BAD"}
+        assert batch.get("AAPL")["lastPrice"] == 150.25
+        assert batch.get("MSFT")["symbol"] == "MSFT"
+        assert batch.invalid_symbols == ["BAD"]
+        assert batch.errors == {}
+
+        # The per-symbol cache is filled
+        assert client_with_cache.get_quote("MSFT")["lastPrice"] == 410.0
+        mock_request.assert_called_once()
+
+    @mock.patch("src.schwab.client.endpoints.MARKETDATA_QUOTES_MAX_SYMBOLS", 2)
+    @mock.patch("src.schwab.client.requests.Session.request")
+    def test_get_quotes_chunks_and_reports_failures(self, mock_request, client):
+        """get_quotes() chunks requests and reports a failed chunk per symbol."""
+        ok = mock.Mock(status_code=200, ok=True)
+        ok.json.return_value = {
+            "AAPL": {"symbol": "AAPL", "quote": {"lastPrice": 150.0}},
+            "MSFT": {"symbol": "MSFT", "quote": {"lastPrice": 410.0}},
+        }
+        failed = mock.Mock(status_code=400, ok=False, text="Bad request")
+        mock_request.side_effect = [ok, failed]
+
+        batch = client.get_quotes(["AAPL", "MSFT", "F"])
+
+        assert mock_request.call_count == 2
+        assert set(batch.quotes) == {"AAPL", "MSFT"}
+        assert list(batch.errors) == ["F"]
+        assert batch.failed_symbols == ["F"]
+
+    @mock.patch("src.schwab.client.requests.Session.request")
+    def test_get_quote_uses_cache(self, mock_request, client_with_cache, mock_quote_response):
         """get_quote() uses cached data when available."""
         # Set up cache with recent data (within 5-minute TTL)
-        current_time = 1000000.0
-        mock_time.time.return_value = current_time
+        current_time = time.time()
 
         cached_quote = mock_quote_response["AAPL"]["quote"].copy()
         cached_quote["symbol"] = "AAPL"
         cached_quote["quoteType"] = mock_quote_response["AAPL"]["quoteType"]
         cached_quote["realtime"] = mock_quote_response["AAPL"]["realtime"]
 
-        client_with_cache.cache["schwab_quote_AAPL"] = (cached_quote, current_time - 60)  # 1 minute old
+        client_with_cache.quote_cache["AAPL"] = (cached_quote, current_time - 60)  # 1 minute old
 
         quote = client_with_cache.get_quote("AAPL", use_cache=True)
 
@@ -168,8 +221,8 @@ class TestMarketDataEndpoints:
         quote = client_with_cache.get_quote("AAPL", use_cache=True)
 
         # Should cache the result
-        assert "schwab_quote_AAPL" in client_with_cache.cache
-        cached_quote, cached_time = client_with_cache.cache["schwab_quote_AAPL"]
+        assert "AAPL" in client_with_cache.quote_cache
+        cached_quote, cached_time = client_with_cache.quote_cache["AAPL"]
         assert cached_quote == quote
         assert isinstance(cached_time, float)  # Unix timestamp
 
@@ -238,14 +291,12 @@ class TestMarketDataEndpoints:
         assert params["fromDate"] == "2026-02-01"
         assert params["toDate"] == "2026-03-01"
 
-    @mock.patch("src.schwab.client.time")
     @mock.patch("src.schwab.client.requests.Session.request")
     def test_get_option_chain_uses_cache(
-        self, mock_request, mock_time, client_with_cache, mock_option_chain_response
+        self, mock_request, client_with_cache, mock_option_chain_response
     ):
         """get_option_chain() uses cached data when available."""
-        current_time = 1000000.0
-        mock_time.time.return_value = current_time
+        current_time = time.time()
 
         # Create a mock OptionsChain to return from cache
         cached_chain = OptionsChain(
@@ -255,8 +306,8 @@ class TestMarketDataEndpoints:
         )
 
         # Add to cache (within 15-minute TTL)
-        cache_key = "schwab_chain_AAPL_None_None_None_None"
-        client_with_cache.cache[cache_key] = (cached_chain, current_time - 300)  # 5 minutes old
+        cache_key = "AAPL_None_None_None_None"
+        client_with_cache.chain_cache[cache_key] = (cached_chain, current_time - 300)  # 5 minutes old
 
         chain = client_with_cache.get_option_chain("AAPL", use_cache=True)
 
@@ -278,12 +329,53 @@ class TestMarketDataEndpoints:
         chain = client_with_cache.get_option_chain("AAPL", use_cache=True)
 
         # Should cache the result
-        cache_keys = [k for k in client_with_cache.cache.keys() if k.startswith("schwab_chain_")]
+        cache_keys = list(client_with_cache.chain_cache.keys())
         assert len(cache_keys) == 1
-        cached_chain, cached_time = client_with_cache.cache[cache_keys[0]]
+        cached_chain, cached_time = client_with_cache.chain_cache[cache_keys[0]]
         assert isinstance(cached_chain, OptionsChain)
         assert isinstance(cached_time, float)  # Unix timestamp
 
+    @mock.patch("src.schwab.client.requests.Session.request")
+    def test_get_option_chain_writes_snapshot(
+        self, mock_request, mock_oauth, mock_option_chain_response
+    ):
+        """get_option_chain() appends fetched chains to the snapshot store."""
+        store = mock.Mock()
+        client = SchwabClient(
+            oauth_coordinator=mock_oauth, enable_cache=False, snapshot_store=store
+        )
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.ok = True
+        mock_response.json.return_value = mock_option_chain_response
+        mock_request.return_value = mock_response
+
+        chain = client.get_option_chain("AAPL", strike_count=10)
+
+        store.write.assert_called_once()
+        assert store.write.call_args.args[0] is chain
+        assert store.write.call_args.kwargs["query"]["strikeCount"] == 10
+
+    @mock.patch("src.schwab.client.requests.Session.request")
+    def test_get_option_chain_snapshot_failure_not_fatal(
+        self, mock_request, mock_oauth, mock_option_chain_response
+    ):
+        """A failing snapshot store does not break the fetch."""
+        store = mock.Mock()
+        store.write.side_effect = OSError("disk full")
+        client = SchwabClient(
+            oauth_coordinator=mock_oauth, enable_cache=False, snapshot_store=store
+        )
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.ok = True
+        mock_response.json.return_value = mock_option_chain_response
+        mock_request.return_value = mock_response
+
+        chain = client.get_option_chain("AAPL")
+
+        assert len(chain.contracts) == 2
+
     def test_parse_schwab_contract(self, client):
         """_parse_schwab_contract() correctly parses contract data."""
         contract_data = {
@@ -346,3 +438,101 @@ class TestMarketDataEndpoints:
         strikes = [c.strike for c in chain.contracts]
         assert 150.0 in strikes
         assert 155.0 in strikes
+
+
+class TestSingleFlightCoalescing:
+    """Concurrent cache misses for the same key share one request."""
+
+    @pytest.fixture
+    def client(self):
+        oauth = mock.Mock()
+        oauth.get_authorization_header.return_value = {"Authorization": "Bearer test_token"}
+        return SchwabClient(oauth_coordinator=oauth, retry_delay=0)
+
+    @staticmethod
+    def blocking_response(release: threading.Event, body: dict):
+        """Session.request side effect that waits for release before answering."""
+
+        def respond(*args, **kwargs):
+            release.wait(5)
+            response = mock.Mock(status_code=200, ok=True)
+            response.json.return_value = body
+            return response
+
+        return respond
+
+    @staticmethod
+    def start_leader(client: SchwabClient, target) -> threading.Thread:
+        """Start target in a thread and wait until its fetch is in flight."""
+        thread = threading.Thread(target=target)
+        thread.start()
+        while client.single_flight.in_flight() == 0:
+            time.sleep(0.001)
+        return thread
+
+    @mock.patch("src.schwab.client.requests.Session.request")
+    def test_concurrent_get_quote(self, mock_request, client):
+        release = threading.Event()
+        body = {"AAPL": {"symbol": "AAPL", "quote": {"lastPrice": 150.0}}}
+        mock_request.side_effect = self.blocking_response(release, body)
+        results = []
+
+        leader = self.start_leader(client, lambda: results.append(client.get_quote("AAPL")))
+        followers = [
+            threading.Thread(target=lambda: results.append(client.get_quote("AAPL")))
+            for _ in range(3)
+        ]
+        for t in followers:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in [leader, *followers]:
+            t.join(timeout=10)
+
+        mock_request.assert_called_once()
+        assert [q["lastPrice"] for q in results] == [150.0] * 4
+        assert client.single_flight.stats()["schwab_quote"] == {"executed": 1, "coalesced": 3}
+
+    @mock.patch("src.schwab.client.requests.Session.request")
+    def test_get_quotes_joins_in_flight_symbols(self, mock_request, client):
+        release = threading.Event()
+        body = {
+            "AAPL": {"symbol": "AAPL", "quote": {"lastPrice": 150.0}},
+            "MSFT": {"symbol": "MSFT", "quote": {"lastPrice": 410.0}},
+        }
+        mock_request.side_effect = self.blocking_response(release, body)
+
+        leader = self.start_leader(client, lambda: client.get_quote("AAPL"))
+        threading.Timer(0.05, release.set).start()
+        batch = client.get_quotes(["AAPL", "MSFT"])
+        leader.join(timeout=10)
+
+        # AAPL was joined; only MSFT was requested by the batch
+        assert mock_request.call_count == 2
+        assert mock_request.call_args.kwargs["params"] == {"symbols": "MSFT"}
+        assert batch.get("AAPL")["lastPrice"] == 150.0
+        assert batch.get("MSFT")["lastPrice"] == 410.0
+
+    @mock.patch("src.schwab.client.requests.Session.request")
+    def test_error_is_shared(self, mock_request, client):
+        release = threading.Event()
+        mock_request.side_effect = self.blocking_response(release, {})
+        errors = []
+
+        def call():
+            try:
+                client.get_quote("BAD")
+            except SchwabInvalidSymbolError as e:
+                errors.append(e)
+
+        leader = self.start_leader(client, call)
+        follower = threading.Thread(target=call)
+        follower.start()
+        time.sleep(0.05)
+        release.set()
+        for t in (leader, follower):
+            t.join(timeout=10)
+
+        mock_request.assert_called_once()
+        assert len(errors) == 2
+        assert errors[0] is errors[1]
@@ -16,6 +16,7 @@ from sqlalchemy.orm import Session, sessionmaker
 from src.server.config import settings
 from src.server.database.session import Base, get_db
 from src.server.main import app
+from src.server.services.provider_registry import ProviderRegistry, set_provider_registry
 
 # Import all models to ensure they're registered with Base
 from src.server.database.models import (  # noqa: F401
@@ -26,12 +27,29 @@ from src.server.database.models import (  # noqa: F401
     Portfolio,
     SchedulerConfig,
     Snapshot,
+    SymbolVolatilityState,
     Trade,
     WatchlistItem,
     Wheel,
 )
 
 
+@pytest.fixture(autouse=True)
+def provider_registry() -> Generator[ProviderRegistry, None, None]:
+    """Install an empty provider registry for each test.
+
+    Keeps services from building real market data clients and keeps the
+    shared quote caches from leaking between tests.
+
+    Yields:
+        ProviderRegistry without clients
+    """
+    registry = ProviderRegistry()
+    set_provider_registry(registry)
+    yield registry
+    set_provider_registry(None)
+
+
 @pytest.fixture(scope="function")
 def test_db() -> Generator[Session, None, None]:
     """Create a test database session.
@@ -215,3 +215,49 @@ def test_info_endpoint_response_structure(client_no_db: TestClient):
         datetime.fromisoformat(data["timestamp"].replace("Z", "+00:00"))
     except ValueError:
         pytest.fail("Timestamp is not in valid ISO format")
+
+
+def test_rate_limits_endpoint(client_no_db: TestClient, monkeypatch):
+    """Test GET /api/v1/rate-limits returns the shared limiter's counters.
+
+    Args:
+        client_no_db: FastAPI test client without database mocking
+
+    Asserts:
+        - Response status code is 200
+        - Counters are keyed by budget
+    """
+    from src.api import rate_limiter
+
+    limiter = rate_limiter.RateLimiter({"schwab": rate_limiter.RateLimit(10, 60)})
+    limiter.reserve("schwab")
+    monkeypatch.setattr(rate_limiter, "_shared_limiter", limiter)
+
+    response = client_no_db.get("/api/v1/rate-limits")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["schwab"]["requests"] == 1
+
+
+def test_cache_stats_endpoint(client_no_db: TestClient, provider_registry):
+    """Test GET /api/v1/cache-stats returns the shared cache's counters.
+
+    Args:
+        client_no_db: FastAPI test client without database mocking
+        provider_registry: Registry installed for the test
+
+    Asserts:
+        - Response status code is 200
+        - Entry count and per-namespace counters are reported
+    """
+    quotes = provider_registry.cache.namespace("schwab_quote", 300)
+    quotes.store("AAPL", {"lastPrice": 150.0})
+    quotes.lookup("AAPL")
+
+    response = client_no_db.get("/api/v1/cache-stats")
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["entries"] == 1
+    assert data["namespaces"]["schwab_quote"]["hits"] == 1
+    assert data["single_flight"] == {}
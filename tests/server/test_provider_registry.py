@@ -0,0 +1,125 @@
+"""Tests for the application-scoped provider registry."""
+
+from unittest.mock import Mock, patch
+
+from src.api.cache import SQLiteCacheBackend
+from src.server.services.position_service import PositionMonitorService
+from src.server.services.provider_registry import (
+    ProviderRegistry,
+    get_provider_registry,
+    set_provider_registry,
+)
+from src.server.services.recommendation_service import RecommendationService
+from src.server.services.watchlist_service import WatchlistService
+
+
+class TestProviderRegistry:
+    """Tests for registry lifecycle."""
+
+    def test_wraps_clients(self):
+        schwab = Mock()
+        registry = ProviderRegistry(schwab_client=schwab, finnhub_client=Mock())
+
+        assert registry.price_fetcher._client is schwab
+        assert registry.position_monitor.schwab_client is schwab
+        assert registry.position_monitor.price_fetcher is registry.price_fetcher
+
+    def test_empty_registry(self):
+        registry = ProviderRegistry()
+
+        assert registry.schwab_client is None
+        assert registry.price_fetcher is None
+        registry.close()
+
+    def test_missing_credentials_disable_providers(self, monkeypatch):
+        monkeypatch.delenv("FINNHUB_API_KEY", raising=False)
+        with patch(
+            "src.server.services.provider_registry.SchwabClient",
+            side_effect=ValueError("no creds"),
+        ):
+            registry = ProviderRegistry.from_environment()
+
+        assert registry.schwab_client is None
+        assert registry.finnhub_client is None
+
+    def test_persistent_cache_from_environment(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("FINNHUB_API_KEY", raising=False)
+        monkeypatch.setenv("WHEEL_PERSISTENT_CACHE", "1")
+        monkeypatch.setenv("WHEEL_CACHE_DB", str(tmp_path / "cache.db"))
+        with patch(
+            "src.server.services.provider_registry.SchwabClient",
+            side_effect=ValueError("no creds"),
+        ):
+            registry = ProviderRegistry.from_environment()
+
+        assert isinstance(registry.cache.backend, SQLiteCacheBackend)
+        assert registry.cache.backend.path == tmp_path / "cache.db"
+
+    def test_created_once(self):
+        set_provider_registry(None)
+        with patch.object(
+            ProviderRegistry, "from_environment", return_value=ProviderRegistry()
+        ) as factory:
+            first = get_provider_registry()
+            second = get_provider_registry()
+
+        assert first is second
+        factory.assert_called_once()
+
+    def test_replacing_closes_previous(self):
+        old = ProviderRegistry(schwab_client=Mock())
+        set_provider_registry(old)
+
+        set_provider_registry(ProviderRegistry())
+
+        old.schwab_client.close.assert_called_once()
+
+
+class TestServicesShareProviders:
+    """Services built from one registry share its clients and caches."""
+
+    def test_recommendation_service(self, test_db):
+        registry = ProviderRegistry(schwab_client=Mock(), finnhub_client=Mock())
+
+        first = RecommendationService(test_db, providers=registry)
+        second = RecommendationService(test_db, providers=registry)
+
+        assert first.schwab_client is second.schwab_client is registry.schwab_client
+        assert first.price_fetcher is second.price_fetcher is registry.price_fetcher
+        assert first.finnhub_client is registry.finnhub_client
+
+    def test_watchlist_service(self, test_db):
+        registry = ProviderRegistry(schwab_client=Mock(), finnhub_client=Mock())
+
+        service = WatchlistService(test_db, providers=registry)
+
+        assert service.recommend_engine.schwab is registry.schwab_client
+        assert service.volatility_service.price_fetcher is registry.price_fetcher
+
+    def test_position_service_reuses_monitor(self, test_db):
+        registry = ProviderRegistry(schwab_client=Mock())
+
+        first = PositionMonitorService(test_db, providers=registry)
+        second = PositionMonitorService(test_db, providers=registry)
+
+        assert first.monitor is second.monitor is registry.position_monitor
+
+    def test_explicit_client_wins(self, test_db):
+        registry = ProviderRegistry(schwab_client=Mock())
+        schwab = Mock()
+
+        service = PositionMonitorService(test_db, schwab_client=schwab, providers=registry)
+
+        assert service.schwab_client is schwab
+        assert service.monitor is not registry.position_monitor
+
+    def test_routes_use_shared_registry(self, client, provider_registry):
+        """Requests resolve the process-wide registry instead of new clients."""
+        with patch(
+            "src.server.services.recommendation_service.SchwabClient"
+        ) as schwab_class:
+            response = client.delete("/api/v1/wheels/recommend/cache")
+
+        assert response.status_code == 204
+        schwab_class.assert_not_called()
+        assert get_provider_registry() is provider_registry
@@ -15,6 +15,7 @@ from src.server.database.models.trade import Trade
 from src.server.tasks.market_hours import (
     get_next_market_close,
     get_next_market_open,
+    get_open_session_date,
     is_market_open,
     should_run_task,
 )
@@ -145,6 +146,18 @@ class TestMarketHours:
         assert next_close.hour == 16
         assert next_close.minute == 0
 
+    def test_open_session_date_before_close(self):
+        """Test today's session is open until 4:00 PM."""
+        # Wednesday at 11:00 AM ET
+        test_time = EASTERN.localize(datetime(2026, 2, 4, 11, 0))
+        assert get_open_session_date(test_time) == "2026-02-04"
+
+    def test_open_session_date_after_close(self):
+        """Test no session is open after the close or on weekends."""
+        # Wednesday at 4:30 PM ET, Saturday at noon ET
+        assert get_open_session_date(EASTERN.localize(datetime(2026, 2, 4, 16, 30))) is None
+        assert get_open_session_date(EASTERN.localize(datetime(2026, 2, 7, 12, 0))) is None
+
 
 class TestPriceRefreshTask:
     """Test cases for price refresh task."""
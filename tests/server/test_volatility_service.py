@@ -0,0 +1,195 @@
+"""Tests for VolatilityStateService and VolatilityStateRepository."""
+
+import math
+import random
+from unittest.mock import patch
+
+import pytest
+
+from src.analysis.volatility import VolatilityCalculator
+from src.analysis.volatility_models import PriceData
+from src.analysis.volatility_state import VolatilityState
+from src.server.database.models.volatility_state import SymbolVolatilityState
+from src.server.repositories.volatility_state import VolatilityStateRepository
+from src.server.services.volatility_service import VolatilityStateService
+
+
+class FakePriceFetcher:
+    """Serves the last lookback_days bars of a fixed history up to a movable 'today'."""
+
+    def __init__(self, n: int = 200):
+        rng = random.Random(5)
+        price = 80.0
+        self.closes = []
+        for _ in range(n):
+            price *= math.exp(rng.gauss(0, 0.02))
+            self.closes.append(price)
+        self.dates = [f"2025-{i // 28 + 1:02d}-{i % 28 + 1:02d}" for i in range(n)]
+        self.today = 120
+        self.calls = []
+
+    def fetch_price_data(self, symbol, lookback_days=60):
+        self.calls.append((symbol, lookback_days))
+        start = max(0, self.today - lookback_days)
+        return PriceData(dates=self.dates[start : self.today], closes=self.closes[start : self.today])
+
+
+@pytest.fixture
+def fetcher():
+    return FakePriceFetcher()
+
+
+@pytest.fixture
+def service(test_db, fetcher):
+    return VolatilityStateService(test_db, price_fetcher=fetcher)
+
+
+def expected_volatility(fetcher: FakePriceFetcher) -> float:
+    """20-day close-to-close volatility from a full recompute."""
+    closes = fetcher.closes[: fetcher.today]
+    return VolatilityCalculator().calculate_close_to_close(closes, window=20).volatility
+
+
+class TestVolatilityStateRepository:
+    """Tests for persisting VolatilityState."""
+
+    def test_save_and_load(self, test_db, fetcher):
+        repo = VolatilityStateRepository(test_db)
+        state = VolatilityState.from_price_data(
+            PriceData(dates=fetcher.dates[:80], closes=fetcher.closes[:80])
+        )
+
+        assert repo.save_states({"AAPL": state}) == 1
+        loaded = repo.get_states(["AAPL", "MSFT"])
+
+        assert list(loaded) == ["AAPL"]
+        assert loaded["AAPL"].to_dict() == pytest.approx(state.to_dict())
+
+    def test_save_updates_existing_row(self, test_db):
+        repo = VolatilityStateRepository(test_db)
+        state = VolatilityState()
+        state.update("2025-01-01", 100.0)
+        repo.save_states({"AAPL": state})
+
+        state.update("2025-01-02", 101.0)
+        repo.save_states({"AAPL": state})
+
+        assert test_db.query(SymbolVolatilityState).count() == 1
+        assert repo.get_by_symbol("aapl").last_date == "2025-01-02"
+
+    def test_delete(self, test_db):
+        repo = VolatilityStateRepository(test_db)
+        repo.save_states({"AAPL": VolatilityState()})
+
+        assert repo.delete("AAPL") is True
+        assert repo.delete("AAPL") is False
+
+
+class TestVolatilityStateService:
+    """Tests for incremental volatility across runs."""
+
+    def test_first_run_builds_state(self, service, fetcher):
+        result = service.get_volatilities(["AAPL"])
+
+        assert result["AAPL"] == pytest.approx(expected_volatility(fetcher), rel=1e-9)
+        assert fetcher.calls == [("AAPL", service.rebuild_lookback_days)]
+        assert service.repo.get_by_symbol("AAPL").last_date == fetcher.dates[119]
+
+    def test_next_run_applies_only_new_bars(self, service, fetcher):
+        service.get_volatilities(["AAPL"])
+        fetcher.today += 1
+        fetcher.calls.clear()
+
+        result = service.get_volatilities(["AAPL"])
+
+        assert fetcher.calls == [("AAPL", 10)]
+        assert result["AAPL"] == pytest.approx(expected_volatility(fetcher), rel=1e-9)
+        assert service.repo.get_by_symbol("AAPL").bars == 91
+
+    def test_partial_bar_waits_for_close(self, service, fetcher):
+        service.get_volatilities(["AAPL"])
+        final_close = fetcher.closes[120]
+        fetcher.closes[120] = final_close * 1.05
+        fetcher.today += 1
+
+        with patch(
+            "src.server.services.volatility_service.get_open_session_date",
+            return_value=fetcher.dates[120],
+        ):
+            intraday = service.get_volatilities(["AAPL"])
+
+        assert service.repo.get_by_symbol("AAPL").last_date == fetcher.dates[119]
+        fetcher.today -= 1
+        assert intraday["AAPL"] == pytest.approx(expected_volatility(fetcher), rel=1e-9)
+
+        fetcher.closes[120] = final_close
+        fetcher.today += 1
+        with patch(
+            "src.server.services.volatility_service.get_open_session_date", return_value=None
+        ):
+            result = service.get_volatilities(["AAPL"])
+
+        assert service.repo.get_by_symbol("AAPL").last_date == fetcher.dates[120]
+        assert result["AAPL"] == pytest.approx(expected_volatility(fetcher), rel=1e-9)
+
+    def test_stale_state_is_rebuilt(self, service, fetcher):
+        service.get_volatilities(["AAPL"])
+        fetcher.today += 30
+        fetcher.calls.clear()
+
+        result = service.get_volatilities(["AAPL"])
+
+        assert fetcher.calls == [("AAPL", 10), ("AAPL", service.rebuild_lookback_days)]
+        assert result["AAPL"] == pytest.approx(expected_volatility(fetcher), rel=1e-9)
+
+    def test_rebuild_many_matches_full_recompute(self, service, fetcher):
+        results = service.rebuild_many(["AAPL", "MSFT", "NVDA"], workers=2)
+
+        assert list(results) == ["AAPL", "MSFT", "NVDA"]
+        reference = service._full_recompute("AAPL").to_dict()
+        for state, volatility in results.values():
+            assert volatility == pytest.approx(expected_volatility(fetcher), rel=1e-9)
+            assert state.to_dict() == pytest.approx(reference)
+
+    def test_new_symbols_are_rebuilt_together(self, service, fetcher):
+        service.get_volatilities(["AAPL"])
+        fetcher.today += 1
+        fetcher.calls.clear()
+
+        with patch.object(service, "rebuild_many", wraps=service.rebuild_many) as rebuild_many:
+            result = service.get_volatilities(["AAPL", "MSFT"])
+
+        rebuild_many.assert_called_once_with(["MSFT"])
+        assert sorted(fetcher.calls) == [("AAPL", 10), ("MSFT", service.rebuild_lookback_days)]
+        assert result["MSFT"] == pytest.approx(result["AAPL"], rel=1e-9)
+        assert service.repo.get_by_symbol("MSFT").last_date == fetcher.dates[120]
+
+    def test_validate_matches_full_recompute(self, service, fetcher):
+        service.get_volatilities(["AAPL"])
+        for _ in range(15):
+            fetcher.today += 1
+            service.get_volatilities(["AAPL"])
+
+        report = service.validate("AAPL")
+
+        assert report["last_date"] == fetcher.dates[fetcher.today - 1]
+        assert report["max_abs_diff"] < 1e-12
+        assert "ewma" in report["stored"]
+
+    def test_validate_without_state(self, service):
+        with pytest.raises(ValueError, match="No volatility state stored"):
+            service.validate("AAPL")
+
+    def test_rebuild(self, service, fetcher):
+        state = service.rebuild("aapl")
+
+        assert state.bars == service.rebuild_lookback_days
+        assert service.repo.get_by_symbol("AAPL") is not None
+
+    def test_failed_symbol_is_omitted(self, service, fetcher):
+        fetcher.today = 5
+
+        assert service.get_volatilities(["AAPL"]) == {}
+
+    def test_no_price_fetcher(self, test_db):
+        assert VolatilityStateService(test_db).get_volatilities(["AAPL"]) == {}
@@ -1,14 +1,52 @@
 """Tests for WatchlistService."""
 
+import threading
+
 import pytest
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
 
+from src.api.circuit_breaker import CircuitState
+from src.models.base import OptionContract, OptionsChain
 from src.server.database.models.watchlist import WatchlistItem
 from src.server.repositories.watchlist import WatchlistRepository
+from src.server.models.watchlist import ScanResultResponse
 from src.server.repositories.opportunity import OpportunityRepository
 from src.server.services.watchlist_service import WatchlistService
 from src.wheel.models import WheelRecommendation
+from src.wheel.recommend import ScanInputs
+
+
+def _inputs(price=155.0, volatility=0.3, bid=2.50, far_bid=0.10):
+    expiration = (date.today() + timedelta(days=30)).isoformat()
+    contracts = [
+        # ~3 sigma: outside every default profile band
+        OptionContract("AAPL", 120.0, expiration, "Put", bid=far_bid, ask=far_bid + 0.05),
+        OptionContract("AAPL", 145.0, expiration, "Put", bid=bid, ask=bid + 0.15),
+        OptionContract("AAPL", 165.0, expiration, "Call", bid=1.80, ask=2.00),
+    ]
+    chain = OptionsChain("AAPL", contracts, retrieved_at=datetime.now().isoformat())
+    return ScanInputs(current_price=price, volatility=volatility, options_chain=chain)
+
+
+def _recommendation(symbol="AAPL"):
+    return WheelRecommendation(
+        symbol=symbol,
+        direction="put",
+        strike=150.0,
+        expiration_date="2026-03-20",
+        premium_per_share=2.50,
+        contracts=1,
+        total_premium=250.0,
+        sigma_distance=1.7,
+        p_itm=0.12,
+        annualized_yield_pct=18.5,
+        bias_score=0.75,
+        dte=30,
+        current_price=155.0,
+        bid=2.50,
+        ask=2.65,
+    )
 
 
 class TestWatchlistService:
@@ -21,6 +59,12 @@ class TestWatchlistService:
             with patch("src.server.services.watchlist_service.SchwabPriceDataFetcher"):
                 svc = WatchlistService(test_db, schwab_client=Mock())
                 svc.recommend_engine = Mock()
+                svc.recommend_engine.fetch_scan_inputs.return_value = _inputs()
+                svc.volatility_service = Mock()
+                svc.volatility_service.load_states.return_value = {}
+                svc.volatility_service.needs_rebuild.return_value = False
+                svc.volatility_service.rebuild_many.return_value = {}
+                svc.volatility_service.advance.side_effect = ValueError("no history")
                 return svc
 
     def test_add_symbol(self, service):
@@ -98,6 +142,288 @@ class TestWatchlistService:
         assert result["symbols_scanned"] == 1
         assert result["opportunities_found"] == 0
 
+    def test_scan_all_advances_volatility_state(self, service):
+        for symbol in ("AAPL", "MSFT"):
+            service.add_symbol(symbol)
+        stored = {"AAPL": Mock()}
+        advanced = {"AAPL": Mock(), "MSFT": Mock()}
+        service.volatility_service.load_states.return_value = stored
+        service.volatility_service.advance.side_effect = lambda symbol, state: (
+            advanced[symbol],
+            {"AAPL": 0.25, "MSFT": 0.4}[symbol],
+        )
+        service.recommend_engine.scan_opportunities.return_value = []
+
+        service.scan_all()
+
+        service.volatility_service.load_states.assert_called_once_with(["AAPL", "MSFT"])
+        assert {c.args for c in service.volatility_service.advance.call_args_list} == {
+            ("AAPL", stored["AAPL"]),
+            ("MSFT", None),
+        }
+        service.volatility_service.save_states.assert_called_once_with(advanced)
+        calls = service.recommend_engine.fetch_scan_inputs.call_args_list
+        assert {c.kwargs["symbol"]: c.kwargs["volatility"] for c in calls} == {
+            "AAPL": 0.25,
+            "MSFT": 0.4,
+        }
+
+    def test_scan_all_rebuilds_missing_states_in_one_batch(self, service):
+        for symbol in ("AAPL", "MSFT", "NVDA"):
+            service.add_symbol(symbol)
+        stored = {"AAPL": Mock()}
+        advanced = Mock()
+        rebuilt = {"MSFT": Mock(), "NVDA": Mock()}
+        service.volatility_service.load_states.return_value = stored
+        service.volatility_service.needs_rebuild.side_effect = lambda state: state is None
+        service.volatility_service.rebuild_many.return_value = {
+            "MSFT": (rebuilt["MSFT"], 0.4),
+            "NVDA": (rebuilt["NVDA"], 0.5),
+        }
+        service.volatility_service.advance.side_effect = lambda symbol, state: (advanced, 0.25)
+        service.recommend_engine.scan_opportunities.return_value = []
+
+        service.scan_all(fetch_workers=3)
+
+        service.volatility_service.rebuild_many.assert_called_once_with(
+            ["MSFT", "NVDA"], workers=3
+        )
+        service.volatility_service.advance.assert_called_once_with("AAPL", stored["AAPL"])
+        service.volatility_service.save_states.assert_called_once_with(
+            {"AAPL": advanced, **rebuilt}
+        )
+        calls = service.recommend_engine.fetch_scan_inputs.call_args_list
+        assert {c.kwargs["symbol"]: c.kwargs["volatility"] for c in calls} == {
+            "AAPL": 0.25,
+            "MSFT": 0.4,
+            "NVDA": 0.5,
+        }
+
+    def test_scan_all_estimates_volatility_when_state_fails(self, service):
+        for symbol in ("AAPL", "MSFT"):
+            service.add_symbol(symbol)
+        state = Mock()
+
+        def advance(symbol, stored):
+            if symbol == "MSFT":
+                raise ValueError("no history")
+            return state, 0.22
+
+        service.volatility_service.advance.side_effect = advance
+        service.recommend_engine.scan_opportunities.return_value = []
+
+        service.scan_all()
+
+        service.volatility_service.save_states.assert_called_once_with({"AAPL": state})
+        calls = service.recommend_engine.fetch_scan_inputs.call_args_list
+        assert {c.kwargs["symbol"]: c.kwargs["volatility"] for c in calls} == {
+            "AAPL": 0.22,
+            "MSFT": None,
+        }
+
+    def test_scan_all_times_out_slow_volatility(self, service):
+        for symbol in ("AAPL", "SLOW"):
+            service.add_symbol(symbol)
+        release = threading.Event()
+
+        def advance(symbol, stored):
+            if symbol == "SLOW":
+                release.wait(5)
+            return Mock(), 0.3
+
+        service.volatility_service.advance.side_effect = advance
+        service.recommend_engine.scan_opportunities.return_value = [_recommendation()]
+        try:
+            result = service.scan_all(symbol_timeout=0.2)
+        finally:
+            release.set()
+
+        assert set(result["errors"]) == {"SLOW"}
+        assert "Timed out" in result["errors"]["SLOW"]
+        assert result["opportunities_found"] == 1
+
+    def test_scan_all_passes_prefetched_chains(self, service):
+        for symbol in ("AAPL", "MSFT"):
+            service.add_symbol(symbol)
+        chain = Mock()
+        service.recommend_engine.prefetch_options_chains.return_value = {"AAPL": chain}
+        service.recommend_engine.scan_opportunities.return_value = []
+
+        service.scan_all()
+
+        service.recommend_engine.prefetch_options_chains.assert_called_once_with(
+            ["AAPL", "MSFT"], max_dte=45
+        )
+        calls = service.recommend_engine.fetch_scan_inputs.call_args_list
+        assert {c.kwargs["symbol"]: c.kwargs["options_chain"] for c in calls} == {
+            "AAPL": chain,
+            "MSFT": None,
+        }
+
+    def test_scan_all_scores_fetched_inputs(self, service):
+        service.add_symbol("AAPL")
+        inputs = _inputs()
+        service.recommend_engine.fetch_scan_inputs.return_value = inputs
+        service.recommend_engine.scan_opportunities.return_value = []
+
+        service.scan_all()
+
+        kwargs = service.recommend_engine.scan_opportunities.call_args.kwargs
+        assert kwargs["current_price"] == 155.0
+        assert kwargs["volatility"] == 0.3
+        assert kwargs["options_chain"] is inputs.options_chain
+
+    def test_scan_all_passes_top_k(self, service):
+        service.add_symbol("AAPL")
+        service.recommend_engine.scan_opportunities.return_value = []
+
+        service.scan_all(top_k=3)
+
+        assert service.recommend_engine.scan_opportunities.call_args.kwargs["top_k"] == 3
+
+    def test_scan_all_reports_timings(self, service):
+        service.add_symbol("AAPL")
+        service.recommend_engine.scan_opportunities.return_value = [_recommendation()]
+
+        result = service.scan_all()
+
+        assert set(result["timings"]) == {"prepare", "fetch", "score", "write", "total"}
+        assert all(seconds >= 0 for seconds in result["timings"].values())
+        assert result["timings"]["total"] >= result["timings"]["prepare"]
+        ScanResultResponse(**result)
+
+    def test_scan_all_fetches_symbols_concurrently(self, service):
+        symbols = ("AAPL", "MSFT", "NVDA", "AMD")
+        for symbol in symbols:
+            service.add_symbol(symbol)
+        barrier = threading.Barrier(len(symbols), timeout=5)
+
+        def fetch(**kwargs):
+            barrier.wait()  # Only passes if every fetch is in flight at once
+            return _inputs()
+
+        service.recommend_engine.fetch_scan_inputs.side_effect = fetch
+        service.recommend_engine.scan_opportunities.return_value = []
+
+        result = service.scan_all(fetch_workers=len(symbols))
+
+        assert result["errors"] == {}
+        assert service.recommend_engine.scan_opportunities.call_count == len(symbols)
+
+    def test_scan_all_times_out_slow_symbol(self, service):
+        for symbol in ("AAPL", "SLOW"):
+            service.add_symbol(symbol)
+        release = threading.Event()
+
+        def fetch(symbol, **kwargs):
+            if symbol == "SLOW":
+                release.wait(5)
+            return _inputs()
+
+        service.recommend_engine.fetch_scan_inputs.side_effect = fetch
+        service.recommend_engine.scan_opportunities.return_value = [_recommendation()]
+        try:
+            result = service.scan_all(symbol_timeout=0.2)
+        finally:
+            release.set()
+
+        assert set(result["errors"]) == {"SLOW"}
+        assert "Timed out" in result["errors"]["SLOW"]
+        assert result["opportunities_found"] == 1
+        assert len(service.get_opportunities()) == 1
+
+    def test_scan_all_writes_in_batches(self, service):
+        for symbol in ("AAPL", "MSFT", "NVDA"):
+            service.add_symbol(symbol)
+        service.recommend_engine.scan_opportunities.side_effect = (
+            lambda symbol, **kwargs: [_recommendation(symbol), _recommendation(symbol)]
+        )
+
+        with patch.object(
+            service.opportunity_repo, "bulk_create", wraps=service.opportunity_repo.bulk_create
+        ) as bulk_create:
+            result = service.scan_all(write_batch_size=4)
+
+        # 6 opportunities: one batch once 4 are pending, the rest at the end
+        assert [len(call.args[0]) for call in bulk_create.call_args_list] == [4, 2]
+        assert result["opportunities_found"] == 6
+        assert len(service.get_opportunities()) == 6
+
+    def test_scan_all_reuses_unchanged_symbols(self, service):
+        service.add_symbol("AAPL")
+        service.recommend_engine.scan_opportunities.return_value = [_recommendation()]
+        service.scan_all()
+        first = service.get_opportunities()[0]
+        service.mark_read(first.id)
+
+        result = service.scan_all()
+
+        assert result["symbols_skipped"] == 1
+        assert result["opportunities_found"] == 0
+        assert service.recommend_engine.scan_opportunities.call_count == 1
+        (opp,) = service.get_opportunities()
+        assert opp.id == first.id
+        assert opp.is_read is True
+        assert opp.scanned_at == service.watchlist_repo.get_by_symbol("AAPL").scanned_at
+
+    def test_scan_all_rescans_changed_symbols(self, service):
+        service.add_symbol("AAPL")
+        service.recommend_engine.scan_opportunities.return_value = [_recommendation()]
+        service.scan_all()
+
+        service.recommend_engine.fetch_scan_inputs.return_value = _inputs(bid=2.60)
+        result = service.scan_all()
+
+        assert result["symbols_skipped"] == 0
+        assert result["opportunities_found"] == 1
+        assert service.recommend_engine.scan_opportunities.call_count == 2
+
+    def test_scan_all_skips_out_of_band_quote_changes(self, service):
+        service.add_symbol("AAPL")
+        service.recommend_engine.scan_opportunities.return_value = [_recommendation()]
+        service.scan_all()
+
+        service.recommend_engine.fetch_scan_inputs.return_value = _inputs(far_bid=0.35)
+        result = service.scan_all()
+
+        assert result["symbols_skipped"] == 1
+        assert service.recommend_engine.scan_opportunities.call_count == 1
+
+    def test_scan_all_force_rescans_unchanged_symbols(self, service):
+        service.add_symbol("AAPL")
+        service.recommend_engine.scan_opportunities.return_value = []
+        service.scan_all()
+
+        result = service.scan_all(force=True)
+
+        assert result["symbols_skipped"] == 0
+        assert service.recommend_engine.scan_opportunities.call_count == 2
+
+    def test_scan_all_rescans_after_error(self, service):
+        service.add_symbol("AAPL")
+        service.recommend_engine.scan_opportunities.side_effect = Exception("API error")
+        service.scan_all()
+
+        service.recommend_engine.scan_opportunities.side_effect = None
+        service.recommend_engine.scan_opportunities.return_value = []
+        result = service.scan_all()
+
+        assert result["symbols_skipped"] == 0
+        assert result["errors"] == {}
+
+    def test_scan_all_skipped_while_circuit_open(self, service):
+        for symbol in ("AAPL", "MSFT"):
+            service.add_symbol(symbol)
+        service._schwab.circuit_state.return_value = CircuitState.OPEN
+
+        result = service.scan_all()
+
+        assert result["symbols_scanned"] == 0
+        assert result["opportunities_found"] == 0
+        assert set(result["errors"]) == {"AAPL", "MSFT"}
+        service.recommend_engine.prefetch_options_chains.assert_not_called()
+        service.recommend_engine.scan_opportunities.assert_not_called()
+
     def test_get_unread_count(self, service):
         assert service.get_unread_count() == 0
 
@@ -0,0 +1,75 @@
+"""Unit tests for the asyncio Finnhub client."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.config import FinnhubConfig
+from src.market_data.async_finnhub_client import AsyncFinnhubClient
+from src.market_data.finnhub_client import FinnhubAPIError
+
+
+@pytest.fixture
+def config():
+    """Create test configuration."""
+    return FinnhubConfig(api_key="test_api_key", timeout=5, max_retries=1, retry_delay=0.01)
+
+
+def run(client: AsyncFinnhubClient, coro_fn):
+    """Run a coroutine against a client and close it."""
+
+    async def main():
+        async with client:
+            return await coro_fn(client)
+
+    return asyncio.run(main())
+
+
+class TestAsyncFinnhubClient:
+    """Test suite for AsyncFinnhubClient."""
+
+    def test_gather_chains(self, config):
+        """Chains for every symbol are returned, keyed by symbol."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.params["token"] == "test_api_key"
+            return httpx.Response(200, json={"code": request.url.params["symbol"], "data": []})
+
+        client = AsyncFinnhubClient(config, transport=httpx.MockTransport(handler))
+        chains = run(client, lambda c: c.gather_chains(["F", "AAPL"]))
+
+        assert chains == {"F": {"code": "F", "data": []}, "AAPL": {"code": "AAPL", "data": []}}
+
+    def test_status_errors_are_mapped(self, config):
+        """401/429 map to FinnhubAPIError; invalid symbols are reported per symbol."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(429)
+
+        client = AsyncFinnhubClient(config, transport=httpx.MockTransport(handler))
+        chains = run(client, lambda c: c.gather_chains(["F", "BRK.B"]))
+
+        assert isinstance(chains["F"], FinnhubAPIError)
+        assert "Rate limit" in str(chains["F"])
+        assert isinstance(chains["BRK.B"], ValueError)
+
+    def test_get_candle_data_uses_shared_parser(self, config):
+        """Candle responses are parsed as by FinnhubClient."""
+        body = {
+            "s": "ok",
+            "t": [1704153600, 1704240000],
+            "o": [10.0, 10.5],
+            "h": [11.0, 11.5],
+            "l": [9.5, 10.0],
+            "c": [10.5, 11.0],
+            "v": [1000, 2000],
+        }
+        client = AsyncFinnhubClient(
+            config, transport=httpx.MockTransport(lambda request: httpx.Response(200, json=body))
+        )
+
+        data = run(client, lambda c: c.get_candle_data("F", lookback_days=2))
+
+        assert data.closes == [10.5, 11.0]
+        assert data.volumes == [1000, 2000]
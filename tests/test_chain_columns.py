@@ -0,0 +1,200 @@
+"""Tests for the columnar options chain representation."""
+
+import math
+import pickle
+
+import numpy as np
+import pytest
+
+from src.models import ChainSlice, ColumnarChain, OptionContract, OptionsChain
+
+
+def _contract(strike, expiration, option_type, bid=1.0, **kwargs):
+    return OptionContract(
+        symbol="SPY",
+        strike=strike,
+        expiration_date=expiration,
+        option_type=option_type,
+        bid=bid,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def contracts():
+    """Unsorted contracts over two expirations."""
+    return [
+        _contract(110.0, "2026-12-18", "Put", ask=1.2, volume=10),
+        _contract(100.0, "2026-11-20", "Call", ask=2.1),
+        _contract(105.0, "2026-11-20", "Put", bid=None),
+        _contract(95.0, "2026-11-20", "Put", open_interest=250),
+        _contract(105.0, "2026-11-20", "Call"),
+        _contract(100.0, "2026-12-18", "Put"),
+        _contract(95.0, "2026-11-20", "Call", implied_volatility=0.25),
+    ]
+
+
+class TestColumnarChain:
+    """Tests for ColumnarChain."""
+
+    def test_groups_sorted_by_strike(self, contracts):
+        """Each (type, expiration) slice is strike-sorted."""
+        columns = ColumnarChain.from_contracts("SPY", contracts)
+
+        calls = columns.slice("call", "2026-11-20")
+        puts = columns.slice("PUT", "2026-11-20")
+
+        assert calls.strike.tolist() == [95.0, 100.0, 105.0]
+        assert puts.strike.tolist() == [95.0, 105.0]
+        assert columns.expirations == ["2026-11-20", "2026-12-18"]
+        assert len(columns) == 7
+
+    def test_slices_are_views(self, contracts):
+        """Slice columns share memory with the chain arrays."""
+        columns = ColumnarChain.from_contracts("SPY", contracts)
+        view = columns.slice("call", "2026-11-20").bid
+        assert np.shares_memory(view, columns.columns["bid"])
+
+    def test_missing_values_are_nan(self, contracts):
+        """None fields become NaN in the columns."""
+        puts = ColumnarChain.from_contracts("SPY", contracts).slice("put", "2026-11-20")
+        assert math.isnan(puts.bid[1])
+        assert np.isnan(puts.delta).all()
+
+    def test_missing_group_is_empty(self, contracts):
+        """Unknown expirations give an empty slice."""
+        columns = ColumnarChain.from_contracts("SPY", contracts)
+        assert len(columns.slice("call", "2027-01-15")) == 0
+        assert [s.expiration_date for s in columns.slices("call")] == ["2026-11-20"]
+
+    def test_invalid_option_type(self, contracts):
+        """Option types other than call/put are rejected."""
+        columns = ColumnarChain.from_contracts("SPY", contracts)
+        with pytest.raises(ValueError, match="call"):
+            columns.slice("straddle", "2026-11-20")
+
+    def test_strike_range(self, contracts):
+        """strike_range narrows by binary search, inclusive on both ends."""
+        calls = ColumnarChain.from_contracts("SPY", contracts).slice("call", "2026-11-20")
+
+        assert calls.strike_range(100.0, 105.0).strike.tolist() == [100.0, 105.0]
+        assert calls.strike_range(low=101.0).strike.tolist() == [105.0]
+        assert calls.strike_range(high=94.0).strike.tolist() == []
+
+    def test_strike_range_requires_expiration(self, contracts):
+        """Type-wide slices span expirations and are not strike-sorted."""
+        columns = ColumnarChain.from_contracts("SPY", contracts)
+        with pytest.raises(ValueError):
+            columns.type_slice("put").strike_range(100.0, 110.0)
+
+    def test_materializes_original_contracts(self, contracts):
+        """Contracts built from objects come back as the same objects."""
+        calls = ColumnarChain.from_contracts("SPY", contracts).slice("call", "2026-11-20")
+        assert calls.contract(0) is contracts[6]
+        assert calls.contracts() == [contracts[6], contracts[1], contracts[4]]
+
+    def test_from_arrays_materializes_lazily(self):
+        """Contracts are built on request from raw columns and cached."""
+        columns = ColumnarChain.from_arrays(
+            "SPY",
+            expiration_dates=["2026-11-20", "2026-11-20", "2026-10-30"],
+            is_call=[False, True, True],
+            strike=[100.0, 105.0, 102.0],
+            bid=[1.5, np.nan, 0.8],
+            volume=[12, 3, np.nan],
+        )
+
+        first = columns.slice("call", "2026-10-30").contract(0)
+        assert first == OptionContract(
+            symbol="SPY",
+            strike=102.0,
+            expiration_date="2026-10-30",
+            option_type="Call",
+            bid=0.8,
+        )
+        assert columns.slice("call", "2026-10-30").contract(0) is first
+
+        put = columns.slice("put", "2026-11-20").contract(0)
+        assert put.volume == 12
+        assert isinstance(put.volume, int)
+        assert columns.slice("call", "2026-11-20").contract(0).bid is None
+
+    def test_from_arrays_rejects_unknown_fields(self):
+        """Unknown field names are an error."""
+        with pytest.raises(ValueError, match="Unknown"):
+            ColumnarChain.from_arrays("SPY", ["2026-11-20"], [True], strike=[1.0], greeks=[0])
+
+    def test_empty_chain(self):
+        """An empty chain has no slices."""
+        columns = ColumnarChain.from_contracts("SPY", [])
+        assert len(columns) == 0
+        assert columns.slices("call") == []
+        assert len(columns.type_slice("put")) == 0
+
+    def test_slice_repr(self, contracts):
+        """Slices describe their group."""
+        chain_slice = ColumnarChain.from_contracts("SPY", contracts).slice("put", "2026-12-18")
+        assert isinstance(chain_slice, ChainSlice)
+        assert repr(chain_slice) == "ChainSlice(SPY put 2026-12-18: 2 contracts)"
+
+
+class TestOptionsChainFacade:
+    """OptionsChain keeps its list API on top of the columns."""
+
+    @pytest.fixture
+    def chain(self, contracts):
+        return OptionsChain(symbol="SPY", contracts=contracts, retrieved_at="2026-10-16T00:00:00")
+
+    def test_get_calls_and_puts_keep_chain_order(self, chain, contracts):
+        """Facade lists match a linear scan of the contracts."""
+        assert chain.get_calls() == [c for c in contracts if c.is_call]
+        assert chain.get_puts() == [c for c in contracts if c.is_put]
+
+    def test_get_by_expiration(self, chain, contracts):
+        """get_by_expiration returns both types in chain order."""
+        expected = [c for c in contracts if c.expiration_date == "2026-11-20"]
+        assert chain.get_by_expiration("2026-11-20") == expected
+
+    def test_get_contracts(self, chain):
+        """get_contracts returns one group sorted by strike."""
+        strikes = [c.strike for c in chain.get_contracts("put", "2026-12-18")]
+        assert strikes == [100.0, 110.0]
+
+    def test_get_strikes(self, chain):
+        """Strikes are unique and sorted."""
+        assert chain.get_strikes() == [95.0, 100.0, 105.0, 110.0]
+        assert chain.get_strikes("2026-12-18") == [100.0, 110.0]
+
+    def test_columns_cached_and_rebuilt(self, chain):
+        """Columns are reused until the contracts list is replaced."""
+        first = chain.columns
+        assert chain.columns is first
+
+        chain.contracts = chain.contracts + [_contract(120.0, "2027-01-15", "Call")]
+        assert chain.columns is not first
+        assert chain.get_expirations()[-1] == "2027-01-15"
+
+    def test_columns_follow_version_not_identity(self, chain):
+        """A list appended to in place is picked up only after invalidate_columns()."""
+        first = chain.columns
+        chain.contracts.append(_contract(120.0, "2027-01-15", "Call"))
+        assert chain.columns is first
+
+        chain.invalidate_columns()
+        assert chain.get_expirations()[-1] == "2027-01-15"
+
+    def test_pickle_drops_columns(self, chain):
+        """Pickled chains carry the contracts only and rebuild their columns."""
+        assert len(chain.columns) == len(chain.contracts)
+        restored = pickle.loads(pickle.dumps(chain))
+
+        assert "_columns" not in restored.__dict__
+        assert restored == chain
+        assert restored.get_strikes() == chain.get_strikes()
+
+    def test_invalidate_columns(self, chain):
+        """In-place edits are picked up after invalidate_columns()."""
+        assert chain.columns.slice("put", "2026-12-18").bid.tolist() == [1.0, 1.0]
+        chain.contracts[0].bid = 9.0
+        chain.invalidate_columns()
+        assert chain.columns.slice("put", "2026-12-18").bid.tolist() == [1.0, 9.0]
@@ -0,0 +1,137 @@
+"""Tests for the on-disk option chain snapshot store."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.market_data.chain_store import ChainSnapshotStore
+from src.models import OptionContract, OptionsChain
+
+
+def _contract(strike, expiration, option_type, **kwargs):
+    return OptionContract(
+        symbol="SPY",
+        strike=strike,
+        expiration_date=expiration,
+        option_type=option_type,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def chain():
+    """Unsorted chain with missing fields and an IV source tag."""
+    return OptionsChain(
+        symbol="SPY",
+        contracts=[
+            _contract(110.0, "2026-12-18", "Put", bid=1.1, ask=1.2, volume=10),
+            _contract(100.0, "2026-11-20", "Call", bid=2.0, ask=2.1, open_interest=300),
+            _contract(105.0, "2026-11-20", "Put", bid=None, delta=-0.4),
+            _contract(
+                95.0, "2026-11-20", "Call", bid=6.0, implied_volatility=0.25, iv_source="solved"
+            ),
+        ],
+        retrieved_at="2026-10-16T14:30:00+00:00",
+        underlying_price=101.5,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ChainSnapshotStore(tmp_path / "chains")
+
+
+AT = datetime(2026, 10, 16, 14, 30, tzinfo=timezone.utc)
+
+
+class TestChainSnapshotStore:
+    """Tests for ChainSnapshotStore."""
+
+    def test_write_partitions_by_symbol_and_date(self, store, chain):
+        """Snapshots land under <root>/<SYMBOL>/<date>/ with a metadata file."""
+        snapshot = store.write(chain, fetched_at=AT, query={"strikeCount": 20})
+
+        assert snapshot.path.parent == store.root / "SPY" / "2026-10-16"
+        assert snapshot.path.suffix == ".npy"
+        assert snapshot.meta_path.exists()
+        meta = store.read_meta(snapshot)
+        assert meta["contracts"] == 4
+        assert meta["query"] == {"strikeCount": 20}
+        assert not list(snapshot.path.parent.glob("*.tmp"))
+
+    def test_round_trip(self, store, chain):
+        """A loaded chain has the same contracts, sorted by type, expiration and strike."""
+        store.write(chain, fetched_at=AT)
+
+        loaded = store.load_latest("SPY")
+
+        assert loaded.underlying_price == 101.5
+        assert loaded.retrieved_at == chain.retrieved_at
+        assert loaded.contracts == [chain.contracts[i] for i in (3, 1, 2, 0)]
+        assert loaded.contracts[0].iv_source == "solved"
+        assert loaded.contracts[2].bid is None
+        assert isinstance(loaded.contracts[3].volume, int)
+
+    def test_columns_are_memory_mapped(self, store, chain):
+        """Numeric columns are views into the mapped file."""
+        snapshot = store.write(chain, fetched_at=AT)
+
+        columns = store.load_columns(snapshot)
+        bid = columns.slice("call", "2026-11-20").bid
+
+        assert isinstance(columns.columns["bid"].base, np.memmap)
+        assert bid.tolist() == [6.0, 2.0]
+        assert not columns.columns["bid"].flags.writeable
+
+    def test_loaded_columns_attached(self, store, chain):
+        """OptionsChain.columns reuses the mapped columns and materialized contracts."""
+        store.write(chain, fetched_at=AT)
+        loaded = store.load_latest("SPY")
+
+        columns = loaded.columns
+        assert columns.slice("put", "2026-12-18").contract(0) is loaded.contracts[3]
+        assert loaded.get_strikes("2026-11-20") == [95.0, 100.0, 105.0]
+
+    def test_latest_as_of(self, store, chain):
+        """latest() picks the newest snapshot at or before the cutoff."""
+        first = store.write(chain, fetched_at=AT)
+        second = store.write(chain, fetched_at=AT + timedelta(days=1))
+
+        assert store.latest("spy") == second
+        assert store.latest("SPY", as_of=AT + timedelta(hours=1)) == first
+        assert store.latest("SPY", as_of=AT.replace(tzinfo=None)) == first
+        assert store.latest("SPY", as_of=AT - timedelta(seconds=1)) is None
+        assert store.snapshots("SPY", day="2026-10-17") == [second]
+
+    def test_same_timestamp_is_append_only(self, store, chain):
+        """Writes at the same instant never overwrite each other."""
+        first = store.write(chain, fetched_at=AT)
+        chain.underlying_price = 102.0
+        second = store.write(chain, fetched_at=AT)
+
+        assert first.path != second.path
+        assert store.snapshots("SPY") == [first, second]
+        assert store.load(second).underlying_price == 102.0
+
+    def test_incomplete_snapshots_ignored(self, store, chain):
+        """Snapshots without metadata are not listed."""
+        snapshot = store.write(chain, fetched_at=AT)
+        snapshot.meta_path.unlink()
+
+        assert store.snapshots("SPY") == []
+        assert store.load_latest("SPY") is None
+
+    def test_empty_chain(self, store):
+        """Empty chains are stored and loaded."""
+        empty = OptionsChain(symbol="XYZ", contracts=[], retrieved_at="2026-10-16T14:30:00")
+        store.write(empty, fetched_at=AT)
+
+        loaded = store.load_latest("XYZ")
+        assert loaded.contracts == []
+        assert loaded.get_expirations() == []
+
+    def test_unknown_symbol(self, store):
+        """Symbols without snapshots have no latest snapshot."""
+        assert store.snapshots("QQQ") == []
+        assert store.latest("QQQ") is None
@@ -0,0 +1,191 @@
+"""Tests for per-host circuit breakers and jittered retry delays."""
+
+from unittest import mock
+
+import pytest
+
+from src.api.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    CircuitState,
+    decorrelated_jitter,
+)
+from src.schwab.client import SchwabClient
+from src.schwab.exceptions import SchwabAPIError
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker("api.example.com", failure_threshold=3, recovery_timeout=30, clock=clock)
+
+
+def trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.before_request()
+        breaker.record_failure()
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request()
+        assert exc_info.value.host == "api.example.com"
+        assert exc_info.value.retry_after == 30
+
+    def test_success_resets_failure_count(self, breaker):
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_admits_one_probe(self, breaker, clock):
+        trip(breaker)
+        clock.now += 30
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_request()  # the probe
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_successful_probe_closes(self, breaker, clock):
+        trip(breaker)
+        clock.now += 30
+        breaker.before_request()
+
+        breaker.record_success()
+
+        assert breaker.state is CircuitState.CLOSED
+        breaker.before_request()
+
+    def test_failed_probe_reopens(self, breaker, clock):
+        trip(breaker)
+        clock.now += 30
+        breaker.before_request()
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.retry_after() == 30
+
+    def test_lost_probe_is_replaced(self, breaker, clock):
+        trip(breaker)
+        clock.now += 30
+        breaker.before_request()
+
+        clock.now += 30
+        breaker.before_request()  # no exception: a new probe is admitted
+
+    def test_rejects_bad_threshold(self):
+        with pytest.raises(ValueError):
+            CircuitBreaker("host", failure_threshold=0)
+
+
+class TestCircuitBreakerRegistry:
+    """Tests for CircuitBreakerRegistry."""
+
+    def test_one_breaker_per_host(self, clock):
+        registry = CircuitBreakerRegistry(failure_threshold=1, clock=clock)
+        schwab = registry.get("api.schwabapi.com")
+
+        assert registry.get("api.schwabapi.com") is schwab
+        schwab.record_failure()
+        assert registry.get("finnhub.io").state is CircuitState.CLOSED
+        assert registry.states() == {
+            "api.schwabapi.com": CircuitState.OPEN,
+            "finnhub.io": CircuitState.CLOSED,
+        }
+
+
+class TestDecorrelatedJitter:
+    """Tests for decorrelated_jitter()."""
+
+    def test_bounds(self):
+        previous = 1.0
+        for _ in range(50):
+            delay = decorrelated_jitter(1.0, previous, cap=10.0)
+            assert 1.0 <= delay <= min(10.0, previous * 3)
+            previous = delay
+
+    def test_capped(self):
+        assert decorrelated_jitter(1.0, 100.0, cap=10.0, rng=lambda low, high: high) == 10.0
+
+
+class TestClientCircuitBreaking:
+    """BaseAPIClient fails fast once the host's circuit opens."""
+
+    @pytest.fixture
+    def client(self, clock):
+        oauth = mock.Mock()
+        oauth.get_authorization_header.return_value = {"Authorization": "Bearer test_token"}
+        return SchwabClient(
+            oauth_coordinator=oauth,
+            max_retries=3,
+            retry_delay=0,
+            enable_cache=False,
+            circuit_breakers=CircuitBreakerRegistry(failure_threshold=3, clock=clock),
+        )
+
+    @mock.patch("src.api.base_client.time.sleep")
+    @mock.patch("src.schwab.client.requests.Session.request")
+    def test_outage_fails_fast(self, mock_request, mock_sleep, client):
+        response = mock.Mock(status_code=503, ok=False, text="Service Unavailable")
+        mock_request.return_value = response
+
+        # The first call opens the circuit partway through its retry ladder
+        with pytest.raises(SchwabAPIError, match="Circuit open"):
+            client._request("GET", "/quotes")
+        assert mock_request.call_count == 3
+        assert client.circuit_state() is CircuitState.OPEN
+
+        # Later calls do not reach the network at all
+        with pytest.raises(SchwabAPIError, match="Circuit open"):
+            client._request("GET", "/quotes")
+        assert mock_request.call_count == 3
+
+    @mock.patch("src.api.base_client.time.sleep")
+    @mock.patch("src.schwab.client.requests.Session.request")
+    def test_recovers_after_probe(self, mock_request, mock_sleep, client, clock):
+        mock_request.return_value = mock.Mock(status_code=503, ok=False, text="down")
+        with pytest.raises(SchwabAPIError):
+            client._request("GET", "/quotes")
+
+        clock.now += 30
+        ok = mock.Mock(status_code=200, ok=True)
+        ok.json.return_value = {}
+        mock_request.return_value = ok
+
+        client._request("GET", "/quotes")
+
+        assert client.circuit_state() is CircuitState.CLOSED
+
+    def test_no_breakers_reads_closed(self):
+        client = SchwabClient(oauth_coordinator=mock.Mock())
+        assert client.circuit_state() is CircuitState.CLOSED
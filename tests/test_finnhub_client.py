@@ -192,12 +192,10 @@ class TestFinnhubClient:
             with contextlib.suppress(requests.exceptions.Timeout):
                 client._make_request_with_retry("GET", "https://test.com", params={"param": "value"})
 
-            # Should have called sleep with exponential backoff
-            # First retry: 0.1 * 2^0 = 0.1
-            # We configured max_retries=2, so only 1 sleep call
+            # First retry: jittered between the base delay and three times it
             calls = mock_sleep.call_args_list
             assert len(calls) >= 1
-            assert calls[0][0][0] == 0.1
+            assert 0.1 <= calls[0][0][0] <= 0.3
 
     def test_close(self, client):
         """Test client cleanup."""
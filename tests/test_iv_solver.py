@@ -0,0 +1,280 @@
+"""Tests for the batch implied volatility solver."""
+
+import math
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from src.models import OptionContract, OptionsChain
+from src.strategies.iv_solver import (
+    IV_SOURCE_PROVIDER,
+    IV_SOURCE_SOLVED,
+    STATUS_ABOVE_BOUNDS,
+    STATUS_BELOW_BOUNDS,
+    STATUS_CONVERGED,
+    STATUS_INVALID_INPUT,
+    STATUS_NO_QUOTE,
+    ImpliedVolatilitySolver,
+    black_scholes_price,
+)
+
+RATE = 0.05
+
+
+def _bs(spot, strike, days, vol, is_call):
+    """Scalar Black-Scholes price for building test quotes."""
+    price, _ = black_scholes_price(
+        np.array([spot], dtype=float),
+        np.array([strike], dtype=float),
+        np.array([days / 365.0]),
+        np.array([vol]),
+        np.array([is_call]),
+        RATE,
+    )
+    return float(price[0])
+
+
+@pytest.fixture
+def solver():
+    """Create a solver with a fixed risk-free rate."""
+    return ImpliedVolatilitySolver(risk_free_rate=RATE)
+
+
+class TestBlackScholesPrice:
+    """Tests for the vectorized pricer."""
+
+    def test_put_call_parity(self):
+        """Call minus put equals S - K*exp(-rT)."""
+        call = _bs(100, 105, 30, 0.3, True)
+        put = _bs(100, 105, 30, 0.3, False)
+        assert call - put == pytest.approx(100 - 105 * math.exp(-RATE * 30 / 365), abs=1e-10)
+
+    def test_known_value(self):
+        """Matches a textbook Black-Scholes value."""
+        # S=100, K=100, T=1, r=5%, sigma=20% -> call 10.4506
+        price, vega = black_scholes_price(
+            np.array([100.0]), np.array([100.0]), np.array([1.0]),
+            np.array([0.2]), np.array([True]), RATE,
+        )
+        assert price[0] == pytest.approx(10.4506, abs=1e-4)
+        assert vega[0] == pytest.approx(37.524, abs=1e-3)
+
+
+class TestSolve:
+    """Tests for ImpliedVolatilitySolver.solve."""
+
+    def test_round_trip(self, solver):
+        """Solving model prices recovers the input volatility."""
+        strikes = np.array([97.0, 95.0, 100.0, 105.0, 120.0, 90.0, 102.0])
+        vols = np.array([0.15, 0.25, 0.35, 0.5, 0.8, 1.5, 0.05])
+        is_call = np.array([True, False, True, False, True, False, True])
+        days = np.array([7, 14, 30, 45, 60, 90, 180])
+        prices, _ = black_scholes_price(
+            np.full(7, 100.0), strikes, days / 365.0, vols, is_call, RATE
+        )
+
+        result = solver.solve(prices, 100.0, strikes, days, is_call)
+
+        assert result.converged.all()
+        np.testing.assert_allclose(result.implied_volatility, vols, rtol=1e-5)
+        assert (result.price_error <= solver.price_tolerance).all()
+        assert result.status_counts() == {STATUS_CONVERGED: 7}
+
+    def test_matches_scalar_solves(self, solver):
+        """Batch results equal solving each contract on its own."""
+        strikes = [90.0, 100.0, 110.0]
+        prices = [12.0, 3.5, 0.6]
+        batch = solver.solve(prices, 100.0, strikes, 30, True)
+        for i in range(3):
+            single = solver.solve([prices[i]], 100.0, [strikes[i]], 30, True)
+            assert single.implied_volatility[0] == batch.implied_volatility[i]
+
+    def test_no_quote(self, solver):
+        """Missing or zero prices are reported, not solved."""
+        result = solver.solve([math.nan, 0.0], 100.0, 100.0, 30, True)
+        assert not result.converged.any()
+        assert list(result.status) == [STATUS_NO_QUOTE, STATUS_NO_QUOTE]
+        assert np.isnan(result.implied_volatility).all()
+
+    def test_invalid_inputs(self, solver):
+        """Non-positive strikes or spot are rejected."""
+        result = solver.solve([1.0, 1.0], [100.0, -1.0], [0.0, 100.0], 30, True)
+        assert list(result.status) == [STATUS_INVALID_INPUT, STATUS_INVALID_INPUT]
+
+    def test_below_intrinsic(self, solver):
+        """A price below intrinsic value has no implied volatility."""
+        result = solver.solve([5.0], 120.0, 100.0, 30, True)
+        assert result.status[0] == STATUS_BELOW_BOUNDS
+        assert not result.converged[0]
+
+    def test_above_max_volatility(self, solver):
+        """A call priced near the spot exceeds the volatility bracket."""
+        result = solver.solve([99.0], 100.0, 100.0, 30, True)
+        assert result.status[0] == STATUS_ABOVE_BOUNDS
+
+    def test_diagnostics(self, solver):
+        """Iterations are counted per contract and bounded."""
+        prices, _ = black_scholes_price(
+            np.array([100.0]), np.array([100.0]), np.array([30 / 365]),
+            np.array([0.3]), np.array([True]), RATE,
+        )
+        result = solver.solve(prices, 100.0, 100.0, 30, True)
+        assert 1 <= result.iterations[0] <= 10
+        assert len(result) == 1
+
+    def test_invalid_bracket(self):
+        """min_volatility must be below max_volatility."""
+        with pytest.raises(ValueError):
+            ImpliedVolatilitySolver(min_volatility=1.0, max_volatility=0.5)
+
+    def test_zero_rate_is_kept(self):
+        """An explicit 0% rate is not replaced by the default."""
+        assert ImpliedVolatilitySolver(risk_free_rate=0.0).risk_free_rate == 0.0
+
+    def test_full_chain_performance(self, solver):
+        """Thousands of contracts solve well under a second."""
+        rng = np.random.default_rng(7)
+        n = 5000
+        strikes = rng.uniform(50, 150, n)
+        days = rng.integers(1, 365, n)
+        vols = rng.uniform(0.1, 1.0, n)
+        is_call = rng.random(n) < 0.5
+        prices, _ = black_scholes_price(
+            np.full(n, 100.0), strikes, days / 365.0, vols, is_call, RATE
+        )
+
+        start = time.perf_counter()
+        result = solver.solve(prices, 100.0, strikes, days, is_call)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+        quoted = prices > 0
+        assert result.converged[quoted].mean() > 0.99
+
+
+class TestSolveChain:
+    """Tests for filling IV across an OptionsChain."""
+
+    @pytest.fixture
+    def expiration(self):
+        """Expiration 30 days out."""
+        return (date.today() + timedelta(days=30)).isoformat()
+
+    def _contract(self, expiration, strike, option_type, bid, ask, iv):
+        return OptionContract(
+            symbol="AAPL",
+            strike=strike,
+            expiration_date=expiration,
+            option_type=option_type,
+            bid=bid,
+            ask=ask,
+            implied_volatility=iv,
+        )
+
+    def test_tags_provider_and_solved(self, solver, expiration):
+        """Valid provider IV is kept; bad IV is solved from the mid."""
+        mid = _bs(100, 105, 30, 0.4, True)
+        chain = OptionsChain(
+            symbol="AAPL",
+            contracts=[
+                self._contract(expiration, 100, "Call", 3.0, 3.2, 0.32),
+                self._contract(expiration, 105, "Call", mid - 0.05, mid + 0.05, -9.99),
+                self._contract(expiration, 95, "Put", 1.0, 1.1, 0.0),
+                self._contract(expiration, 150, "Call", 0.0, 0.0, None),
+            ],
+            retrieved_at="2026-01-01T00:00:00",
+            underlying_price=100.0,
+        )
+
+        summary = solver.solve_chain(chain)
+
+        provider, bad, zero, unquoted = chain.contracts
+        assert provider.iv_source == IV_SOURCE_PROVIDER
+        assert provider.implied_volatility == 0.32
+        assert bad.iv_source == IV_SOURCE_SOLVED
+        assert bad.implied_volatility == pytest.approx(0.4, rel=1e-4)
+        assert zero.iv_source == IV_SOURCE_SOLVED
+        assert zero.implied_volatility > 0
+        assert unquoted.iv_source is None
+        assert unquoted.implied_volatility is None
+
+        assert (summary.total, summary.provider, summary.solved, summary.failed) == (4, 1, 2, 1)
+        assert summary.status_counts == {STATUS_CONVERGED: 2, STATUS_NO_QUOTE: 1}
+        assert summary.to_dict()["max_iterations"] >= 1
+
+    def test_replace_provider(self, solver, expiration):
+        """replace_provider solves every contract from its mid."""
+        mid = _bs(100, 100, 30, 0.25, False)
+        chain = OptionsChain(
+            symbol="AAPL",
+            contracts=[self._contract(expiration, 100, "Put", mid - 0.01, mid + 0.01, 0.9)],
+            retrieved_at="2026-01-01T00:00:00",
+        )
+
+        summary = solver.solve_chain(chain, current_price=100.0, replace_provider=True)
+
+        assert summary.solved == 1
+        assert chain.contracts[0].implied_volatility == pytest.approx(0.25, rel=1e-4)
+
+    def test_already_tagged_contracts_skipped(self, solver, expiration):
+        """A second call leaves tagged contracts alone."""
+        chain = OptionsChain(
+            symbol="AAPL",
+            contracts=[self._contract(expiration, 100, "Call", 3.0, 3.2, -9.99)],
+            retrieved_at="2026-01-01T00:00:00",
+            underlying_price=100.0,
+        )
+        solver.solve_chain(chain)
+        solved_iv = chain.contracts[0].implied_volatility
+
+        summary = solver.solve_chain(chain)
+
+        assert summary.solved == 1
+        assert summary.status_counts == {}
+        assert chain.contracts[0].implied_volatility == solved_iv
+
+    def test_columns_updated_in_place(self, solver, expiration):
+        """Solved IVs are written into the chain's columns instead of rebuilding them."""
+        chain = OptionsChain(
+            symbol="AAPL",
+            contracts=[
+                self._contract(expiration, 100, "Call", 3.0, 3.2, -9.99),
+                self._contract(expiration, 95, "Put", 1.0, 1.1, 0.3),
+            ],
+            retrieved_at="2026-01-01T00:00:00",
+            underlying_price=100.0,
+        )
+        columns = chain.columns
+
+        solver.solve_chain(chain)
+        solver.solve_chain(chain)
+
+        assert chain.columns is columns
+        for row in range(len(columns)):
+            contract = columns.contract(row)
+            assert columns.columns["implied_volatility"][row] == contract.implied_volatility
+            assert columns.iv_source[row] == contract.iv_source
+
+    def test_read_only_columns(self, solver, expiration):
+        """Read-only columns, as loaded from a snapshot, get a writable IV column."""
+        chain = OptionsChain(
+            symbol="AAPL",
+            contracts=[self._contract(expiration, 100, "Call", 3.0, 3.2, -9.99)],
+            retrieved_at="2026-01-01T00:00:00",
+            underlying_price=100.0,
+        )
+        chain.columns.columns["implied_volatility"].flags.writeable = False
+
+        solver.solve_chain(chain)
+
+        solved = chain.contracts[0].implied_volatility
+        assert chain.contracts[0].iv_source == IV_SOURCE_SOLVED
+        assert chain.columns.columns["implied_volatility"][0] == solved
+
+    def test_requires_underlying_price(self, solver):
+        """Without any underlying price the chain cannot be solved."""
+        chain = OptionsChain(symbol="AAPL", contracts=[], retrieved_at="2026-01-01T00:00:00")
+        with pytest.raises(ValueError, match="underlying price"):
+            solver.solve_chain(chain)
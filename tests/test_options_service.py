@@ -1,6 +1,6 @@
 """Unit tests for options service layer."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
 import pytest
@@ -317,3 +317,97 @@ class TestOptionsChainService:
 
         assert len(calls) == 1
         assert len(puts) == 1
+
+    def test_fill_implied_volatility_without_price(self, service, mock_client, sample_api_response):
+        """Test that chains without an underlying price are left unchanged."""
+        mock_client.get_option_chain.return_value = sample_api_response
+        result = service.get_options_chain("F")
+
+        assert service.fill_implied_volatility(result) is None
+        assert all(c.iv_source is None for c in result.contracts)
+
+    def test_fill_implied_volatility_solves_missing_iv(
+        self, service, mock_client, sample_api_response
+    ):
+        """Test that contracts without IV are solved from their mid."""
+        expiration = (datetime.now(timezone.utc).date() + timedelta(days=180)).isoformat()
+        for contract in sample_api_response["data"]:
+            contract["expirationDate"] = expiration
+        mock_client.get_option_chain.return_value = sample_api_response
+        result = service.get_options_chain("F")
+
+        summary = service.fill_implied_volatility(result, current_price=10.2)
+
+        assert summary.solved == 2
+        assert all(c.iv_source == "solved" for c in result.contracts)
+        assert all(c.implied_volatility > 0 for c in result.contracts)
+
+    def test_schwab_chain_iv_filled_on_fetch(self):
+        """Test that Schwab chains get IV filled using their underlying price."""
+        from src.schwab.client import SchwabClient
+
+        expiration = (datetime.now(timezone.utc).date() + timedelta(days=30)).isoformat()
+        chain = OptionsChain(
+            symbol="F",
+            contracts=[
+                OptionContract(
+                    symbol="F",
+                    strike=10.0,
+                    expiration_date=expiration,
+                    option_type="Call",
+                    bid=0.40,
+                    ask=0.45,
+                    implied_volatility=-9.99,
+                )
+            ],
+            retrieved_at=datetime.now(timezone.utc).isoformat(),
+            underlying_price=10.0,
+        )
+        schwab_client = Mock(spec=SchwabClient)
+        schwab_client.get_option_chain.return_value = chain
+
+        result = OptionsChainService(schwab_client).get_options_chain("F")
+
+        assert result.contracts[0].iv_source == "solved"
+        assert 0 < result.contracts[0].implied_volatility < 1
+
+    def test_replay_from_snapshot_store(self, tmp_path):
+        """as_of loads the stored chain instead of calling the client."""
+        from src.market_data.chain_store import ChainSnapshotStore
+
+        expiration = (datetime.now(timezone.utc).date() + timedelta(days=30)).isoformat()
+        chain = OptionsChain(
+            symbol="F",
+            contracts=[
+                OptionContract(
+                    symbol="F",
+                    strike=10.0,
+                    expiration_date=expiration,
+                    option_type=option_type,
+                    bid=0.40,
+                    ask=0.45,
+                    implied_volatility=-9.99,
+                )
+                for option_type in ("Call", "Put")
+            ],
+            retrieved_at=datetime.now(timezone.utc).isoformat(),
+            underlying_price=10.0,
+        )
+        store = ChainSnapshotStore(tmp_path)
+        fetched_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        store.write(chain, fetched_at=fetched_at)
+        client = Mock()
+        service = OptionsChainService(client, snapshot_store=store)
+
+        result = service.get_options_chain("F", contract_type="PUT", as_of=datetime.now(timezone.utc))
+
+        client.get_option_chain.assert_not_called()
+        assert [c.option_type for c in result.contracts] == ["Put"]
+        assert result.contracts[0].iv_source == "solved"
+        with pytest.raises(DataValidationError):
+            service.get_options_chain("F", as_of=fetched_at - timedelta(minutes=1))
+
+    def test_replay_requires_snapshot_store(self, service):
+        """as_of without a snapshot store is an error."""
+        with pytest.raises(ValueError, match="snapshot_store"):
+            service.get_options_chain("F", as_of=datetime.now(timezone.utc))
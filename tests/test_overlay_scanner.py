@@ -14,9 +14,12 @@ Tests cover:
 - Full portfolio scanning
 """
 
+import random
+from dataclasses import replace
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
 import pytest
 
 from src.models import OptionContract, OptionsChain
@@ -37,9 +40,11 @@ from src.overlay_scanner import (
     SlippageModel,
 )
 from src.scanning.filters import (
+    FILTER_ORDER,
     apply_delta_band_filter,
     apply_tradability_filters,
     calculate_near_miss_score,
+    compile_filters,
     get_delta_band,
     populate_near_miss_details,
 )
@@ -1950,3 +1955,172 @@ class TestNearMissAnalysis:
 
         assert "near_miss_candidates" in d
         assert isinstance(d["near_miss_candidates"], list)
+
+
+class TestCompiledFilters:
+    """Tests that the array filter pipeline matches the per-candidate filters."""
+
+    @pytest.fixture
+    def wide_chain(self):
+        """Calls over three weekly expirations with mixed liquidity, shuffled."""
+        rng = random.Random(3)
+        contracts = []
+        for week in range(3):
+            exp_date = (datetime.now() + timedelta(days=3 + 7 * week)).strftime("%Y-%m-%d")
+            for k in range(60):
+                strike = 180.0 + k * 0.5
+                fair = max(0.0, 4.0 * (week + 1) ** 0.5 - 0.3 * (strike - 185.0))
+                bid = rng.choice([None, 0.0, 0.03] + [round(fair, 2)] * 9)
+                contracts.append(
+                    OptionContract(
+                        symbol="AAPL",
+                        strike=strike,
+                        expiration_date=exp_date,
+                        option_type="Call",
+                        bid=bid,
+                        ask=(bid or 0.0) + rng.choice([0.8] + [0.05] * 7),
+                        volume=rng.choice([None, 0] + [500] * 8),
+                        open_interest=rng.choice([None, 50] + [5000] * 8),
+                    )
+                )
+        rng.shuffle(contracts)
+        return OptionsChain(
+            symbol="AAPL", contracts=contracts, retrieved_at=datetime.now().isoformat()
+        )
+
+    @pytest.fixture
+    def wide_result(self, scanner, sample_holding, wide_chain):
+        """Scan of the wide chain with an earnings date inside the second week."""
+        earnings = (datetime.now() + timedelta(days=8)).strftime("%Y-%m-%d")
+        scanner.earnings_calendar._cache["AAPL"] = ([earnings], datetime.now().timestamp())
+        return scanner.scan_holding(
+            holding=sample_holding,
+            current_price=185.50,
+            options_chain=wide_chain,
+            volatility=0.30,
+            override_earnings_check=True,
+        )
+
+    @staticmethod
+    def _reference_details(scanner, candidate, current_price):
+        """Rejection details the per-candidate filters produce."""
+        _, details = apply_tradability_filters(candidate, scanner.config, current_price)
+        delta_detail = apply_delta_band_filter(candidate, scanner.config)
+        if delta_detail:
+            details.append(delta_detail)
+        if candidate.warnings:
+            details.append(
+                RejectionDetail(
+                    reason=RejectionReason.EARNINGS_WEEK,
+                    actual_value=1.0,
+                    threshold=0.0,
+                    margin=1.0,
+                    margin_display=candidate.warnings[0].replace(
+                        "Expiration spans earnings on ", "earnings on "
+                    )
+                    + f" before {candidate.expiration_date}",
+                )
+            )
+        return details
+
+    def test_scan_matches_per_candidate_filters(self, scanner, wide_result):
+        """Rejections, details, binding constraints and scores match the scalar path."""
+        result = wide_result
+        assert result.recommended_strikes and len(result.rejected_strikes) > 5
+        result.resolve_rejections()
+        reasons_seen = set()
+
+        for candidate in result.recommended_strikes:
+            assert self._reference_details(scanner, candidate, result.current_price) == []
+
+        max_net_credit = max(c.total_net_credit for c in result.rejected_strikes) or 100.0
+        for candidate in result.rejected_strikes:
+            details = self._reference_details(scanner, candidate, result.current_price)
+            reference = replace(candidate, rejection_details=details, binding_constraint=None)
+            populate_near_miss_details(reference, max_net_credit)
+
+            assert candidate.rejection_reasons == [d.reason for d in details]
+            assert candidate.near_miss_score == reference.near_miss_score
+            assert candidate.rejection_details == details
+            assert candidate.binding_constraint is candidate.rejection_details[
+                details.index(reference.binding_constraint)
+            ]
+            reasons_seen.update(candidate.rejection_reasons)
+
+        assert RejectionReason.EARNINGS_WEEK in reasons_seen
+        assert RejectionReason.ZERO_BID in reasons_seen
+
+    def test_near_misses_are_top_scores(self, wide_result):
+        """Near-misses are the five best-scored rejections, ties in chain order."""
+        expected = sorted(
+            wide_result.rejected_strikes, key=lambda c: c.near_miss_score, reverse=True
+        )[:5]
+        assert [id(c) for c in wide_result.near_miss_candidates] == [id(c) for c in expected]
+
+    def test_details_built_only_for_near_misses(self, wide_result):
+        """Other rejected strikes get their details from resolve_rejections()."""
+        near_misses = {id(c) for c in wide_result.near_miss_candidates}
+        others = [c for c in wide_result.rejected_strikes if id(c) not in near_misses]
+
+        assert all(c.rejection_details for c in wide_result.near_miss_candidates)
+        assert others and not any(c.rejection_details for c in others)
+        assert all(c.binding_constraint is None for c in others)
+
+        wide_result.resolve_rejections()
+        for candidate in others:
+            assert [d.reason for d in candidate.rejection_details] == candidate.rejection_reasons
+            assert candidate.binding_constraint in candidate.rejection_details
+
+    def test_to_dict_builds_deferred_details(self, wide_result):
+        """Serialized rejected strikes carry their details."""
+        for strike in wide_result.to_dict()["rejected_strikes"]:
+            assert strike["rejection_details"]
+            assert strike["binding_constraint"] in strike["rejection_details"]
+
+    def test_compile_filters_bits(self, scanner):
+        """Bit j of a candidate's mask is set when FILTER_ORDER[j] rejects it."""
+        bids = np.array([0.0, 1.00])
+        asks = np.array([0.50, 1.05])
+        masks = compile_filters(
+            scanner.config,
+            bid=bids,
+            ask=asks,
+            open_interest=np.array([5000.0, 5000.0]),
+            volume=np.array([500.0, 500.0]),
+            delta=np.array([0.12, 0.12]),
+            costs=scanner.calculate_execution_costs(bids, asks),
+            spans_earnings=np.array([False, True]),
+            current_price=100.0,
+        )
+
+        zero_bid = 1 << FILTER_ORDER.index(RejectionReason.ZERO_BID)
+        wide_spread = 1 << FILTER_ORDER.index(RejectionReason.WIDE_SPREAD_ABSOLUTE)
+        friction = 1 << FILTER_ORDER.index(RejectionReason.FRICTION_TOO_HIGH)
+        yield_low = 1 << FILTER_ORDER.index(RejectionReason.YIELD_TOO_LOW)
+        earnings = 1 << FILTER_ORDER.index(RejectionReason.EARNINGS_WEEK)
+        assert masks.bits.tolist() == [zero_bid | wide_spread | yield_low | friction, earnings]
+        assert masks.reasons(1) == [RejectionReason.EARNINGS_WEEK]
+        check, margin = masks.binding()
+        assert FILTER_ORDER[check[1]] == RejectionReason.EARNINGS_WEEK
+        assert margin[1] == 1.0
+
+    @pytest.mark.parametrize("model", list(SlippageModel))
+    def test_execution_costs_match_scalar(self, mock_finnhub_client, strike_optimizer, model):
+        """calculate_execution_costs matches calculate_execution_cost per trade."""
+        scanner = OverlayScanner(
+            mock_finnhub_client,
+            strike_optimizer,
+            ScannerConfig(slippage_model=model, max_slippage_per_contract=0.10),
+        )
+        bids = [0.0, 0.50, 1.20, 3.00]
+        asks = [0.05, 0.55, 1.60, 3.10]
+
+        costs = scanner.calculate_execution_costs(np.array(bids), np.array(asks), contracts=3)
+
+        for i, (bid, ask) in enumerate(zip(bids, asks)):
+            cost = scanner.calculate_execution_cost(bid, ask, contracts=3)
+            assert costs.gross_premium[i] == cost.gross_premium
+            assert costs.commission[i] == cost.commission
+            assert costs.slippage[i] == cost.slippage
+            assert costs.net_credit[i] == cost.net_credit
+            assert costs.net_credit_per_share[i] == cost.net_credit_per_share
@@ -0,0 +1,181 @@
+"""Tests for the client-side token bucket rate limiter."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from src.api.rate_limiter import (
+    MemoryBucketStore,
+    RateLimit,
+    RateLimiter,
+    SQLiteBucketStore,
+)
+from src.schwab.client import SchwabClient
+
+
+class FakeClock:
+    """Manually advanced clock; sleeping advances it."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_limiter(clock, limits, store=None):
+    return RateLimiter(limits, store=store, clock=clock, sleep=clock.sleep)
+
+
+class TestRateLimit:
+    """Tests for RateLimit."""
+
+    def test_rate_and_capacity(self):
+        limit = RateLimit(120, 60)
+        assert limit.rate == 2.0
+        assert limit.capacity == 120.0
+        assert RateLimit(10, 1, burst=3).capacity == 3.0
+
+    def test_rejects_non_positive(self):
+        with pytest.raises(ValueError):
+            RateLimit(0, 60)
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter with the in-memory store."""
+
+    def test_burst_then_throttle(self, clock):
+        """Requests within the burst pass; the next ones wait 1/rate apart."""
+        limiter = make_limiter(clock, {"schwab": RateLimit(2, 1)})
+
+        assert limiter.acquire("schwab") == 0
+        assert limiter.acquire("schwab") == 0
+        assert limiter.acquire("schwab") == pytest.approx(0.5)
+        assert limiter.acquire("schwab") == pytest.approx(0.5)
+        assert clock.slept == pytest.approx([0.5, 0.5])
+
+    def test_reservations_queue(self, clock):
+        """Non-blocking reservations queue behind each other."""
+        limiter = make_limiter(clock, {"finnhub": RateLimit(1, 1)})
+
+        waits = [limiter.reserve("finnhub") for _ in range(4)]
+
+        assert waits == pytest.approx([0, 1, 2, 3])
+
+    def test_refills_over_time(self, clock):
+        """An idle bucket refills up to its capacity."""
+        limiter = make_limiter(clock, {"schwab": RateLimit(2, 1)})
+        limiter.reserve("schwab")
+        limiter.reserve("schwab")
+
+        clock.now += 10
+
+        assert limiter.reserve("schwab") == 0
+        assert limiter.reserve("schwab") == 0
+        assert limiter.reserve("schwab") > 0
+
+    def test_endpoint_budget(self, clock):
+        """Endpoint budgets apply on top of the provider budget, by path prefix."""
+        limiter = make_limiter(
+            clock,
+            {"schwab": RateLimit(100, 1), "schwab:/marketdata/v1/chains": RateLimit(1, 1)},
+        )
+
+        assert limiter.buckets_for("schwab", "/marketdata/v1/quotes") == ["schwab"]
+        assert limiter.buckets_for("schwab", "/marketdata/v1/chains") == [
+            "schwab",
+            "schwab:/marketdata/v1/chains",
+        ]
+        assert limiter.reserve("schwab", "/marketdata/v1/chains") == 0
+        assert limiter.reserve("schwab", "/marketdata/v1/chains") == pytest.approx(1.0)
+        assert limiter.reserve("schwab", "/marketdata/v1/quotes") == 0
+
+    def test_unknown_provider_is_unlimited(self, clock):
+        limiter = make_limiter(clock, {"schwab": RateLimit(1, 60)})
+        assert all(limiter.acquire("other") == 0 for _ in range(5))
+        assert limiter.metrics() == {}
+
+    def test_metrics(self, clock):
+        """Metrics count requests, throttled calls and wait time per bucket."""
+        limiter = make_limiter(clock, {"finnhub": RateLimit(1, 1)})
+        for _ in range(3):
+            limiter.acquire("finnhub")
+
+        metrics = limiter.metrics()["finnhub"]
+        assert metrics["requests"] == 3
+        assert metrics["throttled"] == 2
+        assert metrics["total_wait_seconds"] == pytest.approx(2.0)
+        assert metrics["max_wait_seconds"] == pytest.approx(1.0)
+
+    def test_thread_safe(self, clock):
+        """Concurrent reservations never hand out the same slot twice."""
+        store = MemoryBucketStore()
+        limiter = make_limiter(clock, {"schwab": RateLimit(10, 1)}, store)
+        waits: list[float] = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(10):
+                wait = limiter.reserve("schwab")
+                with lock:
+                    waits.append(wait)
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(waits) == pytest.approx([max(0, (i - 9) / 10) for i in range(50)])
+
+
+class TestSQLiteBucketStore:
+    """Tests for the host-wide SQLite store."""
+
+    def test_state_shared_between_limiters(self, clock, tmp_path):
+        """Two limiters on the same file (e.g. two processes) share one budget."""
+        path = tmp_path / "limits.db"
+        limits = {"schwab": RateLimit(2, 1)}
+        first = make_limiter(clock, limits, SQLiteBucketStore(path))
+        second = make_limiter(clock, limits, SQLiteBucketStore(path))
+
+        assert first.reserve("schwab") == 0
+        assert second.reserve("schwab") == 0
+        assert first.reserve("schwab") == pytest.approx(0.5)
+        assert second.reserve("schwab") == pytest.approx(1.0)
+
+    def test_created_lazily(self, tmp_path):
+        path = tmp_path / "nested" / "limits.db"
+        store = SQLiteBucketStore(path)
+        assert not path.exists()
+
+        store.reserve("schwab", RateLimit(1, 1), 0.0)
+        assert path.exists()
+
+
+class TestClientIntegration:
+    """BaseAPIClient consults the limiter before every request."""
+
+    def test_schwab_request_acquires_budget(self):
+        limiter = Mock()
+        oauth = Mock()
+        oauth.get_authorization_header.return_value = {"Authorization": "Bearer token"}
+        client = SchwabClient(oauth_coordinator=oauth, enable_cache=False, rate_limiter=limiter)
+        response = Mock(status_code=200, ok=True)
+        response.json.return_value = {}
+        client.session.request = Mock(return_value=response)
+
+        client.get("/marketdata/v1/quotes", params={"symbols": "AAPL"})
+
+        limiter.acquire.assert_called_once_with("schwab", "/marketdata/v1/quotes")
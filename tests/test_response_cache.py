@@ -0,0 +1,285 @@
+"""Tests for the bounded response cache."""
+
+import multiprocessing
+import threading
+
+import pytest
+
+from src.api.cache import (
+    CACHE_DB_ENV,
+    Cache,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    persistent_cache,
+)
+from src.market_data.earnings_calendar import EarningsCalendar
+from src.market_data.price_fetcher import PriceDataCache, SchwabPriceDataFetcher
+from src.models.base import OptionsChain
+from src.schwab.client import SchwabClient
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_backend(request, tmp_path):
+    """Factory for each backend type with a given entry limit."""
+
+    def make(max_entries: int = 100):
+        if request.param == "memory":
+            return MemoryCacheBackend(max_entries=max_entries)
+        return SQLiteCacheBackend(tmp_path / "cache.db", max_entries=max_entries)
+
+    return make
+
+
+class TestCache:
+    """Behaviour shared by both backends."""
+
+    def test_lookup_and_store(self, make_backend, clock):
+        cache = Cache(make_backend(), clock=clock)
+        quotes = cache.namespace("quote", ttl_seconds=60)
+
+        assert quotes.lookup("AAPL") is None
+        quotes.store("AAPL", {"lastPrice": 150.0})
+
+        assert quotes.lookup("AAPL") == {"lastPrice": 150.0}
+        assert quotes.stats() == {"hits": 1, "misses": 1, "evictions": 0, "expirations": 0}
+
+    def test_ttl_per_namespace(self, make_backend, clock):
+        cache = Cache(make_backend(), clock=clock)
+        quotes = cache.namespace("quote", ttl_seconds=60)
+        chains = cache.namespace("chain", ttl_seconds=600)
+        quotes.store("AAPL", 1)
+        chains.store("AAPL", 2)
+
+        clock.now += 120
+
+        assert quotes.lookup("AAPL") is None
+        assert chains.lookup("AAPL") == 2
+        assert "AAPL" not in quotes
+        assert cache.stats()["quote"]["expirations"] == 1
+
+    def test_lookup_entry_and_prefixed_keys(self, make_backend, clock):
+        chains = Cache(make_backend(), clock=clock).namespace("chain", ttl_seconds=60)
+        chains.store("AAPL_CALL", 1)
+        chains.store("AAPLX_CALL", 2)
+        clock.now += 10
+
+        assert chains.lookup_entry("AAPL_CALL") == (1, clock.now - 10)
+        assert chains.keys_with_prefix("AAPL_") == ["AAPL_CALL"]
+        clock.now += 60
+        assert chains.lookup_entry("AAPL_CALL") is None
+        assert chains.stats()["expirations"] == 1
+
+    def test_max_age_override(self, make_backend, clock):
+        quotes = Cache(make_backend(), clock=clock).namespace("quote", ttl_seconds=60)
+        quotes.store("AAPL", 1)
+        clock.now += 30
+
+        assert quotes.lookup("AAPL", max_age_seconds=10) is None
+        assert quotes.lookup("AAPL") == 1
+
+    def test_lru_eviction(self, make_backend, clock):
+        cache = Cache(make_backend(max_entries=2), clock=clock)
+        quotes = cache.namespace("quote", ttl_seconds=60)
+        quotes.store("A", 1)
+        quotes.store("B", 2)
+        quotes.lookup("A")  # B is now least recently used
+
+        quotes.store("C", 3)
+
+        assert len(cache) == 2
+        assert quotes.lookup("B") is None
+        assert quotes.lookup("A") == 1
+        assert quotes.lookup("C") == 3
+        assert quotes.stats()["evictions"] == 1
+
+    def test_namespace_entry_limit(self, make_backend, clock):
+        cache = Cache(make_backend(), clock=clock)
+        chains = cache.namespace("chain", ttl_seconds=60, max_entries=2)
+        quotes = cache.namespace("quote", ttl_seconds=60)
+        for symbol in ("A", "B", "C"):
+            quotes.store(symbol, 0)
+        chains.store("A", 1)
+        chains.store("B", 2)
+        chains.lookup("A")  # B is now least recently used
+
+        chains.store("C", 3)
+
+        assert sorted(chains) == ["A", "C"]
+        assert len(quotes) == 3
+        assert chains.stats()["evictions"] == 1
+        with pytest.raises(ValueError):
+            cache.namespace("chain", ttl_seconds=60, max_entries=0)
+
+    def test_expired_entries_go_before_live_ones(self, make_backend, clock):
+        cache = Cache(make_backend(max_entries=2), clock=clock)
+        short = cache.namespace("short", ttl_seconds=10)
+        long = cache.namespace("long", ttl_seconds=600)
+        long.store("A", 1)
+        short.store("B", 2)
+        clock.now += 60
+
+        long.store("C", 3)
+
+        assert long.lookup("A") == 1
+        assert long.lookup("C") == 3
+        assert cache.stats()["long"]["evictions"] == 0
+
+    def test_mapping_interface(self, make_backend, clock):
+        cache = Cache(make_backend(), clock=clock)
+        quotes = cache.namespace("quote", ttl_seconds=60)
+        chains = cache.namespace("chain", ttl_seconds=60)
+        quotes["AAPL"] = ("quote", clock.now - 5)
+        chains["AAPL"] = ("chain", clock.now)
+
+        assert quotes["AAPL"] == ("quote", clock.now - 5)
+        assert list(quotes) == ["AAPL"]
+        assert len(quotes) == 1
+
+        quotes.clear()
+        assert "AAPL" not in quotes
+        assert chains.lookup("AAPL") == "chain"
+
+    def test_purge_expired(self, make_backend, clock):
+        cache = Cache(make_backend(), clock=clock)
+        quotes = cache.namespace("quote", ttl_seconds=60)
+        for symbol in ("A", "B", "C"):
+            quotes.store(symbol, 1)
+        clock.now += 61
+
+        assert cache.purge_expired() == 3
+        assert len(cache) == 0
+
+    def test_entry_counts_and_namespace_clear(self, make_backend, clock):
+        cache = Cache(make_backend(), clock=clock)
+        quotes = cache.namespace("quote", ttl_seconds=60)
+        chains = cache.namespace("chain", ttl_seconds=60)
+        quotes.store("A", 1)
+        quotes.store("B", 2)
+        chains.store("A", 3)
+
+        assert cache.entry_counts() == {"quote": 2, "chain": 1}
+        assert cache.clear("quote") == 2
+        assert cache.entry_counts() == {"chain": 1}
+        assert cache.clear() == 1
+
+    def test_thread_safe(self, make_backend):
+        cache = Cache(make_backend(max_entries=50))
+        quotes = cache.namespace("quote", ttl_seconds=60)
+
+        def worker(offset):
+            for i in range(100):
+                quotes.store(f"S{offset}-{i}", i)
+                quotes.lookup(f"S{offset}-{i // 2}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(cache) == 50
+        stats = quotes.stats()
+        assert stats["hits"] + stats["misses"] == 400
+        assert stats["evictions"] == 350
+
+
+class TestSQLiteCacheBackend:
+    """Tests specific to the on-disk backend."""
+
+    def test_entries_survive_reopen(self, tmp_path, clock):
+        path = tmp_path / "cache.db"
+        chain = OptionsChain(symbol="AAPL", contracts=[], retrieved_at="2026-01-01T00:00:00")
+        Cache(SQLiteCacheBackend(path), clock=clock).namespace("chain", 600).store("AAPL", chain)
+
+        reopened = Cache(SQLiteCacheBackend(path), clock=clock).namespace("chain", 600)
+
+        assert reopened.lookup("AAPL") == chain
+
+    def test_created_lazily(self, tmp_path):
+        path = tmp_path / "nested" / "cache.db"
+        backend = SQLiteCacheBackend(path)
+        assert not path.exists()
+
+        Cache(backend).namespace("quote", 60).store("AAPL", 1)
+        assert path.exists()
+        assert backend.size_bytes() > 0
+
+
+def _store_from_process(path: str, offset: int) -> None:
+    quotes = persistent_cache(path).namespace("quote", ttl_seconds=60)
+    for i in range(50):
+        quotes.store(f"S{offset}-{i}", i)
+        quotes.lookup(f"S{1 - offset}-{i}")
+
+
+class TestPersistentCache:
+    """The on-disk cache shared by CLI runs and the server."""
+
+    def test_path_from_environment(self, tmp_path, monkeypatch):
+        path = tmp_path / "shared.db"
+        monkeypatch.setenv(CACHE_DB_ENV, str(path))
+
+        persistent_cache().namespace("quote", 60).store("AAPL", 1)
+
+        assert persistent_cache(path).namespace("quote", 60).lookup("AAPL") == 1
+
+    def test_shared_between_processes(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=_store_from_process, args=(path, n)) for n in range(2)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+
+        assert [process.exitcode for process in processes] == [0, 0]
+        assert persistent_cache(path).entry_counts() == {"quote": 100}
+
+
+class TestCacheConsumers:
+    """The Schwab, price data and earnings caches share one bounded Cache."""
+
+    def test_shared_ceiling(self):
+        cache = Cache(MemoryCacheBackend(max_entries=3))
+        client = SchwabClient(oauth_coordinator=object(), cache=cache)
+        fetcher = SchwabPriceDataFetcher(client, cache=PriceDataCache(cache=cache))
+        calendar = EarningsCalendar(finnhub_client=None, cache=cache)
+
+        client.quote_cache.store("AAPL", {"lastPrice": 1.0})
+        client.chain_cache.store("AAPL_None_None_None_None", "chain")
+        fetcher.cache.set("AAPL", 60, "prices")
+        calendar._cache.store("AAPL", ["2026-02-01"])
+
+        assert len(cache) == 3
+        assert set(cache.stats()) == {
+            "schwab_quote",
+            "schwab_chain",
+            "schwab_price_history",
+            "price_data",
+            "earnings_dates",
+        }
+        assert cache.stats()["schwab_quote"]["evictions"] == 1
+
+    def test_disabled_client_cache_is_bypassed(self):
+        client = SchwabClient(oauth_coordinator=object(), enable_cache=False)
+        client._cache_result(client.quote_cache, "AAPL", {"lastPrice": 1.0})
+
+        assert client._cached(client.quote_cache, "AAPL") is None
+        assert len(client.cache) == 0
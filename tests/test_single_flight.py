@@ -0,0 +1,148 @@
+"""Tests for single-flight coalescing of in-flight calls."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.api.single_flight import SingleFlight
+
+
+def run_threads(count: int, target) -> list:
+    """Run target in count threads and return their results (or exceptions)."""
+    results: list = [None] * count
+
+    def worker(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+    return results
+
+
+class TestSingleFlight:
+    """Tests for the threaded interface."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {"lastPrice": 150.0}
+
+        def call():
+            return flight.do("quote", "AAPL", fetch)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        while flight.in_flight() == 0:
+            pass
+        threading.Timer(0.1, release.set).start()
+
+        results = run_threads(4, call)
+        leader.join(timeout=10)
+
+        assert calls == [1]
+        assert results == [{"lastPrice": 150.0}] * 4
+        assert flight.stats() == {"quote": {"executed": 1, "coalesced": 4}}
+        assert flight.in_flight() == 0
+
+    def test_error_is_shared(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fetch():
+            release.wait(5)
+            raise ValueError("upstream failed")
+
+        leader = threading.Thread(target=run_threads, args=(1, lambda: flight.do("q", "A", fetch)))
+        leader.start()
+        while flight.in_flight() == 0:
+            pass
+        threading.Timer(0.1, release.set).start()
+
+        results = run_threads(2, lambda: flight.do("q", "A", fetch))
+        leader.join(timeout=10)
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.stats()["q"]["coalesced"] == 2
+
+    def test_sequential_calls_are_not_coalesced(self):
+        flight = SingleFlight()
+
+        assert flight.do("q", "A", lambda: 1) == 1
+        assert flight.do("q", "A", lambda: 2) == 2
+        assert flight.stats()["q"] == {"executed": 2, "coalesced": 0}
+
+    def test_keys_and_namespaces_are_independent(self):
+        flight = SingleFlight()
+        first, _ = flight.begin("quote", "AAPL")
+
+        assert flight.begin("quote", "MSFT")[1] is True
+        assert flight.begin("chain", "AAPL")[1] is True
+        assert flight.begin("quote", "AAPL") == (first, False)
+
+
+class TestSingleFlightAsync:
+    """Tests for the asyncio interface."""
+
+    def test_tasks_share_one_execution(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "chain"
+
+        async def main():
+            return await asyncio.gather(
+                *(flight.do_async("chain", "AAPL", fetch) for _ in range(5))
+            )
+
+        assert asyncio.run(main()) == ["chain"] * 5
+        assert calls == [1]
+        assert flight.stats()["chain"] == {"executed": 1, "coalesced": 4}
+
+    def test_task_joins_thread_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        leader = threading.Thread(
+            target=lambda: flight.do("chain", "AAPL", lambda: release.wait(5) and "chain")
+        )
+        leader.start()
+        while flight.in_flight() == 0:
+            pass
+
+        async def main():
+            asyncio.get_running_loop().call_later(0.05, release.set)
+            return await flight.do_async("chain", "AAPL", pytest.fail)
+
+        assert asyncio.run(main()) == "chain"
+        leader.join(timeout=10)
+
+    def test_cancelled_waiter_does_not_cancel_call(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "chain"
+
+        async def main():
+            leader = asyncio.ensure_future(flight.do_async("chain", "AAPL", fetch))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(flight.do_async("chain", "AAPL", fetch))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            return await leader, waiter.cancelled()
+
+        assert asyncio.run(main()) == ("chain", True)
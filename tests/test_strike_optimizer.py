@@ -3,9 +3,11 @@
 import math
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from src.models import OptionContract, OptionsChain
+from src.strategies.strike_optimizer import norm_cdf
 from src.strike_optimizer import (
     PROFILE_SIGMA_RANGES,
     ProbabilityResult,
@@ -434,6 +436,71 @@ class TestNormCdf:
         assert StrikeOptimizer._norm_cdf(-1.0) == pytest.approx(0.1587, rel=1e-3)
 
 
+class TestVectorizedNormCdf:
+    """Tests for the vectorized normal CDF."""
+
+    def test_matches_scalar(self):
+        """Test norm_cdf matches _norm_cdf across the real line."""
+        xs = np.linspace(-12, 12, 4801)
+        expected = [StrikeOptimizer._norm_cdf(x) for x in xs]
+        assert norm_cdf(xs) == pytest.approx(expected, rel=1e-14, abs=1e-15)
+
+    def test_scalar_and_nan(self):
+        """Test scalars are accepted and NaN propagates."""
+        assert float(norm_cdf(0.0)) == 0.5
+        assert np.isnan(norm_cdf([np.nan])[0])
+
+
+class TestBatchAssignmentProbabilities:
+    """Tests for calculate_assignment_probabilities."""
+
+    @pytest.fixture
+    def optimizer(self):
+        return StrikeOptimizer(risk_free_rate=0.05)
+
+    def test_matches_per_contract(self, optimizer):
+        """Test each entry matches the scalar probability and sigma distance."""
+        strikes = [80.0, 95.0, 100.0, 105.0, 120.0, 80.0, 95.0, 105.0]
+        dtes = [7, 14, 30, 45, 60, 3, 21, 90]
+        vols = [0.2, 0.3, 0.4, 0.25, 0.5, 0.35, 0.3, 0.2]
+        types = ["put", "put", "call", "call", "call", "put", "call", "put"]
+
+        batch = optimizer.calculate_assignment_probabilities(strikes, 100.0, vols, dtes, types)
+
+        for i in range(len(strikes)):
+            expected = optimizer.calculate_assignment_probability(
+                strikes[i], 100.0, vols[i], dtes[i], types[i]
+            )
+            assert batch.probability[i] == pytest.approx(expected.probability, rel=1e-12)
+            assert batch.delta[i] == pytest.approx(expected.delta, rel=1e-12)
+            assert batch.d1[i] == pytest.approx(expected.d1, rel=1e-12)
+            assert batch.d2[i] == pytest.approx(expected.d2, rel=1e-12)
+            assert batch.sigma_distance[i] == pytest.approx(
+                optimizer.get_sigma_for_strike(strikes[i], 100.0, vols[i], dtes[i], types[i]),
+                rel=1e-12,
+            )
+        assert batch.is_call.tolist() == [t == "call" for t in types]
+
+    def test_invalid_entries_are_nan(self, optimizer):
+        """Test invalid inputs produce NaN instead of raising."""
+        batch = optimizer.calculate_assignment_probabilities(
+            [100.0, -5.0, 110.0, 110.0], 100.0, [0.3, 0.3, 0.0, 0.3], [30, 30, 30, 0]
+        )
+
+        assert not np.isnan(batch.probability[0])
+        assert np.isnan(batch.probability[1:]).all()
+        assert np.isnan(batch.sigma_distance[1:]).all()
+
+    def test_empty_chain(self, optimizer):
+        """Test an empty chain returns empty arrays."""
+        assert len(optimizer.calculate_assignment_probabilities([], 100.0, 0.3, [])) == 0
+
+    def test_invalid_option_type(self, optimizer):
+        """Test unknown option types raise ValueError."""
+        with pytest.raises(ValueError, match="must be 'call' or 'put'"):
+            optimizer.calculate_assignment_probabilities([100.0], 100.0, 0.3, 30, "straddle")
+
+
 class TestSigmaCalculations:
     """Tests for sigma distance calculations."""
 
@@ -0,0 +1,113 @@
+"""Tests for cross-sectional volatility panels."""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from src.analysis.volatility import VolatilityCalculator
+from src.analysis.volatility_models import PriceData
+from src.analysis.volatility_panel import PanelVolatilityCalculator, VolatilityPanel
+
+ALL_DATES = [f"2025-{m:02d}-{d:02d}" for m in range(1, 13) for d in range(1, 29)]
+
+
+def make_price_data(dates: list[str], seed: int) -> PriceData:
+    """Build a random-walk OHLC series on the given dates."""
+    rng = random.Random(seed)
+    opens, highs, lows, closes = [], [], [], []
+    prev_close = 50.0 + seed
+    for _ in dates:
+        o = prev_close * math.exp(rng.gauss(0, 0.006))
+        c = o * math.exp(rng.gauss(0, 0.02))
+        highs.append(max(o, c) * math.exp(abs(rng.gauss(0, 0.005))))
+        lows.append(min(o, c) * math.exp(-abs(rng.gauss(0, 0.005))))
+        opens.append(o)
+        closes.append(c)
+        prev_close = c
+    return PriceData(dates=dates, opens=opens, highs=highs, lows=lows, closes=closes)
+
+
+@pytest.fixture
+def universe():
+    """Symbols with full history, a gap-ridden history and a recent IPO."""
+    gappy_dates = [d for i, d in enumerate(ALL_DATES) if i % 9 != 4]
+    return {
+        "FULL": make_price_data(ALL_DATES, seed=1),
+        "GAPS": make_price_data(gappy_dates, seed=2),
+        "IPO": make_price_data(ALL_DATES[-35:], seed=3),
+        "NEW": make_price_data(ALL_DATES[-6:], seed=4),
+    }
+
+
+class TestVolatilityPanel:
+    """Test suite for panel construction."""
+
+    def test_from_price_data_aligns_dates(self, universe):
+        panel = VolatilityPanel.from_price_data(universe)
+
+        assert panel.symbols == ["FULL", "GAPS", "IPO", "NEW"]
+        assert panel.dates == ALL_DATES
+        assert panel.closes.shape == (4, len(ALL_DATES))
+        assert np.isnan(panel.closes[2, 0])
+        assert not np.isnan(panel.closes[2, -1])
+        assert panel.has_ohlc
+
+    def test_shape_validation(self):
+        with pytest.raises(ValueError, match="closes must have shape"):
+            VolatilityPanel(symbols=["A"], dates=["d1", "d2"], closes=np.ones((2, 2)))
+
+    def test_closes_only(self):
+        data = PriceData(dates=ALL_DATES[:30], closes=[100.0 + i for i in range(30)])
+        panel = VolatilityPanel.from_price_data({"A": data})
+
+        assert not panel.has_ohlc
+        result = PanelVolatilityCalculator().calculate(panel)
+        assert set(result.volatilities) == {"close_to_close", "blended"}
+
+
+class TestPanelVolatilityCalculator:
+    """Each symbol must match the single-symbol calculator on its own bars."""
+
+    @pytest.mark.parametrize("window", [20, 60])
+    def test_matches_per_symbol_calculation(self, universe, window):
+        panel = VolatilityPanel.from_price_data(universe)
+        result = PanelVolatilityCalculator().calculate(panel, window=window)
+        reference = VolatilityCalculator()
+
+        for symbol in ("FULL", "GAPS", "IPO"):
+            for method in ("close_to_close", "parkinson", "garman_klass", "yang_zhang"):
+                expected = reference.calculate_from_price_data(
+                    universe[symbol], method=method, window=window
+                )
+                assert result.get(symbol, method) == pytest.approx(expected.volatility, rel=1e-9)
+
+    def test_short_history_is_masked(self, universe):
+        panel = VolatilityPanel.from_price_data(universe)
+        result = PanelVolatilityCalculator().calculate(panel)
+
+        for method in result.volatilities:
+            assert result.get("NEW", method) is None
+        assert "NEW" not in result.to_dict("yang_zhang")
+        assert result.data_points.tolist() == [20, 20, 20, 6]
+
+    def test_blended_with_and_without_iv(self, universe):
+        panel = VolatilityPanel.from_price_data(universe)
+        reference = VolatilityCalculator()
+
+        result = PanelVolatilityCalculator().calculate(panel, implied_volatility={"FULL": 0.35})
+
+        expected = reference.calculate_blended(universe["FULL"], 0.35)
+        assert result.get("FULL") == pytest.approx(expected.volatility, rel=1e-9)
+
+        short = reference.calculate_close_to_close(universe["GAPS"].closes, window=20)
+        long = reference.calculate_close_to_close(universe["GAPS"].closes, window=60)
+        assert result.get("GAPS") == pytest.approx(
+            0.6 * short.volatility + 0.4 * long.volatility, rel=1e-9
+        )
+
+    def test_unknown_symbol(self, universe):
+        result = PanelVolatilityCalculator().calculate(VolatilityPanel.from_price_data(universe))
+
+        assert result.get("MISSING") is None
@@ -0,0 +1,145 @@
+"""Tests for incremental volatility state."""
+
+import math
+import random
+
+import pytest
+
+from src.analysis.volatility import VolatilityCalculator, VolatilityConfig
+from src.analysis.volatility_models import PriceData
+from src.analysis.volatility_state import VolatilityState
+
+
+def make_price_data(n: int = 300, seed: int = 11) -> PriceData:
+    """Build a random-walk close series on ISO-like dates."""
+    rng = random.Random(seed)
+    closes = []
+    price = 100.0
+    for _ in range(n):
+        price *= math.exp(rng.gauss(0, 0.015))
+        closes.append(price)
+    dates = [f"2025-{i // 28 + 1:02d}-{i % 28 + 1:02d}" for i in range(n)]
+    return PriceData(dates=dates, closes=closes)
+
+
+@pytest.fixture
+def price_data():
+    return make_price_data()
+
+
+class TestVolatilityState:
+    """Test suite for VolatilityState updates."""
+
+    @pytest.mark.parametrize("window", [20, 60])
+    def test_matches_close_to_close(self, price_data, window):
+        state = VolatilityState.from_price_data(price_data)
+        calc = VolatilityCalculator()
+
+        expected = calc.calculate_close_to_close(price_data.closes, window=window)
+        actual = calc.calculate_from_state(state, window=window)
+
+        assert actual.volatility == pytest.approx(expected.volatility, rel=1e-9)
+        assert actual.data_points == expected.data_points
+        assert actual.end_date == price_data.dates[-1]
+
+    def test_incremental_matches_full_recompute(self, price_data):
+        head = PriceData(dates=price_data.dates[:100], closes=price_data.closes[:100])
+        state = VolatilityState.from_price_data(head)
+        for date, close in zip(price_data.dates[100:], price_data.closes[100:]):
+            assert state.update(date, close)
+
+        full = VolatilityState.from_price_data(price_data)
+
+        assert state.bars == full.bars
+        assert list(state.returns) == pytest.approx(list(full.returns))
+        assert state.ewma_variance == pytest.approx(full.ewma_variance, rel=1e-12)
+        for window in (20, 60):
+            assert state.window_variance(window)[0] == pytest.approx(
+                full.window_variance(window)[0], rel=1e-9
+            )
+
+    def test_returns_buffer_is_bounded(self, price_data):
+        state = VolatilityState.from_price_data(price_data)
+
+        assert len(state.returns) == 59
+        assert state.short_points == 20
+        assert state.long_points == 60
+
+    def test_seen_bars_are_ignored(self, price_data):
+        state = VolatilityState.from_price_data(price_data)
+        before = state.to_dict()
+
+        applied = state.update_many(price_data.dates[-5:], price_data.closes[-5:])
+
+        assert applied == 0
+        assert state.to_dict() == before
+
+    def test_short_history(self):
+        state = VolatilityState()
+        state.update("2025-01-01", 100.0)
+        state.update("2025-01-02", 101.0)
+
+        with pytest.raises(ValueError, match="need at least 3 points"):
+            state.window_variance(20)
+
+        calc = VolatilityCalculator()
+        for _ in range(3):
+            state.update(f"2025-01-0{state.bars + 1}", 100.0 + state.bars)
+        with pytest.raises(ValueError, match="need at least 10 points, got 5"):
+            calc.calculate_from_state(state)
+
+    def test_untracked_window(self, price_data):
+        state = VolatilityState.from_price_data(price_data)
+
+        with pytest.raises(ValueError, match="not tracked"):
+            state.window_variance(30)
+
+    def test_non_positive_close(self):
+        with pytest.raises(ValueError, match="Close must be positive"):
+            VolatilityState().update("2025-01-01", 0.0)
+
+    def test_dict_round_trip(self, price_data):
+        state = VolatilityState.from_price_data(price_data)
+        restored = VolatilityState.from_dict(state.to_dict())
+
+        assert restored.to_dict() == state.to_dict()
+        restored.update("2026-01-01", 120.0)
+        state.update("2026-01-01", 120.0)
+        assert restored.window_variance(20) == state.window_variance(20)
+
+    def test_from_config(self):
+        config = VolatilityConfig(short_window=10, long_window=30)
+        state = VolatilityState.from_config(config)
+
+        assert (state.short_window, state.long_window) == (10, 30)
+        assert state.returns.maxlen == 29
+
+
+class TestCalculateFromState:
+    """Test suite for VolatilityCalculator.calculate_from_state."""
+
+    def test_ewma(self, price_data):
+        state = VolatilityState.from_price_data(price_data, ewma_lambda=0.9)
+        returns = [
+            math.log(price_data.closes[i] / price_data.closes[i - 1])
+            for i in range(1, len(price_data.closes))
+        ]
+        variance = returns[0] ** 2
+        for r in returns[1:]:
+            variance = 0.9 * variance + 0.1 * r * r
+
+        result = VolatilityCalculator().calculate_from_state(state, method="ewma", annualize=False)
+
+        assert result.method == "ewma"
+        assert result.volatility == pytest.approx(math.sqrt(variance), rel=1e-12)
+        assert result.metadata["lambda"] == 0.9
+
+    def test_ewma_requires_returns(self):
+        with pytest.raises(ValueError, match="EWMA needs at least 2 points"):
+            VolatilityCalculator().calculate_from_state(VolatilityState(), method="ewma")
+
+    def test_unknown_method(self, price_data):
+        state = VolatilityState.from_price_data(price_data)
+
+        with pytest.raises(ValueError, match="Unknown method"):
+            VolatilityCalculator().calculate_from_state(state, method="parkinson")
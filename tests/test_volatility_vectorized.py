@@ -0,0 +1,279 @@
+"""Parity tests for the NumPy-backed volatility calculator."""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from src.analysis.volatility import BlendWeights, VolatilityCalculator, VolatilityConfig
+from src.analysis.volatility_models import PriceData
+from src.analysis.volatility_vectorized import (
+    PriceArrays,
+    VectorizedVolatilityCalculator,
+    as_price_array,
+)
+
+
+def make_price_data(n: int = 756, seed: int = 7) -> PriceData:
+    """Build a random-walk OHLC series with overnight gaps."""
+    rng = random.Random(seed)
+    dates = [f"day-{i:04d}" for i in range(n)]
+    opens, highs, lows, closes = [], [], [], []
+    prev_close = 100.0
+    for _ in range(n):
+        o = prev_close * math.exp(rng.gauss(0, 0.005))
+        c = o * math.exp(rng.gauss(0, 0.015))
+        h = max(o, c) * math.exp(abs(rng.gauss(0, 0.006)))
+        lo = min(o, c) * math.exp(-abs(rng.gauss(0, 0.006)))
+        opens.append(o)
+        highs.append(h)
+        lows.append(lo)
+        closes.append(c)
+        prev_close = c
+    return PriceData(dates=dates, opens=opens, highs=highs, lows=lows, closes=closes)
+
+
+def assert_results_match(expected, actual):
+    """Assert two VolatilityResults are identical up to float rounding."""
+    assert type(actual) is type(expected)
+    assert actual.method == expected.method
+    assert actual.window == expected.window
+    assert actual.data_points == expected.data_points
+    assert actual.start_date == expected.start_date
+    assert actual.end_date == expected.end_date
+    assert actual.annualized == expected.annualized
+    assert actual.volatility == pytest.approx(expected.volatility, rel=1e-10)
+    assert actual.metadata.keys() == expected.metadata.keys()
+    for key, value in expected.metadata.items():
+        if isinstance(value, float):
+            assert actual.metadata[key] == pytest.approx(value, rel=1e-9, abs=1e-15)
+            assert type(actual.metadata[key]) is float
+        else:
+            assert actual.metadata[key] == value
+
+
+@pytest.fixture
+def price_data():
+    return make_price_data()
+
+
+@pytest.fixture
+def calculators():
+    return VolatilityCalculator(), VectorizedVolatilityCalculator()
+
+
+class TestPriceArrays:
+    """Test suite for PriceArrays conversion."""
+
+    def test_from_price_data(self, price_data):
+        arrays = PriceArrays.from_price_data(price_data)
+
+        assert len(arrays) == len(price_data.closes)
+        for arr in (arrays.opens, arrays.highs, arrays.lows, arrays.closes):
+            assert arr.dtype == np.float64
+            assert arr.flags["C_CONTIGUOUS"]
+
+    def test_closes_only(self):
+        data = PriceData(dates=["2026-01-01", "2026-01-02"], closes=[100.0, 101.0])
+        arrays = PriceArrays.from_price_data(data)
+
+        assert arrays.opens is None
+        assert arrays.highs is None
+        assert arrays.lows is None
+
+    def test_as_price_array_no_copy(self):
+        arr = np.arange(1.0, 11.0)
+        assert as_price_array(arr) is arr
+
+
+class TestVectorizedParity:
+    """The vectorized engine must reproduce the list implementation."""
+
+    @pytest.mark.parametrize("window", [None, 20, 60, 252, 5000])
+    @pytest.mark.parametrize("annualize", [True, False])
+    def test_close_to_close(self, calculators, price_data, window, annualize):
+        reference, vectorized = calculators
+        kwargs = {"window": window, "annualize": annualize, "dates": price_data.dates}
+
+        assert_results_match(
+            reference.calculate_close_to_close(price_data.closes, **kwargs),
+            vectorized.calculate_close_to_close(price_data.closes, **kwargs),
+        )
+
+    @pytest.mark.parametrize("window", [None, 60, 252])
+    def test_parkinson(self, calculators, price_data, window):
+        reference, vectorized = calculators
+        args = (price_data.highs, price_data.lows)
+
+        assert_results_match(
+            reference.calculate_parkinson(*args, window=window, dates=price_data.dates),
+            vectorized.calculate_parkinson(*args, window=window, dates=price_data.dates),
+        )
+
+    @pytest.mark.parametrize("method", ["calculate_garman_klass", "calculate_yang_zhang"])
+    @pytest.mark.parametrize("window", [None, 60, 252])
+    def test_ohlc_estimators(self, calculators, price_data, method, window):
+        reference, vectorized = calculators
+        args = (price_data.opens, price_data.highs, price_data.lows, price_data.closes)
+
+        assert_results_match(
+            getattr(reference, method)(*args, window=window, dates=price_data.dates),
+            getattr(vectorized, method)(*args, window=window, dates=price_data.dates),
+        )
+
+    @pytest.mark.parametrize("method", ["close_to_close", "parkinson", "garman_klass", "yang_zhang"])
+    def test_calculate_from_price_data(self, calculators, price_data, method):
+        reference, vectorized = calculators
+
+        assert_results_match(
+            reference.calculate_from_price_data(price_data, method=method, window=60),
+            vectorized.calculate_from_price_data(price_data, method=method, window=60),
+        )
+
+    def test_calculate_from_price_arrays(self, calculators, price_data):
+        reference, vectorized = calculators
+        arrays = PriceArrays.from_price_data(price_data)
+
+        assert_results_match(
+            reference.calculate_from_price_data(price_data, method="yang_zhang"),
+            vectorized.calculate_from_price_data(arrays, method="yang_zhang"),
+        )
+
+    @pytest.mark.parametrize("n", [15, 45, 756])
+    def test_blended(self, calculators, n):
+        reference, vectorized = calculators
+        data = make_price_data(n=n)
+        weights = BlendWeights(realized_short=0.4, realized_long=0.3, implied=0.3)
+
+        expected = reference.calculate_blended(data, 0.28, weights=weights)
+        actual = vectorized.calculate_blended(data, 0.28, weights=weights)
+
+        assert actual.volatility == pytest.approx(expected.volatility, rel=1e-10)
+        assert actual.metadata["rv_short"] == pytest.approx(expected.metadata["rv_short"])
+        assert actual.metadata["rv_long"] == pytest.approx(expected.metadata["rv_long"])
+        assert actual.metadata["weights"] == expected.metadata["weights"]
+        assert actual.data_points == expected.data_points
+        assert actual.window == expected.window
+
+    def test_custom_config(self, price_data):
+        config = VolatilityConfig(short_window=10, long_window=30, annualization_factor=250.0)
+        reference = VolatilityCalculator(config)
+        vectorized = VectorizedVolatilityCalculator(config)
+
+        assert_results_match(
+            reference.calculate_close_to_close(price_data.closes),
+            vectorized.calculate_close_to_close(price_data.closes),
+        )
+
+
+class TestVectorizedValidation:
+    """Validation errors must match the list implementation."""
+
+    def test_insufficient_data(self):
+        calc = VectorizedVolatilityCalculator()
+
+        with pytest.raises(ValueError, match="Insufficient data: need at least 10 points, got 1"):
+            calc.calculate_close_to_close([100.0])
+
+    def test_parkinson_high_less_than_low(self):
+        calc = VectorizedVolatilityCalculator()
+        highs = [102.0] * 9 + [99.0]
+        lows = [100.0] * 10
+
+        with pytest.raises(ValueError, match=r"High \(99.0\) < Low \(100.0\)"):
+            calc.calculate_parkinson(highs, lows)
+
+    def test_parkinson_length_mismatch(self):
+        calc = VectorizedVolatilityCalculator()
+
+        with pytest.raises(ValueError, match="highs and lows must have same length"):
+            calc.calculate_parkinson([100.0, 101.0], [99.0])
+
+    def test_garman_klass_non_positive(self):
+        calc = VectorizedVolatilityCalculator()
+        prices = [100.0] * 10
+
+        with pytest.raises(ValueError, match="All prices must be positive"):
+            calc.calculate_garman_klass(prices, prices, prices, [0.0] + prices[1:])
+
+    def test_ohlc_required(self):
+        calc = VectorizedVolatilityCalculator()
+        data = PriceData(dates=["2026-01-01", "2026-01-02"], closes=[100.0, 101.0])
+
+        with pytest.raises(ValueError, match="Yang-Zhang method requires OHLC prices"):
+            calc.calculate_from_price_data(data, method="yang_zhang")
+
+    def test_unknown_method(self, price_data):
+        calc = VectorizedVolatilityCalculator()
+
+        with pytest.raises(ValueError, match="Unknown method"):
+            calc.calculate_from_price_data(price_data, method="bogus")
+
+
+class TestMultiWindow:
+    """The multi-window table must match per-window calculations."""
+
+    @pytest.mark.parametrize("annualize", [True, False])
+    def test_matches_individual_calculations(self, calculators, price_data, annualize):
+        reference, vectorized = calculators
+        windows = [20, 60, 252, 5000]
+
+        table = vectorized.calculate_multi_window(price_data, windows=windows, annualize=annualize)
+
+        assert table.methods == ("close_to_close", "parkinson", "garman_klass", "yang_zhang")
+        for method in table.methods:
+            for window in windows:
+                expected = reference.calculate_from_price_data(
+                    price_data, method=method, window=window, annualize=annualize
+                )
+                assert table[method, window] == pytest.approx(expected.volatility, rel=1e-8)
+                result = table.to_result(method, window)
+                assert result.data_points == expected.data_points
+                assert result.start_date == expected.start_date
+                assert result.end_date == expected.end_date
+
+    def test_default_windows_from_config(self, price_data):
+        table = VectorizedVolatilityCalculator().calculate_multi_window(price_data)
+
+        assert table.windows == (20, 60)
+
+    def test_closes_only_defaults_to_close_to_close(self):
+        data = make_price_data(n=40)
+        data = PriceData(dates=data.dates, closes=data.closes)
+
+        table = VectorizedVolatilityCalculator().calculate_multi_window(data, windows=[20])
+
+        assert table.methods == ("close_to_close",)
+        assert set(table.to_dict()) == {("close_to_close", 20)}
+
+    def test_short_history_marks_missing_cells(self):
+        data = make_price_data(n=8)
+
+        table = VectorizedVolatilityCalculator().calculate_multi_window(data, windows=[5, 20])
+
+        assert table.get("close_to_close", 5) is None
+        assert table.get("close_to_close", 20) is None
+        assert table.to_dict() == {}
+        with pytest.raises(KeyError):
+            table["close_to_close", 20]
+
+    def test_missing_ohlc_raises(self):
+        data = PriceData(dates=["2026-01-01", "2026-01-02"], closes=[100.0, 101.0])
+
+        with pytest.raises(ValueError, match="require OHLC prices"):
+            VectorizedVolatilityCalculator().calculate_multi_window(data, methods=["yang_zhang"])
+
+    @pytest.mark.parametrize(
+        ("bad_high", "bad_low", "message"),
+        [(99.0, 100.0, r"High \(99.0\) < Low \(100.0\)"), (0.0, 0.0, "Prices must be positive")],
+    )
+    def test_parkinson_validates_ranges(self, bad_high, bad_low, message):
+        arrays = PriceArrays.from_price_data(make_price_data(n=40))
+        arrays.opens = None
+        arrays.highs[-1], arrays.lows[-1] = bad_high, bad_low
+
+        with pytest.raises(ValueError, match=message):
+            VectorizedVolatilityCalculator().calculate_multi_window(
+                arrays, windows=[20], methods=["parkinson"]
+            )
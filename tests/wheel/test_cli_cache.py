@@ -0,0 +1,80 @@
+"""Tests for the wheel cache commands."""
+
+import pytest
+from click.testing import CliRunner
+
+from src.api.cache import CACHE_DB_ENV, persistent_cache
+from src.wheel.cli import cli
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Create a CLI test runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    """Point the persistent cache at a temporary file holding a few entries."""
+    path = tmp_path / "cache.db"
+    monkeypatch.setenv(CACHE_DB_ENV, str(path))
+    cache = persistent_cache(path)
+    quotes = cache.namespace("schwab_quote", ttl_seconds=300)
+    quotes.store("AAPL", {"lastPrice": 150.0})
+    quotes.store("MSFT", {"lastPrice": 400.0}, stored_at=cache.now() - 600)
+    cache.namespace("schwab_chain", ttl_seconds=900).store("AAPL", "chain")
+    return path
+
+
+class TestCacheCommands:
+    """Tests for 'wheel cache' commands (no API credentials required)."""
+
+    def test_status(self, runner: CliRunner, cache_path) -> None:
+        result = runner.invoke(cli, ["cache", "status"])
+
+        assert result.exit_code == 0
+        assert str(cache_path) in result.output
+        assert "Entries: 3 / 2048" in result.output
+        assert "schwab_quote" in result.output
+        assert "schwab_chain" in result.output
+
+    def test_status_without_cache(self, runner: CliRunner, tmp_path) -> None:
+        missing = tmp_path / "missing.db"
+        result = runner.invoke(cli, ["cache", "--path", str(missing), "status"])
+
+        assert result.exit_code == 0
+        assert "No persistent cache" in result.output
+        assert not missing.exists()
+
+    def test_purge_expired(self, runner: CliRunner, cache_path) -> None:
+        result = runner.invoke(cli, ["cache", "purge", "--expired"])
+
+        assert result.exit_code == 0
+        assert "Dropped 1 expired entries" in result.output
+        assert persistent_cache(cache_path).entry_counts() == {
+            "schwab_quote": 1,
+            "schwab_chain": 1,
+        }
+
+    def test_purge_namespace(self, runner: CliRunner, cache_path) -> None:
+        result = runner.invoke(cli, ["cache", "purge", "--namespace", "schwab_quote"])
+
+        assert result.exit_code == 0
+        assert "Dropped 2 entries from schwab_quote" in result.output
+        assert persistent_cache(cache_path).entry_counts() == {"schwab_chain": 1}
+
+    def test_purge_all(self, runner: CliRunner, cache_path) -> None:
+        result = runner.invoke(cli, ["cache", "purge"])
+
+        assert result.exit_code == 0
+        assert len(persistent_cache(cache_path)) == 0
+
+    def test_purge_rejects_expired_with_namespace(
+        self, runner: CliRunner, cache_path
+    ) -> None:
+        result = runner.invoke(
+            cli, ["cache", "purge", "--expired", "--namespace", "schwab_quote"]
+        )
+
+        assert result.exit_code != 0
+        assert len(persistent_cache(cache_path)) == 3
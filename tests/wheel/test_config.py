@@ -87,6 +87,7 @@ def clear_env_vars():
         "WHEEL_MAX_DTE",
         "WHEEL_VERBOSE",
         "WHEEL_JSON_OUTPUT",
+        "WHEEL_PERSISTENT_CACHE",
     ]
 
     # Clear before test
@@ -262,6 +263,26 @@ def test_env_var_json_output(clear_env_vars):
     assert config.json_output is True
 
 
+def test_env_var_persistent_cache(clear_env_vars):
+    """Test persistent cache flag from environment variable."""
+    assert WheelStrategyConfig.merge_with_defaults({}).persistent_cache is False
+
+    os.environ["WHEEL_PERSISTENT_CACHE"] = "1"
+
+    config = WheelStrategyConfig.merge_with_defaults({})
+    assert config.persistent_cache is True
+
+
+def test_persistent_cache_from_config_file(temp_config_file, clear_env_vars):
+    """Test persistent cache flag from the cli section of the config file."""
+    with open(temp_config_file, "w") as f:
+        yaml.dump({"cli": {"persistent_cache": True}}, f)
+
+    config = WheelStrategyConfig.load_from_file(temp_config_file)
+    assert config.persistent_cache is True
+    assert config.to_dict()["cli"]["persistent_cache"] is True
+
+
 def test_env_var_override_file(temp_config_file, sample_config_dict, clear_env_vars):
     """Test environment variables override file config."""
     with open(temp_config_file, "w") as f:
@@ -249,6 +249,90 @@ class TestPositionMonitor:
         assert quote["lowPrice"] is None
         assert quote["closePrice"] is None
 
+    # Batched quote tests
+
+    def test_prefetch_quotes_fills_cache(self):
+        """Test prefetch_quotes fetches all symbols in one batch and caches them."""
+        from src.schwab.models import SchwabQuoteBatch
+
+        schwab = Mock()
+        schwab.get_quotes.return_value = SchwabQuoteBatch(
+            quotes={
+                "AAPL": {"lastPrice": 155.50, "openPrice": 153.00},
+                "MSFT": {"closePrice": 410.00},
+            },
+            invalid_symbols=["BAD"],
+        )
+        monitor = PositionMonitor(schwab_client=schwab)
+
+        refreshed = monitor.prefetch_quotes(["AAPL", "MSFT", "BAD", "AAPL"])
+
+        assert refreshed == {"AAPL", "MSFT"}
+        schwab.get_quotes.assert_called_once_with(["AAPL", "MSFT", "BAD"], use_cache=True)
+        assert monitor._fetch_current_price("AAPL") == 155.50
+        assert monitor._fetch_quote_data("MSFT")["lastPrice"] == 410.00
+        schwab.get_quote.assert_not_called()
+
+    def test_prefetch_quotes_skips_cached_symbols(self):
+        """Test prefetch_quotes only requests symbols missing from the cache."""
+        from src.schwab.models import SchwabQuoteBatch
+
+        schwab = Mock()
+        schwab.get_quotes.return_value = SchwabQuoteBatch(quotes={"MSFT": {"lastPrice": 410.0}})
+        monitor = PositionMonitor(schwab_client=schwab)
+        monitor._cache["AAPL"] = ({"lastPrice": 155.50}, datetime.now())
+
+        monitor.prefetch_quotes(["AAPL", "MSFT"])
+        schwab.get_quotes.assert_called_once_with(["MSFT"], use_cache=True)
+
+        schwab.get_quotes.reset_mock()
+        monitor.prefetch_quotes(["AAPL", "MSFT"], force_refresh=True)
+        schwab.get_quotes.assert_called_once_with(["AAPL", "MSFT"], use_cache=False)
+
+    def test_prefetch_quotes_failure_is_not_fatal(self):
+        """Test a failed batch leaves symbols to the per-symbol fetch."""
+        schwab = Mock()
+        schwab.get_quotes.side_effect = Exception("Schwab error")
+        schwab.get_quote.return_value = {"lastPrice": 155.50}
+        monitor = PositionMonitor(schwab_client=schwab)
+
+        assert monitor.prefetch_quotes(["AAPL"]) == set()
+        assert monitor._fetch_current_price("AAPL") == 155.50
+
+    @patch("src.server.tasks.market_hours.is_market_open", return_value=True)
+    def test_get_all_positions_status_batches_quotes(self, mock_market_open):
+        """Test get_all_positions_status uses one batched request when force refreshing."""
+        from src.schwab.models import SchwabQuoteBatch
+
+        symbols = ["AAPL", "MSFT", "F"]
+        schwab = Mock()
+        schwab.get_quotes.return_value = SchwabQuoteBatch(
+            quotes={symbol: {"lastPrice": 100.0} for symbol in symbols}
+        )
+        monitor = PositionMonitor(schwab_client=schwab)
+        positions = [
+            WheelPosition(id=i, symbol=symbol, state=WheelState.CASH_PUT_OPEN)
+            for i, symbol in enumerate(symbols)
+        ]
+        trades = [
+            TradeRecord(
+                id=i,
+                wheel_id=i,
+                symbol=symbol,
+                direction="put",
+                strike=95.0,
+                expiration_date="2030-01-18",
+                outcome=TradeOutcome.OPEN,
+            )
+            for i, symbol in enumerate(symbols)
+        ]
+
+        results = monitor.get_all_positions_status(positions, trades, force_refresh=True)
+
+        assert len(results) == 3
+        schwab.get_quotes.assert_called_once()
+        schwab.get_quote.assert_not_called()
+
     # Helper method tests
 
     def test_find_open_trade(self):
@@ -241,3 +241,42 @@ class TestWarnings:
         engine._add_warnings([rec], "AAPL")
 
         assert any("Short DTE" in w for w in rec.warnings)
+
+
+class TestEstimateVolatility:
+    """Tests for the realized volatility estimate."""
+
+    def _price_data(self, n: int):
+        from src.analysis.volatility_models import PriceData
+
+        closes = [100.0 * (1.01 if i % 2 else 0.99) ** (i % 7) for i in range(n)]
+        return PriceData(dates=[f"d{i:03d}" for i in range(n)], closes=closes)
+
+    def test_twenty_day_close_to_close(self) -> None:
+        """Volatility is the 20-day close-to-close estimate over a 30-day lookback."""
+        from unittest.mock import Mock
+
+        from src.analysis.volatility import VolatilityCalculator
+
+        price_data = self._price_data(30)
+        fetcher = Mock()
+        fetcher.fetch_price_data.return_value = price_data
+        engine = RecommendEngine(price_fetcher=fetcher)
+
+        result = engine._estimate_volatility("AAPL", 100.0)
+
+        expected = VolatilityCalculator().calculate_from_price_data(
+            price_data, method="close_to_close"
+        )
+        assert result == pytest.approx(expected.volatility)
+        fetcher.fetch_price_data.assert_called_once_with("AAPL", lookback_days=30)
+
+    def test_insufficient_history_uses_default(self) -> None:
+        """Too little history falls back to the 30% default."""
+        from unittest.mock import Mock
+
+        fetcher = Mock()
+        fetcher.fetch_price_data.return_value = self._price_data(5)
+        engine = RecommendEngine(price_fetcher=fetcher)
+
+        assert engine._estimate_volatility("AAPL", 100.0) == 0.30
@@ -3,9 +3,11 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from dataclasses import dataclass
+from datetime import date, timedelta
 
+from src.models.base import OptionContract, OptionsChain
 from src.models.profiles import StrikeProfile
-from src.wheel.recommend import RecommendEngine
+from src.wheel.recommend import RecommendEngine, ScanInputs
 from src.wheel.models import WheelRecommendation
 
 
@@ -54,10 +56,68 @@ class TestScanOpportunities:
         engine.scan_opportunities("AAPL", profiles, max_dte=45)
 
         # Should fetch chain, price, volatility exactly once
-        engine._fetch_options_chain.assert_called_once_with("AAPL")
+        engine._fetch_options_chain.assert_called_once()
+        assert engine._fetch_options_chain.call_args.args[0] == "AAPL"
         engine._fetch_current_price.assert_called_once_with("AAPL")
         engine._estimate_volatility.assert_called_once()
 
+    def test_scan_uses_prefetched_chain(self, engine):
+        """A pre-fetched chain is used instead of fetching one."""
+        chain = self._mock_chain()
+        engine._fetch_options_chain = Mock()
+        engine._fetch_current_price = Mock(return_value=155.0)
+        engine._get_candidates = Mock(return_value=[])
+
+        engine.scan_opportunities(
+            "AAPL", [StrikeProfile.CONSERVATIVE], volatility=0.3, options_chain=chain
+        )
+
+        engine._fetch_options_chain.assert_not_called()
+        assert engine._get_candidates.call_args.kwargs["options_chain"] is chain
+
+    def test_scan_uses_fetched_inputs(self, engine):
+        """Inputs from fetch_scan_inputs are scored without fetching again."""
+        engine._fetch_options_chain = Mock(return_value=self._mock_chain())
+        engine._fetch_current_price = Mock(return_value=155.0)
+        engine._estimate_volatility = Mock(return_value=0.30)
+        engine._get_candidates = Mock(return_value=[])
+
+        inputs = engine.fetch_scan_inputs("AAPL", [StrikeProfile.CONSERVATIVE])
+        engine.scan_opportunities(
+            "AAPL", [StrikeProfile.CONSERVATIVE],
+            current_price=inputs.current_price,
+            volatility=inputs.volatility,
+            options_chain=inputs.options_chain,
+        )
+
+        engine._fetch_current_price.assert_called_once_with("AAPL")
+        engine._estimate_volatility.assert_called_once()
+        engine._fetch_options_chain.assert_called_once()
+        assert engine._get_candidates.call_args.kwargs["current_price"] == 155.0
+
+    def test_scan_requests_profile_envelope(self, engine):
+        """The chain request covers every scanned profile and stops at max_dte."""
+        engine._fetch_options_chain = Mock(return_value=self._mock_chain())
+        engine._fetch_current_price = Mock(return_value=155.0)
+        engine._get_candidates = Mock(return_value=[])
+        engine._strike_spacing["AAPL"] = 2.5
+
+        engine.scan_opportunities(
+            "AAPL", [StrikeProfile.AGGRESSIVE, StrikeProfile.CONSERVATIVE],
+            max_dte=30, volatility=0.30,
+        )
+
+        query = engine._fetch_options_chain.call_args.args[1]
+        assert query.contract_type is None
+        assert query.strike_range == "OTM"
+        assert query.to_date == (date.today() + timedelta(days=30)).isoformat()
+        # 2.0 sigma (conservative edge) at 30 DTE is ~28 dollars above 155
+        assert 11 <= query.strike_count <= 14
+
+    def test_prefetch_requires_schwab_client(self, engine):
+        """Without a real SchwabClient nothing is prefetched."""
+        assert engine.prefetch_options_chains(["AAPL", "MSFT"]) == {}
+
     def test_scan_calls_get_candidates_for_each_combo(self, engine):
         """Should call _get_candidates for each (direction, profile) pair."""
         engine._fetch_options_chain = Mock(return_value=self._mock_chain())
@@ -199,3 +259,196 @@ class TestScanOpportunities:
         # Should be sorted by bias_score descending
         if len(results) > 1:
             assert results[0].bias_score >= results[1].bias_score
+
+
+class TestProfileSweep:
+    """scan_opportunities() shares one pass over the chain between profiles."""
+
+    @pytest.fixture
+    def engine(self):
+        engine = RecommendEngine(
+            finnhub_client=Mock(), price_fetcher=Mock(), schwab_client=Mock()
+        )
+        engine._fetch_current_price = Mock(return_value=100.0)
+        return engine
+
+    @staticmethod
+    def _chain():
+        """Calls and puts every dollar from 60 to 140 over three expirations."""
+        from src.models.base import OptionContract, OptionsChain
+
+        contracts = [
+            OptionContract(
+                symbol="AAPL",
+                strike=float(strike),
+                expiration_date=(date.today() + timedelta(days=days)).isoformat(),
+                option_type=option_type,
+                bid=max(0.05, 4.0 - abs(strike - 100) * 0.1),
+                ask=max(0.10, 4.2 - abs(strike - 100) * 0.1),
+            )
+            for days in (7, 21, 35)
+            for option_type in ("Call", "Put")
+            for strike in range(60, 141)
+        ]
+        return OptionsChain(
+            symbol="AAPL", contracts=contracts, retrieved_at="2026-02-01T00:00:00",
+            underlying_price=100.0,
+        )
+
+    def test_sweep_matches_per_profile_scan(self, engine):
+        profiles = list(StrikeProfile)
+        chain = self._chain()
+
+        swept = engine.scan_opportunities(
+            "AAPL", profiles, max_dte=45, volatility=0.35, options_chain=chain
+        )
+        per_profile = []
+        for profile in profiles:
+            per_profile.extend(
+                engine.scan_opportunities(
+                    "AAPL", [profile], max_dte=45, volatility=0.35, options_chain=chain
+                )
+            )
+
+        assert swept
+        key = lambda r: (r.direction, r.expiration_date, r.strike)  # noqa: E731
+        assert sorted(swept, key=key) == sorted(per_profile, key=key)
+
+    def test_chain_walked_once_per_direction(self, engine):
+        engine._eligible_contracts = Mock(wraps=engine._eligible_contracts)
+
+        engine.scan_opportunities(
+            "AAPL", list(StrikeProfile), max_dte=45, volatility=0.35,
+            options_chain=self._chain(),
+        )
+
+        assert engine._eligible_contracts.call_count == 2
+
+    def test_band_matches_linear_filter(self, engine):
+        from src.models import PROFILE_SIGMA_RANGES
+
+        eligible = engine._eligible_contracts(
+            self._chain(), 100.0, 0.35, "put", expiration_date=None, max_dte=45
+        )
+
+        for min_sigma, max_sigma in PROFILE_SIGMA_RANGES.values():
+            expected = [
+                i for i, sigma in enumerate(eligible.sigma_distance)
+                if min_sigma <= sigma <= max_sigma
+            ]
+            assert eligible.band(min_sigma, max_sigma) == expected
+
+
+class TestTopK:
+    """Candidates are ranked on the eligible columns and only the top K are built."""
+
+    @pytest.fixture
+    def engine(self):
+        return RecommendEngine(finnhub_client=None, price_fetcher=Mock(), schwab_client=None)
+
+    @staticmethod
+    def _candidates(engine, top_k, profile=StrikeProfile.AGGRESSIVE):
+        from src.wheel.models import WheelPosition
+        from src.wheel.state import WheelState
+
+        position = WheelPosition(
+            symbol="AAPL", state=WheelState.CASH, capital_allocated=1_000_000, profile=profile
+        )
+        candidates = engine._get_candidates(
+            options_chain=TestProfileSweep._chain(),
+            current_price=100.0,
+            volatility=0.35,
+            direction="put",
+            profile=profile,
+            expiration_date=None,
+            position=position,
+            max_dte=45,
+            top_k=top_k,
+        )
+        return engine._apply_collection_bias(candidates)
+
+    @pytest.mark.parametrize("profile", list(StrikeProfile))
+    def test_top_k_matches_full_ranking(self, engine, profile):
+        full = self._candidates(engine, None, profile)
+        top = self._candidates(engine, 3, profile)
+
+        assert len(full) > 3
+        assert top == full[:3]
+
+    def test_recommendations_built_for_survivors_only(self, engine):
+        with patch(
+            "src.wheel.recommend.WheelRecommendation", wraps=WheelRecommendation
+        ) as built:
+            top = self._candidates(engine, 2)
+
+        assert len(top) == 2
+        assert built.call_count == 2
+
+    def test_scan_keeps_top_k_per_direction_and_profile(self, engine):
+        engine._fetch_current_price = Mock(return_value=100.0)
+        engine._add_warnings = Mock(wraps=engine._add_warnings)
+        profiles = [StrikeProfile.AGGRESSIVE, StrikeProfile.CONSERVATIVE]
+
+        results = engine.scan_opportunities(
+            "AAPL", profiles, max_dte=45, volatility=0.35,
+            options_chain=TestProfileSweep._chain(), top_k=2,
+        )
+
+        # 2 directions x 2 profiles x 2 kept
+        assert len(results) == 8
+        assert engine._add_warnings.call_args.args[0] == results
+
+
+class TestScanFingerprint:
+    """Tests for ScanInputs.fingerprint()."""
+
+    @staticmethod
+    def _inputs(
+        price=100.0, volatility=0.30, put_bid=1.20, near_bid=2.40, expiration_days=20
+    ):
+        expiration = (date.today() + timedelta(days=expiration_days)).isoformat()
+        contracts = [
+            # ~1.8 sigma: inside the conservative band
+            OptionContract("AAPL", 88.0, expiration, "Put", bid=put_bid, ask=put_bid + 0.1),
+            # ~0.6 sigma: in the aggressive band only
+            OptionContract("AAPL", 96.0, expiration, "Put", bid=near_bid, ask=near_bid + 0.1),
+            OptionContract("AAPL", 112.0, expiration, "Call", bid=0.90, ask=1.00),
+        ]
+        chain = OptionsChain("AAPL", contracts, retrieved_at="2026-03-01T10:00:00")
+        return ScanInputs(price, volatility, chain)
+
+    def test_small_moves_keep_fingerprint(self):
+        profiles = [StrikeProfile.CONSERVATIVE]
+        base = self._inputs().fingerprint(profiles, 45)
+        assert self._inputs(price=100.1, volatility=0.302).fingerprint(profiles, 45) == base
+
+    @pytest.mark.parametrize(
+        "changed",
+        [{"price": 102.0}, {"volatility": 0.35}, {"put_bid": 1.25}],
+    )
+    def test_input_changes_change_fingerprint(self, changed):
+        profiles = [StrikeProfile.CONSERVATIVE]
+        base = self._inputs().fingerprint(profiles, 45)
+        assert self._inputs(**changed).fingerprint(profiles, 45) != base
+
+    def test_scan_parameters_change_fingerprint(self):
+        inputs = self._inputs()
+        base = inputs.fingerprint([StrikeProfile.CONSERVATIVE], 45)
+        assert inputs.fingerprint([StrikeProfile.AGGRESSIVE], 45) != base
+        assert inputs.fingerprint([StrikeProfile.CONSERVATIVE], 30) != base
+        assert inputs.fingerprint([StrikeProfile.CONSERVATIVE], 45, top_k=3) != base
+
+    def test_out_of_band_quotes_ignored(self):
+        profiles = [StrikeProfile.CONSERVATIVE]
+        base = self._inputs().fingerprint(profiles, 45)
+        assert self._inputs(near_bid=3.10).fingerprint(profiles, 45) == base
+        # The same contract is scanned, and counts, once its band is
+        assert self._inputs(near_bid=3.10).fingerprint(
+            [StrikeProfile.CONSERVATIVE, StrikeProfile.AGGRESSIVE], 45
+        ) != self._inputs().fingerprint([StrikeProfile.CONSERVATIVE, StrikeProfile.AGGRESSIVE], 45)
+
+    def test_contracts_past_max_dte_ignored(self):
+        profiles = [StrikeProfile.CONSERVATIVE]
+        far = self._inputs(expiration_days=60)
+        moved = self._inputs(put_bid=2.0, expiration_days=60)
+        assert far.fingerprint(profiles, 45) == moved.fingerprint(profiles, 45)